@@ -0,0 +1,76 @@
+"""Shared fixtures for the Python benchmark suite.
+
+Every benchmark runs against a stub `engram` executable placed first on PATH
+and a throwaway HOME, so the numbers measure the Python layer (process
+spawning, JSON-RPC, caching, FFI marshalling) rather than the real CLI.
+"""
+import asyncio
+import os
+import stat
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+for path in (
+    ROOT / "modules" / "tool-memory",
+    ROOT / "modules" / "hook-memory-context",
+    ROOT / "modules" / "hook-memory-observe",
+    ROOT / "crates" / "engram-core" / "bindings" / "python",
+):
+    sys.path.insert(0, str(path))
+
+# Answers `engram mcp` JSON-RPC, prints a fixed awareness block, and succeeds
+# immediately for every other subcommand.
+STUB_ENGRAM = """#!__PYTHON__
+import json, sys
+cmd = sys.argv[1] if len(sys.argv) > 1 else ""
+if cmd == "mcp":
+    for line in sys.stdin:
+        req = json.loads(line)
+        if req["method"] == "initialize":
+            result = {"protocolVersion": "2024-11-05"}
+        else:
+            text = "stub " + req["params"]["name"]
+            result = {"content": [{"type": "text", "text": text}]}
+        print(json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": result}), flush=True)
+elif cmd == "awareness":
+    print("<engram-context>\\n## Personal\\nDomains: Work (89)\\n</engram-context>")
+elif cmd != "observe":
+    print("stub " + " ".join(sys.argv[1:]))
+"""
+
+
+@pytest.fixture
+def stub_engram(tmp_path, monkeypatch):
+    """Put a stub `engram` on PATH and point HOME and the config at tmp_path."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    engram = bin_dir / "engram"
+    engram.write_text(STUB_ENGRAM.replace("__PYTHON__", sys.executable))
+    engram.chmod(engram.stat().st_mode | stat.S_IXUSR)
+
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("ENGRAM_CONFIG_PATH", str(home / ".engram" / "config.toml"))
+    return engram
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine to completion on a dedicated event loop."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def coordinator():
+    coord = MagicMock()
+    coord.tools = MagicMock()
+    coord.hooks = MagicMock()
+    return coord
@@ -0,0 +1,127 @@
+"""Throughput of the engram_core Python bindings.
+
+Skipped unless the native library has been built and copied next to
+engram_core.py as libuniffi_engram_core.so (see bindings/PYTHON_USAGE.md).
+"""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+try:
+    import engram_core
+except OSError:
+    pytest.skip("libuniffi_engram_core is not built", allow_module_level=True)
+
+BATCH = 1_000
+PAYLOAD = 1024 * 1024
+PROFILE_ROWS = 100_000
+
+
+@pytest.fixture(scope="module")
+def key():
+    return engram_core.derive_key("bench-password", engram_core.generate_salt())
+
+
+@pytest.fixture
+def store(tmp_path, key):
+    return engram_core.MemoryStoreHandle(str(tmp_path / "memory.db"), key)
+
+
+def _inputs(n: int) -> list:
+    return [
+        engram_core.MemoryInput(
+            entity=f"entity-{i % 50}", attribute=f"attr-{i}", value=f"value {i}", source=None
+        )
+        for i in range(n)
+    ]
+
+
+def _rate(benchmark, units: float, label: str) -> None:
+    # No timings are collected under --benchmark-disable.
+    if benchmark.stats is None:
+        return
+    benchmark.extra_info[label] = round(units / benchmark.stats.stats.mean, 1)
+
+
+def test_store_insert_memories(benchmark, tmp_path, key):
+    counter = iter(range(1_000_000))
+
+    def setup():
+        path = tmp_path / f"insert-{next(counter)}.db"
+        return (engram_core.MemoryStoreHandle(str(path), key), _inputs(BATCH)), {}
+
+    benchmark.pedantic(lambda s, inputs: s.insert_memories(inputs), setup=setup, rounds=10)
+    _rate(benchmark, BATCH, "rows/s")
+
+
+def test_store_read_columns(benchmark, store):
+    store.insert_memories(_inputs(BATCH))
+    cols = benchmark(store.read_columns, None, BATCH)
+    assert len(cols.ids) == BATCH
+    _rate(benchmark, BATCH, "rows/s")
+
+
+def test_store_cursor_stream(benchmark, store):
+    store.insert_memories(_inputs(BATCH))
+
+    def stream():
+        cursor = store.open_cursor(engram_core.CursorFilter(), 250)
+        rows = 0
+        while page := cursor.next_page():
+            rows += len(page)
+        return rows
+
+    assert benchmark(stream) == BATCH
+    _rate(benchmark, BATCH, "rows/s")
+
+
+@pytest.fixture(scope="module", params=list(engram_core.StoreProfile), ids=lambda p: p.name.lower())
+def profiled_store(request, tmp_path_factory, key):
+    """A PROFILE_ROWS-row store opened with each StoreProfile in turn."""
+    path = tmp_path_factory.mktemp("profile") / "memory.db"
+    store = engram_core.MemoryStoreHandle.open_with_profile(str(path), key, request.param, 0)
+    rows = _inputs(PROFILE_ROWS)
+    for start in range(0, PROFILE_ROWS, BATCH):
+        store.insert_memories(rows[start : start + BATCH])
+    return store
+
+
+@pytest.mark.parametrize("profile", list(engram_core.StoreProfile), ids=lambda p: p.name.lower())
+def test_profile_insert(benchmark, tmp_path, key, profile):
+    counter = iter(range(1_000_000))
+    rows = _inputs(PROFILE_ROWS)
+
+    def setup():
+        path = tmp_path / f"profile-{next(counter)}.db"
+        return (engram_core.MemoryStoreHandle.open_with_profile(str(path), key, profile, 0),), {}
+
+    def ingest(store):
+        for start in range(0, PROFILE_ROWS, BATCH):
+            store.insert_memories(rows[start : start + BATCH])
+
+    benchmark.pedantic(ingest, setup=setup, rounds=3)
+    _rate(benchmark, PROFILE_ROWS, "rows/s")
+
+
+def test_profile_query(benchmark, profiled_store):
+    entities = [f"entity-{i}" for i in range(0, 50, 5)]
+
+    def query():
+        return sum(len(profiled_store.find_by_entity(e)) for e in entities)
+
+    assert benchmark(query) == len(entities) * PROFILE_ROWS // 50
+    _rate(benchmark, len(entities), "queries/s")
+
+
+def test_encrypt_bytes(benchmark, key):
+    plaintext = os.urandom(PAYLOAD)
+    benchmark(engram_core.encrypt_bytes, key, plaintext)
+    _rate(benchmark, PAYLOAD / 1e6, "MB/s")
+
+
+def test_decrypt_bytes(benchmark, key):
+    ciphertext = engram_core.encrypt_bytes(key, os.urandom(PAYLOAD))
+    benchmark(engram_core.decrypt_bytes, key, ciphertext)
+    _rate(benchmark, PAYLOAD / 1e6, "MB/s")
@@ -0,0 +1,82 @@
+"""Overhead the context and observe hooks add to an Amplifier turn."""
+from __future__ import annotations
+
+import itertools
+from unittest.mock import MagicMock
+
+import pytest
+
+from amplifier_module_hook_memory_context import mount as mount_context
+from amplifier_module_hook_memory_observe import ObserveQueue
+from amplifier_module_hook_memory_observe import mount as mount_observe
+
+
+@pytest.fixture
+def vault(stub_engram, tmp_path):
+    """A 200-note vault registered in the stub config, for a realistic fingerprint walk."""
+    root = tmp_path / "vault"
+    for d in range(20):
+        folder = root / f"area-{d}"
+        folder.mkdir(parents=True)
+        for n in range(10):
+            (folder / f"note-{n}.md").write_text(f"# Note {d}.{n}\n")
+    (root / "_context").mkdir()
+    (root / "_context" / "profile.md").write_text("# Profile\n")
+
+    config = tmp_path / "home" / ".engram" / "config.toml"
+    config.parent.mkdir(parents=True)
+    config.write_text(f'[vaults.personal]\npath = "{root}"\n')
+    return root
+
+
+def test_context_hook_cache_hit(benchmark, vault, run, coordinator):
+    """prompt:submit when the cached awareness block is still fresh."""
+    run(mount_context(coordinator, {}))
+    handler = coordinator.hooks.register.call_args[0][1]
+    run(handler(MagicMock()))
+
+    benchmark(lambda: run(handler(MagicMock())))
+    assert handler.cache.refreshes == 1
+
+
+def test_context_hook_cold_start(benchmark, vault, run, coordinator):
+    """First prompt of a session: fingerprint plus one `engram awareness` run."""
+
+    def cold_prompt():
+        run(mount_context(coordinator, {}))
+        handler = coordinator.hooks.register.call_args[0][1]
+        return run(handler(MagicMock()))
+
+    benchmark.pedantic(cold_prompt, rounds=20)
+
+
+def test_observe_hook_submit(benchmark, stub_engram, run, coordinator):
+    """execution:end returning after the transcript is queued."""
+    close = run(mount_observe(coordinator, {"max_queue": 1_000_000}))
+    handler = coordinator.hooks.register.call_args[0][1]
+    paths = (f"/tmp/transcript-{i}.jsonl" for i in itertools.count())
+
+    def end_session():
+        event = MagicMock()
+        event.context = {"transcript_path": next(paths)}
+        return run(handler(event))
+
+    benchmark(end_session)
+    run(close())
+    assert handler.queue.rejected == 0
+
+
+def test_observe_queue_drain(benchmark, stub_engram, run):
+    """Wall time to run 16 observe jobs through the default two workers."""
+    batch = itertools.count()
+
+    async def drain():
+        queue = ObserveQueue()
+        n = next(batch)
+        for i in range(16):
+            queue.submit(f"/tmp/transcript-{n}-{i}.jsonl")
+        await queue.join()
+        await queue.close()
+        return queue.completed
+
+    assert benchmark.pedantic(lambda: run(drain()), rounds=5) == 16
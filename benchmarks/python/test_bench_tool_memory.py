@@ -0,0 +1,28 @@
+"""Latency of one memory tool call as seen by Amplifier."""
+from __future__ import annotations
+
+from amplifier_module_tool_memory import mount
+
+
+def _tools(coordinator) -> dict:
+    return {c[0][0].__name__: c[0][0] for c in coordinator.tools.register.call_args_list}
+
+
+def test_tool_call_persistent_worker(benchmark, stub_engram, run, coordinator):
+    """memory_search through the long-lived `engram mcp` worker."""
+    close = run(mount(coordinator, {}))
+    memory_search = _tools(coordinator)["memory_search"]
+    assert run(memory_search("warm up")) == "stub memory_search"
+
+    result = benchmark(lambda: run(memory_search("Sofia dietary")))
+    run(close())
+    assert result == "stub memory_search"
+
+
+def test_tool_call_process_per_call(benchmark, stub_engram, run, coordinator):
+    """memory_search spawning a fresh `engram` per call (persistent: false)."""
+    run(mount(coordinator, {"persistent": False}))
+    memory_search = _tools(coordinator)["memory_search"]
+
+    result = benchmark.pedantic(lambda: run(memory_search("Sofia dietary")), rounds=20)
+    assert result.startswith("stub search")
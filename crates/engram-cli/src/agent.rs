@@ -0,0 +1,255 @@
+//! Key agent for the engram CLI.
+//!
+//! Deriving the vault key from a passphrase is Argon2id with 64 MiB and 3
+//! passes, roughly 100 ms per CLI run or daemon sync. `engram agent start`
+//! derives it once, pins it in RAM with mlock(2) and serves it over a Unix
+//! socket that only the owner can open. `resolve_vault_key` asks the agent
+//! before falling back to the passphrase, so later CLI runs, daemon syncs and
+//! the Python hooks (which shell out to the CLI) skip the derivation. The key
+//! is wiped when the TTL expires or on `engram agent stop`.
+//!
+//! Protocol: one request line per connection, `GET` or `STOP`. Replies are
+//! `OK <base64 key>`, `OK` or `ERR <message>`.
+
+use base64::engine::general_purpose::STANDARD as B64;
+use base64::Engine;
+use engram_core::config::EngramConfig;
+use engram_core::crypto::EngramKey;
+use std::io::{self, BufRead, BufReader, Write};
+use std::os::unix::net::{UnixListener, UnixStream};
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex};
+use std::thread;
+use std::time::Duration;
+
+/// Default time the agent holds the key, in seconds.
+pub const DEFAULT_TTL_SECS: u64 = 8 * 60 * 60;
+
+/// How long either side waits on a silent peer.
+const IO_TIMEOUT: Duration = Duration::from_secs(1);
+
+#[derive(Debug, thiserror::Error)]
+pub enum AgentError {
+    #[error("io error: {0}")]
+    Io(#[from] io::Error),
+    #[error("an agent is already listening on {0}")]
+    AlreadyRunning(PathBuf),
+    #[error("agent replied: {0}")]
+    Protocol(String),
+}
+
+/// Path of the agent socket: `agent.sock` next to the config file.
+///
+/// Override with the `ENGRAM_AGENT_SOCK` env var.
+pub fn socket_path() -> PathBuf {
+    if let Ok(path) = std::env::var("ENGRAM_AGENT_SOCK") {
+        return PathBuf::from(path);
+    }
+    EngramConfig::config_path().with_file_name("agent.sock")
+}
+
+/// Ask the agent listening on `path` for the vault key.
+///
+/// Returns `None` if no agent is running, its key has expired, or it does
+/// not answer within a second; the caller then derives the key itself.
+pub fn fetch_key(path: &Path) -> Option<EngramKey> {
+    let reply = request(path, "GET").ok()?;
+    let encoded = reply.strip_prefix("OK ")?;
+    let bytes: [u8; 32] = B64.decode(encoded).ok()?.try_into().ok()?;
+    Some(EngramKey::from_bytes(bytes))
+}
+
+/// Tell the agent listening on `path` to wipe its key and exit.
+pub fn stop(path: &Path) -> Result<(), AgentError> {
+    match request(path, "STOP")?.as_str() {
+        "OK" => Ok(()),
+        other => Err(AgentError::Protocol(other.to_string())),
+    }
+}
+
+/// Serve `key` on `path` until `ttl` elapses or a client sends `STOP`.
+///
+/// The socket is created owner-only (mode 0600) and removed on return. A
+/// stale socket left by a crashed agent is replaced; a live one is an error.
+pub fn serve(path: &Path, key: EngramKey, ttl: Duration) -> Result<(), AgentError> {
+    if UnixStream::connect(path).is_ok() {
+        return Err(AgentError::AlreadyRunning(path.to_path_buf()));
+    }
+    let _ = std::fs::remove_file(path);
+    let listener = bind_owner_only(path)?;
+
+    let key = Arc::new(Mutex::new(Some(LockedKey::new(key))));
+    {
+        let key = Arc::clone(&key);
+        let path = path.to_path_buf();
+        thread::spawn(move || {
+            thread::sleep(ttl);
+            key.lock().unwrap().take();
+            // Wake the accept loop so it notices the key is gone.
+            let _ = UnixStream::connect(&path);
+        });
+    }
+
+    for stream in listener.incoming() {
+        if key.lock().unwrap().is_none() {
+            break;
+        }
+        let Ok(stream) = stream else { continue };
+        match handle_client(&stream, &key) {
+            Ok(true) | Err(_) => {}
+            Ok(false) => break,
+        }
+    }
+
+    key.lock().unwrap().take();
+    let _ = std::fs::remove_file(path);
+    Ok(())
+}
+
+// ── Private helpers ──────────────────────────────────────────────────────────
+
+/// The vault key pinned in RAM with mlock(2), so it is never swapped to disk,
+/// and zeroed when dropped.
+struct LockedKey(Box<[u8; 32]>);
+
+impl LockedKey {
+    fn new(key: EngramKey) -> Self {
+        let bytes = Box::new(*key.as_bytes());
+        // SAFETY: the pointer and length describe the boxed array, which stays
+        // at this address until `drop` unlocks it. A failed mlock (e.g. a low
+        // RLIMIT_MEMLOCK) leaves the key usable, only swappable.
+        unsafe { libc::mlock(bytes.as_ptr().cast(), bytes.len()) };
+        LockedKey(bytes)
+    }
+}
+
+impl Drop for LockedKey {
+    fn drop(&mut self) {
+        for byte in self.0.iter_mut() {
+            // SAFETY: `byte` is a valid, exclusive reference; the volatile
+            // write keeps the compiler from eliding the wipe.
+            unsafe { std::ptr::write_volatile(byte, 0) };
+        }
+        // SAFETY: same region that `new` locked.
+        unsafe { libc::munlock(self.0.as_ptr().cast(), self.0.len()) };
+    }
+}
+
+/// Bind a listener at `path` whose socket file is readable and writable by the owner only.
+fn bind_owner_only(path: &Path) -> io::Result<UnixListener> {
+    if let Some(dir) = path.parent() {
+        std::fs::create_dir_all(dir)?;
+    }
+    // Set the mode at creation rather than chmod-ing after bind, which would
+    // leave a window where other users could connect.
+    // SAFETY: umask(2) always succeeds; the previous mask is restored below.
+    let previous = unsafe { libc::umask(0o177) };
+    let listener = UnixListener::bind(path);
+    unsafe { libc::umask(previous) };
+    listener
+}
+
+/// Answer one request. Returns `Ok(false)` when the agent should shut down.
+fn handle_client(stream: &UnixStream, key: &Mutex<Option<LockedKey>>) -> io::Result<bool> {
+    stream.set_read_timeout(Some(IO_TIMEOUT))?;
+    stream.set_write_timeout(Some(IO_TIMEOUT))?;
+    let mut line = String::new();
+    BufReader::new(stream).read_line(&mut line)?;
+
+    let mut out = stream;
+    match line.trim() {
+        "GET" => match key.lock().unwrap().as_ref() {
+            Some(locked) => writeln!(out, "OK {}", B64.encode(&locked.0[..]))?,
+            None => writeln!(out, "ERR key expired")?,
+        },
+        "STOP" => {
+            key.lock().unwrap().take();
+            writeln!(out, "OK")?;
+            return Ok(false);
+        }
+        other => writeln!(out, "ERR unknown request: {other}")?,
+    }
+    Ok(true)
+}
+
+/// Send one request line to the agent and return its reply line.
+fn request(path: &Path, command: &str) -> io::Result<String> {
+    let stream = UnixStream::connect(path)?;
+    stream.set_read_timeout(Some(IO_TIMEOUT))?;
+    stream.set_write_timeout(Some(IO_TIMEOUT))?;
+    writeln!(&stream, "{command}")?;
+    let mut reply = String::new();
+    BufReader::new(&stream).read_line(&mut reply)?;
+    Ok(reply.trim_end().to_string())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::os::unix::fs::PermissionsExt;
+    use std::time::Instant;
+    use tempfile::TempDir;
+
+    /// Start an agent on a thread and wait until its socket accepts connections.
+    fn spawn_agent(path: &Path, ttl: Duration) -> thread::JoinHandle<Result<(), AgentError>> {
+        let serve_path = path.to_path_buf();
+        let handle =
+            thread::spawn(move || serve(&serve_path, EngramKey::from_bytes([7u8; 32]), ttl));
+        let deadline = Instant::now() + Duration::from_secs(5);
+        while !path.exists() {
+            assert!(Instant::now() < deadline, "agent did not start");
+            thread::sleep(Duration::from_millis(10));
+        }
+        handle
+    }
+
+    #[test]
+    fn test_fetch_key_returns_served_key_until_stop() {
+        let dir = TempDir::new().unwrap();
+        let path = dir.path().join("agent.sock");
+        let agent = spawn_agent(&path, Duration::from_secs(60));
+
+        let mode = std::fs::metadata(&path).unwrap().permissions().mode();
+        assert_eq!(mode & 0o077, 0, "socket must be owner-only, got {mode:o}");
+
+        let key = fetch_key(&path).expect("agent should serve the key");
+        assert_eq!(key.as_bytes(), &[7u8; 32]);
+
+        stop(&path).expect("stop failed");
+        agent.join().unwrap().expect("serve failed");
+        assert!(!path.exists(), "socket should be removed on exit");
+        assert!(fetch_key(&path).is_none());
+    }
+
+    #[test]
+    fn test_agent_exits_when_ttl_expires() {
+        let dir = TempDir::new().unwrap();
+        let path = dir.path().join("agent.sock");
+        let agent = spawn_agent(&path, Duration::from_millis(200));
+        agent.join().unwrap().expect("serve failed");
+        assert!(fetch_key(&path).is_none());
+    }
+
+    #[test]
+    fn test_second_agent_on_same_socket_is_rejected() {
+        let dir = TempDir::new().unwrap();
+        let path = dir.path().join("agent.sock");
+        let agent = spawn_agent(&path, Duration::from_secs(60));
+
+        let second = serve(
+            &path,
+            EngramKey::from_bytes([1u8; 32]),
+            Duration::from_secs(1),
+        );
+        assert!(matches!(second, Err(AgentError::AlreadyRunning(_))));
+
+        stop(&path).unwrap();
+        agent.join().unwrap().unwrap();
+    }
+
+    #[test]
+    fn test_fetch_key_without_agent_is_none() {
+        let dir = TempDir::new().unwrap();
+        assert!(fetch_key(&dir.path().join("agent.sock")).is_none());
+    }
+}
@@ -1,7 +1,8 @@
 // awareness.rs — vault domain structure and context file helpers
 
+use engram_core::config::EngramConfig;
 use engram_core::crypto::KeyStore;
-use engram_core::store::MemoryStore;
+use engram_core::store::{MemoryStore, StoreOptions};
 use engram_core::vault::Vault;
 use std::collections::BTreeMap;
 use std::path::Path;
@@ -128,7 +129,8 @@ pub fn vault_recent_facts(engram_dir: &Path, limit: usize) -> String {
     }
 
     // Step 3: Open MemoryStore — return empty on error.
-    let store = match MemoryStore::open(&db_path, &key) {
+    let options = StoreOptions::from_config(&EngramConfig::load());
+    let store = match MemoryStore::open_with(&db_path, &key, &options) {
         Ok(s) => s,
         Err(_) => return String::new(),
     };
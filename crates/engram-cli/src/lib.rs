@@ -1,6 +1,9 @@
 // engram library — expose internal modules for testing
+#[cfg(unix)]
+pub mod agent;
 pub mod awareness;
 pub mod daemon;
 pub mod load;
 pub mod mcp;
 pub mod observe;
+pub mod transfer;
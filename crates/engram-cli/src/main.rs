@@ -1,20 +1,30 @@
 // engram-cli — Personal memory assistant CLI
 
+#[cfg(unix)]
+mod agent;
 mod awareness;
 mod daemon;
 mod install;
 mod load;
 mod mcp;
 mod observe;
+mod transfer;
 
 use base64::engine::general_purpose::STANDARD as B64;
 use base64::Engine;
 use clap::{Parser, Subcommand, ValueEnum};
 use directories::UserDirs;
 use engram_core::config::{EngramConfig, SyncMode, VaultAccess, VaultEntry, VaultSyncCredentials};
-use engram_core::{store::MemoryStore, vault::Vault};
+use engram_core::store::{MemoryStore, StoreOptions, StoreProfile};
+use engram_core::vault::Vault;
+use engram_search::cache::{EmbeddingCache, DEFAULT_CACHE_ENTRIES};
+use engram_search::embedder::Embedder;
 use engram_search::indexer::TantivyIndexer;
+use engram_search::pipeline::EmbedOptions;
 use engram_search::{SearchResult, SearchSource};
+use flate2::write::GzEncoder;
+use flate2::Compression;
+use std::collections::HashMap;
 use std::path::{Path, PathBuf};
 
 /// Search mode for the `search` subcommand.
@@ -67,6 +77,12 @@ enum Commands {
         /// Force a full reindex by wiping the search index first
         #[arg(long)]
         force: bool,
+        /// Chunks per embedding batch (default: `[search] embed_batch_size`, else 64)
+        #[arg(long)]
+        batch_size: Option<usize>,
+        /// Threads reading files for embedding (default: `[search] embed_threads`, else one per core)
+        #[arg(long)]
+        threads: Option<usize>,
     },
     /// Search the indexed vault
     Search {
@@ -81,6 +97,9 @@ enum Commands {
         /// Search mode: fulltext (BM25), vector (KNN), or hybrid (RRF merge)
         #[arg(long, default_value = "hybrid")]
         mode: SearchMode,
+        /// Search the facts in the memory store instead of the vault index
+        #[arg(long, conflicts_with_all = ["vault", "mode"])]
+        facts: bool,
     },
     /// Observe a session transcript and extract facts into memory
     Observe {
@@ -121,6 +140,52 @@ enum Commands {
         #[command(subcommand)]
         command: VaultCommands,
     },
+    /// Export or import the memory store as JSONL
+    Store {
+        #[command(subcommand)]
+        command: StoreCommands,
+    },
+    /// Hold the derived vault key so other engram runs skip the passphrase derivation
+    #[cfg(unix)]
+    Agent {
+        #[command(subcommand)]
+        command: AgentCommands,
+    },
+}
+
+#[cfg(unix)]
+#[derive(Subcommand)]
+enum AgentCommands {
+    /// Derive the vault key once and serve it over a user-only socket (runs in the foreground)
+    Start {
+        /// Seconds to hold the key before wiping it and exiting
+        #[arg(long, env = "ENGRAM_AGENT_TTL", default_value_t = agent::DEFAULT_TTL_SECS)]
+        ttl: u64,
+    },
+    /// Wipe the key and stop the running agent
+    Stop,
+}
+
+#[derive(Subcommand)]
+enum StoreCommands {
+    /// Stream every memory to JSONL, oldest first, then the archived facts
+    Export {
+        /// Output file (stdout when omitted or "-")
+        output: Option<PathBuf>,
+        /// Gzip the output (implied by a .gz output file)
+        #[arg(long)]
+        gzip: bool,
+    },
+    /// Load a JSONL export (plain or gzip), skipping ids already in the store
+    Import {
+        /// Input file ("-" for stdin)
+        input: PathBuf,
+        /// Memories written per transaction
+        #[arg(long, default_value_t = transfer::DEFAULT_BATCH)]
+        batch: usize,
+    },
+    /// Archive cold facts per `[store.retention]`, reclaim free pages and refresh query statistics
+    Compact,
 }
 
 #[derive(Subcommand)]
@@ -265,13 +330,29 @@ fn main() {
             vault,
             approve,
         } => run_sync(backend.as_deref(), vault.as_deref(), approve),
-        Commands::Index { vault, force } => run_index(vault.as_deref(), force),
+        Commands::Index {
+            vault,
+            force,
+            batch_size,
+            threads,
+        } => run_index(
+            vault.as_deref(),
+            force,
+            embed_options(&EngramConfig::load(), batch_size, threads),
+        ),
         Commands::Search {
             query,
             vault,
             limit,
             mode,
-        } => run_search(&query, vault.as_deref(), limit, &mode),
+            facts,
+        } => {
+            if facts {
+                run_search_facts(&query, limit)
+            } else {
+                run_search(&query, vault.as_deref(), limit, &mode)
+            }
+        }
         Commands::Observe {
             session_path,
             api_key,
@@ -308,18 +389,30 @@ fn main() {
             VaultCommands::Remove { name } => run_vault_remove(&name),
             VaultCommands::SetDefault { name } => run_vault_set_default(&name),
         },
+        Commands::Store { command } => match command {
+            StoreCommands::Export { output, gzip } => run_store_export(output.as_deref(), gzip),
+            StoreCommands::Import { input, batch } => run_store_import(&input, batch),
+            StoreCommands::Compact => run_store_compact(),
+        },
+        #[cfg(unix)]
+        Commands::Agent { command } => match command {
+            AgentCommands::Start { ttl } => run_agent_start(ttl),
+            AgentCommands::Stop => run_agent_stop(),
+        },
     }
 }
 
-/// Resolve the vault encryption key using a four-tier fallback strategy.
+/// Resolve the vault encryption key using a five-tier fallback strategy.
 ///
 /// Tier 1 — `ENGRAM_VAULT_KEY` env var: base64-encoded 32 bytes decoded directly
 ///   into an [`engram_core::crypto::EngramKey`].
 /// Tier 2 — `~/.engram/sync.key` file: base64-encoded 32 bytes, chmod 600.
 ///   The id_rsa equivalent for headless daemon operation.
-/// Tier 3 — `ENGRAM_VAULT_PASSPHRASE` env var + salt from config: the passphrase is
+/// Tier 3 — Running key agent (`engram agent start`, Unix only): the key it
+///   derived earlier, so no Argon2id run is needed.
+/// Tier 4 — `ENGRAM_VAULT_PASSPHRASE` env var + salt from config: the passphrase is
 ///   derived using Argon2id with the salt stored in the engram config file.
-/// Tier 4 — Interactive `rpassword` prompt + salt from config.
+/// Tier 5 — Interactive `rpassword` prompt + salt from config.
 ///
 /// Never panics. Returns a human-friendly `Err(String)` on failure.
 fn resolve_vault_key() -> Result<engram_core::crypto::EngramKey, String> {
@@ -343,6 +436,12 @@ fn resolve_vault_key() -> Result<engram_core::crypto::EngramKey, String> {
         }
     }
 
+    // ── Tier 3: running key agent ─────────────────────────────────────────────
+    #[cfg(unix)]
+    if let Some(key) = agent::fetch_key(&agent::socket_path()) {
+        return Ok(key);
+    }
+
     // Helper: load the 16-byte Argon2 salt from the engram config file.
     let load_salt = || -> Option<[u8; 16]> {
         let config = EngramConfig::load();
@@ -351,7 +450,7 @@ fn resolve_vault_key() -> Result<engram_core::crypto::EngramKey, String> {
         bytes.try_into().ok()
     };
 
-    // ── Tier 3: ENGRAM_VAULT_PASSPHRASE env var + config salt ─────────────────
+    // ── Tier 4: ENGRAM_VAULT_PASSPHRASE env var + config salt ─────────────────
     if let Ok(passphrase) = std::env::var("ENGRAM_VAULT_PASSPHRASE") {
         let salt =
             load_salt().ok_or_else(|| "No salt found in config. Run: engram init".to_string())?;
@@ -359,7 +458,7 @@ fn resolve_vault_key() -> Result<engram_core::crypto::EngramKey, String> {
             .map_err(|e| format!("Key derivation failed: {}", e));
     }
 
-    // ── Tier 4: interactive rpassword prompt + config salt ────────────────────
+    // ── Tier 5: interactive rpassword prompt + config salt ────────────────────
     let salt =
         load_salt().ok_or_else(|| "No salt found in config. Run: engram init".to_string())?;
     let passphrase = rpassword::prompt_password("Vault passphrase: ")
@@ -430,6 +529,46 @@ fn run_init() {
     println!("  Tip: set ENGRAM_VAULT_PASSPHRASE to avoid interactive prompts.");
 }
 
+/// Run the key agent in the foreground until its TTL expires or `engram agent stop`.
+#[cfg(unix)]
+fn run_agent_start(ttl_secs: u64) {
+    let path = agent::socket_path();
+    if agent::fetch_key(&path).is_some() {
+        eprintln!("engram: an agent is already running on {}", path.display());
+        std::process::exit(1);
+    }
+    let key = match resolve_vault_key() {
+        Ok(k) => k,
+        Err(e) => {
+            eprintln!("Cannot access vault key: {}", e);
+            eprintln!("Tip: run `engram init` to set up the vault");
+            std::process::exit(1);
+        }
+    };
+    println!(
+        "engram agent listening on {} (key held for {}s)",
+        path.display(),
+        ttl_secs
+    );
+    if let Err(e) = agent::serve(&path, key, std::time::Duration::from_secs(ttl_secs)) {
+        eprintln!("engram: agent error: {e}");
+        std::process::exit(1);
+    }
+}
+
+/// Ask the running key agent to wipe its key and exit.
+#[cfg(unix)]
+fn run_agent_stop() {
+    let path = agent::socket_path();
+    match agent::stop(&path) {
+        Ok(()) => println!("engram agent stopped"),
+        Err(e) => {
+            eprintln!("No agent stopped at {}: {}", path.display(), e);
+            std::process::exit(1);
+        }
+    }
+}
+
 fn run_mcp() {
     let store_path = default_store_path();
     let key = match resolve_vault_key() {
@@ -440,14 +579,15 @@ fn run_mcp() {
             std::process::exit(1);
         }
     };
-    let store = match MemoryStore::open(&store_path, &key) {
+    let store = match open_memory_store(&store_path, &key) {
         Ok(s) => s,
         Err(e) => {
             eprintln!("Failed to open memory store: {}", e);
             std::process::exit(1);
         }
     };
-    if let Err(e) = mcp::run_mcp_server(&store) {
+    let mut server = mcp::McpServer::new(store, key);
+    if let Err(e) = mcp::run_mcp_server(&mut server) {
         eprintln!("MCP server error: {}", e);
         std::process::exit(1);
     }
@@ -858,7 +998,6 @@ fn run_sync(backend_name: Option<&str>, vault_arg: Option<&str>, approve: bool)
     use engram_sync::{
         azure::AzureBackend,
         backend::SyncBackend,
-        encrypt::encrypt_for_sync,
         gcs::GcsBackend,
         manifest::{FileEntry, SyncManifest},
         onedrive::OneDriveBackend,
@@ -974,15 +1113,18 @@ fn run_sync(backend_name: Option<&str>, vault_arg: Option<&str>, approve: bool)
     //      → unchanged → SKIP
     //   2. content hash  (file read + SHA-256; only when size/mtime differ)
     //      → same hash  → SKIP (mtime drifted but content identical, e.g. editor save)
-    //      → different  → queue for upload
+    //      → different  → encrypt and upload
     //
     // We cannot use the remote ETag for deduplication because engram encrypts
     // with a random nonce — identical plaintext produces different ciphertext
     // on every push, so the remote-side hash is meaningless.  The manifest is
     // our "last known remote state".
+    //
+    // Step 1 runs here on the main thread.  Step 2 is CPU-bound and runs in
+    // the phase 2 pipeline, next to the uploads.
 
     let mut manifest = SyncManifest::load(&vault_name);
-    let mut to_upload: Vec<(String, engram_sync::Bytes, FileEntry)> = Vec::new();
+    let mut candidates: Vec<(String, FileEntry)> = Vec::new();
     let mut skipped_fast = 0usize; // skipped by mtime+size (no file read)
     let mut skipped_hash = 0usize; // skipped by hash (content unchanged)
     let mut errors = 0usize;
@@ -1011,108 +1153,134 @@ fn run_sync(backend_name: Option<&str>, vault_arg: Option<&str>, approve: bool)
             continue; // definitely unchanged — skip with zero file I/O
         }
 
-        // ── Slow path: read + SHA-256 ─────────────────────────────────────
-        let content = match vault.read(relative_path) {
-            Ok(c) => c,
-            Err(e) => {
-                eprintln!("  ✗ {}: {}", relative_path, e);
-                errors += 1;
-                continue;
-            }
-        };
-        let hash = SyncManifest::content_hash(content.as_bytes());
-
-        if manifest.is_hash_match(relative_path, &hash) {
-            // Content identical — mtime just drifted.  Update the fast-path
-            // fields so the next sync skips with zero reads again.
-            manifest.update_fast_path(relative_path.clone(), size, mtime_secs, mtime_nanos);
-            skipped_hash += 1;
-            continue;
-        }
-
-        // ── Content changed → encrypt and queue ───────────────────────────
-        let encrypted = match encrypt_for_sync(&key, content.as_bytes()) {
-            Ok(e) => e,
-            Err(e) => {
-                eprintln!("  ✗ {}: encryption failed — {}", relative_path, e);
-                errors += 1;
-                continue;
-            }
-        };
-        to_upload.push((
+        // The hash is filled in once the pipeline has read the file.
+        candidates.push((
             relative_path.clone(),
-            encrypted,
             FileEntry {
                 size,
                 mtime_secs,
                 mtime_nanos,
-                hash,
+                hash: String::new(),
             },
         ));
     }
 
     println!(
-        "Uploading {}/{} files via {} ({} unchanged) …",
-        to_upload.len(),
+        "Checking {}/{} files via {} ({} unchanged) …",
+        candidates.len(),
         files.len(),
         effective_backend,
-        skipped_fast + skipped_hash,
+        skipped_fast,
     );
 
-    // ── Phase 2: Parallel uploads ──────────────────────────────────────────
+    // ── Phase 2: Parallel hash, encrypt and upload ─────────────────────────
+    //
+    // Every candidate becomes one task: read + SHA-256 + seal_for_sync on
+    // tokio's blocking pool, then the push.  Two semaphores bound the
+    // pipeline:
     //
-    // All queued uploads run concurrently inside a single tokio runtime block.
-    // A semaphore caps at 8 simultaneous in-flight requests — enough to fill
-    // a TCP connection pipeline without overwhelming the remote or exhausting
-    // local sockets.  (rclone defaults to --transfers=4; 8 is safe for S3
-    // and OneDrive which both handle high concurrency well.)
+    //   cpu  one permit per core for the read/hash/encrypt step
+    //   net  8 simultaneous in-flight requests — enough to fill a TCP
+    //        connection pipeline without overwhelming the remote or
+    //        exhausting local sockets.  (rclone defaults to --transfers=4;
+    //        8 is safe for S3 and OneDrive which both handle high
+    //        concurrency well.)
+    //
+    // A file is uploaded as soon as it is sealed, so on a first sync the
+    // network is busy while the rest of the vault is still being encrypted.
     //
     // The backend Arc is required because the trait object must be shared
     // across spawn()ed tasks.  SyncBackend is already Send+Sync.
 
+    enum Checked {
+        /// Same hash as the manifest; only the mtime drifted.
+        Unchanged(FileEntry),
+        Pushed(FileEntry),
+        Failed(String),
+    }
+
     let runtime = tokio::runtime::Runtime::new().unwrap();
     let mut success = 0usize;
 
-    if !to_upload.is_empty() {
+    if !candidates.is_empty() {
         use std::sync::Arc;
         use tokio::sync::Semaphore;
         use tokio::task::JoinSet;
 
-        // spawn() requires an active tokio context, so the entire upload
-        // phase — spawning tasks AND collecting results — must live inside
-        // a single block_on() call.  We collect outcomes into a Vec and
-        // apply them to the manifest afterwards (manifest is !Send).
-        let outcomes: Vec<(String, FileEntry, Result<(), engram_sync::SyncError>)> = runtime
-            .block_on(async {
-                let backend: Arc<dyn SyncBackend> = Arc::from(backend);
-                let sem = Arc::new(Semaphore::new(8));
-                let mut join_set: JoinSet<(String, FileEntry, Result<(), engram_sync::SyncError>)> =
-                    JoinSet::new();
-
-                for (path, data, entry) in to_upload {
-                    let backend = Arc::clone(&backend);
-                    let sem = Arc::clone(&sem);
-                    join_set.spawn(async move {
-                        let _permit = sem.acquire().await.expect("semaphore closed");
-                        let result = backend.push(&path, data).await;
-                        (path, entry, result)
-                    });
-                }
+        // spawn() requires an active tokio context, so the entire pipeline —
+        // spawning tasks AND collecting results — must live inside a single
+        // block_on() call.  We collect outcomes into a Vec and apply them to
+        // the manifest afterwards; the tasks only see the hashes they need.
+        let outcomes: Vec<(String, Checked)> = runtime.block_on(async {
+            let backend: Arc<dyn SyncBackend> = Arc::from(backend);
+            let vault = Arc::new(vault);
+            let key = Arc::new(key);
+            let cores = std::thread::available_parallelism()
+                .map(|n| n.get())
+                .unwrap_or(1);
+            let cpu = Arc::new(Semaphore::new(cores));
+            let net = Arc::new(Semaphore::new(8));
+            let mut join_set: JoinSet<(String, Checked)> = JoinSet::new();
+
+            for (path, mut entry) in candidates {
+                let known_hash = manifest.files.get(&path).map(|e| e.hash.clone());
+                let backend = Arc::clone(&backend);
+                let vault = Arc::clone(&vault);
+                let key = Arc::clone(&key);
+                let cpu = Arc::clone(&cpu);
+                let net = Arc::clone(&net);
+                join_set.spawn(async move {
+                    let sealed = {
+                        let _permit = cpu.acquire().await.expect("semaphore closed");
+                        let path = path.clone();
+                        tokio::task::spawn_blocking(move || {
+                            seal_changed_file(&vault, &key, &path, known_hash.as_deref())
+                        })
+                        .await
+                        .unwrap_or_else(|e| Err(e.to_string()))
+                    };
+                    let (hash, data) = match sealed {
+                        Ok(sealed) => sealed,
+                        Err(e) => return (path, Checked::Failed(e)),
+                    };
+                    entry.hash = hash;
+                    let Some(data) = data else {
+                        return (path, Checked::Unchanged(entry));
+                    };
 
-                let mut results = Vec::new();
-                while let Some(res) = join_set.join_next().await {
-                    results.push(res);
-                }
-                results.into_iter().filter_map(|r| r.ok()).collect()
-            });
+                    let _permit = net.acquire().await.expect("semaphore closed");
+                    match backend.push(&path, data).await {
+                        Ok(()) => (path, Checked::Pushed(entry)),
+                        Err(e) => (path, Checked::Failed(e.to_string())),
+                    }
+                });
+            }
 
-        for (path, entry, result) in outcomes {
-            match result {
-                Ok(()) => {
+            let mut results = Vec::new();
+            while let Some(res) = join_set.join_next().await {
+                results.push(res);
+            }
+            results.into_iter().filter_map(|r| r.ok()).collect()
+        });
+
+        for (path, checked) in outcomes {
+            match checked {
+                Checked::Unchanged(entry) => {
+                    // Content identical — mtime just drifted.  Update the
+                    // fast-path fields so the next sync skips with zero reads.
+                    manifest.update_fast_path(
+                        path,
+                        entry.size,
+                        entry.mtime_secs,
+                        entry.mtime_nanos,
+                    );
+                    skipped_hash += 1;
+                }
+                Checked::Pushed(entry) => {
                     manifest.mark_synced(path, entry);
                     success += 1;
                 }
-                Err(e) => {
+                Checked::Failed(e) => {
                     eprintln!("  ✗ {}: {}", path, e);
                     errors += 1;
                 }
@@ -1135,6 +1303,26 @@ fn run_sync(backend_name: Option<&str>, vault_arg: Option<&str>, approve: bool)
     }
 }
 
+/// Read, hash and encrypt one vault file for `run_sync`.
+///
+/// Returns the plaintext SHA-256 together with the sealed blob, or with
+/// `None` when the hash equals `known_hash` and there is nothing to upload.
+fn seal_changed_file(
+    vault: &Vault,
+    key: &engram_core::crypto::EngramKey,
+    relative_path: &str,
+    known_hash: Option<&str>,
+) -> Result<(String, Option<engram_sync::Bytes>), String> {
+    let content = vault.read(relative_path).map_err(|e| e.to_string())?;
+    let hash = engram_sync::manifest::SyncManifest::content_hash(content.as_bytes());
+    if known_hash == Some(hash.as_str()) {
+        return Ok((hash, None));
+    }
+    let sealed = engram_sync::encrypt::seal_for_sync(key, content.into_bytes())
+        .map_err(|e| format!("encryption failed — {}", e))?;
+    Ok((hash, Some(sealed)))
+}
+
 /// Returns the per-vault storage directory: `~/.engram/<vault_name>/`.
 ///
 /// This directory is used to store vault-specific files such as the memory
@@ -1245,6 +1433,14 @@ fn default_store_path() -> PathBuf {
     default_store_path_from_config(&EngramConfig::load())
 }
 
+/// Open the memory store at `path` with the `[store]` profile from the config file.
+fn open_memory_store(
+    path: &Path,
+    key: &engram_core::crypto::EngramKey,
+) -> Result<MemoryStore, engram_core::store::StoreError> {
+    MemoryStore::open_with(path, key, &StoreOptions::from_config(&EngramConfig::load()))
+}
+
 /// Returns the default search index path: `~/.engram/search`.
 #[allow(dead_code)]
 fn default_search_dir() -> PathBuf {
@@ -1261,6 +1457,49 @@ fn default_vectors_path() -> PathBuf {
         .unwrap_or_else(|| PathBuf::from(".engram/vectors.db"))
 }
 
+/// Returns the embedding cache path shared by every vault: `~/.engram/embeddings.db`.
+fn embedding_cache_path() -> PathBuf {
+    UserDirs::new()
+        .map(|u| u.home_dir().join(".engram/embeddings.db"))
+        .unwrap_or_else(|| PathBuf::from(".engram/embeddings.db"))
+}
+
+/// Open the shared embedding cache, bounded by `[search] embed_cache_entries`.
+///
+/// The cache only saves work, so a cache that fails to open is reported and skipped.
+fn open_embedding_cache(config: &EngramConfig) -> Option<EmbeddingCache> {
+    let max_entries = config
+        .search
+        .embed_cache_entries
+        .unwrap_or(DEFAULT_CACHE_ENTRIES);
+    match EmbeddingCache::open(&embedding_cache_path(), max_entries) {
+        Ok(cache) => Some(cache),
+        Err(e) => {
+            eprintln!("  ! Embedding cache unavailable: {}", e);
+            None
+        }
+    }
+}
+
+/// Load the embedding model, backed by the shared embedding cache when it opens.
+fn load_embedder(config: &EngramConfig) -> Result<Embedder, engram_search::SearchError> {
+    let embedder = Embedder::new()?;
+    Ok(match open_embedding_cache(config) {
+        Some(cache) => embedder.with_cache(cache),
+        None => embedder,
+    })
+}
+
+/// Return `embedder`, loading the model on first use.
+fn loaded_embedder(
+    embedder: &mut Option<Embedder>,
+) -> Result<&Embedder, engram_search::SearchError> {
+    if embedder.is_none() {
+        *embedder = Some(Embedder::new()?);
+    }
+    Ok(embedder.as_ref().unwrap())
+}
+
 /// Resolve the vault name for auth commands.
 ///
 /// - If `vault_arg` is non-empty, return it directly.
@@ -1323,9 +1562,11 @@ fn dir_size_bytes(path: &Path) -> u64 {
 
 /// Index vault markdown files for full-text search with content-hash deduplication,
 /// and embed all files into the sqlite-vec vector store.
-fn run_index(vault_arg: Option<&str>, force: bool) {
-    use engram_search::embedder::Embedder;
+fn run_index(vault_arg: Option<&str>, force: bool, options: EmbedOptions) {
+    use engram_search::embedder::MODEL_ID;
+    use engram_search::pipeline::embed_files;
     use engram_search::vector::VectorIndex;
+    use std::io::{self, Write};
 
     // Determine the vault name for per-vault storage directories.
     let vault_name = resolve_vault_name(vault_arg);
@@ -1377,25 +1618,13 @@ fn run_index(vault_arg: Option<&str>, force: bool) {
     };
 
     // Vector embedding pass ────────────────────────────────────────────────
-    // The vector store has no content-hash deduplication, so we always delete
-    // and rebuild it to avoid accumulating duplicate vectors across runs.
-    if vectors_path.exists() {
-        if let Err(e) = std::fs::remove_file(&vectors_path) {
-            eprintln!("Failed to clear vector store: {}", e);
-            std::process::exit(1);
-        }
-    }
-
-    println!("Loading embedding model (first run downloads ~90MB)...");
-
-    let embedder = match Embedder::new() {
-        Ok(e) => e,
-        Err(e) => {
-            eprintln!("Failed to load embedding model: {}", e);
-            std::process::exit(1);
-        }
-    };
-
+    // The vector store records a content hash per path, so only new or edited
+    // files are embedded, and vectors of files no longer in the vault are
+    // pruned.  Each file is split on headings into chunks that fit the model's
+    // input window and gets one vector per chunk.  Reader threads prepare the
+    // files while this thread embeds their chunks in batches.  Chunks already
+    // in the shared embedding cache (from another vault, or from before a
+    // --force) are not re-embedded; the model is loaded only on a cache miss.
     let vector_index = match VectorIndex::open(&vectors_path) {
         Ok(v) => v,
         Err(e) => {
@@ -1412,31 +1641,66 @@ fn run_index(vault_arg: Option<&str>, force: bool) {
         }
     };
 
-    let mut vectors_indexed = 0usize;
-
-    for rel_path in &files {
-        let content = match vault.read(rel_path) {
-            Ok(c) => c,
+    let mut cache = open_embedding_cache(&EngramConfig::load());
+    let mut embedder: Option<Embedder> = None;
+    let mut run_model = |texts: &[&str]| {
+        if embedder.is_none() {
+            println!("Loading embedding model (first run downloads ~90MB)...");
+        }
+        match loaded_embedder(&mut embedder) {
+            Ok(model) => model.run_model(texts),
             Err(e) => {
-                eprintln!("  \u{2717} {}: read failed \u{2014} {}", rel_path, e);
-                continue;
+                eprintln!("Failed to load embedding model: {}", e);
+                std::process::exit(1);
             }
-        };
-        let embedding = match embedder.embed(&content) {
-            Ok(v) => v,
-            Err(e) => {
-                eprintln!("  \u{2717} {}: embed failed \u{2014} {}", rel_path, e);
-                continue;
+        }
+    };
+    let vector_stats = embed_files(
+        &vault,
+        &files,
+        &vector_index,
+        options,
+        |texts| match cache.as_mut() {
+            Some(cache) => cache.embed_batch_with(MODEL_ID, texts, &mut run_model),
+            None => run_model(texts),
+        },
+        |progress| {
+            if progress.embedded > 0 {
+                print!(
+                    "\r  {} files embedded ({:.0} files/s)",
+                    progress.embedded,
+                    progress.files_per_sec()
+                );
+                let _ = io::stdout().flush();
             }
-        };
-        if let Err(e) = vector_index.insert(rel_path, &embedding) {
-            eprintln!(
-                "  \u{2717} {}: vector insert failed \u{2014} {}",
-                rel_path, e
-            );
-        } else {
-            vectors_indexed += 1;
+        },
+    );
+    let vector_stats = match vector_stats {
+        Ok(s) => s,
+        Err(e) => {
+            eprintln!("\nVector indexing failed: {}", e);
+            std::process::exit(1);
         }
+    };
+    if vector_stats.embedded > 0 {
+        println!();
+    }
+    for (path, reason) in &vector_stats.failures {
+        eprintln!("  \u{2717} {}: {}", path, reason);
+    }
+
+    let live: std::collections::HashSet<&str> = files.iter().map(String::as_str).collect();
+    let mut vectors_pruned = 0usize;
+    match vector_index.indexed_paths() {
+        Ok(paths) => {
+            for path in paths.iter().filter(|p| !live.contains(p.as_str())) {
+                match vector_index.remove(path) {
+                    Ok(()) => vectors_pruned += 1,
+                    Err(e) => eprintln!("  \u{2717} {}: vector prune failed \u{2014} {}", path, e),
+                }
+            }
+        }
+        Err(e) => eprintln!("Failed to list indexed vectors: {}", e),
     }
 
     let index_size_mb = dir_size_bytes(&search_dir) as f64 / 1_048_576.0;
@@ -1445,7 +1709,14 @@ fn run_index(vault_arg: Option<&str>, force: bool) {
     println!("Indexed:    {}", stats.indexed);
     println!("Skipped:    {}", stats.skipped);
     println!("Total:      {}", stats.total);
-    println!("Vectors:    {}", vectors_indexed);
+    println!(
+        "Vectors:    {} embedded, {} unchanged, {} pruned ({} chunks, {:.0} files/s)",
+        vector_stats.embedded,
+        vector_stats.unchanged,
+        vectors_pruned,
+        vector_stats.chunks,
+        vector_stats.files_per_sec()
+    );
     println!(
         "Index path: {} ({:.2} MB)",
         search_dir.display(),
@@ -1453,131 +1724,226 @@ fn run_index(vault_arg: Option<&str>, force: bool) {
     );
 }
 
+/// Resolve `engram index` embedding options: CLI flags, then `[search]` config, then defaults.
+fn embed_options(
+    config: &EngramConfig,
+    batch_size: Option<usize>,
+    threads: Option<usize>,
+) -> EmbedOptions {
+    let defaults = EmbedOptions::default();
+    EmbedOptions {
+        batch_size: batch_size
+            .or(config.search.embed_batch_size)
+            .unwrap_or(defaults.batch_size),
+        threads: threads
+            .or(config.search.embed_threads)
+            .unwrap_or(defaults.threads),
+    }
+}
+
 /// Search the indexed vault using the specified mode.
 fn run_search(query: &str, vault_arg: Option<&str>, limit: usize, mode: &SearchMode) {
-    use engram_search::embedder::Embedder;
-    use engram_search::hybrid::HybridSearch;
-    use engram_search::vector::VectorIndex;
-
-    // Determine the vault name for per-vault storage directories.
-    let vault_name = resolve_vault_name(vault_arg);
-
-    let search_dir = vault_storage_dir(&vault_name).join("search");
-
-    // Check search index exists.
-    if !search_dir.join("meta.json").exists() {
-        eprintln!("Search index not found. Run: engram index");
-        std::process::exit(1);
+    match search_report(query, vault_arg, limit, mode) {
+        Ok(report) => print!("{}", report),
+        Err(e) => {
+            eprintln!("{}", e);
+            std::process::exit(1);
+        }
     }
+}
 
-    let indexer = match TantivyIndexer::open(&search_dir) {
-        Ok(i) => i,
+/// `engram search --facts`: full-text search over the facts in the memory store.
+fn run_search_facts(query: &str, limit: usize) {
+    let store_path = default_store_path();
+    let key = match resolve_vault_key() {
+        Ok(k) => k,
         Err(e) => {
-            eprintln!("Failed to open search index: {}", e);
+            eprintln!("Cannot access vault key: {}", e);
+            eprintln!("Tip: run `engram init` to set up the vault");
             std::process::exit(1);
         }
     };
-
-    let results: Vec<SearchResult> = match mode {
-        SearchMode::Fulltext => match indexer.search(query, limit) {
-            Ok(r) => r,
-            Err(e) => {
-                eprintln!("Full-text search failed: {}", e);
-                std::process::exit(1);
-            }
-        },
-
-        SearchMode::Vector => {
-            let vectors_path = vault_storage_dir(&vault_name).join("vectors.db");
-            let vector_index = match VectorIndex::open(&vectors_path) {
-                Ok(v) => v,
-                Err(e) => {
-                    eprintln!("Failed to open vector index: {}", e);
-                    std::process::exit(1);
-                }
-            };
-            let embedder = match Embedder::new() {
-                Ok(e) => e,
-                Err(e) => {
-                    eprintln!("Failed to load embedder: {}", e);
-                    std::process::exit(1);
-                }
-            };
-            let embedding = match embedder.embed(query) {
-                Ok(v) => v,
-                Err(e) => {
-                    eprintln!("Failed to embed query: {}", e);
-                    std::process::exit(1);
-                }
-            };
-            let knn = match vector_index.knn_search(&embedding, limit) {
-                Ok(r) => r,
-                Err(e) => {
-                    eprintln!("Vector search failed: {}", e);
-                    std::process::exit(1);
-                }
-            };
-            knn.into_iter()
-                .map(|(path, dist)| SearchResult {
-                    path,
-                    snippet: String::new(),
-                    score: 1.0 - dist,
-                    source: SearchSource::Vector,
-                })
-                .collect()
-        }
-
-        SearchMode::Hybrid => {
-            let vectors_path = vault_storage_dir(&vault_name).join("vectors.db");
-            let vector_index = match VectorIndex::open(&vectors_path) {
-                Ok(v) => v,
-                Err(e) => {
-                    eprintln!("Failed to open vector index: {}", e);
-                    std::process::exit(1);
-                }
-            };
-            let embedder = match Embedder::new() {
-                Ok(e) => e,
-                Err(e) => {
-                    eprintln!("Failed to load embedder: {}", e);
-                    std::process::exit(1);
-                }
-            };
-            let hybrid = HybridSearch::new(indexer, vector_index, embedder);
-            match hybrid.search(query, limit) {
-                Ok(r) => r,
-                Err(e) => {
-                    eprintln!("Hybrid search failed: {}", e);
-                    std::process::exit(1);
-                }
-            }
+    let store = match open_memory_store(&store_path, &key) {
+        Ok(s) => s,
+        Err(e) => {
+            eprintln!("Failed to open memory store: {}", e);
+            std::process::exit(1);
         }
     };
+    match facts_report(&store, query, limit) {
+        Ok(report) => println!("{}", report),
+        Err(e) => {
+            eprintln!("{}", e);
+            std::process::exit(1);
+        }
+    }
+}
 
-    // Print results header.
-    let mode_label = match mode {
-        SearchMode::Fulltext => "fulltext",
-        SearchMode::Vector => "vector",
-        SearchMode::Hybrid => "hybrid",
-    };
-    println!(
-        "Results for \"{}\" [{}] — {} found",
-        query,
-        mode_label,
-        results.len()
-    );
-    println!("{}", "─".repeat(49));
-
+/// Return the facts in `store` matching `query`, best first, one
+/// `entity: attribute = value` line each.
+///
+/// This is what `engram search --facts` prints and the MCP `memory_search`
+/// tool returns.
+fn facts_report(store: &MemoryStore, query: &str, limit: usize) -> Result<String, String> {
+    let results = store
+        .search(query, limit)
+        .map_err(|e| format!("store error: {}", e))?;
     if results.is_empty() {
-        println!("No results found.");
-        return;
+        return Ok("No results found.".to_string());
     }
+    Ok(results
+        .iter()
+        .map(|m| format!("{}: {} = {}", m.entity, m.attribute, m.value))
+        .collect::<Vec<_>>()
+        .join("\n"))
+}
 
-    for result in results {
-        println!("{} (score: {:.2})", result.path, result.score);
-        if !result.snippet.is_empty() {
-            println!("  {}", result.snippet);
+/// Run a vault search and return the report `engram search` prints.
+///
+/// `Err` carries the message `engram search` exits with. Opens the indices and
+/// loads the model for this one query; `engram mcp` keeps a [`SearchSession`] instead.
+fn search_report(
+    query: &str,
+    vault_arg: Option<&str>,
+    limit: usize,
+    mode: &SearchMode,
+) -> Result<String, String> {
+    SearchSession::default().report(query, vault_arg, limit, mode)
+}
+
+/// Search state reused across queries: each vault's indices and one embedder.
+///
+/// `engram mcp` keeps one for its lifetime, so only its first search pays for
+/// opening the indices and loading the model. A vault's indices are reopened
+/// when its `search/meta.json` changes, i.e. after `engram index` commits.
+#[derive(Default)]
+struct SearchSession {
+    vaults: HashMap<String, VaultIndices>,
+    embedder: Option<Embedder>,
+}
+
+/// One vault's open indices, as of the `meta.json` modification time in `stamp`.
+struct VaultIndices {
+    indexer: TantivyIndexer,
+    vectors: Option<engram_search::vector::VectorIndex>,
+    stamp: Option<std::time::SystemTime>,
+}
+
+impl SearchSession {
+    /// Search `vault_arg` (the default vault if `None`) and return the report
+    /// `engram search` prints; see [`search_report`].
+    fn report(
+        &mut self,
+        query: &str,
+        vault_arg: Option<&str>,
+        limit: usize,
+        mode: &SearchMode,
+    ) -> Result<String, String> {
+        use engram_search::hybrid::fuse;
+        use engram_search::vector::VectorIndex;
+        use std::fmt::Write;
+
+        // Determine the vault name for per-vault storage directories.
+        let vault_name = resolve_vault_name(vault_arg);
+        let storage_dir = vault_storage_dir(&vault_name);
+        let search_dir = storage_dir.join("search");
+
+        // Check search index exists.
+        let stamp = match std::fs::metadata(search_dir.join("meta.json")) {
+            Ok(meta) => meta.modified().ok(),
+            Err(_) => return Err("Search index not found. Run: engram index".to_string()),
+        };
+
+        let current = self.vaults.get(&vault_name).map(|v| v.stamp);
+        if current != Some(stamp) {
+            let indexer = TantivyIndexer::open(&search_dir)
+                .map_err(|e| format!("Failed to open search index: {}", e))?;
+            self.vaults.insert(
+                vault_name.clone(),
+                VaultIndices {
+                    indexer,
+                    vectors: None,
+                    stamp,
+                },
+            );
+        }
+        let indices = self.vaults.get_mut(&vault_name).unwrap();
+
+        let results: Vec<SearchResult> = if let SearchMode::Fulltext = mode {
+            indices
+                .indexer
+                .search(query, limit)
+                .map_err(|e| format!("Full-text search failed: {}", e))?
+        } else {
+            if indices.vectors.is_none() {
+                let vectors = VectorIndex::open(&storage_dir.join("vectors.db"))
+                    .map_err(|e| format!("Failed to open vector index: {}", e))?;
+                indices.vectors = Some(vectors);
+            }
+            let vector_index = indices.vectors.as_ref().unwrap();
+            if self.embedder.is_none() {
+                let embedder = load_embedder(&EngramConfig::load())
+                    .map_err(|e| format!("Failed to load embedder: {}", e))?;
+                self.embedder = Some(embedder);
+            }
+            let embedder = self.embedder.as_ref().unwrap();
+
+            if let SearchMode::Vector = mode {
+                let embedding = embedder
+                    .embed(query)
+                    .map_err(|e| format!("Failed to embed query: {}", e))?;
+                let knn = vector_index
+                    .knn_search(&embedding, limit)
+                    .map_err(|e| format!("Vector search failed: {}", e))?;
+                knn.into_iter()
+                    .map(|hit| SearchResult {
+                        path: hit.path,
+                        snippet: hit.snippet,
+                        score: 1.0 - hit.distance,
+                        source: SearchSource::Vector,
+                    })
+                    .collect()
+            } else {
+                // Same candidate pool and fusion as `HybridSearch::search`.
+                let candidate_pool = limit * 3;
+                let hybrid = || -> Result<_, engram_search::SearchError> {
+                    let ft_results = indices.indexer.search(query, candidate_pool)?;
+                    let embedding = embedder.embed(query)?;
+                    let vec_results = vector_index.knn_search(&embedding, candidate_pool)?;
+                    Ok(fuse(ft_results, vec_results, limit))
+                };
+                hybrid().map_err(|e| format!("Hybrid search failed: {}", e))?
+            }
+        };
+
+        // Results header.
+        let mode_label = match mode {
+            SearchMode::Fulltext => "fulltext",
+            SearchMode::Vector => "vector",
+            SearchMode::Hybrid => "hybrid",
+        };
+        let mut report = String::new();
+        let _ = writeln!(
+            report,
+            "Results for \"{}\" [{}] — {} found",
+            query,
+            mode_label,
+            results.len()
+        );
+        let _ = writeln!(report, "{}", "─".repeat(49));
+
+        if results.is_empty() {
+            let _ = writeln!(report, "No results found.");
+            return Ok(report);
         }
+
+        for result in results {
+            let _ = writeln!(report, "{} (score: {:.2})", result.path, result.score);
+            if !result.snippet.is_empty() {
+                let _ = writeln!(report, "  {}", result.snippet);
+            }
+        }
+        Ok(report)
     }
 }
 
@@ -1592,23 +1958,154 @@ fn run_load(format: &str) {
             std::process::exit(1);
         }
     };
-    let store = match MemoryStore::open(&store_path, &key) {
+    let store = match open_memory_store(&store_path, &key) {
         Ok(s) => s,
         Err(e) => {
             eprintln!("Failed to open memory store: {}", e);
             std::process::exit(1);
         }
     };
+    match load_report(&store, format) {
+        Ok(output) => print!("{}", output),
+        Err(e) => {
+            eprintln!("{}", e);
+            std::process::exit(1);
+        }
+    }
+}
+
+/// Return what `engram load --format=<format>` prints for `store`.
+///
+/// `Err` carries the message `engram load` exits with; the MCP `engram_load` tool
+/// returns the same text.
+fn load_report(store: &MemoryStore, format: &str) -> Result<String, String> {
     match format {
-        "context" => match load::load_context(&store) {
-            Ok(output) => print!("{}", output),
+        "context" => load::load_context(store).map_err(|e| format!("Error: {}", e)),
+        other => Err(format!("Unknown format: {}. Valid formats: context", other)),
+    }
+}
+
+/// `engram store export`: stream the memory store to `output` (stdout if `None` or `-`) as JSONL.
+fn run_store_export(output: Option<&Path>, gzip: bool) {
+    let store = open_store_for_transfer(StoreOptions::from_config(&EngramConfig::load()));
+    let output = output.filter(|p| *p != Path::new("-"));
+    let out: Box<dyn std::io::Write> = match output {
+        Some(path) => match std::fs::File::create(path) {
+            Ok(f) => Box::new(f),
             Err(e) => {
-                eprintln!("Error: {}", e);
+                eprintln!("Cannot create {}: {}", path.display(), e);
                 std::process::exit(1);
             }
         },
-        other => {
-            eprintln!("Unknown format: {}. Valid formats: context", other);
+        None => Box::new(std::io::stdout().lock()),
+    };
+    let gzip = gzip || output.is_some_and(|p| p.extension().is_some_and(|ext| ext == "gz"));
+    let progress = |n: u64| eprint!("\rExported {} memories", n);
+
+    let result = if gzip {
+        let mut encoder = GzEncoder::new(out, Compression::default());
+        match transfer::export_jsonl(&store, &mut encoder, transfer::DEFAULT_BATCH, progress) {
+            Ok(n) => encoder.finish().map(|_| n).map_err(Into::into),
+            Err(e) => Err(e),
+        }
+    } else {
+        transfer::export_jsonl(&store, out, transfer::DEFAULT_BATCH, progress)
+    };
+    eprintln!();
+    if let Err(e) = result {
+        eprintln!("Export failed: {}", e);
+        std::process::exit(1);
+    }
+}
+
+/// `engram store import`: load a JSONL export from `input` (`-` for stdin) into the memory store.
+///
+/// The store is opened with the bulk-ingest profile regardless of the config.
+fn run_store_import(input: &Path, batch: usize) {
+    let options = StoreOptions {
+        profile: StoreProfile::BulkIngest,
+        ..StoreOptions::from_config(&EngramConfig::load())
+    };
+    let store = open_store_for_transfer(options);
+    let reader: Box<dyn std::io::Read> = if input == Path::new("-") {
+        Box::new(std::io::stdin().lock())
+    } else {
+        match std::fs::File::open(input) {
+            Ok(f) => Box::new(f),
+            Err(e) => {
+                eprintln!("Cannot open {}: {}", input.display(), e);
+                std::process::exit(1);
+            }
+        }
+    };
+
+    let result = transfer::import_jsonl(&store, reader, batch, |stats| {
+        eprint!(
+            "\rImported {} memories ({} new, {} merged, {} already present, {} failed)",
+            stats.read, stats.inserted, stats.merged, stats.skipped, stats.failed
+        )
+    });
+    eprintln!();
+    match result {
+        Ok(stats) if stats.failed > 0 => {
+            eprintln!("{} memories were rejected by the store", stats.failed);
+            std::process::exit(1);
+        }
+        Ok(_) => {}
+        Err(e) => {
+            eprintln!("Import failed: {}", e);
+            std::process::exit(1);
+        }
+    }
+}
+
+/// `engram store compact`: run the retention and maintenance job once.
+fn run_store_compact() {
+    let config = EngramConfig::load();
+    let store = open_store_for_transfer(StoreOptions::from_config(&config));
+    match store.compact(&config.store.retention) {
+        Ok(report) => println!(
+            "Archived {} cold facts, purged {} expired, freed {} pages",
+            report.archived, report.purged, report.pages_freed
+        ),
+        Err(e) => {
+            eprintln!("Compaction failed: {}", e);
+            std::process::exit(1);
+        }
+    }
+}
+
+/// One background compaction for the daemon; failures are logged, not fatal.
+fn compact_store_in_background(config: &EngramConfig) {
+    let result = resolve_vault_key().and_then(|key| {
+        let options = StoreOptions::from_config(config);
+        MemoryStore::open_with(&default_store_path_from_config(config), &key, &options)
+            .and_then(|store| store.compact(&config.store.retention))
+            .map_err(|e| e.to_string())
+    });
+    match result {
+        Ok(report) => println!(
+            "  store compacted: {} archived, {} purged, {} pages freed",
+            report.archived, report.purged, report.pages_freed
+        ),
+        Err(e) => eprintln!("  store compaction error: {e}"),
+    }
+}
+
+/// Resolve the vault key and open the default memory store with `options`, exiting on failure.
+fn open_store_for_transfer(options: StoreOptions) -> MemoryStore {
+    let key = match resolve_vault_key() {
+        Ok(k) => k,
+        Err(e) => {
+            eprintln!("Cannot access vault key: {}", e);
+            eprintln!("Tip: run `engram init` to set up the vault");
+            std::process::exit(1);
+        }
+    };
+    match MemoryStore::open_with(&default_store_path(), &key, &options) {
+        Ok(s) => s,
+        Err(e) => {
+            eprintln!("Failed to open memory store: {}", e);
             std::process::exit(1);
         }
     }
@@ -1670,7 +2167,7 @@ fn run_observe(session_path: &Path, api_key: Option<&str>) {
 
     // Open (or create) the memory store.
     let store_path = default_store_path();
-    let store = match MemoryStore::open(&store_path, &key) {
+    let store = match open_memory_store(&store_path, &key) {
         Ok(s) => s,
         Err(e) => {
             eprintln!("Failed to open memory store: {}", e);
@@ -1727,6 +2224,7 @@ fn search_index_status(search_dir: &Path) -> String {
 /// Vaults with `sync_mode = Auto` also get:
 ///   (a) a debounced upload trigger on local change (10-second quiet period)
 ///   (b) a periodic pull loop every 5 minutes
+/// The memory store is compacted every `[store.retention] interval_hours` (see `engram store compact`).
 fn run_daemon() -> Result<(), Box<dyn std::error::Error>> {
     use crate::daemon::{watch_vault, VaultEvent};
     use std::sync::mpsc;
@@ -1802,6 +2300,26 @@ fn run_daemon() -> Result<(), Box<dyn std::error::Error>> {
         }
     });
 
+    // Compaction loop: archives cold facts and reclaims space every
+    // `[store.retention] interval_hours` (0 disables it), in 1-second ticks.
+    let compact_ticks = u64::from(config.store.retention.interval_hours) * 3600;
+    let config_for_compact = config.clone();
+    let running_for_compact = running.clone();
+    let compact_handle = std::thread::spawn(move || {
+        if compact_ticks == 0 || !default_store_path_from_config(&config_for_compact).exists() {
+            return;
+        }
+        let mut ticks = 0;
+        while running_for_compact.load(std::sync::atomic::Ordering::SeqCst) {
+            std::thread::sleep(std::time::Duration::from_secs(1));
+            ticks += 1;
+            if ticks >= compact_ticks {
+                ticks = 0;
+                compact_store_in_background(&config_for_compact);
+            }
+        }
+    });
+
     // Debounce map: vault_name → last event time, used for SyncMode::Auto upload trigger.
     // The runtime is created once here and reused for every debounce flush — creating a
     // fresh Runtime inside the `for name in ready` loop would spin up a new thread pool
@@ -1811,6 +2329,10 @@ fn run_daemon() -> Result<(), Box<dyn std::error::Error>> {
         std::collections::HashMap::new();
     let sync_debounce = std::time::Duration::from_secs(10);
 
+    // Embedding model for incremental vector updates, loaded on the first change
+    // to a vault with a vector store and kept for the life of the daemon.
+    let mut embedder: Option<Embedder> = None;
+
     // Event loop
     while running.load(std::sync::atomic::Ordering::SeqCst) {
         match rx.recv_timeout(std::time::Duration::from_secs(1)) {
@@ -1821,7 +2343,7 @@ fn run_daemon() -> Result<(), Box<dyn std::error::Error>> {
                     eprintln!("  [{}] changed: {}", event.vault_name, event.path.display());
                     // Incremental search index update
                     if let Some(vault) = config.vaults.get(&event.vault_name) {
-                        if let Err(e) = index_single_file(&vault.path, &event.path, &event.vault_name) {
+                        if let Err(e) = index_single_file(&vault.path, &event.path, &event.vault_name, &config, &mut embedder) {
                             eprintln!("  index error for {}: {e}", event.path.display());
                         }
                     }
@@ -1857,6 +2379,7 @@ fn run_daemon() -> Result<(), Box<dyn std::error::Error>> {
 
     println!("engram daemon stopped.");
     pull_handle.join().ok(); // wait for the pull loop to finish any in-progress sync
+    compact_handle.join().ok();
     Ok(())
 }
 
@@ -1958,14 +2481,20 @@ async fn trigger_bisync(
     Ok(())
 }
 
-/// Index a single vault file incrementally in the Tantivy search index.
+/// Index a single vault file incrementally in the Tantivy search index and,
+/// when the vault has one, the vector store.
 /// Called by the daemon when a *.md file changes. Skips silently if no
 /// search index exists yet (user hasn't run `engram index`).
 fn index_single_file(
     vault_path: &std::path::Path,
     file_path: &std::path::Path,
     vault_name: &str,
+    config: &EngramConfig,
+    embedder: &mut Option<Embedder>,
 ) -> Result<(), Box<dyn std::error::Error>> {
+    use engram_search::chunker::{chunk_markdown, DEFAULT_CHUNK_TOKENS};
+    use engram_search::vector::VectorIndex;
+
     let search_dir = vault_storage_dir(vault_name).join("search");
     // Only index if a search index already exists (meta.json present); don't
     // create one on-the-fly. Checking meta.json is more precise than checking
@@ -1982,6 +2511,26 @@ fn index_single_file(
         .unwrap_or_else(|_| file_path.to_string_lossy().into_owned());
     let mut indexer = TantivyIndexer::open(&search_dir)?;
     indexer.index_file(&rel, &content)?;
+
+    // Re-embed the file's chunks through the shared embedding cache, so chunks
+    // the edit left untouched are not run through the model again.
+    let vectors_path = vault_storage_dir(vault_name).join("vectors.db");
+    if !vectors_path.exists() {
+        return Ok(());
+    }
+    let vectors = VectorIndex::open(&vectors_path)?;
+    let hash = TantivyIndexer::content_hash(&content);
+    if !vectors.needs_reindex(&rel, &hash)? {
+        return Ok(());
+    }
+    if embedder.is_none() {
+        *embedder = Some(load_embedder(config)?);
+    }
+    let chunks = chunk_markdown(&content, DEFAULT_CHUNK_TOKENS);
+    let texts: Vec<&str> = chunks.iter().map(|c| c.text).collect();
+    let embeddings = embedder.as_ref().unwrap().embed_batch(&texts)?;
+    let chunk_vectors: Vec<_> = chunks.into_iter().zip(embeddings).collect();
+    vectors.upsert(&rel, &hash, &chunk_vectors)?;
     Ok(())
 }
 
@@ -2051,6 +2600,8 @@ fn doctor_key_method(config: &EngramConfig) -> String {
             "sync.key file ({}) \u{2713}",
             EngramConfig::sync_key_path().display()
         )
+    } else if let Some(socket) = running_agent_socket() {
+        format!("key agent ({}) \u{2713}", socket.display())
     } else if std::env::var("ENGRAM_VAULT_PASSPHRASE").is_ok() {
         "ENGRAM_VAULT_PASSPHRASE env var \u{2713}".to_string()
     } else if config.key.salt.is_some() {
@@ -2060,6 +2611,18 @@ fn doctor_key_method(config: &EngramConfig) -> String {
     }
 }
 
+/// Return the agent socket path if a key agent is currently serving the key.
+fn running_agent_socket() -> Option<PathBuf> {
+    #[cfg(unix)]
+    {
+        let path = agent::socket_path();
+        if agent::fetch_key(&path).is_some() {
+            return Some(path);
+        }
+    }
+    None
+}
+
 /// Print diagnostic information about the engram installation.
 fn daemon_service_status() -> String {
     #[cfg(target_os = "macos")]
@@ -2133,10 +2696,11 @@ fn run_doctor() {
 
     // ── Memory store status ────────────────────────────────────────────────────
     let store_path = default_store_path_from_config(&config);
+    let store_options = StoreOptions::from_config(&config);
     let key_result = resolve_vault_key();
     if store_path.exists() {
         match &key_result {
-            Ok(key) => match MemoryStore::open(&store_path, key) {
+            Ok(key) => match MemoryStore::open_with(&store_path, key, &store_options) {
                 Ok(store) => {
                     let count = store.record_count().unwrap_or(0);
                     println!(
@@ -2452,11 +3016,24 @@ fn run_vault_set_default(name: &str) {
 
 /// Print vault state, memory store stats, and keyring status to stdout.
 fn run_status() {
+    let key = resolve_vault_key();
+    print!("{}", status_report(key.as_ref().map_err(String::as_str)));
+}
+
+/// Return the vault state, memory store stats and keyring report `engram status` prints.
+///
+/// `key` is the outcome of [`resolve_vault_key`]; callers resolve it themselves
+/// so that `engram mcp` can do so once at start-up instead of on every call.
+fn status_report(key: Result<&engram_core::crypto::EngramKey, &str>) -> String {
+    use std::fmt::Write;
+
+    let mut report = String::new();
+
     // Load config once to avoid redundant filesystem reads across helpers.
     let config = EngramConfig::load();
 
     // Separator line
-    println!("{}", "\u{2500}".repeat(41));
+    let _ = writeln!(report, "{}", "\u{2500}".repeat(41));
 
     // ── Vault status ──────────────────────────────────────────────────────────
     if config.vaults.is_empty() {
@@ -2465,13 +3042,18 @@ fn run_status() {
         if vault_path.exists() {
             let vault = Vault::new(&vault_path);
             let count = vault.list_markdown().map(|files| files.len()).unwrap_or(0);
-            println!("Vault:        {} ({} files)", vault_path.display(), count);
+            let _ = writeln!(
+                report,
+                "Vault:        {} ({} files)",
+                vault_path.display(),
+                count
+            );
         } else {
-            println!("Vault:        {} (NOT FOUND)", vault_path.display());
+            let _ = writeln!(report, "Vault:        {} (NOT FOUND)", vault_path.display());
         }
     } else {
         // Multi-vault path: print 'Vaults:' header then each configured vault.
-        println!("Vaults:");
+        let _ = writeln!(report, "Vaults:");
         let default_name = config.default_vault().map(|(n, _)| n.to_string());
         for (name, entry) in &config.vaults {
             let exists_marker = if entry.path.exists() {
@@ -2496,7 +3078,8 @@ fn run_status() {
             } else {
                 0
             };
-            println!(
+            let _ = writeln!(
+                report,
                 "  {} {}{} \u{2014} {} files  {} \u{00B7} {}",
                 exists_marker, name, default_tag, count, access_str, sync_str
             );
@@ -2505,29 +3088,38 @@ fn run_status() {
 
     // ── Memory store status ───────────────────────────────────────────────────
     let store_path = default_store_path_from_config(&config);
-    let key_result = resolve_vault_key();
+    let store_options = StoreOptions::from_config(&config);
 
     if store_path.exists() {
-        match &key_result {
-            Ok(key) => match MemoryStore::open(&store_path, key) {
+        match key {
+            Ok(key) => match MemoryStore::open_with(&store_path, key, &store_options) {
                 Ok(store) => {
                     let count = store.record_count().unwrap_or(0);
-                    println!(
+                    let _ = writeln!(
+                        report,
                         "Memory store: {} (present, {} records)",
                         store_path.display(),
                         count
                     );
                 }
                 Err(_) => {
-                    println!("Memory store: {} (wrong key)", store_path.display());
+                    let _ = writeln!(report, "Memory store: {} (wrong key)", store_path.display());
                 }
             },
             Err(_) => {
-                println!("Memory store: {} (present, no key)", store_path.display());
+                let _ = writeln!(
+                    report,
+                    "Memory store: {} (present, no key)",
+                    store_path.display()
+                );
             }
         }
     } else {
-        println!("Memory store: {} (not initialized)", store_path.display());
+        let _ = writeln!(
+            report,
+            "Memory store: {} (not initialized)",
+            store_path.display()
+        );
     }
 
     // ── Search index status ───────────────────────────────────────────────────
@@ -2535,13 +3127,14 @@ fn run_status() {
     // `engram status` accurately reflects what `engram index` built.
     let vault_name = resolve_vault_name(None);
     let search_dir = vault_storage_dir(&vault_name).join("search");
-    println!("{}", search_index_status(&search_dir));
+    let _ = writeln!(report, "{}", search_index_status(&search_dir));
 
     // ── Key status ───────────────────────────────────────────────────────
-    match key_result {
-        Ok(_) => println!("Key:          accessible \u{2713}"),
-        Err(e) => println!("Key:          not accessible — {}", e),
-    }
+    let _ = match key {
+        Ok(_) => writeln!(report, "Key:          accessible \u{2713}"),
+        Err(e) => writeln!(report, "Key:          not accessible — {}", e),
+    };
+    report
 }
 
 #[cfg(test)]
@@ -2616,6 +3209,20 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_embed_options_prefers_flags_then_config() {
+        let mut config = EngramConfig::default();
+        config.search.embed_batch_size = Some(128);
+        config.search.embed_threads = Some(2);
+
+        let from_config = embed_options(&config, None, None);
+        assert_eq!((from_config.batch_size, from_config.threads), (128, 2));
+        let from_flags = embed_options(&config, Some(16), Some(8));
+        assert_eq!((from_flags.batch_size, from_flags.threads), (16, 8));
+        let defaults = embed_options(&EngramConfig::default(), None, None);
+        assert_eq!(defaults, EmbedOptions::default());
+    }
+
     #[test]
     fn test_dir_size_bytes_returns_zero_for_nonexistent_path() {
         let size = dir_size_bytes(std::path::Path::new("/tmp/nonexistent_engram_test_dir_xyz"));
@@ -1,14 +1,24 @@
 // mcp.rs — MCP stdio server (JSON-RPC 2.0 over stdin/stdout)
 //
 // Implements the Model Context Protocol (https://spec.modelcontextprotocol.io/)
-// exposing three memory tools: memory_search, memory_load, memory_status.
+// exposing three memory tools (memory_search, memory_load, memory_status) over
+// the memory store, and three tools that return exactly what the matching CLI
+// command prints (engram_search, engram_load, engram_status), so a long-lived
+// server can stand in for spawning `engram` per call.
 
 use std::io::{self, BufRead, Write};
 
+use engram_core::crypto::EngramKey;
 use engram_core::store::{MemoryStore, StoreError};
 use serde_json::{json, Value};
 use thiserror::Error;
 
+/// Results returned by `memory_search` when the caller gives no `limit`.
+const DEFAULT_SEARCH_LIMIT: usize = 20;
+
+/// Results returned by `engram_search` when the caller gives no `limit`, as in `engram search`.
+const DEFAULT_CLI_SEARCH_LIMIT: usize = 10;
+
 /// Errors that can occur during MCP server operation.
 #[derive(Debug, Error)]
 pub enum McpError {
@@ -20,12 +30,38 @@ pub enum McpError {
     Store(#[from] StoreError),
 }
 
-/// Returns the JSON array of 3 MCP tool definitions.
+/// State the server keeps for its lifetime.
+///
+/// The vault key is resolved once by the caller before the server starts, so
+/// no request re-runs key derivation or reaches the interactive passphrase
+/// prompt, which would block the stdio transport. The search session keeps
+/// each vault's indices and the embedding model open between `engram_search` calls.
+pub struct McpServer {
+    store: MemoryStore,
+    key: EngramKey,
+    search: crate::SearchSession,
+}
+
+impl McpServer {
+    /// Create a server over `store`, opened with `key`.
+    pub fn new(store: MemoryStore, key: EngramKey) -> Self {
+        Self {
+            store,
+            key,
+            search: crate::SearchSession::default(),
+        }
+    }
+}
+
+/// Returns the JSON array of 6 MCP tool definitions.
 ///
 /// Tools:
 /// - `memory_search`: query (required string), limit (optional number)
 /// - `memory_load`:   format (optional string enum: context/facts/summary)
 /// - `memory_status`: no parameters
+/// - `engram_search`: query (required string), limit (optional number)
+/// - `engram_load`:   format (optional string, default context)
+/// - `engram_status`: no parameters
 pub fn tool_definitions() -> Value {
     json!([
         {
@@ -40,7 +76,7 @@ pub fn tool_definitions() -> Value {
                     },
                     "limit": {
                         "type": "number",
-                        "description": "Maximum number of results to return"
+                        "description": "Maximum number of results to return (default: 20)"
                     }
                 },
                 "required": ["query"]
@@ -67,6 +103,45 @@ pub fn tool_definitions() -> Value {
                 "type": "object",
                 "properties": {}
             }
+        },
+        {
+            "name": "engram_search",
+            "description": "Search the vault (hybrid BM25 + semantic); returns what `engram search` prints",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Search query string"
+                    },
+                    "limit": {
+                        "type": "number",
+                        "description": "Maximum number of results to return (default: 10)"
+                    }
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "engram_load",
+            "description": "Load recent memories; returns what `engram load` prints",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "description": "Output format, as `engram load --format` (default: context)"
+                    }
+                }
+            }
+        },
+        {
+            "name": "engram_status",
+            "description": "Vault, memory store, search index and key status; returns what `engram status` prints",
+            "inputSchema": {
+                "type": "object",
+                "properties": {}
+            }
         }
     ])
 }
@@ -130,43 +205,33 @@ pub fn handle_tools_list(id: &Value) -> Value {
 
 /// Handle the `tools/call` method — dispatch by tool name.
 ///
-/// - `memory_search` — calls `store.search(query)`, formats results
+/// - `memory_search` — fact search, as `engram search --facts`
 /// - `memory_load`   — calls `crate::load::load_context(store)`
 /// - `memory_status` — returns `record_count`
+/// - `engram_search` — hybrid vault search, as `engram search --limit <limit>`
+/// - `engram_load`   — the store's context block, as `engram load --format=<format>`
+/// - `engram_status` — the `engram status` report
 /// - unknown tool    — returns -32602 error
-pub fn handle_tools_call(id: &Value, params: &Value, store: &MemoryStore) -> Value {
+///
+/// The `engram_*` tools return failures the CLI would exit with as -32603
+/// errors carrying its message.
+pub fn handle_tools_call(id: &Value, params: &Value, server: &mut McpServer) -> Value {
     let name = match params.get("name").and_then(|n| n.as_str()) {
         Some(n) => n,
         None => return make_error(id, -32602, "missing tool name"),
     };
+    let store = &server.store;
 
     match name {
         "memory_search" => {
-            // Extract the required `query` argument; reject empty strings.
-            let query = match params
-                .get("arguments")
-                .and_then(|a| a.get("query"))
-                .and_then(|q| q.as_str())
-            {
-                Some(q) if !q.is_empty() => q.to_string(),
-                Some(_) => return make_error(id, -32602, "query cannot be empty"),
-                None => return make_error(id, -32602, "missing required parameter: query"),
+            let (query, limit) = match search_arguments(params, DEFAULT_SEARCH_LIMIT) {
+                Ok(args) => args,
+                Err(message) => return make_error(id, -32602, message),
             };
 
-            match store.search(&query) {
-                Ok(results) => {
-                    let text = if results.is_empty() {
-                        "No results found.".to_string()
-                    } else {
-                        results
-                            .iter()
-                            .map(|m| format!("{}: {} = {}", m.entity, m.attribute, m.value))
-                            .collect::<Vec<_>>()
-                            .join("\n")
-                    };
-                    make_tool_result(id, &text)
-                }
-                Err(e) => make_error(id, -32603, &format!("store error: {}", e)),
+            match crate::facts_report(store, &query, limit) {
+                Ok(text) => make_tool_result(id, &text),
+                Err(e) => make_error(id, -32603, &e),
             }
         }
 
@@ -180,6 +245,34 @@ pub fn handle_tools_call(id: &Value, params: &Value, store: &MemoryStore) -> Val
             Err(e) => make_error(id, -32603, &format!("store error: {}", e)),
         },
 
+        "engram_search" => {
+            let (query, limit) = match search_arguments(params, DEFAULT_CLI_SEARCH_LIMIT) {
+                Ok(args) => args,
+                Err(message) => return make_error(id, -32602, message),
+            };
+            let report = server
+                .search
+                .report(&query, None, limit, &crate::SearchMode::Hybrid);
+            match report {
+                Ok(text) => make_tool_result(id, &text),
+                Err(e) => make_error(id, -32603, &e),
+            }
+        }
+
+        "engram_load" => {
+            let format = params
+                .get("arguments")
+                .and_then(|a| a.get("format"))
+                .and_then(|f| f.as_str())
+                .unwrap_or("context");
+            match crate::load_report(store, format) {
+                Ok(text) => make_tool_result(id, &text),
+                Err(e) => make_error(id, -32603, &e),
+            }
+        }
+
+        "engram_status" => make_tool_result(id, &crate::status_report(Ok(&server.key))),
+
         _ => make_error(id, -32602, &format!("unknown tool: {}", name)),
     }
 }
@@ -191,7 +284,7 @@ pub fn handle_tools_call(id: &Value, params: &Value, store: &MemoryStore) -> Val
 /// - `tools/list`  → `handle_tools_list`
 /// - `tools/call`  → `handle_tools_call`
 /// - unknown       → -32601 error
-pub fn handle_request(request: &Value, store: &MemoryStore) -> Value {
+pub fn handle_request(request: &Value, server: &mut McpServer) -> Value {
     let id = request.get("id").unwrap_or(&Value::Null);
     let method = match request.get("method").and_then(|m| m.as_str()) {
         Some(m) => m,
@@ -206,7 +299,7 @@ pub fn handle_request(request: &Value, store: &MemoryStore) -> Value {
                 Some(p) => p,
                 None => return make_error(id, -32602, "missing params for tools/call"),
             };
-            handle_tools_call(id, params, store)
+            handle_tools_call(id, params, server)
         }
         _ => make_error(id, -32601, &format!("method not found: {}", method)),
     }
@@ -218,7 +311,7 @@ pub fn handle_request(request: &Value, store: &MemoryStore) -> Value {
 /// to `handle_request`, and writes the JSON response followed by a newline to
 /// stdout (flushed after every response).  Malformed JSON lines produce a
 /// -32700 parse-error response.  The loop exits when stdin is closed.
-pub fn run_mcp_server(store: &MemoryStore) -> Result<(), McpError> {
+pub fn run_mcp_server(server: &mut McpServer) -> Result<(), McpError> {
     let stdin = io::stdin();
     let stdout = io::stdout();
     let mut out = stdout.lock();
@@ -230,7 +323,7 @@ pub fn run_mcp_server(store: &MemoryStore) -> Result<(), McpError> {
         }
 
         let response = match serde_json::from_str::<Value>(&line) {
-            Ok(request) => handle_request(&request, store),
+            Ok(request) => handle_request(&request, server),
             Err(_) => make_error(&Value::Null, -32700, "parse error"),
         };
 
@@ -241,57 +334,87 @@ pub fn run_mcp_server(store: &MemoryStore) -> Result<(), McpError> {
     Ok(())
 }
 
+// ── Private helpers ──────────────────────────────────────────────────────────
+
+/// Extract the `query` (required, non-empty) and `limit` arguments of a search tool.
+fn search_arguments(params: &Value, default_limit: usize) -> Result<(String, usize), &'static str> {
+    let arguments = params.get("arguments");
+    let query = match arguments
+        .and_then(|a| a.get("query"))
+        .and_then(|q| q.as_str())
+    {
+        Some(q) if !q.is_empty() => q.to_string(),
+        Some(_) => return Err("query cannot be empty"),
+        None => return Err("missing required parameter: query"),
+    };
+    let limit = arguments
+        .and_then(|a| a.get("limit"))
+        .and_then(|l| l.as_u64())
+        .map_or(default_limit, |l| l as usize);
+    Ok((query, limit))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
     use engram_core::crypto::EngramKey;
     use engram_core::store::{Memory, MemoryStore};
+    use engram_search::indexer::TantivyIndexer;
     use serde_json::json;
+    use serial_test::serial;
     use tempfile::TempDir;
 
     fn test_key() -> EngramKey {
         EngramKey::derive(b"testpassword", &[0u8; 16]).expect("key derivation failed")
     }
 
-    fn temp_store() -> (TempDir, MemoryStore) {
+    fn temp_server() -> (TempDir, McpServer) {
         let dir = TempDir::new().expect("create temp dir failed");
         let path = dir.path().join("test.db");
         let store = MemoryStore::open(&path, &test_key()).expect("open store failed");
-        (dir, store)
+        (dir, McpServer::new(store, test_key()))
     }
 
-    /// tool_definitions() must return exactly 3 tools with correct names.
+    fn call_tool(server: &mut McpServer, name: &str, arguments: Value) -> Value {
+        let request = json!({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {
+                "name": name,
+                "arguments": arguments
+            }
+        });
+        handle_request(&request, server)
+    }
+
+    fn tool_text(response: &Value) -> &str {
+        response["result"]["content"][0]["text"]
+            .as_str()
+            .unwrap_or_else(|| panic!("expected text content, got: {}", response))
+    }
+
+    /// tool_definitions() must return the three memory tools and the three CLI tools.
     #[test]
-    fn test_tools_list_returns_three_tools() {
+    fn test_tools_list_returns_six_tools() {
         let tools = tool_definitions();
         let arr = tools
             .as_array()
             .expect("tool_definitions should return a JSON array");
-        assert_eq!(
-            arr.len(),
-            3,
-            "should return exactly 3 tools, got {}",
-            arr.len()
-        );
-
         let names: Vec<&str> = arr
             .iter()
             .filter_map(|t| t.get("name").and_then(|n| n.as_str()))
             .collect();
-        assert!(
-            names.contains(&"memory_search"),
-            "tools should include 'memory_search', got: {:?}",
-            names
-        );
-        assert!(
-            names.contains(&"memory_load"),
-            "tools should include 'memory_load', got: {:?}",
-            names
-        );
-        assert!(
-            names.contains(&"memory_status"),
-            "tools should include 'memory_status', got: {:?}",
-            names
+        assert_eq!(
+            names,
+            vec![
+                "memory_search",
+                "memory_load",
+                "memory_status",
+                "engram_search",
+                "engram_load",
+                "engram_status"
+            ]
         );
     }
 
@@ -313,13 +436,13 @@ mod tests {
     /// Dispatching an unknown method must return JSON-RPC error code -32601.
     #[test]
     fn test_unknown_method_returns_error_32601() {
-        let (_dir, store) = temp_store();
+        let (_dir, mut server) = temp_server();
         let request = json!({
             "jsonrpc": "2.0",
             "id": 1,
             "method": "unknown/method"
         });
-        let response = handle_request(&request, &store);
+        let response = handle_request(&request, &mut server);
         let code = response["error"]["code"]
             .as_i64()
             .expect("unknown method should produce an error.code field");
@@ -333,23 +456,12 @@ mod tests {
     /// memory_status tool must include the current record count.
     #[test]
     fn test_memory_status_returns_record_count() {
-        let (_dir, store) = temp_store();
+        let (_dir, mut server) = temp_server();
         let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
-        store.insert(&memory).expect("insert failed");
+        server.store.insert(&memory).expect("insert failed");
 
-        let request = json!({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {
-                "name": "memory_status",
-                "arguments": {}
-            }
-        });
-        let response = handle_request(&request, &store);
-        let text = response["result"]["content"][0]["text"]
-            .as_str()
-            .expect("memory_status should return text content");
+        let response = call_tool(&mut server, "memory_status", json!({}));
+        let text = tool_text(&response);
         assert!(
             text.contains("record_count: 1"),
             "status text should contain 'record_count: 1', got: {}",
@@ -357,22 +469,27 @@ mod tests {
         );
     }
 
+    /// memory_load keeps accepting every format it advertises.
+    #[test]
+    fn test_memory_load_accepts_all_formats() {
+        let (_dir, mut server) = temp_server();
+        let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
+        server.store.insert(&memory).expect("insert failed");
+
+        for format in ["context", "facts", "summary"] {
+            let response = call_tool(&mut server, "memory_load", json!({"format": format}));
+            assert!(
+                tool_text(&response).contains("vegetarian"),
+                "{format}: {response}"
+            );
+        }
+    }
+
     /// memory_search with an empty query string must return an error.
     #[test]
     fn test_memory_search_empty_query_returns_error() {
-        let (_dir, store) = temp_store();
-        let request = json!({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {
-                "name": "memory_search",
-                "arguments": {
-                    "query": ""
-                }
-            }
-        });
-        let response = handle_request(&request, &store);
+        let (_dir, mut server) = temp_server();
+        let response = call_tool(&mut server, "memory_search", json!({"query": ""}));
         assert!(
             response.get("error").is_some(),
             "empty query should return an error response, got: {}",
@@ -383,29 +500,150 @@ mod tests {
     /// memory_search must find a fact that was previously inserted.
     #[test]
     fn test_memory_search_finds_inserted_fact() {
-        let (_dir, store) = temp_store();
+        let (_dir, mut server) = temp_server();
         let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
-        store.insert(&memory).expect("insert failed");
+        server.store.insert(&memory).expect("insert failed");
 
-        let request = json!({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {
-                "name": "memory_search",
-                "arguments": {
-                    "query": "vegetarian"
-                }
-            }
-        });
-        let response = handle_request(&request, &store);
-        let text = response["result"]["content"][0]["text"]
-            .as_str()
-            .expect("memory_search should return text content");
+        let response = call_tool(&mut server, "memory_search", json!({"query": "vegetarian"}));
+        let text = tool_text(&response);
         assert!(
-            text.contains("vegetarian"),
-            "search result should contain 'vegetarian', got: {}",
+            text.contains("Sofia: dietary = vegetarian"),
+            "search result should contain the fact, got: {}",
             text
         );
     }
+
+    const ISOLATED_VARS: [&str; 4] = [
+        "HOME",
+        "ENGRAM_CONFIG_PATH",
+        "ENGRAM_STORE_PATH",
+        "ENGRAM_VAULT_KEY",
+    ];
+
+    /// Restores the variables [`isolated_env`] replaced when dropped.
+    struct EnvGuard(Vec<(&'static str, Option<std::ffi::OsString>)>);
+
+    impl Drop for EnvGuard {
+        fn drop(&mut self) {
+            for (name, value) in &self.0 {
+                match value {
+                    Some(v) => std::env::set_var(name, v),
+                    None => std::env::remove_var(name),
+                }
+            }
+        }
+    }
+
+    /// Point the config, store and key at `dir` so the CLI reports never prompt.
+    fn isolated_env(dir: &TempDir) -> EnvGuard {
+        let guard = EnvGuard(
+            ISOLATED_VARS
+                .iter()
+                .map(|name| (*name, std::env::var_os(name)))
+                .collect(),
+        );
+        std::env::set_var("HOME", dir.path());
+        std::env::set_var("ENGRAM_CONFIG_PATH", dir.path().join("config.toml"));
+        std::env::set_var("ENGRAM_STORE_PATH", dir.path().join("memory.db"));
+        std::env::set_var(
+            "ENGRAM_VAULT_KEY",
+            "BwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwc=",
+        );
+        guard
+    }
+
+    /// engram_status returns the `engram status` report, using the server's key.
+    #[test]
+    #[serial]
+    fn test_engram_status_uses_the_server_key() {
+        let (dir, mut server) = temp_server();
+        let _env = isolated_env(&dir);
+
+        let response = call_tool(&mut server, "engram_status", json!({}));
+        let text = tool_text(&response).to_string();
+        assert_eq!(text, crate::status_report(Ok(&server.key)));
+        assert!(text.contains("Key:          accessible"), "{text}");
+
+        // The key was resolved once at startup: an environment that would now
+        // fall through to the passphrase prompt does not affect the tool.
+        std::env::remove_var("ENGRAM_VAULT_KEY");
+        let response = call_tool(&mut server, "engram_status", json!({}));
+        assert_eq!(tool_text(&response), text);
+    }
+
+    /// engram_load returns what `engram load` prints, and rejects the formats it rejects.
+    #[test]
+    fn test_engram_load_matches_load_report() {
+        let (_dir, mut server) = temp_server();
+        let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
+        server.store.insert(&memory).expect("insert failed");
+
+        let response = call_tool(&mut server, "engram_load", json!({"format": "context"}));
+        assert_eq!(
+            Ok(tool_text(&response).to_string()),
+            crate::load_report(&server.store, "context")
+        );
+
+        let response = call_tool(&mut server, "engram_load", json!({"format": "summary"}));
+        assert_eq!(
+            response["error"]["message"].as_str().map(str::to_string),
+            crate::load_report(&server.store, "summary").err()
+        );
+    }
+
+    /// engram_search fails the way `engram search` does when the vault has no index.
+    #[test]
+    #[serial]
+    fn test_engram_search_matches_search_report() {
+        let (dir, mut server) = temp_server();
+        let _env = isolated_env(&dir);
+
+        let response = call_tool(&mut server, "engram_search", json!({"query": "vegetarian"}));
+        let expected = crate::search_report(
+            "vegetarian",
+            None,
+            DEFAULT_CLI_SEARCH_LIMIT,
+            &crate::SearchMode::Hybrid,
+        );
+        assert_eq!(
+            expected,
+            Err("Search index not found. Run: engram index".to_string())
+        );
+        assert_eq!(
+            response["error"]["message"].as_str(),
+            Some("Search index not found. Run: engram index")
+        );
+    }
+
+    /// The search session keeps a vault's index open between queries and
+    /// reopens it only after `engram index` commits.
+    #[test]
+    #[serial]
+    fn test_search_session_reuses_indices_until_the_index_changes() {
+        let dir = TempDir::new().unwrap();
+        let _env = isolated_env(&dir);
+        let search_dir = crate::vault_storage_dir("default").join("search");
+        TantivyIndexer::open(&search_dir)
+            .unwrap()
+            .index_file("a.md", "alpha note")
+            .unwrap();
+
+        let mut session = crate::SearchSession::default();
+        let fulltext = crate::SearchMode::Fulltext;
+        let first = session.report("note", None, 10, &fulltext).unwrap();
+        assert!(first.contains("1 found"), "{first}");
+        let stamp = session.vaults["default"].stamp;
+        session.report("alpha", None, 10, &fulltext).unwrap();
+        assert_eq!(session.vaults["default"].stamp, stamp);
+
+        // A commit rewrites meta.json; make sure its mtime visibly moves.
+        std::thread::sleep(std::time::Duration::from_millis(20));
+        TantivyIndexer::open(&search_dir)
+            .unwrap()
+            .index_file("b.md", "beta note")
+            .unwrap();
+        let after = session.report("note", None, 10, &fulltext).unwrap();
+        assert!(after.contains("2 found"), "{after}");
+        assert_ne!(session.vaults["default"].stamp, stamp);
+    }
 }
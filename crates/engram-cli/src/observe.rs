@@ -207,26 +207,29 @@ pub fn parse_transcript(path: &Path) -> Result<Vec<TranscriptTurn>, ObserveError
 ///
 /// For each fact, creates a [`Memory`] with entity/attribute/value and an optional source
 /// (set to `None` when the fact's source field is empty).
-/// Inserts each memory into `store`, silently skipping any that fail to insert.
-/// Returns the count of successfully written memories.
+/// All memories are written in one transaction via
+/// [`MemoryStore::upsert_many`](engram_core::store::MemoryStore::upsert_many), so a fact
+/// the store already holds is bumped rather than duplicated. Rows that fail to insert
+/// are skipped, and a transaction-level failure writes nothing.
+/// Returns the count of successfully written memories (new or merged).
 pub fn write_facts_to_store(
     facts: &[ExtractedFact],
     store: &engram_core::store::MemoryStore,
 ) -> usize {
-    let mut count = 0;
-    for fact in facts {
-        let source = if fact.source.is_empty() {
-            None
-        } else {
-            Some(fact.source.as_str())
-        };
-        let memory =
-            engram_core::store::Memory::new(&fact.entity, &fact.attribute, &fact.value, source);
-        if store.insert(&memory).is_ok() {
-            count += 1;
-        }
-    }
-    count
+    let memories: Vec<_> = facts
+        .iter()
+        .map(|fact| {
+            let source = if fact.source.is_empty() {
+                None
+            } else {
+                Some(fact.source.as_str())
+            };
+            engram_core::store::Memory::new(&fact.entity, &fact.attribute, &fact.value, source)
+        })
+        .collect();
+    store
+        .upsert_many(&memories)
+        .map_or(0, |report| report.ids.len())
 }
 
 /// Orchestrate a full observe session: parse transcript → extract facts → write to store.
@@ -462,4 +465,34 @@ mod tests {
         assert_eq!(sofia.value, "vegetarian");
         assert_eq!(sofia.source, Some("user".to_string()));
     }
+
+    #[test]
+    fn test_write_facts_to_store_twice_does_not_duplicate() {
+        use engram_core::crypto::EngramKey;
+        use engram_core::store::MemoryStore;
+        use tempfile::TempDir;
+
+        let dir = TempDir::new().expect("create temp dir failed");
+        let db_path = dir.path().join("test.db");
+        let key = EngramKey::derive(b"testpassword", &[0u8; 16]).expect("key derivation failed");
+        let store = MemoryStore::open(&db_path, &key).expect("open store failed");
+
+        let facts = vec![ExtractedFact {
+            entity: "Sofia".to_string(),
+            attribute: "dietary".to_string(),
+            value: "vegetarian".to_string(),
+            source: "user".to_string(),
+        }];
+        assert_eq!(write_facts_to_store(&facts, &store), 1);
+        assert_eq!(write_facts_to_store(&facts, &store), 1);
+
+        assert_eq!(store.record_count().expect("record_count failed"), 1);
+        let sofia = &store
+            .find_by_entity("Sofia")
+            .expect("find_by_entity failed")[0];
+        assert_eq!(
+            store.seen_count(&sofia.id).expect("seen_count failed"),
+            Some(2)
+        );
+    }
 }
@@ -0,0 +1,386 @@
+// transfer.rs — stream the memory store to and from JSONL
+//
+// `engram store export` writes one `Memory` JSON object per line, plus the
+// fact's `seen_count`, oldest first, followed by the facts `compact` moved to
+// the archive, which carry an extra `archived_at` field; `engram store import`
+// loads such a file into another store, archived facts back into its archive. Both sides work a page
+// at a time, so memory use does not grow with the store.
+
+use std::io::{self, BufRead, BufReader, Read, Write};
+
+use engram_core::store::{
+    ArchivedFact, Memory, MemoryQuery, MemoryStore, QueryOrder, QueryPage, StoreError,
+};
+use flate2::read::MultiGzDecoder;
+use serde::{Deserialize, Serialize};
+use thiserror::Error;
+
+/// Memories read per page on export and written per transaction on import.
+pub const DEFAULT_BATCH: usize = 5_000;
+
+/// The two bytes every gzip stream starts with.
+const GZIP_MAGIC: [u8; 2] = [0x1f, 0x8b];
+
+/// Errors that can occur during export or import.
+#[derive(Debug, Error)]
+pub enum TransferError {
+    #[error("IO error: {0}")]
+    Io(#[from] io::Error),
+    #[error("store error: {0}")]
+    Store(#[from] StoreError),
+    #[error("line {line}: {source}")]
+    Parse {
+        line: u64,
+        source: serde_json::Error,
+    },
+}
+
+/// One line of an export: a `Memory` plus how many times its fact was seen.
+/// `archived_at` (ms since epoch) is set only for facts read from the archive.
+/// Exports written before `seen_count` was carried import it as 1.
+#[derive(Serialize, Deserialize)]
+struct Line {
+    #[serde(flatten)]
+    memory: Memory,
+    #[serde(default = "first_sighting")]
+    seen_count: u64,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    archived_at: Option<i64>,
+}
+
+/// Running totals of an [`import_jsonl`] call.
+#[derive(Debug, Default, Clone, PartialEq, Eq)]
+pub struct ImportStats {
+    /// Memories parsed from the input.
+    pub read: u64,
+    /// Of the new rows, those written to the archive.
+    pub archived: u64,
+    /// New rows written.
+    pub inserted: u64,
+    /// Memories folded into a row already holding the same fact.
+    pub merged: u64,
+    /// Memories whose id was already in the store.
+    pub skipped: u64,
+    /// Memories the store rejected.
+    pub failed: u64,
+}
+
+/// Write every memory in `store` to `out` as JSONL, oldest first, then every
+/// archived fact with its `archived_at`.
+///
+/// The store is read in keyset pages of `batch` memories and `progress` is
+/// called with the running total after each page. Returns the number of
+/// memories written, archived facts included.
+pub fn export_jsonl<W: Write>(
+    store: &MemoryStore,
+    out: W,
+    batch: usize,
+    mut progress: impl FnMut(u64),
+) -> Result<u64, TransferError> {
+    let query = MemoryQuery::new()
+        .order(QueryOrder::CreatedAsc)
+        .page_size(batch);
+    let mut out = io::BufWriter::new(out);
+    let mut cursor: Option<String> = None;
+    let mut written = 0;
+    loop {
+        let QueryPage {
+            memories,
+            seen_counts,
+            next,
+        } = store.query(&query, cursor.as_deref())?;
+        written += memories.len() as u64;
+        for (memory, seen_count) in memories.into_iter().zip(seen_counts) {
+            let line = Line {
+                memory,
+                seen_count,
+                archived_at: None,
+            };
+            serde_json::to_writer(&mut out, &line).map_err(io::Error::from)?;
+            out.write_all(b"\n")?;
+        }
+        progress(written);
+        match next {
+            Some(next) => cursor = Some(next),
+            None => break,
+        }
+    }
+
+    let mut after = None;
+    loop {
+        let (facts, next) = store.archived_page(after, batch)?;
+        if facts.is_empty() {
+            break;
+        }
+        written += facts.len() as u64;
+        for fact in facts {
+            let line = Line {
+                memory: fact.memory,
+                seen_count: fact.seen_count,
+                archived_at: Some(fact.archived_at),
+            };
+            serde_json::to_writer(&mut out, &line).map_err(io::Error::from)?;
+            out.write_all(b"\n")?;
+        }
+        progress(written);
+        match next {
+            Some(next) => after = Some(next),
+            None => break,
+        }
+    }
+    out.flush()?;
+    Ok(written)
+}
+
+/// Load a JSONL export from `input` into `store`, `batch` memories per transaction.
+///
+/// Gzip input is detected from its first bytes. Memories keep their ids,
+/// timestamps and seen-counts; ids already in the store are skipped, so an interrupted import
+/// can simply be run again. Lines with `archived_at` go to the archive, where
+/// facts it already holds are skipped. `progress` is called after each batch.
+pub fn import_jsonl<R: Read>(
+    store: &MemoryStore,
+    input: R,
+    batch: usize,
+    progress: impl FnMut(&ImportStats),
+) -> Result<ImportStats, TransferError> {
+    let mut input = BufReader::new(input);
+    if input.fill_buf()?.starts_with(&GZIP_MAGIC) {
+        load_lines(
+            store,
+            BufReader::new(MultiGzDecoder::new(input)),
+            batch,
+            progress,
+        )
+    } else {
+        load_lines(store, input, batch, progress)
+    }
+}
+
+// ── Private helpers ──────────────────────────────────────────────────────────
+
+/// The `seen_count` of a line that has none: every stored fact was seen once.
+fn first_sighting() -> u64 {
+    1
+}
+
+fn load_lines(
+    store: &MemoryStore,
+    mut reader: impl BufRead,
+    batch: usize,
+    mut progress: impl FnMut(&ImportStats),
+) -> Result<ImportStats, TransferError> {
+    let batch = batch.max(1);
+    let mut stats = ImportStats::default();
+    let mut pending = Vec::with_capacity(batch);
+    let mut archived = Vec::new();
+    let mut line = String::new();
+    let mut line_no = 0;
+    loop {
+        line.clear();
+        if reader.read_line(&mut line)? == 0 {
+            break;
+        }
+        line_no += 1;
+        if line.trim().is_empty() {
+            continue;
+        }
+        let parsed: Line = serde_json::from_str(&line).map_err(|source| TransferError::Parse {
+            line: line_no,
+            source,
+        })?;
+        match parsed.archived_at {
+            Some(archived_at) => archived.push(ArchivedFact {
+                memory: parsed.memory,
+                seen_count: parsed.seen_count,
+                archived_at,
+            }),
+            None => pending.push((parsed.memory, parsed.seen_count)),
+        }
+        if pending.len() + archived.len() == batch {
+            write_batch(store, &mut pending, &mut archived, &mut stats)?;
+            progress(&stats);
+        }
+    }
+    if !pending.is_empty() || !archived.is_empty() {
+        write_batch(store, &mut pending, &mut archived, &mut stats)?;
+        progress(&stats);
+    }
+    Ok(stats)
+}
+
+fn write_batch(
+    store: &MemoryStore,
+    pending: &mut Vec<(Memory, u64)>,
+    archived: &mut Vec<ArchivedFact>,
+    stats: &mut ImportStats,
+) -> Result<(), TransferError> {
+    if !archived.is_empty() {
+        let report = store.import_archived(archived)?;
+        stats.read += archived.len() as u64;
+        stats.archived += report.inserted as u64;
+        stats.inserted += report.inserted as u64;
+        stats.skipped += report.skipped as u64;
+        stats.failed += report.failures.len() as u64;
+        archived.clear();
+    }
+    if pending.is_empty() {
+        return Ok(());
+    }
+    let report = store.import_many(pending)?;
+    stats.read += pending.len() as u64;
+    stats.inserted += report.inserted as u64;
+    stats.merged += report.merged as u64;
+    stats.skipped += report.skipped as u64;
+    stats.failed += report.failures.len() as u64;
+    pending.clear();
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use engram_core::crypto::EngramKey;
+    use engram_core::store::RetentionPolicy;
+    use flate2::write::GzEncoder;
+    use flate2::Compression;
+    use tempfile::TempDir;
+
+    fn test_key() -> EngramKey {
+        EngramKey::from_bytes([3u8; 32])
+    }
+
+    fn temp_store(dir: &TempDir, name: &str) -> MemoryStore {
+        MemoryStore::open(&dir.path().join(name), &test_key()).expect("open store failed")
+    }
+
+    fn seeded_store(dir: &TempDir, rows: usize) -> MemoryStore {
+        let store = temp_store(dir, "source.db");
+        let memories: Vec<Memory> = (0..rows)
+            .map(|i| {
+                Memory::new(
+                    &format!("entity-{}", i % 7),
+                    &format!("attr-{i}"),
+                    "value",
+                    None,
+                )
+            })
+            .collect();
+        store.insert_many(&memories).expect("seed failed");
+        store
+    }
+
+    #[test]
+    fn test_export_then_import_round_trips_in_batches() {
+        let dir = TempDir::new().unwrap();
+        let source = seeded_store(&dir, 25);
+        let mut jsonl = Vec::new();
+        let mut pages = 0;
+        let written = export_jsonl(&source, &mut jsonl, 10, |_| pages += 1).unwrap();
+        assert_eq!((written, pages), (25, 3));
+        assert_eq!(jsonl.iter().filter(|&&b| b == b'\n').count(), 25);
+
+        let target = temp_store(&dir, "target.db");
+        let mut batches = 0;
+        let stats = import_jsonl(&target, jsonl.as_slice(), 10, |_| batches += 1).unwrap();
+        assert_eq!((stats.read, stats.inserted, batches), (25, 25, 3));
+
+        let ids: Vec<String> = source
+            .query(&MemoryQuery::new().page_size(100), None)
+            .unwrap()
+            .memories
+            .into_iter()
+            .map(|m| m.id)
+            .collect();
+        assert_eq!(target.get_many(&ids).unwrap().len(), 25);
+    }
+
+    #[test]
+    fn test_export_and_import_carry_archived_facts() {
+        let dir = TempDir::new().unwrap();
+        let source = seeded_store(&dir, 5);
+        let mut cold = Memory::new("Sofia", "note", "archived", None);
+        cold.created_at -= 400 * 24 * 60 * 60 * 1000;
+        cold.updated_at = cold.created_at;
+        source.insert(&cold).unwrap();
+        source.compact(&RetentionPolicy::default()).unwrap();
+        assert_eq!(source.archived_count().unwrap(), 1);
+
+        let mut jsonl = Vec::new();
+        assert_eq!(export_jsonl(&source, &mut jsonl, 2, |_| {}).unwrap(), 6);
+        let text = String::from_utf8(jsonl.clone()).unwrap();
+        assert_eq!(text.matches("\"archived_at\"").count(), 1);
+
+        let target = temp_store(&dir, "target.db");
+        let stats = import_jsonl(&target, jsonl.as_slice(), 4, |_| {}).unwrap();
+        assert_eq!((stats.read, stats.inserted, stats.archived), (6, 6, 1));
+        assert_eq!(target.record_count().unwrap(), 5);
+        assert_eq!(target.archived_page(None, 10).unwrap().0[0].memory, cold);
+
+        let again = import_jsonl(&target, jsonl.as_slice(), 4, |_| {}).unwrap();
+        assert_eq!((again.inserted, again.skipped), (0, 6));
+    }
+
+    #[test]
+    fn test_export_and_import_carry_seen_counts() {
+        let dir = TempDir::new().unwrap();
+        let source = temp_store(&dir, "source.db");
+        let hot = Memory::new("Sofia", "dietary", "vegetarian", None);
+        for _ in 0..3 {
+            source.upsert(&hot).unwrap();
+        }
+        let mut cold = Memory::new("Sofia", "note", "archived", None);
+        cold.created_at -= 800 * 24 * 60 * 60 * 1000;
+        cold.updated_at = cold.created_at;
+        source.upsert(&cold).unwrap();
+        source.upsert(&cold).unwrap();
+        source.compact(&RetentionPolicy::default()).unwrap();
+
+        let mut jsonl = Vec::new();
+        export_jsonl(&source, &mut jsonl, DEFAULT_BATCH, |_| {}).unwrap();
+        let target = temp_store(&dir, "target.db");
+        import_jsonl(&target, jsonl.as_slice(), DEFAULT_BATCH, |_| {}).unwrap();
+
+        assert_eq!(target.seen_count(&hot.id).unwrap(), Some(3));
+        let (archived, _) = target.archived_page(None, 10).unwrap();
+        assert_eq!(archived.len(), 1);
+        assert_eq!((&archived[0].memory, archived[0].seen_count), (&cold, 2));
+    }
+
+    #[test]
+    fn test_import_defaults_missing_seen_count_to_one() {
+        let dir = TempDir::new().unwrap();
+        let memory = Memory::new("Ken", "role", "engineer", None);
+        let input = format!("{}\n", serde_json::to_string(&memory).unwrap());
+
+        let target = temp_store(&dir, "target.db");
+        let stats = import_jsonl(&target, input.as_bytes(), DEFAULT_BATCH, |_| {}).unwrap();
+        assert_eq!(stats.inserted, 1);
+        assert_eq!(target.seen_count(&memory.id).unwrap(), Some(1));
+    }
+
+    #[test]
+    fn test_import_gzip_and_reimport_skips_known_ids() {
+        let dir = TempDir::new().unwrap();
+        let source = seeded_store(&dir, 12);
+        let mut encoder = GzEncoder::new(Vec::new(), Compression::default());
+        export_jsonl(&source, &mut encoder, DEFAULT_BATCH, |_| {}).unwrap();
+        let gz = encoder.finish().unwrap();
+
+        let target = temp_store(&dir, "target.db");
+        let first = import_jsonl(&target, gz.as_slice(), DEFAULT_BATCH, |_| {}).unwrap();
+        assert_eq!(first.inserted, 12);
+        let again = import_jsonl(&target, gz.as_slice(), DEFAULT_BATCH, |_| {}).unwrap();
+        assert_eq!((again.inserted, again.skipped), (0, 12));
+        assert_eq!(target.record_count().unwrap(), 12);
+    }
+
+    #[test]
+    fn test_import_reports_malformed_line_number() {
+        let dir = TempDir::new().unwrap();
+        let target = temp_store(&dir, "target.db");
+        let input = b"\nnot json\n";
+        let err = import_jsonl(&target, &input[..], DEFAULT_BATCH, |_| {}).unwrap_err();
+        assert!(matches!(err, TransferError::Parse { line: 2, .. }), "{err}");
+    }
+}
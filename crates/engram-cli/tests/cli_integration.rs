@@ -623,6 +623,132 @@ fn test_mcp_help_exits_successfully() {
     cmd.assert().success();
 }
 
+/// Run `engram <args>` and the `engram mcp` tool `tool` against the same isolated home,
+/// returning the CLI's output (stdout, or stderr on failure) and the tool's answer
+/// (its text, or its error message).
+fn cli_and_mcp_output(args: &[&str], tool: &str, arguments: serde_json::Value) -> (String, String) {
+    let home = TempDir::new().unwrap();
+    let engram = |cmd: &mut Command| {
+        cmd.env("HOME", home.path())
+            .env("ENGRAM_CONFIG_PATH", home.path().join("config.toml"))
+            .env("ENGRAM_STORE_PATH", home.path().join("memory.db"))
+            .env(
+                "ENGRAM_VAULT_KEY",
+                "BwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwc=",
+            );
+    };
+
+    let requests = [
+        serde_json::json!({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}),
+        serde_json::json!({
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "tools/call",
+            "params": {"name": tool, "arguments": arguments}
+        }),
+    ];
+    let stdin: String = requests.iter().map(|r| format!("{}\n", r)).collect();
+    let mut mcp = Command::cargo_bin("engram").unwrap();
+    engram(&mut mcp);
+    let output = mcp.arg("mcp").write_stdin(stdin).output().unwrap();
+    assert!(output.status.success(), "engram mcp failed: {:?}", output);
+    let stdout = String::from_utf8(output.stdout).unwrap();
+    let response: serde_json::Value =
+        serde_json::from_str(stdout.lines().nth(1).expect("no tools/call response")).unwrap();
+    let mcp_text = match response.get("error") {
+        Some(error) => error["message"].as_str().unwrap().to_string(),
+        None => response["result"]["content"][0]["text"]
+            .as_str()
+            .unwrap()
+            .to_string(),
+    };
+
+    // Run the CLI second: `engram mcp` opens (and so creates) the memory store.
+    let mut cli = Command::cargo_bin("engram").unwrap();
+    engram(&mut cli);
+    let output = cli.args(args).output().unwrap();
+    let cli_text = if output.status.success() {
+        String::from_utf8(output.stdout).unwrap()
+    } else {
+        String::from_utf8(output.stderr).unwrap().trim().to_string()
+    };
+    (cli_text, mcp_text)
+}
+
+/// The MCP `engram_status` tool answers with the `engram status` report.
+#[test]
+fn test_mcp_engram_status_matches_cli() {
+    let (cli, mcp) = cli_and_mcp_output(&["status"], "engram_status", serde_json::json!({}));
+    assert!(cli.contains("Memory store:"), "unexpected status: {}", cli);
+    assert_eq!(mcp, cli);
+}
+
+/// The MCP `engram_load` tool answers with what `engram load` prints.
+#[test]
+fn test_mcp_engram_load_matches_cli() {
+    let (cli, mcp) = cli_and_mcp_output(
+        &["load", "--format=context"],
+        "engram_load",
+        serde_json::json!({"format": "context"}),
+    );
+    assert_eq!(mcp, cli);
+}
+
+/// The MCP `engram_search` tool runs the vault search `engram search` runs, and fails
+/// the same way when the vault has no index.
+#[test]
+fn test_mcp_engram_search_matches_cli() {
+    let (cli, mcp) = cli_and_mcp_output(
+        &["search", "vegetarian", "--limit", "5"],
+        "engram_search",
+        serde_json::json!({"query": "vegetarian", "limit": 5}),
+    );
+    assert_eq!(cli, "Search index not found. Run: engram index");
+    assert_eq!(mcp, cli);
+}
+
+/// `engram search --facts` searches the facts in the memory store rather than the
+/// vault index, and refuses the vault-search flags.
+#[test]
+fn test_search_facts_finds_stored_fact() {
+    use engram_core::crypto::EngramKey;
+    use engram_core::store::{Memory, MemoryStore};
+
+    let home = TempDir::new().unwrap();
+    let store_path = home.path().join("memory.db");
+    let store = MemoryStore::open(&store_path, &EngramKey::from_bytes([7u8; 32])).unwrap();
+    store
+        .insert(&Memory::new("Sofia", "dietary", "vegetarian", None))
+        .unwrap();
+    drop(store);
+
+    let engram = || {
+        let mut cmd = Command::cargo_bin("engram").unwrap();
+        cmd.env("HOME", home.path())
+            .env("ENGRAM_CONFIG_PATH", home.path().join("config.toml"))
+            .env("ENGRAM_STORE_PATH", &store_path)
+            .env(
+                "ENGRAM_VAULT_KEY",
+                "BwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwc=",
+            );
+        cmd
+    };
+    engram()
+        .args(["search", "--facts", "sofi veg"])
+        .assert()
+        .success()
+        .stdout("Sofia: dietary = vegetarian\n");
+    engram()
+        .args(["search", "--facts", "nothing"])
+        .assert()
+        .success()
+        .stdout("No results found.\n");
+    engram()
+        .args(["search", "--facts", "--mode", "vector", "sofia"])
+        .assert()
+        .failure();
+}
+
 // ─── config-module integration tests (Task 5) ──────────────────────────────
 
 /// `engram status` must still exit zero after the config module is integrated into
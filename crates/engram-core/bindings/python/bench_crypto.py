@@ -0,0 +1,59 @@
+"""Throughput of encrypt_bytes / decrypt_bytes through the Python bindings.
+
+Build the library and place it next to engram_core.py, then run:
+
+    cargo build -p engram-core --release
+    cp target/release/libengram_core.so crates/engram-core/bindings/python/libuniffi_engram_core.so
+    python crates/engram-core/bindings/python/bench_crypto.py
+
+Each row reports MB/s for a round trip of one payload, including the
+marshalling cost on both sides of the FFI.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import engram_core
+
+SIZES = [4 * 1024, 64 * 1024, 1024 * 1024, 8 * 1024 * 1024]
+
+
+def _throughput(fn, payload_len: int, min_seconds: float) -> float:
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds or calls < 3:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return payload_len * calls / elapsed / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="minimum time per measurement")
+    args = parser.parse_args()
+
+    key = engram_core.derive_key("bench-password", engram_core.generate_salt())
+
+    print(f"{'size':>10} {'input':>10} {'encrypt MB/s':>14} {'decrypt MB/s':>14}")
+    for size in SIZES:
+        plaintext = os.urandom(size)
+        ciphertext = engram_core.encrypt_bytes(key, plaintext)
+        assert engram_core.decrypt_bytes(key, ciphertext) == plaintext
+
+        inputs = {
+            "bytes": (plaintext, ciphertext),
+            "bytearray": (bytearray(plaintext), bytearray(ciphertext)),
+            "memoryview": (memoryview(bytearray(plaintext)), memoryview(bytearray(ciphertext))),
+        }
+        for label, (pt, ct) in inputs.items():
+            enc = _throughput(lambda: engram_core.encrypt_bytes(key, pt), size, args.seconds)
+            dec = _throughput(lambda: engram_core.decrypt_bytes(key, ct), size, args.seconds)
+            print(f"{size // 1024:>8}Ki {label:>10} {enc:>14.1f} {dec:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ import itertools
 import traceback
 import typing
 import platform
+import asyncio
 
 # Used for default argument values
 _DEFAULT = object() # type: typing.Any
@@ -208,9 +209,20 @@ class _UniffiRustBufferBuilder:
                 self.rbuf.data[self.rbuf.len + i] = byte
 
     def write(self, value):
-        with self._reserve(len(value)):
-            for i, byte in enumerate(value):
-                self.rbuf.data[self.rbuf.len + i] = byte
+        # One memmove instead of a Python-level loop per byte. `bytes` and
+        # writable buffers are passed straight through; only read-only
+        # non-bytes buffers (e.g. a read-only mmap) need a temporary copy.
+        view = memoryview(value).cast("B")
+        size = view.nbytes
+        if isinstance(value, bytes):
+            src = value
+        elif not view.readonly:
+            src = (ctypes.c_char * size).from_buffer(view)
+        else:
+            src = view.tobytes()
+        with self._reserve(size):
+            dst = ctypes.addressof(self.rbuf.data.contents) + self.rbuf.len
+            ctypes.memmove(dst, src, size)
 
     def write_i8(self, v):
         self._pack_into(1, ">b", v)
@@ -590,6 +602,25 @@ class _UniffiForeignFutureStructVoid(ctypes.Structure):
     ]
 _UNIFFI_FOREIGN_FUTURE_COMPLETE_VOID = ctypes.CFUNCTYPE(None,ctypes.c_uint64,_UniffiForeignFutureStructVoid,
 )
+_UniffiLib.uniffi_engram_core_fn_clone_memorycursor.argtypes = (
+    ctypes.c_void_p,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_clone_memorycursor.restype = ctypes.c_void_p
+_UniffiLib.uniffi_engram_core_fn_free_memorycursor.argtypes = (
+    ctypes.c_void_p,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_free_memorycursor.restype = None
+_UniffiLib.uniffi_engram_core_fn_method_memorycursor_next_page.argtypes = (
+    ctypes.c_void_p,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorycursor_next_page.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_engram_core_fn_method_memorycursor_next_page_async.argtypes = (
+    ctypes.c_void_p,
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorycursor_next_page_async.restype = ctypes.c_uint64
 _UniffiLib.uniffi_engram_core_fn_clone_memorystorehandle.argtypes = (
     ctypes.c_void_p,
     ctypes.POINTER(_UniffiRustCallStatus),
@@ -606,18 +637,65 @@ _UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_new.argtypes = (
     ctypes.POINTER(_UniffiRustCallStatus),
 )
 _UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_new.restype = ctypes.c_void_p
+_UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_open_pooled.argtypes = (
+    _UniffiRustBuffer,
+    _UniffiRustBuffer,
+    ctypes.c_uint32,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_open_pooled.restype = ctypes.c_void_p
+_UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_open_with_profile.argtypes = (
+    _UniffiRustBuffer,
+    _UniffiRustBuffer,
+    _UniffiRustBuffer,
+    ctypes.c_uint32,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_open_with_profile.restype = ctypes.c_void_p
 _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_find_by_entity.argtypes = (
     ctypes.c_void_p,
     _UniffiRustBuffer,
     ctypes.POINTER(_UniffiRustCallStatus),
 )
 _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_find_by_entity.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_find_by_entity_async.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_find_by_entity_async.restype = ctypes.c_uint64
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memories.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memories.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memories_async.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memories_async.restype = ctypes.c_uint64
 _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memory.argtypes = (
     ctypes.c_void_p,
     _UniffiRustBuffer,
     ctypes.POINTER(_UniffiRustCallStatus),
 )
 _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memory.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memory_async.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memory_async.restype = ctypes.c_uint64
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memories.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memories.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memories_async.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memories_async.restype = ctypes.c_uint64
 _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memory.argtypes = (
     ctypes.c_void_p,
     _UniffiRustBuffer,
@@ -627,11 +705,43 @@ _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memory.argtypes
     ctypes.POINTER(_UniffiRustCallStatus),
 )
 _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memory.restype = None
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memory_async.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+    _UniffiRustBuffer,
+    _UniffiRustBuffer,
+    _UniffiRustBuffer,
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memory_async.restype = ctypes.c_uint64
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_open_cursor.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+    ctypes.c_uint32,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_open_cursor.restype = ctypes.c_void_p
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_read_columns.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+    ctypes.c_uint32,
+    ctypes.POINTER(_UniffiRustCallStatus),
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_read_columns.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_read_columns_async.argtypes = (
+    ctypes.c_void_p,
+    _UniffiRustBuffer,
+    ctypes.c_uint32,
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_read_columns_async.restype = ctypes.c_uint64
 _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_record_count.argtypes = (
     ctypes.c_void_p,
     ctypes.POINTER(_UniffiRustCallStatus),
 )
 _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_record_count.restype = ctypes.c_uint64
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_record_count_async.argtypes = (
+    ctypes.c_void_p,
+)
+_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_record_count_async.restype = ctypes.c_uint64
 _UniffiLib.uniffi_engram_core_fn_func_decrypt_bytes.argtypes = (
     _UniffiRustBuffer,
     _UniffiRustBuffer,
@@ -644,6 +754,11 @@ _UniffiLib.uniffi_engram_core_fn_func_derive_key.argtypes = (
     ctypes.POINTER(_UniffiRustCallStatus),
 )
 _UniffiLib.uniffi_engram_core_fn_func_derive_key.restype = _UniffiRustBuffer
+_UniffiLib.uniffi_engram_core_fn_func_derive_key_async.argtypes = (
+    _UniffiRustBuffer,
+    _UniffiRustBuffer,
+)
+_UniffiLib.uniffi_engram_core_fn_func_derive_key_async.restype = ctypes.c_uint64
 _UniffiLib.uniffi_engram_core_fn_func_encrypt_bytes.argtypes = (
     _UniffiRustBuffer,
     _UniffiRustBuffer,
@@ -986,18 +1101,18 @@ _uniffi_check_contract_api_version(_UniffiLib)
 # Public interface members begin here.
 
 
-class _UniffiConverterUInt8(_UniffiConverterPrimitiveInt):
-    CLASS_NAME = "u8"
+class _UniffiConverterUInt32(_UniffiConverterPrimitiveInt):
+    CLASS_NAME = "u32"
     VALUE_MIN = 0
-    VALUE_MAX = 2**8
+    VALUE_MAX = 2**32
 
     @staticmethod
     def read(buf):
-        return buf.read_u8()
+        return buf.read_u32()
 
     @staticmethod
     def write(value, buf):
-        buf.write_u8(value)
+        buf.write_u32(value)
 
 class _UniffiConverterUInt64(_UniffiConverterPrimitiveInt):
     CLASS_NAME = "u64"
@@ -1059,27 +1174,163 @@ class _UniffiConverterString:
 
 
 
+class _UniffiConverterBytes(_UniffiConverterRustBuffer):
+    @staticmethod
+    def read(buf):
+        size = buf.read_i32()
+        if size < 0:
+            raise InternalError("Unexpected negative byte string length")
+        return buf.read(size)
+
+    @staticmethod
+    def check_lower(value):
+        try:
+            memoryview(value)
+        except TypeError:
+            raise TypeError("a bytes-like object is required, not {!r}".format(type(value).__name__))
+
+    @staticmethod
+    def write(value, buf):
+        view = memoryview(value).cast("B")
+        buf.write_i32(view.nbytes)
+        buf.write(view if not isinstance(value, bytes) else value)
+
+
+
+class MemoryCursorProtocol(typing.Protocol):
+    def next_page(self, ):
+        raise NotImplementedError
+    async def next_page_async(self, ):
+        raise NotImplementedError
+
+
+class MemoryCursor:
+    _pointer: ctypes.c_void_p
+    
+    def __init__(self, *args, **kwargs):
+        raise ValueError("This class has no default constructor")
+
+    def __del__(self):
+        # In case of partial initialization of instances.
+        pointer = getattr(self, "_pointer", None)
+        if pointer is not None:
+            _uniffi_rust_call(_UniffiLib.uniffi_engram_core_fn_free_memorycursor, pointer)
+
+    def _uniffi_clone_pointer(self):
+        return _uniffi_rust_call(_UniffiLib.uniffi_engram_core_fn_clone_memorycursor, self._pointer)
+
+    # Used by alternative constructors or any methods which return this type.
+    @classmethod
+    def _make_instance_(cls, pointer):
+        # Lightly yucky way to bypass the usual __init__ logic
+        # and just create a new instance with the required pointer.
+        inst = cls.__new__(cls)
+        inst._pointer = pointer
+        return inst
+
+
+    def next_page(self, ) -> "typing.List[MemoryRecord]":
+        return _UniffiConverterSequenceTypeMemoryRecord.lift(
+            _uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_method_memorycursor_next_page,self._uniffi_clone_pointer(),)
+        )
+
+
+
+
+
+
+    async def next_page_async(self, ) -> "typing.List[MemoryRecord]":
+        return await _uniffi_rust_call_async(
+            _UniffiLib.uniffi_engram_core_fn_method_memorycursor_next_page_async(
+                self._uniffi_clone_pointer(),
+            ),
+            _UniffiLib.ffi_engram_core_rust_future_poll_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_complete_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_free_rust_buffer,
+            # lift function
+            _UniffiConverterSequenceTypeMemoryRecord.lift,
+            # Error FFI converter
+            _UniffiConverterTypeEngramError,
+        )
+
+
+
+
+
+
+class _UniffiConverterTypeMemoryCursor:
+
+    @staticmethod
+    def lift(value: int):
+        return MemoryCursor._make_instance_(value)
+
+    @staticmethod
+    def check_lower(value: MemoryCursor):
+        if not isinstance(value, MemoryCursor):
+            raise TypeError("Expected MemoryCursor instance, {} found".format(type(value).__name__))
+
+    @staticmethod
+    def lower(value: MemoryCursorProtocol):
+        if not isinstance(value, MemoryCursor):
+            raise TypeError("Expected MemoryCursor instance, {} found".format(type(value).__name__))
+        return value._uniffi_clone_pointer()
+
+    @classmethod
+    def read(cls, buf: _UniffiRustBuffer):
+        ptr = buf.read_u64()
+        if ptr == 0:
+            raise InternalError("Raw pointer value was null")
+        return cls.lift(ptr)
+
+    @classmethod
+    def write(cls, value: MemoryCursorProtocol, buf: _UniffiRustBuffer):
+        buf.write_u64(cls.lower(value))
+
+
+
 class MemoryStoreHandleProtocol(typing.Protocol):
     def find_by_entity(self, entity: "str"):
         raise NotImplementedError
+    async def find_by_entity_async(self, entity: "str"):
+        raise NotImplementedError
+    def get_memories(self, ids: "typing.List[str]"):
+        raise NotImplementedError
+    async def get_memories_async(self, ids: "typing.List[str]"):
+        raise NotImplementedError
     def get_memory(self, id: "str"):
         raise NotImplementedError
+    async def get_memory_async(self, id: "str"):
+        raise NotImplementedError
+    def insert_memories(self, memories: "typing.List[MemoryInput]"):
+        raise NotImplementedError
+    async def insert_memories_async(self, memories: "typing.List[MemoryInput]"):
+        raise NotImplementedError
     def insert_memory(self, entity: "str",attribute: "str",value: "str",source: "typing.Optional[str]"):
         raise NotImplementedError
+    async def insert_memory_async(self, entity: "str",attribute: "str",value: "str",source: "typing.Optional[str]"):
+        raise NotImplementedError
+    def open_cursor(self, filter: "CursorFilter",page_size: "int"):
+        raise NotImplementedError
+    def read_columns(self, entity: "typing.Optional[str]",limit: "int"):
+        raise NotImplementedError
+    async def read_columns_async(self, entity: "typing.Optional[str]",limit: "int"):
+        raise NotImplementedError
     def record_count(self, ):
         raise NotImplementedError
+    async def record_count_async(self, ):
+        raise NotImplementedError
 
 
 class MemoryStoreHandle:
     _pointer: ctypes.c_void_p
-    def __init__(self, db_path: "str",key_bytes: "typing.List[int]"):
+    def __init__(self, db_path: "str",key_bytes: "bytes"):
         _UniffiConverterString.check_lower(db_path)
         
-        _UniffiConverterSequenceUInt8.check_lower(key_bytes)
+        _UniffiConverterBytes.check_lower(key_bytes)
         
         self._pointer = _uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_new,
         _UniffiConverterString.lower(db_path),
-        _UniffiConverterSequenceUInt8.lower(key_bytes))
+        _UniffiConverterBytes.lower(key_bytes))
 
     def __del__(self):
         # In case of partial initialization of instances.
@@ -1098,6 +1349,38 @@ class MemoryStoreHandle:
         inst = cls.__new__(cls)
         inst._pointer = pointer
         return inst
+    @classmethod
+    def open_pooled(cls, db_path: "str",key_bytes: "bytes",readers: "int"):
+        _UniffiConverterString.check_lower(db_path)
+        
+        _UniffiConverterBytes.check_lower(key_bytes)
+        
+        _UniffiConverterUInt32.check_lower(readers)
+        
+        # Call the (fallible) function before creating any half-baked object instances.
+        pointer = _uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_open_pooled,
+        _UniffiConverterString.lower(db_path),
+        _UniffiConverterBytes.lower(key_bytes),
+        _UniffiConverterUInt32.lower(readers))
+        return cls._make_instance_(pointer)
+    @classmethod
+    def open_with_profile(cls, db_path: "str",key_bytes: "bytes",profile: "StoreProfile",readers: "int"):
+        _UniffiConverterString.check_lower(db_path)
+        
+        _UniffiConverterBytes.check_lower(key_bytes)
+        
+        _UniffiConverterTypeStoreProfile.check_lower(profile)
+        
+        _UniffiConverterUInt32.check_lower(readers)
+        
+        # Call the (fallible) function before creating any half-baked object instances.
+        pointer = _uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_constructor_memorystorehandle_open_with_profile,
+        _UniffiConverterString.lower(db_path),
+        _UniffiConverterBytes.lower(key_bytes),
+        _UniffiConverterTypeStoreProfile.lower(profile),
+        _UniffiConverterUInt32.lower(readers))
+        return cls._make_instance_(pointer)
+
 
 
     def find_by_entity(self, entity: "str") -> "typing.List[MemoryRecord]":
@@ -1112,6 +1395,62 @@ class MemoryStoreHandle:
 
 
 
+    async def find_by_entity_async(self, entity: "str") -> "typing.List[MemoryRecord]":
+        _UniffiConverterString.check_lower(entity)
+        
+        return await _uniffi_rust_call_async(
+            _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_find_by_entity_async(
+                self._uniffi_clone_pointer(),
+                _UniffiConverterString.lower(entity),
+            ),
+            _UniffiLib.ffi_engram_core_rust_future_poll_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_complete_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_free_rust_buffer,
+            # lift function
+            _UniffiConverterSequenceTypeMemoryRecord.lift,
+            # Error FFI converter
+            _UniffiConverterTypeEngramError,
+        )
+
+
+
+
+
+
+    def get_memories(self, ids: "typing.List[str]") -> "typing.List[MemoryRecord]":
+        _UniffiConverterSequenceString.check_lower(ids)
+        
+        return _UniffiConverterSequenceTypeMemoryRecord.lift(
+            _uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memories,self._uniffi_clone_pointer(),
+        _UniffiConverterSequenceString.lower(ids))
+        )
+
+
+
+
+
+    async def get_memories_async(self, ids: "typing.List[str]") -> "typing.List[MemoryRecord]":
+        _UniffiConverterSequenceString.check_lower(ids)
+        
+        return await _uniffi_rust_call_async(
+            _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memories_async(
+                self._uniffi_clone_pointer(),
+                _UniffiConverterSequenceString.lower(ids),
+            ),
+            _UniffiLib.ffi_engram_core_rust_future_poll_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_complete_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_free_rust_buffer,
+            # lift function
+            _UniffiConverterSequenceTypeMemoryRecord.lift,
+            # Error FFI converter
+            _UniffiConverterTypeEngramError,
+        )
+
+
+
+
+
+
     def get_memory(self, id: "str") -> "typing.Optional[MemoryRecord]":
         _UniffiConverterString.check_lower(id)
         
@@ -1124,6 +1463,62 @@ class MemoryStoreHandle:
 
 
 
+    async def get_memory_async(self, id: "str") -> "typing.Optional[MemoryRecord]":
+        _UniffiConverterString.check_lower(id)
+        
+        return await _uniffi_rust_call_async(
+            _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_get_memory_async(
+                self._uniffi_clone_pointer(),
+                _UniffiConverterString.lower(id),
+            ),
+            _UniffiLib.ffi_engram_core_rust_future_poll_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_complete_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_free_rust_buffer,
+            # lift function
+            _UniffiConverterOptionalTypeMemoryRecord.lift,
+            # Error FFI converter
+            _UniffiConverterTypeEngramError,
+        )
+
+
+
+
+
+
+    def insert_memories(self, memories: "typing.List[MemoryInput]") -> "typing.List[str]":
+        _UniffiConverterSequenceTypeMemoryInput.check_lower(memories)
+        
+        return _UniffiConverterSequenceString.lift(
+            _uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memories,self._uniffi_clone_pointer(),
+        _UniffiConverterSequenceTypeMemoryInput.lower(memories))
+        )
+
+
+
+
+
+    async def insert_memories_async(self, memories: "typing.List[MemoryInput]") -> "typing.List[str]":
+        _UniffiConverterSequenceTypeMemoryInput.check_lower(memories)
+        
+        return await _uniffi_rust_call_async(
+            _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memories_async(
+                self._uniffi_clone_pointer(),
+                _UniffiConverterSequenceTypeMemoryInput.lower(memories),
+            ),
+            _UniffiLib.ffi_engram_core_rust_future_poll_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_complete_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_free_rust_buffer,
+            # lift function
+            _UniffiConverterSequenceString.lift,
+            # Error FFI converter
+            _UniffiConverterTypeEngramError,
+        )
+
+
+
+
+
+
     def insert_memory(self, entity: "str",attribute: "str",value: "str",source: "typing.Optional[str]") -> None:
         _UniffiConverterString.check_lower(entity)
         
@@ -1144,6 +1539,92 @@ class MemoryStoreHandle:
 
 
 
+    async def insert_memory_async(self, entity: "str",attribute: "str",value: "str",source: "typing.Optional[str]") -> None:
+        _UniffiConverterString.check_lower(entity)
+        
+        _UniffiConverterString.check_lower(attribute)
+        
+        _UniffiConverterString.check_lower(value)
+        
+        _UniffiConverterOptionalString.check_lower(source)
+        
+        return await _uniffi_rust_call_async(
+            _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_insert_memory_async(
+                self._uniffi_clone_pointer(),
+                _UniffiConverterString.lower(entity),
+                _UniffiConverterString.lower(attribute),
+                _UniffiConverterString.lower(value),
+                _UniffiConverterOptionalString.lower(source),
+            ),
+            _UniffiLib.ffi_engram_core_rust_future_poll_void,
+            _UniffiLib.ffi_engram_core_rust_future_complete_void,
+            _UniffiLib.ffi_engram_core_rust_future_free_void,
+            # lift function
+            lambda val: None,
+            # Error FFI converter
+            _UniffiConverterTypeEngramError,
+        )
+
+
+
+
+
+
+    def open_cursor(self, filter: "CursorFilter",page_size: "int") -> "MemoryCursor":
+        _UniffiConverterTypeCursorFilter.check_lower(filter)
+        
+        _UniffiConverterUInt32.check_lower(page_size)
+        
+        return _UniffiConverterTypeMemoryCursor.lift(
+            _uniffi_rust_call(_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_open_cursor,self._uniffi_clone_pointer(),
+        _UniffiConverterTypeCursorFilter.lower(filter),
+        _UniffiConverterUInt32.lower(page_size))
+        )
+
+
+
+
+
+    def read_columns(self, entity: "typing.Optional[str]",limit: "int") -> "MemoryColumns":
+        _UniffiConverterOptionalString.check_lower(entity)
+        
+        _UniffiConverterUInt32.check_lower(limit)
+        
+        return _UniffiConverterTypeMemoryColumns.lift(
+            _uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_read_columns,self._uniffi_clone_pointer(),
+        _UniffiConverterOptionalString.lower(entity),
+        _UniffiConverterUInt32.lower(limit))
+        )
+
+
+
+
+
+    async def read_columns_async(self, entity: "typing.Optional[str]",limit: "int") -> "MemoryColumns":
+        _UniffiConverterOptionalString.check_lower(entity)
+        
+        _UniffiConverterUInt32.check_lower(limit)
+        
+        return await _uniffi_rust_call_async(
+            _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_read_columns_async(
+                self._uniffi_clone_pointer(),
+                _UniffiConverterOptionalString.lower(entity),
+                _UniffiConverterUInt32.lower(limit),
+            ),
+            _UniffiLib.ffi_engram_core_rust_future_poll_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_complete_rust_buffer,
+            _UniffiLib.ffi_engram_core_rust_future_free_rust_buffer,
+            # lift function
+            _UniffiConverterTypeMemoryColumns.lift,
+            # Error FFI converter
+            _UniffiConverterTypeEngramError,
+        )
+
+
+
+
+
+
     def record_count(self, ) -> "int":
         return _UniffiConverterUInt64.lift(
             _uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_record_count,self._uniffi_clone_pointer(),)
@@ -1154,6 +1635,25 @@ class MemoryStoreHandle:
 
 
 
+    async def record_count_async(self, ) -> "int":
+        return await _uniffi_rust_call_async(
+            _UniffiLib.uniffi_engram_core_fn_method_memorystorehandle_record_count_async(
+                self._uniffi_clone_pointer(),
+            ),
+            _UniffiLib.ffi_engram_core_rust_future_poll_u64,
+            _UniffiLib.ffi_engram_core_rust_future_complete_u64,
+            _UniffiLib.ffi_engram_core_rust_future_free_u64,
+            # lift function
+            _UniffiConverterUInt64.lift,
+            # Error FFI converter
+            _UniffiConverterTypeEngramError,
+        )
+
+
+
+
+
+
 class _UniffiConverterTypeMemoryStoreHandle:
 
     @staticmethod
@@ -1183,6 +1683,189 @@ class _UniffiConverterTypeMemoryStoreHandle:
         buf.write_u64(cls.lower(value))
 
 
+class CursorFilter:
+    entity: "typing.Optional[str]"
+    source: "typing.Optional[str]"
+    since_ms: "typing.Optional[int]"
+    until_ms: "typing.Optional[int]"
+    def __init__(self, *, entity: "typing.Optional[str]" = _DEFAULT, source: "typing.Optional[str]" = _DEFAULT, since_ms: "typing.Optional[int]" = _DEFAULT, until_ms: "typing.Optional[int]" = _DEFAULT):
+        if entity is _DEFAULT:
+            self.entity = None
+        else:
+            self.entity = entity
+        if source is _DEFAULT:
+            self.source = None
+        else:
+            self.source = source
+        if since_ms is _DEFAULT:
+            self.since_ms = None
+        else:
+            self.since_ms = since_ms
+        if until_ms is _DEFAULT:
+            self.until_ms = None
+        else:
+            self.until_ms = until_ms
+
+    def __str__(self):
+        return "CursorFilter(entity={}, source={}, since_ms={}, until_ms={})".format(self.entity, self.source, self.since_ms, self.until_ms)
+
+    def __eq__(self, other):
+        if self.entity != other.entity:
+            return False
+        if self.source != other.source:
+            return False
+        if self.since_ms != other.since_ms:
+            return False
+        if self.until_ms != other.until_ms:
+            return False
+        return True
+
+class _UniffiConverterTypeCursorFilter(_UniffiConverterRustBuffer):
+    @staticmethod
+    def read(buf):
+        return CursorFilter(
+            entity=_UniffiConverterOptionalString.read(buf),
+            source=_UniffiConverterOptionalString.read(buf),
+            since_ms=_UniffiConverterOptionalInt64.read(buf),
+            until_ms=_UniffiConverterOptionalInt64.read(buf),
+        )
+
+    @staticmethod
+    def check_lower(value):
+        _UniffiConverterOptionalString.check_lower(value.entity)
+        _UniffiConverterOptionalString.check_lower(value.source)
+        _UniffiConverterOptionalInt64.check_lower(value.since_ms)
+        _UniffiConverterOptionalInt64.check_lower(value.until_ms)
+
+    @staticmethod
+    def write(value, buf):
+        _UniffiConverterOptionalString.write(value.entity, buf)
+        _UniffiConverterOptionalString.write(value.source, buf)
+        _UniffiConverterOptionalInt64.write(value.since_ms, buf)
+        _UniffiConverterOptionalInt64.write(value.until_ms, buf)
+
+
+class MemoryColumns:
+    ids: "typing.List[str]"
+    entities: "typing.List[str]"
+    attributes: "typing.List[str]"
+    values: "typing.List[str]"
+    sources: "typing.List[typing.Optional[str]]"
+    created_at: "typing.List[int]"
+    updated_at: "typing.List[int]"
+    def __init__(self, *, ids: "typing.List[str]", entities: "typing.List[str]", attributes: "typing.List[str]", values: "typing.List[str]", sources: "typing.List[typing.Optional[str]]", created_at: "typing.List[int]", updated_at: "typing.List[int]"):
+        self.ids = ids
+        self.entities = entities
+        self.attributes = attributes
+        self.values = values
+        self.sources = sources
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __str__(self):
+        return "MemoryColumns(ids={}, entities={}, attributes={}, values={}, sources={}, created_at={}, updated_at={})".format(self.ids, self.entities, self.attributes, self.values, self.sources, self.created_at, self.updated_at)
+
+    def __eq__(self, other):
+        if self.ids != other.ids:
+            return False
+        if self.entities != other.entities:
+            return False
+        if self.attributes != other.attributes:
+            return False
+        if self.values != other.values:
+            return False
+        if self.sources != other.sources:
+            return False
+        if self.created_at != other.created_at:
+            return False
+        if self.updated_at != other.updated_at:
+            return False
+        return True
+
+class _UniffiConverterTypeMemoryColumns(_UniffiConverterRustBuffer):
+    @staticmethod
+    def read(buf):
+        return MemoryColumns(
+            ids=_UniffiConverterSequenceString.read(buf),
+            entities=_UniffiConverterSequenceString.read(buf),
+            attributes=_UniffiConverterSequenceString.read(buf),
+            values=_UniffiConverterSequenceString.read(buf),
+            sources=_UniffiConverterSequenceOptionalString.read(buf),
+            created_at=_UniffiConverterSequenceInt64.read(buf),
+            updated_at=_UniffiConverterSequenceInt64.read(buf),
+        )
+
+    @staticmethod
+    def check_lower(value):
+        _UniffiConverterSequenceString.check_lower(value.ids)
+        _UniffiConverterSequenceString.check_lower(value.entities)
+        _UniffiConverterSequenceString.check_lower(value.attributes)
+        _UniffiConverterSequenceString.check_lower(value.values)
+        _UniffiConverterSequenceOptionalString.check_lower(value.sources)
+        _UniffiConverterSequenceInt64.check_lower(value.created_at)
+        _UniffiConverterSequenceInt64.check_lower(value.updated_at)
+
+    @staticmethod
+    def write(value, buf):
+        _UniffiConverterSequenceString.write(value.ids, buf)
+        _UniffiConverterSequenceString.write(value.entities, buf)
+        _UniffiConverterSequenceString.write(value.attributes, buf)
+        _UniffiConverterSequenceString.write(value.values, buf)
+        _UniffiConverterSequenceOptionalString.write(value.sources, buf)
+        _UniffiConverterSequenceInt64.write(value.created_at, buf)
+        _UniffiConverterSequenceInt64.write(value.updated_at, buf)
+
+
+class MemoryInput:
+    entity: "str"
+    attribute: "str"
+    value: "str"
+    source: "typing.Optional[str]"
+    def __init__(self, *, entity: "str", attribute: "str", value: "str", source: "typing.Optional[str]"):
+        self.entity = entity
+        self.attribute = attribute
+        self.value = value
+        self.source = source
+
+    def __str__(self):
+        return "MemoryInput(entity={}, attribute={}, value={}, source={})".format(self.entity, self.attribute, self.value, self.source)
+
+    def __eq__(self, other):
+        if self.entity != other.entity:
+            return False
+        if self.attribute != other.attribute:
+            return False
+        if self.value != other.value:
+            return False
+        if self.source != other.source:
+            return False
+        return True
+
+class _UniffiConverterTypeMemoryInput(_UniffiConverterRustBuffer):
+    @staticmethod
+    def read(buf):
+        return MemoryInput(
+            entity=_UniffiConverterString.read(buf),
+            attribute=_UniffiConverterString.read(buf),
+            value=_UniffiConverterString.read(buf),
+            source=_UniffiConverterOptionalString.read(buf),
+        )
+
+    @staticmethod
+    def check_lower(value):
+        _UniffiConverterString.check_lower(value.entity)
+        _UniffiConverterString.check_lower(value.attribute)
+        _UniffiConverterString.check_lower(value.value)
+        _UniffiConverterOptionalString.check_lower(value.source)
+
+    @staticmethod
+    def write(value, buf):
+        _UniffiConverterString.write(value.entity, buf)
+        _UniffiConverterString.write(value.attribute, buf)
+        _UniffiConverterString.write(value.value, buf)
+        _UniffiConverterOptionalString.write(value.source, buf)
+
+
 class MemoryRecord:
     id: "str"
     entity: "str"
@@ -1337,6 +2020,76 @@ class _UniffiConverterTypeEngramError(_UniffiConverterRustBuffer):
 
 
 
+
+class StoreProfile(enum.Enum):
+    INTERACTIVE = 0
+    
+    BULK_INGEST = 1
+    
+    MOBILE = 2
+    
+
+
+class _UniffiConverterTypeStoreProfile(_UniffiConverterRustBuffer):
+    @staticmethod
+    def read(buf):
+        variant = buf.read_i32()
+        if variant == 1:
+            return StoreProfile.INTERACTIVE
+        if variant == 2:
+            return StoreProfile.BULK_INGEST
+        if variant == 3:
+            return StoreProfile.MOBILE
+        raise InternalError("Raw enum value doesn't match any cases")
+
+    @staticmethod
+    def check_lower(value):
+        if value == StoreProfile.INTERACTIVE:
+            return
+        if value == StoreProfile.BULK_INGEST:
+            return
+        if value == StoreProfile.MOBILE:
+            return
+        raise ValueError(value)
+
+    @staticmethod
+    def write(value, buf):
+        if value == StoreProfile.INTERACTIVE:
+            buf.write_i32(1)
+        if value == StoreProfile.BULK_INGEST:
+            buf.write_i32(2)
+        if value == StoreProfile.MOBILE:
+            buf.write_i32(3)
+
+
+
+class _UniffiConverterOptionalInt64(_UniffiConverterRustBuffer):
+    @classmethod
+    def check_lower(cls, value):
+        if value is not None:
+            _UniffiConverterInt64.check_lower(value)
+
+    @classmethod
+    def write(cls, value, buf):
+        if value is None:
+            buf.write_u8(0)
+            return
+
+        buf.write_u8(1)
+        _UniffiConverterInt64.write(value, buf)
+
+    @classmethod
+    def read(cls, buf):
+        flag = buf.read_u8()
+        if flag == 0:
+            return None
+        elif flag == 1:
+            return _UniffiConverterInt64.read(buf)
+        else:
+            raise InternalError("Unexpected flag byte for optional type")
+
+
+
 class _UniffiConverterOptionalString(_UniffiConverterRustBuffer):
     @classmethod
     def check_lower(cls, value):
@@ -1391,18 +2144,18 @@ class _UniffiConverterOptionalTypeMemoryRecord(_UniffiConverterRustBuffer):
 
 
 
-class _UniffiConverterSequenceUInt8(_UniffiConverterRustBuffer):
+class _UniffiConverterSequenceInt64(_UniffiConverterRustBuffer):
     @classmethod
     def check_lower(cls, value):
         for item in value:
-            _UniffiConverterUInt8.check_lower(item)
+            _UniffiConverterInt64.check_lower(item)
 
     @classmethod
     def write(cls, value, buf):
         items = len(value)
         buf.write_i32(items)
         for item in value:
-            _UniffiConverterUInt8.write(item, buf)
+            _UniffiConverterInt64.write(item, buf)
 
     @classmethod
     def read(cls, buf):
@@ -1411,7 +2164,7 @@ class _UniffiConverterSequenceUInt8(_UniffiConverterRustBuffer):
             raise InternalError("Unexpected negative sequence length")
 
         return [
-            _UniffiConverterUInt8.read(buf) for i in range(count)
+            _UniffiConverterInt64.read(buf) for i in range(count)
         ]
 
 
@@ -1441,6 +2194,56 @@ class _UniffiConverterSequenceString(_UniffiConverterRustBuffer):
 
 
 
+class _UniffiConverterSequenceOptionalString(_UniffiConverterRustBuffer):
+    @classmethod
+    def check_lower(cls, value):
+        for item in value:
+            _UniffiConverterOptionalString.check_lower(item)
+
+    @classmethod
+    def write(cls, value, buf):
+        items = len(value)
+        buf.write_i32(items)
+        for item in value:
+            _UniffiConverterOptionalString.write(item, buf)
+
+    @classmethod
+    def read(cls, buf):
+        count = buf.read_i32()
+        if count < 0:
+            raise InternalError("Unexpected negative sequence length")
+
+        return [
+            _UniffiConverterOptionalString.read(buf) for i in range(count)
+        ]
+
+
+
+class _UniffiConverterSequenceTypeMemoryInput(_UniffiConverterRustBuffer):
+    @classmethod
+    def check_lower(cls, value):
+        for item in value:
+            _UniffiConverterTypeMemoryInput.check_lower(item)
+
+    @classmethod
+    def write(cls, value, buf):
+        items = len(value)
+        buf.write_i32(items)
+        for item in value:
+            _UniffiConverterTypeMemoryInput.write(item, buf)
+
+    @classmethod
+    def read(cls, buf):
+        count = buf.read_i32()
+        if count < 0:
+            raise InternalError("Unexpected negative sequence length")
+
+        return [
+            _UniffiConverterTypeMemoryInput.read(buf) for i in range(count)
+        ]
+
+
+
 class _UniffiConverterSequenceTypeMemoryRecord(_UniffiConverterRustBuffer):
     @classmethod
     def check_lower(cls, value):
@@ -1465,39 +2268,122 @@ class _UniffiConverterSequenceTypeMemoryRecord(_UniffiConverterRustBuffer):
         ]
 
 # Async support
+# RustFuturePoll values
+_UNIFFI_RUST_FUTURE_POLL_READY = 0
+_UNIFFI_RUST_FUTURE_POLL_MAYBE_READY = 1
+
+# Stores futures for _uniffi_continuation_callback
+_UniffiContinuationHandleMap = _UniffiHandleMap()
+
+_UNIFFI_GLOBAL_EVENT_LOOP = None
+
+"""
+Set the event loop to use for async functions
+
+This is needed if some async functions run outside of the eventloop, for example:
+    - A non-eventloop thread is spawned, maybe from `EventLoop.run_in_executor` or maybe from the
+      Rust code spawning its own thread.
+    - The Rust code calls an async callback method from a sync callback function, using something
+      like `pollster` to block on the async call.
 
-def decrypt_bytes(key_bytes: "typing.List[int]",ciphertext: "typing.List[int]") -> "typing.List[int]":
-    _UniffiConverterSequenceUInt8.check_lower(key_bytes)
+In this case, we need an event loop to run the Python async function, but there's no eventloop set
+for the thread.  Use `uniffi_set_event_loop` to force an eventloop to be used in this case.
+"""
+def uniffi_set_event_loop(eventloop: asyncio.BaseEventLoop):
+    global _UNIFFI_GLOBAL_EVENT_LOOP
+    _UNIFFI_GLOBAL_EVENT_LOOP = eventloop
+
+def _uniffi_get_event_loop():
+    if _UNIFFI_GLOBAL_EVENT_LOOP is not None:
+        return _UNIFFI_GLOBAL_EVENT_LOOP
+    else:
+        return asyncio.get_running_loop()
+
+# Continuation callback for async functions
+# lift the return value or error and resolve the future, causing the async function to resume.
+@_UNIFFI_RUST_FUTURE_CONTINUATION_CALLBACK
+def _uniffi_continuation_callback(future_ptr, poll_code):
+    (eventloop, future) = _UniffiContinuationHandleMap.remove(future_ptr)
+    eventloop.call_soon_threadsafe(_uniffi_set_future_result, future, poll_code)
+
+def _uniffi_set_future_result(future, poll_code):
+    if not future.cancelled():
+        future.set_result(poll_code)
+
+async def _uniffi_rust_call_async(rust_future, ffi_poll, ffi_complete, ffi_free, lift_func, error_ffi_converter):
+    try:
+        eventloop = _uniffi_get_event_loop()
+
+        # Loop and poll until we see a _UNIFFI_RUST_FUTURE_POLL_READY value
+        while True:
+            future = eventloop.create_future()
+            ffi_poll(
+                rust_future,
+                _uniffi_continuation_callback,
+                _UniffiContinuationHandleMap.insert((eventloop, future)),
+            )
+            poll_code = await future
+            if poll_code == _UNIFFI_RUST_FUTURE_POLL_READY:
+                break
+
+        return lift_func(
+            _uniffi_rust_call_with_error(error_ffi_converter, ffi_complete, rust_future)
+        )
+    finally:
+        ffi_free(rust_future)
+
+def decrypt_bytes(key_bytes: "bytes",ciphertext: "bytes") -> "bytes":
+    _UniffiConverterBytes.check_lower(key_bytes)
     
-    _UniffiConverterSequenceUInt8.check_lower(ciphertext)
+    _UniffiConverterBytes.check_lower(ciphertext)
     
-    return _UniffiConverterSequenceUInt8.lift(_uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_func_decrypt_bytes,
-        _UniffiConverterSequenceUInt8.lower(key_bytes),
-        _UniffiConverterSequenceUInt8.lower(ciphertext)))
+    return _UniffiConverterBytes.lift(_uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_func_decrypt_bytes,
+        _UniffiConverterBytes.lower(key_bytes),
+        _UniffiConverterBytes.lower(ciphertext)))
 
 
-def derive_key(password: "str",salt: "typing.List[int]") -> "typing.List[int]":
+def derive_key(password: "str",salt: "bytes") -> "bytes":
     _UniffiConverterString.check_lower(password)
     
-    _UniffiConverterSequenceUInt8.check_lower(salt)
+    _UniffiConverterBytes.check_lower(salt)
     
-    return _UniffiConverterSequenceUInt8.lift(_uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_func_derive_key,
+    return _UniffiConverterBytes.lift(_uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_func_derive_key,
         _UniffiConverterString.lower(password),
-        _UniffiConverterSequenceUInt8.lower(salt)))
+        _UniffiConverterBytes.lower(salt)))
 
 
-def encrypt_bytes(key_bytes: "typing.List[int]",plaintext: "typing.List[int]") -> "typing.List[int]":
-    _UniffiConverterSequenceUInt8.check_lower(key_bytes)
+async def derive_key_async(password: "str",salt: "bytes") -> "bytes":
+    _UniffiConverterString.check_lower(password)
+    
+    _UniffiConverterBytes.check_lower(salt)
+    
+    return await _uniffi_rust_call_async(
+        _UniffiLib.uniffi_engram_core_fn_func_derive_key_async(
+            _UniffiConverterString.lower(password),
+            _UniffiConverterBytes.lower(salt),
+        ),
+        _UniffiLib.ffi_engram_core_rust_future_poll_rust_buffer,
+        _UniffiLib.ffi_engram_core_rust_future_complete_rust_buffer,
+        _UniffiLib.ffi_engram_core_rust_future_free_rust_buffer,
+        # lift function
+        _UniffiConverterBytes.lift,
+        # Error FFI converter
+        _UniffiConverterTypeEngramError,
+    )
+
+
+def encrypt_bytes(key_bytes: "bytes",plaintext: "bytes") -> "bytes":
+    _UniffiConverterBytes.check_lower(key_bytes)
     
-    _UniffiConverterSequenceUInt8.check_lower(plaintext)
+    _UniffiConverterBytes.check_lower(plaintext)
     
-    return _UniffiConverterSequenceUInt8.lift(_uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_func_encrypt_bytes,
-        _UniffiConverterSequenceUInt8.lower(key_bytes),
-        _UniffiConverterSequenceUInt8.lower(plaintext)))
+    return _UniffiConverterBytes.lift(_uniffi_rust_call_with_error(_UniffiConverterTypeEngramError,_UniffiLib.uniffi_engram_core_fn_func_encrypt_bytes,
+        _UniffiConverterBytes.lower(key_bytes),
+        _UniffiConverterBytes.lower(plaintext)))
 
 
-def generate_salt() -> "typing.List[int]":
-    return _UniffiConverterSequenceUInt8.lift(_uniffi_rust_call(_UniffiLib.uniffi_engram_core_fn_func_generate_salt,))
+def generate_salt() -> "bytes":
+    return _UniffiConverterBytes.lift(_uniffi_rust_call(_UniffiLib.uniffi_engram_core_fn_func_generate_salt,))
 
 
 def vault_list_markdown(vault_path: "str") -> "typing.List[str]":
@@ -1533,14 +2419,21 @@ def vault_write(vault_path: "str",relative_path: "str",content: "str") -> None:
 __all__ = [
     "InternalError",
     "EngramError",
+    "StoreProfile",
+    "CursorFilter",
+    "MemoryColumns",
+    "MemoryInput",
     "MemoryRecord",
     "decrypt_bytes",
     "derive_key",
+    "derive_key_async",
     "encrypt_bytes",
     "generate_salt",
     "vault_list_markdown",
     "vault_read",
     "vault_write",
+    "MemoryCursor",
     "MemoryStoreHandle",
+    "uniffi_set_event_loop",
 ]
 
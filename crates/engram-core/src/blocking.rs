@@ -0,0 +1,159 @@
+// blocking.rs — run blocking work on a shared thread pool from async FFI calls
+//
+// UniFFI polls async exports from the foreign language's event loop. Work
+// such as Argon2id key derivation or SQLCipher queries must therefore not run
+// inside `poll`; instead it is handed to a small pool of Rust threads and the
+// returned future completes when the job finishes. No async runtime is
+// required, so the futures work with any foreign executor (asyncio, Kotlin
+// coroutines, Swift concurrency).
+
+use std::future::Future;
+use std::panic::{self, AssertUnwindSafe};
+use std::pin::Pin;
+use std::sync::mpsc::{self, Sender};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::task::{Context, Poll, Waker};
+use std::thread;
+
+type Job = Box<dyn FnOnce() + Send + 'static>;
+
+/// Result slot shared between a pool job and the future awaiting it.
+struct Slot<T> {
+    result: Option<thread::Result<T>>,
+    waker: Option<Waker>,
+}
+
+/// Future resolved by a job running on the blocking pool.
+pub struct BlockingTask<T> {
+    slot: Arc<Mutex<Slot<T>>>,
+}
+
+impl<T> Future for BlockingTask<T> {
+    type Output = T;
+
+    fn poll(self: Pin<&mut Self>, cx: &mut Context<'_>) -> Poll<T> {
+        let mut slot = self.slot.lock().unwrap();
+        match slot.result.take() {
+            Some(Ok(value)) => Poll::Ready(value),
+            // Re-raise on the polling side so UniFFI reports it as a panic.
+            Some(Err(payload)) => panic::resume_unwind(payload),
+            None => {
+                slot.waker = Some(cx.waker().clone());
+                Poll::Pending
+            }
+        }
+    }
+}
+
+/// Run `f` on the shared blocking pool and return a future for its result.
+pub fn spawn<T, F>(f: F) -> BlockingTask<T>
+where
+    F: FnOnce() -> T + Send + 'static,
+    T: Send + 'static,
+{
+    let slot = Arc::new(Mutex::new(Slot {
+        result: None,
+        waker: None,
+    }));
+    let job_slot = Arc::clone(&slot);
+    let job: Job = Box::new(move || {
+        let result = panic::catch_unwind(AssertUnwindSafe(f));
+        let waker = {
+            let mut slot = job_slot.lock().unwrap();
+            slot.result = Some(result);
+            slot.waker.take()
+        };
+        if let Some(waker) = waker {
+            waker.wake();
+        }
+    });
+    pool()
+        .lock()
+        .unwrap()
+        .send(job)
+        .expect("blocking pool is gone");
+    BlockingTask { slot }
+}
+
+// --- Private helpers ---
+
+/// Lazily start one worker per available core (at least two) sharing a job queue.
+fn pool() -> &'static Mutex<Sender<Job>> {
+    static POOL: OnceLock<Mutex<Sender<Job>>> = OnceLock::new();
+    POOL.get_or_init(|| {
+        let (tx, rx) = mpsc::channel::<Job>();
+        let rx = Arc::new(Mutex::new(rx));
+        let workers = thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(2)
+            .max(2);
+        for i in 0..workers {
+            let rx = Arc::clone(&rx);
+            thread::Builder::new()
+                .name(format!("engram-blocking-{i}"))
+                .spawn(move || loop {
+                    let job = match rx.lock().unwrap().recv() {
+                        Ok(job) => job,
+                        Err(_) => break,
+                    };
+                    job();
+                })
+                .expect("failed to spawn blocking pool thread");
+        }
+        Mutex::new(tx)
+    })
+}
+
+/// Minimal executor for tests: park the current thread until the future is woken.
+#[cfg(test)]
+pub(crate) fn block_on<F: Future>(future: F) -> F::Output {
+    struct ThreadWaker(thread::Thread);
+    impl std::task::Wake for ThreadWaker {
+        fn wake(self: Arc<Self>) {
+            self.0.unpark();
+        }
+    }
+
+    let waker = Waker::from(Arc::new(ThreadWaker(thread::current())));
+    let mut cx = Context::from_waker(&waker);
+    let mut future = Box::pin(future);
+    loop {
+        match future.as_mut().poll(&mut cx) {
+            Poll::Ready(value) => return value,
+            Poll::Pending => thread::park(),
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    #[test]
+    fn test_spawn_returns_result() {
+        assert_eq!(block_on(spawn(|| 6 * 7)), 42);
+    }
+
+    #[test]
+    fn test_spawn_runs_off_the_calling_thread() {
+        let caller = thread::current().id();
+        let worker = block_on(spawn(|| thread::current().id()));
+        assert_ne!(caller, worker);
+    }
+
+    #[test]
+    fn test_many_jobs_all_complete() {
+        let counter = Arc::new(AtomicUsize::new(0));
+        let tasks: Vec<_> = (0..64)
+            .map(|_| {
+                let counter = Arc::clone(&counter);
+                spawn(move || counter.fetch_add(1, Ordering::SeqCst))
+            })
+            .collect();
+        for task in tasks {
+            block_on(task);
+        }
+        assert_eq!(counter.load(Ordering::SeqCst), 64);
+    }
+}
@@ -6,6 +6,8 @@ use std::path::PathBuf;
 use serde::{Deserialize, Serialize};
 use thiserror::Error;
 
+use crate::store::{RetentionPolicy, StoreProfile};
+
 // ──────────────────────────────────────────────────────────────────────────────
 // Errors
 // ──────────────────────────────────────────────────────────────────────────────
@@ -106,6 +108,31 @@ pub struct VaultEntry {
     pub vault_type: Option<String>,
 }
 
+/// Memory-store configuration (`[store]` section).
+#[derive(Debug, Clone, Default, Serialize, Deserialize)]
+pub struct StoreConfig {
+    /// Connection tuning profile: "interactive" (default), "bulk-ingest" or "mobile".
+    #[serde(default)]
+    pub profile: StoreProfile,
+    /// When `engram store compact` and the daemon archive cold facts (`[store.retention]`).
+    #[serde(default)]
+    pub retention: RetentionPolicy,
+}
+
+/// Search-index configuration (`[search]` section).
+#[derive(Debug, Clone, Default, Serialize, Deserialize)]
+pub struct SearchConfig {
+    /// Chunks per embedding batch in `engram index` (default 64).
+    #[serde(default)]
+    pub embed_batch_size: Option<usize>,
+    /// Threads reading and chunking files in `engram index` (default: one per core).
+    #[serde(default)]
+    pub embed_threads: Option<usize>,
+    /// Embeddings kept in the shared `~/.engram/embeddings.db` cache (default 100000).
+    #[serde(default)]
+    pub embed_cache_entries: Option<usize>,
+}
+
 /// Top-level Engram configuration file.
 #[derive(Debug, Clone, Default, Serialize, Deserialize)]
 pub struct EngramConfig {
@@ -113,6 +140,10 @@ pub struct EngramConfig {
     pub vaults: BTreeMap<String, VaultEntry>,
     #[serde(default)]
     pub key: KeyConfig,
+    #[serde(default)]
+    pub store: StoreConfig,
+    #[serde(default)]
+    pub search: SearchConfig,
 }
 
 // ──────────────────────────────────────────────────────────────────────────────
@@ -609,6 +640,18 @@ default = false
         );
     }
 
+    #[test]
+    fn test_search_section_overrides_only_given_fields() {
+        let toml_str = r#"
+[search]
+embed_batch_size = 128
+"#;
+        let config: EngramConfig = toml::from_str(toml_str).expect("parse [search]");
+        assert_eq!(config.search.embed_batch_size, Some(128));
+        assert_eq!(config.search.embed_threads, None);
+        assert_eq!(config.search.embed_cache_entries, None);
+    }
+
     #[cfg(unix)]
     #[test]
     fn test_save_sets_0600_permissions() {
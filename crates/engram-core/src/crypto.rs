@@ -2,14 +2,20 @@
 
 use argon2::{Algorithm, Argon2, Params, Version};
 use chacha20poly1305::{
-    aead::{Aead, AeadCore, KeyInit, OsRng},
-    XChaCha20Poly1305, XNonce,
+    aead::{Aead, AeadCore, AeadInPlace, KeyInit, OsRng},
+    Tag, XChaCha20Poly1305, XNonce,
 };
 use hex;
 use keyring::Entry;
 use rand::RngCore;
 use thiserror::Error;
 
+/// Length of the random nonce that prefixes every ciphertext.
+pub const NONCE_LEN: usize = 24;
+
+/// Length of the Poly1305 authentication tag that ends every ciphertext.
+pub const TAG_LEN: usize = 16;
+
 /// Errors produced by cryptographic operations.
 #[derive(Debug, Error)]
 pub enum CryptoError {
@@ -110,6 +116,63 @@ pub fn decrypt(key: &EngramKey, data: &[u8]) -> Result<Vec<u8>, CryptoError> {
         .map_err(|e| CryptoError::Decryption(e.to_string()))
 }
 
+/// Encrypt in place, leaving `buf[offset..]` in the format of [`encrypt`].
+///
+/// `buf[..offset]` is left untouched (room for a caller's header),
+/// `buf[offset..offset + NONCE_LEN]` is overwritten with the nonce and the
+/// rest is the plaintext, encrypted where it lies. The tag is appended, so
+/// reserve `TAG_LEN` bytes of spare capacity to avoid a reallocation.
+pub fn encrypt_in_place(
+    key: &EngramKey,
+    buf: &mut Vec<u8>,
+    offset: usize,
+) -> Result<(), CryptoError> {
+    if buf.len() < offset + NONCE_LEN {
+        return Err(CryptoError::Encryption(
+            "buffer too short to hold the nonce".to_string(),
+        ));
+    }
+    let cipher = XChaCha20Poly1305::new_from_slice(key.as_bytes())
+        .map_err(|e| CryptoError::Encryption(e.to_string()))?;
+    let nonce = XChaCha20Poly1305::generate_nonce(&mut OsRng);
+    let (nonce_slot, plaintext) = buf[offset..].split_at_mut(NONCE_LEN);
+    nonce_slot.copy_from_slice(&nonce);
+    let tag = cipher
+        .encrypt_in_place_detached(&nonce, b"", plaintext)
+        .map_err(|e| CryptoError::Encryption(e.to_string()))?;
+    buf.extend_from_slice(&tag);
+    Ok(())
+}
+
+/// Decrypt data produced by [`encrypt`] in place.
+///
+/// On success the plaintext occupies `data[NONCE_LEN..data.len() - TAG_LEN]`,
+/// which is the range returned; the nonce and tag bytes are left as they were.
+pub fn decrypt_in_place(
+    key: &EngramKey,
+    data: &mut [u8],
+) -> Result<std::ops::Range<usize>, CryptoError> {
+    if data.len() < NONCE_LEN + TAG_LEN {
+        return Err(CryptoError::Decryption(
+            "data too short to contain nonce and tag".to_string(),
+        ));
+    }
+    let end = data.len() - TAG_LEN;
+    let (head, tag) = data.split_at_mut(end);
+    let (nonce_bytes, ciphertext) = head.split_at_mut(NONCE_LEN);
+    let cipher = XChaCha20Poly1305::new_from_slice(key.as_bytes())
+        .map_err(|e| CryptoError::Decryption(e.to_string()))?;
+    cipher
+        .decrypt_in_place_detached(
+            XNonce::from_slice(nonce_bytes),
+            b"",
+            ciphertext,
+            Tag::from_slice(tag),
+        )
+        .map_err(|e| CryptoError::Decryption(e.to_string()))?;
+    Ok(NONCE_LEN..end)
+}
+
 /// Manages storage and retrieval of `EngramKey` in the platform keychain.
 ///
 /// Uses the `keyring` crate to interface with macOS Keychain, Windows Credential
@@ -251,6 +314,28 @@ mod tests {
         assert!(result.is_err(), "tampered ciphertext must fail decryption");
     }
 
+    #[test]
+    fn test_in_place_matches_allocating_format() {
+        let key = EngramKey::from_bytes([9u8; 32]);
+        let plaintext = b"hello, engram!";
+        let mut buf = b"HDR".to_vec();
+        buf.extend_from_slice(&[0u8; NONCE_LEN]);
+        buf.extend_from_slice(plaintext);
+        encrypt_in_place(&key, &mut buf, 3).expect("encrypt_in_place failed");
+        assert_eq!(&buf[..3], b"HDR");
+        assert_eq!(buf.len(), 3 + NONCE_LEN + plaintext.len() + TAG_LEN);
+        assert_eq!(decrypt(&key, &buf[3..]).unwrap(), plaintext);
+
+        let mut sealed = encrypt(&key, plaintext).unwrap();
+        let range = decrypt_in_place(&key, &mut sealed).expect("decrypt_in_place failed");
+        assert_eq!(&sealed[range], plaintext);
+
+        let mut tampered = encrypt(&key, plaintext).unwrap();
+        tampered[NONCE_LEN] ^= 0x01;
+        assert!(decrypt_in_place(&key, &mut tampered).is_err());
+        assert!(decrypt_in_place(&key, &mut [0u8; 8]).is_err());
+    }
+
     #[test]
     fn test_different_nonces_each_encrypt() {
         let salt = [0u8; 16];
@@ -4,10 +4,13 @@
 // boundary using types that are compatible with UniFFI's code generation.
 
 use std::path::Path;
-use std::sync::Mutex;
+use std::sync::{Arc, Mutex};
 
+use crate::blocking;
 use crate::crypto::{decrypt, encrypt, generate_salt as crypto_generate_salt, EngramKey};
-use crate::store::{Memory, MemoryStore};
+use crate::store::{
+    InsertReport, Memory, MemoryFilter, MemoryStore, StoreOptions, StorePool, StoreProfile,
+};
 use crate::vault::Vault;
 
 /// Errors exposed across the FFI boundary.
@@ -50,6 +53,50 @@ fn memory_to_record(m: Memory) -> MemoryRecord {
     }
 }
 
+/// Expand an [`InsertReport`] for `len` inputs into one [`InsertOutcome`] per input.
+fn report_to_outcomes(report: InsertReport, len: usize) -> Vec<InsertOutcome> {
+    let mut failures = report.failures.into_iter().peekable();
+    let mut ids = report.ids.into_iter();
+    let mut outcomes = Vec::with_capacity(len);
+    for index in 0..len {
+        let outcome = match failures.next_if(|(failed, _)| *failed == index) {
+            Some((_, e)) => InsertOutcome {
+                id: None,
+                error: Some(e.to_string()),
+            },
+            None => InsertOutcome {
+                id: ids.next(),
+                error: None,
+            },
+        };
+        outcomes.push(outcome);
+    }
+    outcomes
+}
+
+/// Split store `Memory` rows into parallel column vectors.
+fn memories_to_columns(memories: Vec<Memory>) -> MemoryColumns {
+    let mut columns = MemoryColumns {
+        ids: Vec::with_capacity(memories.len()),
+        entities: Vec::with_capacity(memories.len()),
+        attributes: Vec::with_capacity(memories.len()),
+        values: Vec::with_capacity(memories.len()),
+        sources: Vec::with_capacity(memories.len()),
+        created_at: Vec::with_capacity(memories.len()),
+        updated_at: Vec::with_capacity(memories.len()),
+    };
+    for m in memories {
+        columns.ids.push(m.id);
+        columns.entities.push(m.entity);
+        columns.attributes.push(m.attribute);
+        columns.values.push(m.value);
+        columns.sources.push(m.source);
+        columns.created_at.push(m.created_at);
+        columns.updated_at.push(m.updated_at);
+    }
+    columns
+}
+
 // ── crypto wrappers ───────────────────────────────────────────────────────────
 
 /// Derive a 32-byte key from `password` and `salt`.
@@ -68,6 +115,12 @@ pub fn derive_key(password: String, salt: Vec<u8>) -> Result<Vec<u8>, EngramErro
     Ok(key.as_bytes().to_vec())
 }
 
+/// Async [`derive_key`]: Argon2id runs on the blocking pool, so awaiting it
+/// does not stall the caller's event loop.
+pub async fn derive_key_async(password: String, salt: Vec<u8>) -> Result<Vec<u8>, EngramError> {
+    blocking::spawn(move || derive_key(password, salt)).await
+}
+
 /// Generate a fresh 16-byte random salt.
 pub fn generate_salt() -> Vec<u8> {
     crypto_generate_salt().to_vec()
@@ -131,10 +184,53 @@ pub struct MemoryRecord {
     pub updated_at: i64,
 }
 
+/// Input for a new memory in a batch insert; id and timestamps are assigned by the store.
+/// uniffi::Record semantics are provided by the UDL definition (dictionary MemoryInput).
+#[derive(Debug, Clone)]
+pub struct MemoryInput {
+    pub entity: String,
+    pub attribute: String,
+    pub value: String,
+    pub source: Option<String>,
+}
+
+/// Result of one input of [`MemoryStoreHandle::insert_memories`]: the id of the
+/// row holding it, or why the store rejected it.
+/// uniffi::Record semantics are provided by the UDL definition (dictionary InsertOutcome).
+#[derive(Debug, Clone, PartialEq)]
+pub struct InsertOutcome {
+    pub id: Option<String>,
+    pub error: Option<String>,
+}
+
+/// Column-oriented view of many memory records: element `i` of every vector
+/// belongs to the same record.
+/// uniffi::Record semantics are provided by the UDL definition (dictionary MemoryColumns).
+#[derive(Debug, Clone, Default)]
+pub struct MemoryColumns {
+    pub ids: Vec<String>,
+    pub entities: Vec<String>,
+    pub attributes: Vec<String>,
+    pub values: Vec<String>,
+    pub sources: Vec<Option<String>>,
+    pub created_at: Vec<i64>,
+    pub updated_at: Vec<i64>,
+}
+
+/// Optional filters for [`MemoryStoreHandle::open_cursor`]; `None` matches everything.
+/// uniffi::Record semantics are provided by the UDL definition (dictionary CursorFilter).
+#[derive(Debug, Clone, Default)]
+pub struct CursorFilter {
+    pub entity: Option<String>,
+    pub source: Option<String>,
+    pub since_ms: Option<i64>,
+    pub until_ms: Option<i64>,
+}
+
 /// A thread-safe, opaque handle to the encrypted memory store.
 /// uniffi::Object semantics are provided by the UDL definition (interface MemoryStoreHandle).
 pub struct MemoryStoreHandle {
-    inner: Mutex<MemoryStore>,
+    inner: Arc<StorePool>,
 }
 
 impl MemoryStoreHandle {
@@ -154,11 +250,51 @@ impl MemoryStoreHandle {
         let store = MemoryStore::open(Path::new(&db_path), &key)
             .map_err(|e| EngramError::Store(e.to_string()))?;
         Ok(Self {
-            inner: Mutex::new(store),
+            inner: Arc::new(StorePool::single(store)),
+        })
+    }
+
+    /// Open the store with one writer plus `readers` read-only connections.
+    ///
+    /// Reads (gets, lists, cursors, counts) are served by whichever reader is
+    /// free and run in parallel with each other and with writes.
+    pub fn open_pooled(
+        db_path: String,
+        key_bytes: Vec<u8>,
+        readers: u32,
+    ) -> Result<Self, EngramError> {
+        let key = bytes_to_key(key_bytes)?;
+        let pool = StorePool::open(Path::new(&db_path), &key, readers as usize)
+            .map_err(|e| EngramError::Store(e.to_string()))?;
+        Ok(Self {
+            inner: Arc::new(pool),
+        })
+    }
+
+    /// Open the store with the connection tuning of `profile`, plus `readers`
+    /// read-only connections (0 for a single connection).
+    pub fn open_with_profile(
+        db_path: String,
+        key_bytes: Vec<u8>,
+        profile: StoreProfile,
+        readers: u32,
+    ) -> Result<Self, EngramError> {
+        let key = bytes_to_key(key_bytes)?;
+        let options = StoreOptions {
+            profile,
+            ..StoreOptions::default()
+        };
+        let pool = StorePool::open_with(Path::new(&db_path), &key, &options, readers as usize)
+            .map_err(|e| EngramError::Store(e.to_string()))?;
+        Ok(Self {
+            inner: Arc::new(pool),
         })
     }
 
-    /// Create and insert a new memory record for the given entity/attribute/value triple.
+    /// Record the given entity/attribute/value triple.
+    ///
+    /// A fact the store already holds is not duplicated: its `updated_at` and
+    /// seen-count are bumped instead.
     pub fn insert_memory(
         &self,
         entity: String,
@@ -168,40 +304,225 @@ impl MemoryStoreHandle {
     ) -> Result<(), EngramError> {
         let memory = Memory::new(&entity, &attribute, &value, source.as_deref());
         self.inner
-            .lock()
-            .unwrap()
-            .insert(&memory)
+            .write(|s| s.upsert(&memory))
+            .map(|_| ())
+            .map_err(|e| EngramError::Store(e.to_string()))
+    }
+
+    /// Record many memories in one transaction and return one outcome per input,
+    /// in input order.
+    ///
+    /// As with [`Self::insert_memory`], a fact the store already holds is merged
+    /// and its existing id returned. A row the store rejects gets an outcome
+    /// with `error` set and no `id`, while the other rows are still committed;
+    /// an error that aborts the transaction writes nothing and is returned as `Err`.
+    pub fn insert_memories(
+        &self,
+        memories: Vec<MemoryInput>,
+    ) -> Result<Vec<InsertOutcome>, EngramError> {
+        let memories: Vec<Memory> = memories
+            .iter()
+            .map(|m| Memory::new(&m.entity, &m.attribute, &m.value, m.source.as_deref()))
+            .collect();
+        self.inner
+            .write(|s| s.upsert_many(&memories))
+            .map(|report| report_to_outcomes(report, memories.len()))
             .map_err(|e| EngramError::Store(e.to_string()))
     }
 
     /// Retrieve a memory record by id, or `None` if not found.
     pub fn get_memory(&self, id: String) -> Result<Option<MemoryRecord>, EngramError> {
         self.inner
-            .lock()
-            .unwrap()
-            .get(&id)
+            .read(|s| s.get(&id))
             .map_err(|e| EngramError::Store(e.to_string()))
             .map(|opt| opt.map(memory_to_record))
     }
 
+    /// Retrieve the records for `ids` in one call; unknown ids are skipped.
+    pub fn get_memories(&self, ids: Vec<String>) -> Result<Vec<MemoryRecord>, EngramError> {
+        self.inner
+            .read(|s| s.get_many(&ids))
+            .map_err(|e| EngramError::Store(e.to_string()))
+            .map(|vec| vec.into_iter().map(memory_to_record).collect())
+    }
+
+    /// Return up to `limit` records (optionally for one `entity`, newest first)
+    /// as parallel column arrays.
+    pub fn read_columns(
+        &self,
+        entity: Option<String>,
+        limit: u32,
+    ) -> Result<MemoryColumns, EngramError> {
+        self.inner
+            .read(|s| s.list(entity.as_deref(), limit as usize))
+            .map_err(|e| EngramError::Store(e.to_string()))
+            .map(memories_to_columns)
+    }
+
     /// Return all memory records associated with `entity`.
     pub fn find_by_entity(&self, entity: String) -> Result<Vec<MemoryRecord>, EngramError> {
         self.inner
-            .lock()
-            .unwrap()
-            .find_by_entity(&entity)
+            .read(|s| s.find_by_entity(&entity))
             .map_err(|e| EngramError::Store(e.to_string()))
             .map(|vec| vec.into_iter().map(memory_to_record).collect())
     }
 
+    /// Open a cursor that streams records matching `filter`, newest first, in
+    /// pages of at most `page_size`.
+    pub fn open_cursor(&self, filter: CursorFilter, page_size: u32) -> Arc<MemoryCursor> {
+        Arc::new(MemoryCursor {
+            state: Arc::new(CursorState {
+                store: Arc::clone(&self.inner),
+                filter: MemoryFilter {
+                    entity: filter.entity,
+                    source: filter.source,
+                    since_ms: filter.since_ms,
+                    until_ms: filter.until_ms,
+                },
+                page_size: page_size.max(1) as usize,
+                position: Mutex::new(CursorPosition::Start),
+            }),
+        })
+    }
+
     /// Return the total number of records in the store.
     pub fn record_count(&self) -> Result<u64, EngramError> {
         self.inner
-            .lock()
-            .unwrap()
-            .record_count()
+            .read(|s| s.record_count())
             .map_err(|e| EngramError::Store(e.to_string()))
     }
+
+    // Async variants. Each runs its synchronous counterpart on the blocking
+    // pool; store connections are only ever locked on a pool thread.
+
+    /// Async [`Self::insert_memory`].
+    pub async fn insert_memory_async(
+        &self,
+        entity: String,
+        attribute: String,
+        value: String,
+        source: Option<String>,
+    ) -> Result<(), EngramError> {
+        let handle = self.share();
+        blocking::spawn(move || handle.insert_memory(entity, attribute, value, source)).await
+    }
+
+    /// Async [`Self::insert_memories`].
+    pub async fn insert_memories_async(
+        &self,
+        memories: Vec<MemoryInput>,
+    ) -> Result<Vec<InsertOutcome>, EngramError> {
+        let handle = self.share();
+        blocking::spawn(move || handle.insert_memories(memories)).await
+    }
+
+    /// Async [`Self::get_memory`].
+    pub async fn get_memory_async(&self, id: String) -> Result<Option<MemoryRecord>, EngramError> {
+        let handle = self.share();
+        blocking::spawn(move || handle.get_memory(id)).await
+    }
+
+    /// Async [`Self::get_memories`].
+    pub async fn get_memories_async(
+        &self,
+        ids: Vec<String>,
+    ) -> Result<Vec<MemoryRecord>, EngramError> {
+        let handle = self.share();
+        blocking::spawn(move || handle.get_memories(ids)).await
+    }
+
+    /// Async [`Self::read_columns`].
+    pub async fn read_columns_async(
+        &self,
+        entity: Option<String>,
+        limit: u32,
+    ) -> Result<MemoryColumns, EngramError> {
+        let handle = self.share();
+        blocking::spawn(move || handle.read_columns(entity, limit)).await
+    }
+
+    /// Async [`Self::find_by_entity`].
+    pub async fn find_by_entity_async(
+        &self,
+        entity: String,
+    ) -> Result<Vec<MemoryRecord>, EngramError> {
+        let handle = self.share();
+        blocking::spawn(move || handle.find_by_entity(entity)).await
+    }
+
+    /// Async [`Self::record_count`].
+    pub async fn record_count_async(&self) -> Result<u64, EngramError> {
+        let handle = self.share();
+        blocking::spawn(move || handle.record_count()).await
+    }
+
+    /// A second handle onto the same store, movable into a pool job.
+    fn share(&self) -> Self {
+        Self {
+            inner: Arc::clone(&self.inner),
+        }
+    }
+}
+
+/// Where a [`MemoryCursor`] will resume reading.
+enum CursorPosition {
+    Start,
+    After(i64, String),
+    Done,
+}
+
+/// Forward-only cursor over the memory store, backed by keyset pagination.
+///
+/// Only the key of the last row returned is kept between pages, so memory use
+/// is bounded by `page_size` regardless of store size. The store lock is held
+/// only while a page is being read.
+/// uniffi::Object semantics are provided by the UDL definition (interface MemoryCursor).
+pub struct MemoryCursor {
+    state: Arc<CursorState>,
+}
+
+impl MemoryCursor {
+    /// Return the next page of records; an empty list means the cursor is exhausted.
+    pub fn next_page(&self) -> Result<Vec<MemoryRecord>, EngramError> {
+        self.state.next_page()
+    }
+
+    /// Async [`Self::next_page`], read on the blocking pool.
+    pub async fn next_page_async(&self) -> Result<Vec<MemoryRecord>, EngramError> {
+        let state = Arc::clone(&self.state);
+        blocking::spawn(move || state.next_page()).await
+    }
+}
+
+/// Shared cursor state, so an async page read can outlive the borrow of the cursor.
+struct CursorState {
+    store: Arc<StorePool>,
+    filter: MemoryFilter,
+    page_size: usize,
+    position: Mutex<CursorPosition>,
+}
+
+impl CursorState {
+    fn next_page(&self) -> Result<Vec<MemoryRecord>, EngramError> {
+        let mut position = self.position.lock().unwrap();
+        let after = match &*position {
+            CursorPosition::Start => None,
+            CursorPosition::After(updated_at, id) => Some((*updated_at, id.as_str())),
+            CursorPosition::Done => return Ok(Vec::new()),
+        };
+        let page = self
+            .store
+            .read(|s| s.page(&self.filter, after, self.page_size))
+            .map_err(|e| EngramError::Store(e.to_string()))?;
+
+        *position = match page.last() {
+            Some(last) if page.len() == self.page_size => {
+                CursorPosition::After(last.updated_at, last.id.clone())
+            }
+            _ => CursorPosition::Done,
+        };
+        Ok(page.into_iter().map(memory_to_record).collect())
+    }
 }
 
 // ── tests ─────────────────────────────────────────────────────────────────────
@@ -431,4 +752,247 @@ mod tests {
 
         assert_eq!(handle.record_count().expect("count failed"), 2);
     }
+
+    #[test]
+    fn test_pooled_store_reads_see_writes_across_threads() {
+        use std::sync::Arc;
+        use std::thread;
+
+        let dir = TempDir::new().unwrap();
+        let db_path = dir.path().join("pooled.db");
+        let handle = Arc::new(
+            MemoryStoreHandle::open_pooled(db_path.to_str().unwrap().to_string(), vec![0u8; 32], 3)
+                .expect("open_pooled failed"),
+        );
+        handle
+            .insert_memory("Sofia".into(), "dietary".into(), "vegetarian".into(), None)
+            .unwrap();
+
+        let readers: Vec<_> = (0..4)
+            .map(|_| {
+                let h = Arc::clone(&handle);
+                thread::spawn(move || h.find_by_entity("Sofia".to_string()).unwrap().len())
+            })
+            .collect();
+        for r in readers {
+            assert_eq!(r.join().unwrap(), 1);
+        }
+        assert_eq!(handle.record_count().unwrap(), 1);
+    }
+
+    #[test]
+    fn test_open_with_profile_round_trips() {
+        let dir = TempDir::new().unwrap();
+        let db_path = dir.path().join("mobile.db");
+        for readers in [0, 2] {
+            let handle = MemoryStoreHandle::open_with_profile(
+                db_path.to_str().unwrap().to_string(),
+                vec![0u8; 32],
+                StoreProfile::Mobile,
+                readers,
+            )
+            .expect("open_with_profile failed");
+            handle
+                .insert_memory("Sofia".into(), "dietary".into(), "vegetarian".into(), None)
+                .unwrap();
+            assert_eq!(handle.record_count().unwrap(), 1);
+        }
+    }
+
+    #[test]
+    fn test_store_insert_memories_and_get_memories() {
+        let (handle, _dir) = make_test_store();
+        let inputs: Vec<MemoryInput> = (0..50)
+            .map(|i| MemoryInput {
+                entity: "Sofia".to_string(),
+                attribute: format!("attr{}", i),
+                value: format!("val{}", i),
+                source: None,
+            })
+            .collect();
+        let outcomes = handle
+            .insert_memories(inputs)
+            .expect("insert_memories failed");
+        assert_eq!(outcomes.len(), 50);
+        assert!(outcomes.iter().all(|o| o.error.is_none()));
+        let ids: Vec<String> = outcomes.into_iter().filter_map(|o| o.id).collect();
+        assert_eq!(ids.len(), 50);
+        assert_eq!(handle.record_count().unwrap(), 50);
+
+        let wanted = vec![ids[10].clone(), "missing".to_string(), ids[3].clone()];
+        let records = handle.get_memories(wanted).expect("get_memories failed");
+        assert_eq!(records.len(), 2);
+        assert_eq!(records[0].attribute, "attr10");
+        assert_eq!(records[1].attribute, "attr3");
+    }
+
+    #[test]
+    fn test_report_to_outcomes_keeps_rejected_rows_in_place() {
+        let report = InsertReport {
+            inserted: 2,
+            ids: vec!["a".to_string(), "c".to_string()],
+            failures: vec![(1, crate::store::StoreError::NotFound)],
+            ..InsertReport::default()
+        };
+        let outcomes = report_to_outcomes(report, 3);
+        assert_eq!(
+            outcomes,
+            vec![
+                InsertOutcome {
+                    id: Some("a".to_string()),
+                    error: None,
+                },
+                InsertOutcome {
+                    id: None,
+                    error: Some("record not found".to_string()),
+                },
+                InsertOutcome {
+                    id: Some("c".to_string()),
+                    error: None,
+                },
+            ]
+        );
+    }
+
+    #[test]
+    fn test_store_insert_memories_merges_repeated_facts() {
+        let (handle, _dir) = make_test_store();
+        let input = MemoryInput {
+            entity: "Sofia".to_string(),
+            attribute: "dietary".to_string(),
+            value: "vegetarian".to_string(),
+            source: None,
+        };
+        let outcomes = handle
+            .insert_memories(vec![input.clone(), input.clone()])
+            .unwrap();
+        assert_eq!(outcomes.len(), 2);
+        assert!(outcomes[0].id.is_some());
+        assert_eq!(outcomes[0], outcomes[1]);
+        handle
+            .insert_memory("sofia".into(), "dietary".into(), "Vegetarian".into(), None)
+            .unwrap();
+        assert_eq!(handle.record_count().unwrap(), 1);
+    }
+
+    #[test]
+    fn test_store_read_columns_returns_parallel_arrays() {
+        let (handle, _dir) = make_test_store();
+        handle
+            .insert_memories(vec![
+                MemoryInput {
+                    entity: "Sofia".to_string(),
+                    attribute: "dietary".to_string(),
+                    value: "vegetarian".to_string(),
+                    source: Some("transcript".to_string()),
+                },
+                MemoryInput {
+                    entity: "Ken".to_string(),
+                    attribute: "role".to_string(),
+                    value: "engineer".to_string(),
+                    source: None,
+                },
+            ])
+            .unwrap();
+
+        let all = handle.read_columns(None, 100).expect("read_columns failed");
+        assert_eq!(all.ids.len(), 2);
+        assert_eq!(all.entities.len(), 2);
+        assert_eq!(all.values.len(), 2);
+        assert_eq!(all.sources.len(), 2);
+        assert_eq!(all.updated_at.len(), 2);
+
+        let sofia = handle.read_columns(Some("Sofia".to_string()), 100).unwrap();
+        assert_eq!(sofia.entities, vec!["Sofia".to_string()]);
+        assert_eq!(sofia.values, vec!["vegetarian".to_string()]);
+        assert_eq!(sofia.sources, vec![Some("transcript".to_string())]);
+    }
+
+    #[test]
+    fn test_cursor_streams_all_records_in_pages() {
+        let (handle, _dir) = make_test_store();
+        let inputs: Vec<MemoryInput> = (0..25)
+            .map(|i| MemoryInput {
+                entity: if i % 2 == 0 { "Sofia" } else { "Ken" }.to_string(),
+                attribute: format!("attr{}", i),
+                value: format!("val{}", i),
+                source: None,
+            })
+            .collect();
+        handle.insert_memories(inputs).unwrap();
+
+        let cursor = handle.open_cursor(CursorFilter::default(), 10);
+        let mut sizes = Vec::new();
+        loop {
+            let page = cursor.next_page().expect("next_page failed");
+            if page.is_empty() {
+                break;
+            }
+            sizes.push(page.len());
+        }
+        assert_eq!(sizes, vec![10, 10, 5]);
+        assert!(
+            cursor.next_page().unwrap().is_empty(),
+            "cursor stays exhausted"
+        );
+
+        let sofia = handle.open_cursor(
+            CursorFilter {
+                entity: Some("Sofia".to_string()),
+                ..Default::default()
+            },
+            100,
+        );
+        let page = sofia.next_page().unwrap();
+        assert_eq!(page.len(), 13);
+        assert!(page.iter().all(|r| r.entity == "Sofia"));
+    }
+
+    #[test]
+    fn test_derive_key_async_matches_sync() {
+        let salt = generate_salt();
+        let sync_key = derive_key("pw".to_string(), salt.clone()).unwrap();
+        let async_key = blocking::block_on(derive_key_async("pw".to_string(), salt)).unwrap();
+        assert_eq!(sync_key, async_key);
+
+        let err = blocking::block_on(derive_key_async("pw".to_string(), vec![0u8; 4]));
+        assert!(matches!(err, Err(EngramError::InvalidInput(_))));
+    }
+
+    #[test]
+    fn test_store_async_methods_share_the_store() {
+        let (handle, _dir) = make_test_store();
+        blocking::block_on(handle.insert_memory_async(
+            "Sofia".to_string(),
+            "dietary".to_string(),
+            "vegetarian".to_string(),
+            None,
+        ))
+        .unwrap();
+        let outcomes = blocking::block_on(handle.insert_memories_async(vec![MemoryInput {
+            entity: "Ken".to_string(),
+            attribute: "role".to_string(),
+            value: "engineer".to_string(),
+            source: None,
+        }]))
+        .unwrap();
+
+        assert_eq!(blocking::block_on(handle.record_count_async()).unwrap(), 2);
+        assert_eq!(handle.record_count().unwrap(), 2);
+        let ken_id = outcomes[0].id.clone().unwrap();
+        let ken = blocking::block_on(handle.get_memory_async(ken_id)).unwrap();
+        assert_eq!(ken.unwrap().value, "engineer");
+        let sofia = blocking::block_on(handle.find_by_entity_async("Sofia".to_string())).unwrap();
+        assert_eq!(sofia.len(), 1);
+
+        let cursor = handle.open_cursor(CursorFilter::default(), 1);
+        assert_eq!(
+            blocking::block_on(cursor.next_page_async()).unwrap().len(),
+            1
+        );
+        assert_eq!(cursor.next_page().unwrap().len(), 1);
+        assert!(blocking::block_on(cursor.next_page_async())
+            .unwrap()
+            .is_empty());
+    }
 }
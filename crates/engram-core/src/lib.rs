@@ -7,6 +7,7 @@
 // Must appear before module declarations that use uniffi derives.
 uniffi::include_scaffolding!("engram_core");
 
+mod blocking;
 pub mod config;
 pub mod crypto;
 pub mod ffi;
@@ -17,6 +18,8 @@ pub mod vault;
 // The generated scaffolding resolves free functions and types by their
 // unqualified names; this pub use makes them visible at crate root.
 pub use ffi::{
-    decrypt_bytes, derive_key, encrypt_bytes, generate_salt, vault_list_markdown, vault_read,
-    vault_write, EngramError, MemoryRecord, MemoryStoreHandle,
+    decrypt_bytes, derive_key, derive_key_async, encrypt_bytes, generate_salt, vault_list_markdown,
+    vault_read, vault_write, CursorFilter, EngramError, InsertOutcome, MemoryColumns, MemoryCursor,
+    MemoryInput, MemoryRecord, MemoryStoreHandle,
 };
+pub use store::StoreProfile;
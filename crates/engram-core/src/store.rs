@@ -1,13 +1,20 @@
 // store.rs — SQLCipher-backed memory store
 
+use std::collections::hash_map::Entry;
+use std::collections::HashMap;
 use std::path::Path;
-use std::time::{SystemTime, UNIX_EPOCH};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::Mutex;
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
 
-use rusqlite::Connection;
+use base64::engine::general_purpose::URL_SAFE_NO_PAD;
+use base64::Engine;
+use rusqlite::{Connection, OpenFlags, OptionalExtension};
 use serde::{Deserialize, Serialize};
 use thiserror::Error;
 use uuid::Uuid;
 
+use crate::config::EngramConfig;
 use crate::crypto::EngramKey;
 
 /// DDL executed once on database open to create tables and indexes.
@@ -19,7 +26,9 @@ CREATE TABLE IF NOT EXISTS memories (
     value       TEXT NOT NULL,
     source      TEXT,
     created_at  INTEGER NOT NULL,
-    updated_at  INTEGER NOT NULL
+    updated_at  INTEGER NOT NULL,
+    norm_key    TEXT,
+    seen_count  INTEGER NOT NULL DEFAULT 1
 );
 
 CREATE TABLE IF NOT EXISTS entities (
@@ -29,10 +38,105 @@ CREATE TABLE IF NOT EXISTS entities (
     created_at  INTEGER NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_memories_entity ON memories(entity);
+-- (entity, updated_at, id) supersedes the old entity-only index.
+DROP INDEX IF EXISTS idx_memories_entity;
+CREATE INDEX IF NOT EXISTS idx_memories_entity_updated ON memories(entity, updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_memories_updated ON memories(updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_memories_created ON memories(created_at, id);
 CREATE INDEX IF NOT EXISTS idx_entities_name   ON entities(name);
+
+-- Cold facts moved out of `memories` by `MemoryStore::compact`, at most one
+-- row per fact.
+CREATE TABLE IF NOT EXISTS memories_archive (
+    id          TEXT NOT NULL,
+    entity      TEXT NOT NULL,
+    attribute   TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    source      TEXT,
+    created_at  INTEGER NOT NULL,
+    updated_at  INTEGER NOT NULL,
+    norm_key    TEXT NOT NULL,
+    seen_count  INTEGER NOT NULL,
+    archived_at INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_memories_archive_norm_key ON memories_archive(norm_key);
+CREATE INDEX IF NOT EXISTS idx_memories_archive_archived ON memories_archive(archived_at);
+
+-- Full-text index over the searchable columns. External content: the text
+-- lives only in `memories`, the triggers below keep the index in step.
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    entity, attribute, value,
+    content = 'memories', content_rowid = 'rowid',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS memories_fts_ai AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts (rowid, entity, attribute, value)
+    VALUES (new.rowid, new.entity, new.attribute, new.value);
+END;
+
+CREATE TRIGGER IF NOT EXISTS memories_fts_ad AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts (memories_fts, rowid, entity, attribute, value)
+    VALUES ('delete', old.rowid, old.entity, old.attribute, old.value);
+END;
+
+-- Only edits to the indexed text re-index a row; seen-count and timestamp
+-- bumps from re-sightings leave the index alone.
+CREATE TRIGGER IF NOT EXISTS memories_fts_au
+AFTER UPDATE OF entity, attribute, value ON memories BEGIN
+    INSERT INTO memories_fts (memories_fts, rowid, entity, attribute, value)
+    VALUES ('delete', old.rowid, old.entity, old.attribute, old.value);
+    INSERT INTO memories_fts (rowid, entity, attribute, value)
+    VALUES (new.rowid, new.entity, new.attribute, new.value);
+END;
 "#;
 
+/// Parameterised insert shared by single-row and batch inserts.
+const INSERT_MEMORY: &str =
+    "INSERT INTO memories (id, entity, attribute, value, source, created_at, updated_at, norm_key)
+     VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8)
+     RETURNING id";
+
+/// Like [`INSERT_MEMORY`], but a fact already in the store is bumped instead
+/// of duplicated. Returns the id of the row that now holds the fact.
+const UPSERT_MEMORY: &str =
+    "INSERT INTO memories (id, entity, attribute, value, source, created_at, updated_at, norm_key)
+     VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8)
+     ON CONFLICT (norm_key) DO UPDATE SET
+         updated_at = max(updated_at, excluded.updated_at),
+         source     = coalesce(excluded.source, source),
+         seen_count = seen_count + 1
+     RETURNING id";
+
+/// Like [`UPSERT_MEMORY`], but the exported seen-count is bound as `?9` and
+/// added on merge, and a row whose id is already in the store is left
+/// untouched and returns no row, so re-importing an export is a no-op.
+const IMPORT_MEMORY: &str = "INSERT INTO memories
+         (id, entity, attribute, value, source, created_at, updated_at, norm_key, seen_count)
+     VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9)
+     ON CONFLICT (id) DO NOTHING
+     ON CONFLICT (norm_key) DO UPDATE SET
+         updated_at = max(updated_at, excluded.updated_at),
+         source     = coalesce(excluded.source, source),
+         seen_count = seen_count + excluded.seen_count
+     RETURNING id";
+
+/// Load an exported archived fact into `memories_archive`. A fact the archive
+/// already holds is left untouched and returns no row, so re-importing an
+/// export is a no-op.
+const IMPORT_ARCHIVED: &str = "INSERT INTO memories_archive
+         (id, entity, attribute, value, source, created_at, updated_at,
+          norm_key, seen_count, archived_at)
+     VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10)
+     ON CONFLICT (norm_key) DO NOTHING
+     RETURNING id";
+
+/// Predicate selecting the facts [`MemoryStore::compact`] archives: not seen
+/// since `?1 - ?2` ms, with the window doubled for each further sighting up
+/// to 8x. The first term lets the `updated_at` index skip recent rows.
+const COLD_FACTS: &str = "updated_at < ?1 - ?2
+     AND updated_at < ?1 - ?2 * (1 << min(seen_count - 1, 3))";
+
 /// Errors produced by store operations.
 #[derive(Debug, Error)]
 pub enum StoreError {
@@ -41,6 +145,9 @@ pub enum StoreError {
 
     #[error("record not found")]
     NotFound,
+
+    #[error("invalid query cursor")]
+    InvalidCursor,
 }
 
 /// A single memory record stored in the encrypted database.
@@ -71,6 +178,297 @@ impl Memory {
     }
 }
 
+/// Outcome of [`MemoryStore::insert_many`], [`MemoryStore::upsert_many`] and
+/// [`MemoryStore::import_many`].
+#[derive(Debug, Default)]
+pub struct InsertReport {
+    /// Number of new rows committed.
+    pub inserted: usize,
+    /// Number of inputs merged into a row already holding the same fact.
+    pub merged: usize,
+    /// Number of inputs whose id was already in the store ([`MemoryStore::import_many`] only).
+    pub skipped: usize,
+    /// Id of the row holding each successful input, in input order.
+    pub ids: Vec<String>,
+    /// Rows that were rejected, as `(index into the input, error)`.
+    pub failures: Vec<(usize, StoreError)>,
+}
+
+/// A fact [`MemoryStore::compact`] moved to the archive, as read by
+/// [`MemoryStore::archived_page`] and loaded by [`MemoryStore::import_archived`].
+#[derive(Debug, Clone, PartialEq)]
+pub struct ArchivedFact {
+    pub memory: Memory,
+    /// How many times the fact had been recorded.
+    pub seen_count: u64,
+    /// When it was archived (ms since epoch).
+    pub archived_at: i64,
+}
+
+/// Optional filters for [`MemoryStore::page`]. `None` fields match everything.
+#[derive(Debug, Clone, Default, PartialEq)]
+pub struct MemoryFilter {
+    pub entity: Option<String>,
+    pub source: Option<String>,
+    /// Inclusive lower bound on `updated_at` (ms since epoch).
+    pub since_ms: Option<i64>,
+    /// Exclusive upper bound on `updated_at` (ms since epoch).
+    pub until_ms: Option<i64>,
+}
+
+/// Sort order of a [`MemoryQuery`]; also selects the timestamp its time range bounds.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub enum QueryOrder {
+    /// Most recently updated first.
+    #[default]
+    UpdatedDesc,
+    /// Least recently updated first.
+    UpdatedAsc,
+    /// Most recently created first.
+    CreatedDesc,
+    /// Oldest first.
+    CreatedAsc,
+}
+
+impl QueryOrder {
+    fn column(self) -> &'static str {
+        match self {
+            QueryOrder::UpdatedDesc | QueryOrder::UpdatedAsc => "updated_at",
+            QueryOrder::CreatedDesc | QueryOrder::CreatedAsc => "created_at",
+        }
+    }
+
+    fn timestamp(self, memory: &Memory) -> i64 {
+        match self {
+            QueryOrder::UpdatedDesc | QueryOrder::UpdatedAsc => memory.updated_at,
+            QueryOrder::CreatedDesc | QueryOrder::CreatedAsc => memory.created_at,
+        }
+    }
+
+    fn descending(self) -> bool {
+        matches!(self, QueryOrder::UpdatedDesc | QueryOrder::CreatedDesc)
+    }
+
+    /// Short tag embedded in cursors so one cannot be replayed under another order.
+    fn tag(self) -> char {
+        match self {
+            QueryOrder::UpdatedDesc => 'U',
+            QueryOrder::UpdatedAsc => 'u',
+            QueryOrder::CreatedDesc => 'C',
+            QueryOrder::CreatedAsc => 'c',
+        }
+    }
+}
+
+/// A filtered, keyset-paginated read of the store, run with [`MemoryStore::query`].
+///
+/// Built by chaining setters on [`MemoryQuery::new`]; unset filters match
+/// everything. Entity queries use the `(entity, updated_at, id)` index and
+/// created-at orders the `(created_at, id)` index.
+#[derive(Debug, Clone, PartialEq)]
+pub struct MemoryQuery {
+    entity: Option<String>,
+    attribute: Option<String>,
+    source: Option<String>,
+    since_ms: Option<i64>,
+    until_ms: Option<i64>,
+    order: QueryOrder,
+    page_size: usize,
+}
+
+impl Default for MemoryQuery {
+    fn default() -> Self {
+        MemoryQuery {
+            entity: None,
+            attribute: None,
+            source: None,
+            since_ms: None,
+            until_ms: None,
+            order: QueryOrder::default(),
+            page_size: 100,
+        }
+    }
+}
+
+impl MemoryQuery {
+    /// Match every memory, newest update first, 100 per page.
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    pub fn entity(mut self, entity: impl Into<String>) -> Self {
+        self.entity = Some(entity.into());
+        self
+    }
+
+    pub fn attribute(mut self, attribute: impl Into<String>) -> Self {
+        self.attribute = Some(attribute.into());
+        self
+    }
+
+    pub fn source(mut self, source: impl Into<String>) -> Self {
+        self.source = Some(source.into());
+        self
+    }
+
+    /// Inclusive lower bound (ms since epoch) on the order's timestamp.
+    pub fn since_ms(mut self, since_ms: i64) -> Self {
+        self.since_ms = Some(since_ms);
+        self
+    }
+
+    /// Exclusive upper bound (ms since epoch) on the order's timestamp.
+    pub fn until_ms(mut self, until_ms: i64) -> Self {
+        self.until_ms = Some(until_ms);
+        self
+    }
+
+    pub fn order(mut self, order: QueryOrder) -> Self {
+        self.order = order;
+        self
+    }
+
+    /// Maximum memories per page (at least 1).
+    pub fn page_size(mut self, page_size: usize) -> Self {
+        self.page_size = page_size.max(1);
+        self
+    }
+}
+
+/// One page of [`MemoryStore::query`] results.
+#[derive(Debug, Clone, PartialEq)]
+pub struct QueryPage {
+    pub memories: Vec<Memory>,
+    /// How many times each memory's fact has been recorded, parallel to `memories`.
+    pub seen_counts: Vec<u64>,
+    /// Opaque cursor for the following page, or `None` if this was the last.
+    pub next: Option<String>,
+}
+
+/// How [`MemoryStore::compact`] ages facts out of the hot `memories` table,
+/// configured under `[store.retention]`.
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(default)]
+pub struct RetentionPolicy {
+    /// Days a fact seen once stays in `memories` after it was last seen. Each
+    /// further sighting doubles the window, up to 8x.
+    pub cold_after_days: u32,
+    /// Days an archived fact is kept before it is deleted; `None` keeps it.
+    pub archive_ttl_days: Option<u32>,
+    /// Hours between compactions run by `engram daemon`; 0 disables them.
+    pub interval_hours: u32,
+}
+
+impl Default for RetentionPolicy {
+    fn default() -> Self {
+        RetentionPolicy {
+            cold_after_days: 180,
+            archive_ttl_days: None,
+            interval_hours: 24,
+        }
+    }
+}
+
+/// Outcome of [`MemoryStore::compact`].
+#[derive(Debug, Default, Clone, PartialEq, Eq)]
+pub struct CompactReport {
+    /// Facts moved from `memories` to `memories_archive`.
+    pub archived: usize,
+    /// Archived facts deleted because they outlived `archive_ttl_days`.
+    pub purged: usize,
+    /// Database pages returned to the file system.
+    pub pages_freed: u64,
+}
+
+/// Named connection tuning for [`MemoryStore::open_with`], selected in the
+/// config file with `[store] profile = "interactive" | "bulk-ingest" | "mobile"`.
+///
+/// Profiles only set per-connection pragmas. `mmap_size` stays 0 because
+/// SQLCipher cannot memory-map encrypted pages, and `cipher_page_size` is
+/// fixed when the database is created, so every profile keeps SQLCipher's
+/// 4096-byte default and any profile can open any store.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(rename_all = "kebab-case")]
+pub enum StoreProfile {
+    /// CLI runs and hooks: 16 MiB page cache, temp tables in memory.
+    #[default]
+    Interactive,
+    /// Backfills and imports: 128 MiB page cache, temp tables in memory and
+    /// a WAL allowed to grow to 40 MiB between checkpoints.
+    BulkIngest,
+    /// Phones and tablets: 2 MiB page cache, temp tables on disk and the
+    /// WAL truncated back to 4 MiB after each checkpoint.
+    Mobile,
+}
+
+impl StoreProfile {
+    /// The pragmas this profile sets on every connection.
+    fn pragmas(self) -> &'static [&'static str] {
+        match self {
+            StoreProfile::Interactive => {
+                &["PRAGMA cache_size = -16384", "PRAGMA temp_store = MEMORY"]
+            }
+            StoreProfile::BulkIngest => &[
+                "PRAGMA cache_size = -131072",
+                "PRAGMA temp_store = MEMORY",
+                "PRAGMA wal_autocheckpoint = 10000",
+            ],
+            StoreProfile::Mobile => &[
+                "PRAGMA cache_size = -2048",
+                "PRAGMA temp_store = FILE",
+                "PRAGMA journal_size_limit = 4194304",
+            ],
+        }
+    }
+
+    /// Apply [`Self::pragmas`] to `conn`. Some of them echo the new value as a
+    /// row, so each is stepped to completion rather than run as a batch.
+    fn apply(self, conn: &Connection) -> Result<(), StoreError> {
+        for pragma in self.pragmas() {
+            let mut stmt = conn.prepare(pragma)?;
+            let mut rows = stmt.query([])?;
+            while rows.next()?.is_some() {}
+        }
+        Ok(())
+    }
+}
+
+/// Connection settings for [`MemoryStore::open_with`].
+#[derive(Debug, Clone, PartialEq)]
+pub struct StoreOptions {
+    /// Write-ahead logging: readers and the single writer no longer block
+    /// each other. When `false` the rollback journal is used.
+    pub wal: bool,
+    /// How long a statement waits for a lock held by another connection or
+    /// process before failing with `SQLITE_BUSY`.
+    pub busy_timeout: Duration,
+    /// Open without write access. The schema must already exist.
+    pub read_only: bool,
+    /// Cache, temp-storage and checkpoint tuning.
+    pub profile: StoreProfile,
+}
+
+impl Default for StoreOptions {
+    fn default() -> Self {
+        StoreOptions {
+            wal: true,
+            busy_timeout: Duration::from_secs(5),
+            read_only: false,
+            profile: StoreProfile::default(),
+        }
+    }
+}
+
+impl StoreOptions {
+    /// The default options with the profile chosen in `config`'s `[store]` section.
+    pub fn from_config(config: &EngramConfig) -> Self {
+        StoreOptions {
+            profile: config.store.profile,
+            ..StoreOptions::default()
+        }
+    }
+}
+
 /// In-process handle to the encrypted SQLite memory store.
 pub struct MemoryStore {
     conn: Connection,
@@ -82,17 +480,246 @@ impl MemoryStore {
     /// The database is unlocked using SQLCipher's hex-blob key pragma:
     /// `PRAGMA key = "x'<64-char-hex>'"`.
     /// After unlocking, the schema is initialised if it does not yet exist.
+    /// Uses the default [`StoreOptions`] (WAL, 5 s busy timeout).
     pub fn open(path: &Path, key: &EngramKey) -> Result<Self, StoreError> {
-        let conn = Connection::open(path)?;
+        Self::open_with(path, key, &StoreOptions::default())
+    }
+
+    /// Open the store at `path` with explicit connection `options`.
+    ///
+    /// Read-only connections skip schema initialisation and journal-mode
+    /// changes, so the database must have been opened for writing first.
+    pub fn open_with(
+        path: &Path,
+        key: &EngramKey,
+        options: &StoreOptions,
+    ) -> Result<Self, StoreError> {
+        let conn = if options.read_only {
+            Connection::open_with_flags(
+                path,
+                OpenFlags::SQLITE_OPEN_READ_ONLY | OpenFlags::SQLITE_OPEN_NO_MUTEX,
+            )?
+        } else {
+            Connection::open(path)?
+        };
 
         // Unlock the database with the derived key.
         let key_hex = hex::encode(key.as_bytes());
         conn.execute_batch(&format!("PRAGMA key = \"x'{key_hex}'\";"))?;
+        conn.busy_timeout(options.busy_timeout)?;
+        options.profile.apply(&conn)?;
+
+        let store = MemoryStore { conn };
+        if options.read_only {
+            return Ok(store);
+        }
+
+        // Only takes effect on a new, empty database (and must precede the
+        // journal mode for that); `compact` converts older stores.
+        store
+            .conn
+            .execute_batch("PRAGMA auto_vacuum = INCREMENTAL;")?;
+
+        // The journal mode is persistent, so set it either way.
+        let mode = if options.wal { "WAL" } else { "DELETE" };
+        store
+            .conn
+            .query_row(&format!("PRAGMA journal_mode = {mode}"), [], |_| Ok(()))?;
+        if options.wal {
+            // Safe in WAL mode: a crash can lose the last commits, never corrupt.
+            store.conn.execute_batch("PRAGMA synchronous = NORMAL;")?;
+        }
+
+        // Initialise (or verify) the schema. Stores created before the
+        // full-text index existed get it populated from `memories` once.
+        let needs_fts_backfill = !store.table_exists("memories_fts")?;
+        store.drop_stale_fts_update_trigger()?;
+        store.conn.execute_batch(SCHEMA)?;
+        if needs_fts_backfill {
+            store.rebuild_search_index()?;
+        }
+        store.migrate_norm_key()?;
+
+        Ok(store)
+    }
+
+    /// Drop an update trigger that re-indexes on every column.
+    ///
+    /// Older stores fired `memories_fts_au` on any update, so each re-sighting
+    /// rewrote the row's index entries. [`SCHEMA`] creates it `IF NOT EXISTS`,
+    /// so the old definition has to go first for the column list to apply.
+    fn drop_stale_fts_update_trigger(&self) -> Result<(), StoreError> {
+        let sql: Option<String> = self
+            .conn
+            .query_row(
+                "SELECT sql FROM sqlite_master WHERE type='trigger' AND name='memories_fts_au'",
+                [],
+                |row| row.get(0),
+            )
+            .optional()?;
+        if sql.is_some_and(|sql| !sql.contains("UPDATE OF")) {
+            self.conn.execute_batch("DROP TRIGGER memories_fts_au;")?;
+        }
+        Ok(())
+    }
+
+    /// Rebuild the full-text index from the `memories` table.
+    ///
+    /// The index is keyed by `memories.rowid`, which `VACUUM` may renumber, so
+    /// call this after vacuuming.
+    pub fn rebuild_search_index(&self) -> Result<(), StoreError> {
+        self.conn
+            .execute_batch("INSERT INTO memories_fts (memories_fts) VALUES ('rebuild');")?;
+        Ok(())
+    }
 
-        // Initialise (or verify) the schema.
-        conn.execute_batch(SCHEMA)?;
+    /// Run the maintenance job behind `engram store compact` and the daemon.
+    ///
+    /// Moves facts that have gone cold under `policy` into `memories_archive`
+    /// (merging with an archived copy of the same fact), drops archived facts
+    /// past their TTL, returns free pages to the file system and refreshes
+    /// the planner statistics, so the table the context loaders read stays
+    /// small and its query plans current. Stores created before incremental
+    /// vacuum was enabled are converted by one full `VACUUM` on the first run.
+    pub fn compact(&self, policy: &RetentionPolicy) -> Result<CompactReport, StoreError> {
+        const DAY_MS: i64 = 24 * 60 * 60 * 1000;
+        let now = now_ms();
+        let cold_after = i64::from(policy.cold_after_days) * DAY_MS;
+        let mut report = CompactReport::default();
 
-        Ok(MemoryStore { conn })
+        let tx = self.conn.unchecked_transaction()?;
+        tx.execute(
+            &format!(
+                "INSERT INTO memories_archive
+                     (id, entity, attribute, value, source, created_at, updated_at,
+                      norm_key, seen_count, archived_at)
+                 SELECT id, entity, attribute, value, source, created_at, updated_at,
+                        norm_key, seen_count, ?1
+                 FROM memories WHERE {COLD_FACTS}
+                 ON CONFLICT (norm_key) DO UPDATE SET
+                     id          = excluded.id,
+                     source      = coalesce(excluded.source, source),
+                     created_at  = min(created_at, excluded.created_at),
+                     updated_at  = max(updated_at, excluded.updated_at),
+                     seen_count  = seen_count + excluded.seen_count,
+                     archived_at = excluded.archived_at"
+            ),
+            (now, cold_after),
+        )?;
+        report.archived = tx.execute(
+            &format!("DELETE FROM memories WHERE {COLD_FACTS}"),
+            (now, cold_after),
+        )?;
+        if let Some(ttl_days) = policy.archive_ttl_days {
+            report.purged = tx.execute(
+                "DELETE FROM memories_archive WHERE archived_at < ?1",
+                [now - i64::from(ttl_days) * DAY_MS],
+            )?;
+        }
+        tx.commit()?;
+
+        let free_before = self.pragma_u64("freelist_count")?;
+        if self.pragma_u64("auto_vacuum")? == 2 {
+            let mut stmt = self.conn.prepare("PRAGMA incremental_vacuum")?;
+            let mut rows = stmt.query([])?;
+            while rows.next()?.is_some() {}
+        } else {
+            self.conn
+                .execute_batch("PRAGMA auto_vacuum = INCREMENTAL; VACUUM;")?;
+            self.rebuild_search_index()?;
+        }
+        report.pages_freed = free_before.saturating_sub(self.pragma_u64("freelist_count")?);
+
+        // Sample at most ~1000 rows per index so this stays cheap on big stores.
+        self.conn
+            .execute_batch("PRAGMA analysis_limit = 1000; ANALYZE;")?;
+        self.conn
+            .query_row("PRAGMA wal_checkpoint(TRUNCATE)", [], |_| Ok(()))?;
+        Ok(report)
+    }
+
+    /// Return how many facts `compact` has moved to the archive.
+    pub fn archived_count(&self) -> Result<u64, StoreError> {
+        let count: i64 =
+            self.conn
+                .query_row("SELECT COUNT(*) FROM memories_archive", [], |row| {
+                    row.get(0)
+                })?;
+        Ok(count as u64)
+    }
+
+    /// Return up to `limit` archived facts, in archive order.
+    ///
+    /// Pass the returned cursor back as `after` to read the next page; it is
+    /// `None` once the archive is exhausted. Start with `after = None`.
+    pub fn archived_page(
+        &self,
+        after: Option<i64>,
+        limit: usize,
+    ) -> Result<(Vec<ArchivedFact>, Option<i64>), StoreError> {
+        let mut stmt = self.conn.prepare_cached(
+            "SELECT id, entity, attribute, value, source, created_at, updated_at,
+                    seen_count, archived_at, rowid
+             FROM memories_archive WHERE rowid > ?1 ORDER BY rowid LIMIT ?2",
+        )?;
+        let rows = stmt
+            .query_map((after.unwrap_or(0), limit as i64), |row| {
+                let fact = ArchivedFact {
+                    memory: row_to_memory(row)?,
+                    seen_count: row.get::<_, i64>(7)? as u64,
+                    archived_at: row.get(8)?,
+                };
+                Ok((fact, row.get(9)?))
+            })?
+            .collect::<Result<Vec<(ArchivedFact, i64)>, _>>()?;
+        let next = match rows.last() {
+            Some(&(_, rowid)) if rows.len() == limit => Some(rowid),
+            _ => None,
+        };
+        let facts = rows.into_iter().map(|(fact, _)| fact).collect();
+        Ok((facts, next))
+    }
+
+    /// Load exported archived facts into `memories_archive` inside a single
+    /// transaction, keeping their ids, timestamps, seen-counts and `archived_at`.
+    ///
+    /// A fact the archive already holds is skipped. Failures are reported per
+    /// row as for [`Self::insert_many`].
+    pub fn import_archived(&self, facts: &[ArchivedFact]) -> Result<InsertReport, StoreError> {
+        let tx = self.conn.unchecked_transaction()?;
+        let mut report = InsertReport::default();
+        {
+            let mut stmt = tx.prepare_cached(IMPORT_ARCHIVED)?;
+            for (index, fact) in facts.iter().enumerate() {
+                let memory = &fact.memory;
+                let params = (
+                    &memory.id,
+                    &memory.entity,
+                    &memory.attribute,
+                    &memory.value,
+                    &memory.source,
+                    memory.created_at,
+                    memory.updated_at,
+                    norm_key(&memory.entity, &memory.attribute, &memory.value),
+                    fact.seen_count as i64,
+                    fact.archived_at,
+                );
+                match stmt.query_row(params, |row| row.get::<_, String>(0)) {
+                    Ok(id) => {
+                        report.inserted += 1;
+                        report.ids.push(id);
+                    }
+                    Err(rusqlite::Error::QueryReturnedNoRows) => {
+                        report.skipped += 1;
+                        report.ids.push(memory.id.clone());
+                    }
+                    Err(e) if tx.is_autocommit() => return Err(e.into()),
+                    Err(e) => report.failures.push((index, e.into())),
+                }
+            }
+        }
+        tx.commit()?;
+        Ok(report)
     }
 
     /// Return `true` if a table with the given `name` exists in the database.
@@ -114,23 +741,103 @@ impl MemoryStore {
     }
 
     /// Insert a `Memory` record into the database.
+    ///
+    /// Fails if the store already holds the same fact; use [`Self::upsert`]
+    /// to merge instead.
     pub fn insert(&self, memory: &Memory) -> Result<(), StoreError> {
-        self.conn.execute(
-            "INSERT INTO memories (id, entity, attribute, value, source, created_at, updated_at)
-             VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7)",
-            rusqlite::params![
-                memory.id,
-                memory.entity,
-                memory.attribute,
-                memory.value,
-                memory.source,
-                memory.created_at,
-                memory.updated_at,
-            ],
-        )?;
+        let mut stmt = self.conn.prepare_cached(INSERT_MEMORY)?;
+        stmt.query_row(memory_params(memory), |_| Ok(()))?;
+        Ok(())
+    }
+
+    /// Insert `memory`, or merge it into the row already holding the same fact.
+    ///
+    /// Facts are matched on case-folded, whitespace-collapsed
+    /// entity/attribute/value. A match keeps its id, takes the later
+    /// `updated_at` (and `memory.source`, if set) and has its seen-count
+    /// bumped. Returns the id of the row holding the fact.
+    pub fn upsert(&self, memory: &Memory) -> Result<String, StoreError> {
+        let mut stmt = self.conn.prepare_cached(UPSERT_MEMORY)?;
+        Ok(stmt.query_row(memory_params(memory), |row| row.get(0))?)
+    }
+
+    /// Insert all `memories` inside a single transaction.
+    ///
+    /// The batch is all-or-nothing: if any row fails (e.g. a duplicate id) the
+    /// transaction is rolled back and that row's error is returned.
+    pub fn insert_batch(&self, memories: &[Memory]) -> Result<(), StoreError> {
+        let tx = self.conn.unchecked_transaction()?;
+        {
+            let mut stmt = tx.prepare_cached(INSERT_MEMORY)?;
+            for memory in memories {
+                stmt.query_row(memory_params(memory), |_| Ok(()))?;
+            }
+        }
+        tx.commit()?;
         Ok(())
     }
 
+    /// Insert `memories` inside a single transaction, skipping rows that fail.
+    ///
+    /// Unlike [`Self::insert_batch`], a rejected row (e.g. a duplicate id) only
+    /// undoes its own statement; the rest of the batch is still committed and
+    /// the failure is recorded in the returned [`InsertReport`]. An error that
+    /// aborts the whole transaction (disk full, I/O) is returned as `Err`.
+    pub fn insert_many(&self, memories: &[Memory]) -> Result<InsertReport, StoreError> {
+        self.write_many(
+            memories.iter().map(|m| (m, memory_params(m))),
+            INSERT_MEMORY,
+        )
+    }
+
+    /// [`Self::upsert`] every memory inside a single transaction.
+    ///
+    /// Failures are reported per row as for [`Self::insert_many`].
+    pub fn upsert_many(&self, memories: &[Memory]) -> Result<InsertReport, StoreError> {
+        self.write_many(
+            memories.iter().map(|m| (m, memory_params(m))),
+            UPSERT_MEMORY,
+        )
+    }
+
+    /// Load exported memories, each with its seen-count, inside a single
+    /// transaction, keeping their ids, timestamps and seen-counts.
+    ///
+    /// A memory whose id is already present is skipped; one holding a fact
+    /// the store already has under another id is merged as by [`Self::upsert`],
+    /// adding its seen-count. Failures are reported per row as for
+    /// [`Self::insert_many`].
+    pub fn import_many(&self, memories: &[(Memory, u64)]) -> Result<InsertReport, StoreError> {
+        let rows = memories.iter().map(|(m, seen_count)| {
+            let params = (
+                &m.id,
+                &m.entity,
+                &m.attribute,
+                &m.value,
+                &m.source,
+                m.created_at,
+                m.updated_at,
+                norm_key(&m.entity, &m.attribute, &m.value),
+                *seen_count as i64,
+            );
+            (m, params)
+        });
+        self.write_many(rows, IMPORT_MEMORY)
+    }
+
+    /// Return how many times the fact stored under `id` has been recorded.
+    pub fn seen_count(&self, id: &str) -> Result<Option<u64>, StoreError> {
+        let count: Option<i64> = self
+            .conn
+            .query_row(
+                "SELECT seen_count FROM memories WHERE id = ?1",
+                [id],
+                |row| row.get(0),
+            )
+            .optional()?;
+        Ok(count.map(|c| c as u64))
+    }
+
     /// Retrieve a `Memory` by id, returning `None` if no row exists.
     pub fn get(&self, id: &str) -> Result<Option<Memory>, StoreError> {
         let result = self.conn.query_row(
@@ -146,11 +853,41 @@ impl MemoryStore {
         }
     }
 
+    /// Retrieve the memories with the given `ids`, in the order requested.
+    ///
+    /// Ids with no matching row are skipped rather than reported as errors.
+    pub fn get_many(&self, ids: &[String]) -> Result<Vec<Memory>, StoreError> {
+        let mut stmt = self.conn.prepare_cached(
+            "SELECT id, entity, attribute, value, source, created_at, updated_at
+             FROM memories WHERE id = ?1",
+        )?;
+        let mut memories = Vec::with_capacity(ids.len());
+        for id in ids {
+            if let Some(memory) = stmt.query_row([id], row_to_memory).optional()? {
+                memories.push(memory);
+            }
+        }
+        Ok(memories)
+    }
+
     /// Update the `value` field and `updated_at` timestamp of a memory.
+    ///
+    /// Fails if the new value would make the row a duplicate of another fact.
     pub fn update_value(&self, id: &str, value: &str) -> Result<(), StoreError> {
+        let Some((entity, attribute)) = self
+            .conn
+            .query_row(
+                "SELECT entity, attribute FROM memories WHERE id = ?1",
+                [id],
+                |row| Ok((row.get::<_, String>(0)?, row.get::<_, String>(1)?)),
+            )
+            .optional()?
+        else {
+            return Ok(());
+        };
         self.conn.execute(
-            "UPDATE memories SET value = ?1, updated_at = ?2 WHERE id = ?3",
-            rusqlite::params![value, now_ms(), id],
+            "UPDATE memories SET value = ?1, updated_at = ?2, norm_key = ?3 WHERE id = ?4",
+            rusqlite::params![value, now_ms(), norm_key(&entity, &attribute, value), id],
         )?;
         Ok(())
     }
@@ -163,6 +900,9 @@ impl MemoryStore {
     }
 
     /// Return all memories for a given entity, ordered by `updated_at` DESC.
+    ///
+    /// The result is unbounded; use [`Self::query`] to page through an
+    /// entity with many facts.
     pub fn find_by_entity(&self, entity: &str) -> Result<Vec<Memory>, StoreError> {
         let mut stmt = self.conn.prepare(
             "SELECT id, entity, attribute, value, source, created_at, updated_at
@@ -184,21 +924,375 @@ impl MemoryStore {
         Ok(result?)
     }
 
-    /// Search memories matching `query` as a LIKE pattern across entity, attribute, and value.
+    /// Return up to `limit` memories, optionally restricted to one `entity`,
+    /// ordered by `updated_at` DESC.
+    pub fn list(&self, entity: Option<&str>, limit: usize) -> Result<Vec<Memory>, StoreError> {
+        let memories = match entity {
+            Some(entity) => {
+                let mut stmt = self.conn.prepare(
+                    "SELECT id, entity, attribute, value, source, created_at, updated_at
+                     FROM memories WHERE entity = ?1 ORDER BY updated_at DESC, id DESC LIMIT ?2",
+                )?;
+                let rows =
+                    stmt.query_map(rusqlite::params![entity, limit as i64], row_to_memory)?;
+                rows.collect::<Result<Vec<Memory>, rusqlite::Error>>()?
+            }
+            None => {
+                let mut stmt = self.conn.prepare(
+                    "SELECT id, entity, attribute, value, source, created_at, updated_at
+                     FROM memories ORDER BY updated_at DESC, id DESC LIMIT ?1",
+                )?;
+                let rows = stmt.query_map([limit as i64], row_to_memory)?;
+                rows.collect::<Result<Vec<Memory>, rusqlite::Error>>()?
+            }
+        };
+        Ok(memories)
+    }
+
+    /// Return the next page of at most `limit` memories matching `filter`,
+    /// ordered by `(updated_at, id)` DESC.
     ///
-    /// Returns up to 20 results ordered by `updated_at` DESC.
-    pub fn search(&self, query: &str) -> Result<Vec<Memory>, StoreError> {
-        let pattern = format!("%{}%", query);
-        let mut stmt = self.conn.prepare(
-            "SELECT id, entity, attribute, value, source, created_at, updated_at
-             FROM memories
-             WHERE entity LIKE ?1 OR attribute LIKE ?1 OR value LIKE ?1
-             ORDER BY updated_at DESC LIMIT 20",
+    /// Pagination is keyset-based: pass the `(updated_at, id)` of the last row
+    /// of the previous page as `after` (or `None` for the first page). Each
+    /// page is an index range scan, so reading deep into a large store costs
+    /// the same per page as reading the first one.
+    pub fn page(
+        &self,
+        filter: &MemoryFilter,
+        after: Option<(i64, &str)>,
+        limit: usize,
+    ) -> Result<Vec<Memory>, StoreError> {
+        let query = MemoryQuery {
+            entity: filter.entity.clone(),
+            source: filter.source.clone(),
+            since_ms: filter.since_ms,
+            until_ms: filter.until_ms,
+            ..MemoryQuery::default()
+        };
+        let rows = self.fetch(&query, after, limit)?;
+        Ok(rows.into_iter().map(|(memory, _)| memory).collect())
+    }
+
+    /// Run `query`, returning one page and the cursor for the next.
+    ///
+    /// Pass `None` for the first page and the previous page's `next` after
+    /// that. Like [`Self::page`], each page is an index range scan. A cursor
+    /// is only valid for a query with the same order; anything else is
+    /// rejected with [`StoreError::InvalidCursor`].
+    pub fn query(
+        &self,
+        query: &MemoryQuery,
+        cursor: Option<&str>,
+    ) -> Result<QueryPage, StoreError> {
+        let after = cursor.map(|c| decode_cursor(c, query.order)).transpose()?;
+        let after = after.as_ref().map(|(ts, id)| (*ts, id.as_str()));
+        // Fetch one extra row to learn whether another page follows.
+        let mut rows = self.fetch(query, after, query.page_size + 1)?;
+        let next = if rows.len() > query.page_size {
+            rows.truncate(query.page_size);
+            rows.last().map(|(m, _)| encode_cursor(m, query.order))
+        } else {
+            None
+        };
+        let (memories, seen_counts) = rows.into_iter().unzip();
+        Ok(QueryPage {
+            memories,
+            seen_counts,
+            next,
+        })
+    }
+
+    /// Full-text search over entity, attribute and value, best match first.
+    ///
+    /// Every word in `query` must match (in any column) and is treated as a
+    /// prefix, so `"sofi veg"` finds Sofia's vegetarian fact. Results are ranked
+    /// by BM25 and capped at `limit`. A query with no searchable words returns
+    /// no results.
+    pub fn search(&self, query: &str, limit: usize) -> Result<Vec<Memory>, StoreError> {
+        let Some(fts_query) = fts_prefix_query(query) else {
+            return Ok(Vec::new());
+        };
+        let mut stmt = self.conn.prepare_cached(
+            "SELECT m.id, m.entity, m.attribute, m.value, m.source, m.created_at, m.updated_at
+             FROM memories_fts
+             JOIN memories m ON m.rowid = memories_fts.rowid
+             WHERE memories_fts MATCH ?1
+             ORDER BY bm25(memories_fts), m.updated_at DESC
+             LIMIT ?2",
         )?;
-        let memories = stmt.query_map([&pattern], row_to_memory)?;
+        let memories = stmt.query_map(rusqlite::params![fts_query, limit as i64], row_to_memory)?;
         let result: Result<Vec<Memory>, rusqlite::Error> = memories.collect();
         Ok(result?)
     }
+
+    // --- Private helpers ---
+
+    /// Read up to `limit` rows matching `query` that sort after the `after` key,
+    /// each with its seen-count.
+    fn fetch(
+        &self,
+        query: &MemoryQuery,
+        after: Option<(i64, &str)>,
+        limit: usize,
+    ) -> Result<Vec<(Memory, u64)>, StoreError> {
+        use rusqlite::types::Value;
+
+        let column = query.order.column();
+        let (direction, past) = if query.order.descending() {
+            ("DESC", "<")
+        } else {
+            ("ASC", ">")
+        };
+
+        let mut clauses: Vec<String> = Vec::new();
+        let mut params: Vec<Value> = Vec::new();
+        for (name, value) in [
+            ("entity", &query.entity),
+            ("attribute", &query.attribute),
+            ("source", &query.source),
+        ] {
+            if let Some(value) = value {
+                clauses.push(format!("{name} = ?"));
+                params.push(Value::Text(value.clone()));
+            }
+        }
+        if let Some(since) = query.since_ms {
+            clauses.push(format!("{column} >= ?"));
+            params.push(Value::Integer(since));
+        }
+        if let Some(until) = query.until_ms {
+            clauses.push(format!("{column} < ?"));
+            params.push(Value::Integer(until));
+        }
+        if let Some((ts, id)) = after {
+            clauses.push(format!("({column}, id) {past} (?, ?)"));
+            params.push(Value::Integer(ts));
+            params.push(Value::Text(id.to_string()));
+        }
+        params.push(Value::Integer(limit as i64));
+
+        let where_sql = if clauses.is_empty() {
+            String::new()
+        } else {
+            format!("WHERE {}", clauses.join(" AND "))
+        };
+        let sql = format!(
+            "SELECT id, entity, attribute, value, source, created_at, updated_at, seen_count
+             FROM memories {where_sql} ORDER BY {column} {direction}, id {direction} LIMIT ?"
+        );
+        let mut stmt = self.conn.prepare_cached(&sql)?;
+        let rows = stmt.query_map(rusqlite::params_from_iter(params), |row| {
+            Ok((row_to_memory(row)?, row.get::<_, i64>(7)? as u64))
+        })?;
+        let result: Result<Vec<(Memory, u64)>, rusqlite::Error> = rows.collect();
+        Ok(result?)
+    }
+
+    /// Read an integer-valued pragma such as `freelist_count`.
+    fn pragma_u64(&self, name: &str) -> Result<u64, StoreError> {
+        let value: i64 = self
+            .conn
+            .query_row(&format!("PRAGMA {name}"), [], |row| row.get(0))?;
+        Ok(value as u64)
+    }
+
+    /// Run `sql` ([`INSERT_MEMORY`], [`UPSERT_MEMORY`] or [`IMPORT_MEMORY`])
+    /// once per `(memory, params)` row in one transaction.
+    fn write_many<'a, P: rusqlite::Params>(
+        &self,
+        rows: impl Iterator<Item = (&'a Memory, P)>,
+        sql: &str,
+    ) -> Result<InsertReport, StoreError> {
+        let tx = self.conn.unchecked_transaction()?;
+        let mut report = InsertReport::default();
+        {
+            let mut stmt = tx.prepare_cached(sql)?;
+            for (index, (memory, params)) in rows.enumerate() {
+                match stmt.query_row(params, |row| row.get::<_, String>(0)) {
+                    Ok(id) => {
+                        if id == memory.id {
+                            report.inserted += 1;
+                        } else {
+                            report.merged += 1;
+                        }
+                        report.ids.push(id);
+                    }
+                    // IMPORT_MEMORY returns nothing for an id already in the store.
+                    Err(rusqlite::Error::QueryReturnedNoRows) => {
+                        report.skipped += 1;
+                        report.ids.push(memory.id.clone());
+                    }
+                    // SQLite rolled the whole transaction back; nothing to commit.
+                    Err(e) if tx.is_autocommit() => return Err(e.into()),
+                    Err(e) => report.failures.push((index, e.into())),
+                }
+            }
+        }
+        tx.commit()?;
+        Ok(report)
+    }
+
+    /// One-shot migration to deduplicated facts.
+    ///
+    /// Stores created before facts were deduplicated get the `norm_key` and
+    /// `seen_count` columns; rows holding the same fact are then folded into
+    /// the most recently updated one, which keeps the earliest `created_at`
+    /// and the summed seen-count. Finally the unique index that [`UPSERT_MEMORY`]
+    /// relies on is created, which marks the migration as done.
+    fn migrate_norm_key(&self) -> Result<(), StoreError> {
+        let done: i64 = self.conn.query_row(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type='index' AND name='idx_memories_norm_key'",
+            [],
+            |row| row.get(0),
+        )?;
+        if done > 0 {
+            return Ok(());
+        }
+
+        let tx = self.conn.unchecked_transaction()?;
+        let has_norm_key: i64 = tx.query_row(
+            "SELECT COUNT(*) FROM pragma_table_info('memories') WHERE name = 'norm_key'",
+            [],
+            |row| row.get(0),
+        )?;
+        if has_norm_key == 0 {
+            tx.execute_batch(
+                "ALTER TABLE memories ADD COLUMN norm_key TEXT;
+                 ALTER TABLE memories ADD COLUMN seen_count INTEGER NOT NULL DEFAULT 1;",
+            )?;
+        }
+
+        // key -> (surviving id, earliest created_at, total seen-count)
+        let mut survivors: HashMap<String, (String, i64, i64)> = HashMap::new();
+        let mut duplicates = Vec::new();
+        {
+            let mut stmt = tx.prepare(
+                "SELECT id, entity, attribute, value, created_at, seen_count
+                 FROM memories ORDER BY updated_at DESC, id DESC",
+            )?;
+            let mut rows = stmt.query([])?;
+            while let Some(row) = rows.next()? {
+                let id: String = row.get(0)?;
+                let key = norm_key(
+                    &row.get::<_, String>(1)?,
+                    &row.get::<_, String>(2)?,
+                    &row.get::<_, String>(3)?,
+                );
+                let created_at: i64 = row.get(4)?;
+                let seen: i64 = row.get(5)?;
+                match survivors.entry(key) {
+                    Entry::Occupied(mut entry) => {
+                        let (_, first_seen, total) = entry.get_mut();
+                        *first_seen = (*first_seen).min(created_at);
+                        *total += seen;
+                        duplicates.push(id);
+                    }
+                    Entry::Vacant(entry) => {
+                        entry.insert((id, created_at, seen));
+                    }
+                }
+            }
+        }
+        {
+            let mut delete = tx.prepare("DELETE FROM memories WHERE id = ?1")?;
+            for id in &duplicates {
+                delete.execute([id])?;
+            }
+            let mut update = tx.prepare(
+                "UPDATE memories SET norm_key = ?1, created_at = ?2, seen_count = ?3 WHERE id = ?4",
+            )?;
+            for (key, (id, created_at, seen)) in &survivors {
+                update.execute(rusqlite::params![key, created_at, seen, id])?;
+            }
+        }
+        tx.execute_batch("CREATE UNIQUE INDEX idx_memories_norm_key ON memories(norm_key);")?;
+        tx.commit()?;
+        Ok(())
+    }
+}
+
+/// One writer connection plus a set of read-only connections to one store.
+///
+/// Writes are serialised on the writer. Reads go to whichever reader is free,
+/// so in WAL mode they run in parallel with each other and with the writer.
+/// A pool with no readers sends every call to the writer.
+pub struct StorePool {
+    writer: Mutex<MemoryStore>,
+    readers: Vec<Mutex<MemoryStore>>,
+    next_reader: AtomicUsize,
+}
+
+impl StorePool {
+    /// Open the store at `path` for writing (WAL mode) plus `readers` read-only connections.
+    pub fn open(path: &Path, key: &EngramKey, readers: usize) -> Result<Self, StoreError> {
+        Self::open_with(path, key, &StoreOptions::default(), readers)
+    }
+
+    /// Like [`Self::open`], opening every connection with `options`.
+    ///
+    /// `options.read_only` is ignored: the writer is always read-write and
+    /// the readers always read-only.
+    pub fn open_with(
+        path: &Path,
+        key: &EngramKey,
+        options: &StoreOptions,
+        readers: usize,
+    ) -> Result<Self, StoreError> {
+        let writer = MemoryStore::open_with(
+            path,
+            key,
+            &StoreOptions {
+                read_only: false,
+                ..options.clone()
+            },
+        )?;
+        let read_only = StoreOptions {
+            read_only: true,
+            ..options.clone()
+        };
+        let readers = (0..readers)
+            .map(|_| MemoryStore::open_with(path, key, &read_only).map(Mutex::new))
+            .collect::<Result<Vec<_>, _>>()?;
+        Ok(StorePool {
+            writer: Mutex::new(writer),
+            readers,
+            next_reader: AtomicUsize::new(0),
+        })
+    }
+
+    /// Wrap a single connection; reads and writes share it.
+    pub fn single(store: MemoryStore) -> Self {
+        StorePool {
+            writer: Mutex::new(store),
+            readers: Vec::new(),
+            next_reader: AtomicUsize::new(0),
+        }
+    }
+
+    /// Number of read-only connections.
+    pub fn reader_count(&self) -> usize {
+        self.readers.len()
+    }
+
+    /// Run `f` with exclusive use of the writer connection.
+    pub fn write<T>(&self, f: impl FnOnce(&MemoryStore) -> T) -> T {
+        f(&self.writer.lock().unwrap())
+    }
+
+    /// Run `f` on a reader connection, preferring one that is not in use.
+    pub fn read<T>(&self, f: impl FnOnce(&MemoryStore) -> T) -> T {
+        if self.readers.is_empty() {
+            return self.write(f);
+        }
+        let start = self.next_reader.fetch_add(1, Ordering::Relaxed);
+        let n = self.readers.len();
+        for i in 0..n {
+            if let Ok(reader) = self.readers[(start + i) % n].try_lock() {
+                return f(&reader);
+            }
+        }
+        f(&self.readers[start % n].lock().unwrap())
+    }
 }
 
 // --- Private helpers --------------------------------------------------------
@@ -211,6 +1305,72 @@ fn now_ms() -> i64 {
         .as_millis() as i64
 }
 
+/// Turn free text into an FTS5 query: each word becomes a quoted prefix term,
+/// implicitly AND-ed. Returns `None` if `query` contains no words.
+fn fts_prefix_query(query: &str) -> Option<String> {
+    let terms: Vec<String> = query
+        .split(|c: char| !c.is_alphanumeric())
+        .filter(|word| !word.is_empty())
+        .map(|word| format!("\"{word}\"*"))
+        .collect();
+    if terms.is_empty() {
+        None
+    } else {
+        Some(terms.join(" "))
+    }
+}
+
+/// Encode the sort key of `last` as an opaque [`MemoryStore::query`] cursor.
+fn encode_cursor(last: &Memory, order: QueryOrder) -> String {
+    let ts = order.timestamp(last);
+    URL_SAFE_NO_PAD.encode(format!("{}{}:{}", order.tag(), ts, last.id))
+}
+
+/// Decode a cursor made by [`encode_cursor`] for the same `order`.
+fn decode_cursor(cursor: &str, order: QueryOrder) -> Result<(i64, String), StoreError> {
+    let raw = URL_SAFE_NO_PAD
+        .decode(cursor)
+        .ok()
+        .and_then(|bytes| String::from_utf8(bytes).ok())
+        .ok_or(StoreError::InvalidCursor)?;
+    let rest = raw
+        .strip_prefix(order.tag())
+        .ok_or(StoreError::InvalidCursor)?;
+    let (ts, id) = rest.split_once(':').ok_or(StoreError::InvalidCursor)?;
+    let ts = ts.parse().map_err(|_| StoreError::InvalidCursor)?;
+    Ok((ts, id.to_string()))
+}
+
+/// Normalised identity of a fact: entity, attribute and value, each
+/// case-folded with runs of whitespace collapsed, joined by U+001F.
+fn norm_key(entity: &str, attribute: &str, value: &str) -> String {
+    [entity, attribute, value]
+        .iter()
+        .map(|part| {
+            part.split_whitespace()
+                .collect::<Vec<_>>()
+                .join(" ")
+                .to_lowercase()
+        })
+        .collect::<Vec<_>>()
+        .join("\u{1f}")
+}
+
+/// Bind a [`Memory`] to the positional parameters of [`INSERT_MEMORY`] and
+/// [`UPSERT_MEMORY`]; [`IMPORT_MEMORY`] takes its seen-count as well.
+fn memory_params(memory: &Memory) -> impl rusqlite::Params + '_ {
+    (
+        &memory.id,
+        &memory.entity,
+        &memory.attribute,
+        &memory.value,
+        &memory.source,
+        memory.created_at,
+        memory.updated_at,
+        norm_key(&memory.entity, &memory.attribute, &memory.value),
+    )
+}
+
 /// Deserialise a `memories` table row into a [`Memory`] struct.
 fn row_to_memory(row: &rusqlite::Row<'_>) -> rusqlite::Result<Memory> {
     Ok(Memory {
@@ -403,7 +1563,7 @@ mod tests {
         let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
         let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
         store.insert(&memory).expect("insert failed");
-        let results = store.search("Sofi").expect("search failed");
+        let results = store.search("Sofi", 20).expect("search failed");
         assert_eq!(results.len(), 1);
         assert_eq!(results[0].entity, "Sofia");
     }
@@ -414,7 +1574,7 @@ mod tests {
         let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
         let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
         store.insert(&memory).expect("insert failed");
-        let results = store.search("vegeta").expect("search failed");
+        let results = store.search("vegeta", 20).expect("search failed");
         assert_eq!(results.len(), 1);
         assert_eq!(results[0].value, "vegetarian");
     }
@@ -425,7 +1585,716 @@ mod tests {
         let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
         let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
         store.insert(&memory).expect("insert failed");
-        let results = store.search("nonexistent_xyz").expect("search failed");
+        let results = store.search("nonexistent_xyz", 20).expect("search failed");
         assert!(results.is_empty());
     }
+
+    #[test]
+    fn test_search_ranks_and_limits() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        store
+            .insert(&Memory::new("Ken", "note", "mentioned coffee once", None))
+            .unwrap();
+        store
+            .insert(&Memory::new(
+                "Sofia",
+                "coffee",
+                "coffee, black coffee",
+                None,
+            ))
+            .unwrap();
+        for i in 0..30 {
+            store
+                .insert(&Memory::new("Ken", &format!("a{i}"), "coffee", None))
+                .unwrap();
+        }
+
+        let results = store.search("coffee", 5).expect("search failed");
+        assert_eq!(results.len(), 5);
+        assert_eq!(results[0].entity, "Sofia", "most matches should rank first");
+        assert!(store.search("sofia coff", 10).unwrap().len() == 1);
+        assert!(store.search("  ** ", 10).unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_search_follows_updates_and_deletes() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
+        store.insert(&memory).unwrap();
+
+        store.update_value(&memory.id, "pescatarian").unwrap();
+        assert!(store.search("vegetarian", 10).unwrap().is_empty());
+        assert_eq!(store.search("pescat", 10).unwrap().len(), 1);
+
+        store.delete(&memory.id).unwrap();
+        assert!(store.search("pescat", 10).unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_open_backfills_search_index_for_existing_store() {
+        let (_dir, db_path) = temp_store();
+        {
+            let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+            store
+                .insert(&Memory::new("Sofia", "dietary", "vegetarian", None))
+                .unwrap();
+            // Simulate a store written before the full-text index existed.
+            store
+                .conn
+                .execute_batch(
+                    "DROP TRIGGER memories_fts_ai; DROP TRIGGER memories_fts_ad;
+                     DROP TRIGGER memories_fts_au; DROP TABLE memories_fts;",
+                )
+                .unwrap();
+        }
+        let store = MemoryStore::open(&db_path, &test_key()).expect("reopen failed");
+        assert_eq!(store.search("vegetarian", 10).unwrap().len(), 1);
+    }
+
+    #[test]
+    fn test_open_replaces_catch_all_fts_update_trigger() {
+        let (_dir, db_path) = temp_store();
+        {
+            let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+            // Simulate a store whose update trigger fired on every column.
+            store
+                .conn
+                .execute_batch(
+                    "DROP TRIGGER memories_fts_au;
+                     CREATE TRIGGER memories_fts_au AFTER UPDATE ON memories BEGIN
+                         INSERT INTO memories_fts (memories_fts, rowid, entity, attribute, value)
+                         VALUES ('delete', old.rowid, old.entity, old.attribute, old.value);
+                         INSERT INTO memories_fts (rowid, entity, attribute, value)
+                         VALUES (new.rowid, new.entity, new.attribute, new.value);
+                     END;",
+                )
+                .unwrap();
+        }
+        let store = MemoryStore::open(&db_path, &test_key()).expect("reopen failed");
+        let sql: String = store
+            .conn
+            .query_row(
+                "SELECT sql FROM sqlite_master WHERE type='trigger' AND name='memories_fts_au'",
+                [],
+                |row| row.get(0),
+            )
+            .unwrap();
+        assert!(sql.contains("AFTER UPDATE OF entity, attribute, value"));
+
+        let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
+        store.insert(&memory).unwrap();
+        store.update_value(&memory.id, "pescatarian").unwrap();
+        assert!(store.search("vegetarian", 10).unwrap().is_empty());
+        assert_eq!(store.search("pescat", 10).unwrap().len(), 1);
+    }
+
+    #[test]
+    fn test_fts_prefix_query_quotes_each_word() {
+        assert_eq!(
+            fts_prefix_query("Sofia's \"diet\" OR*").as_deref(),
+            Some("\"Sofia\"* \"s\"* \"diet\"* \"OR\"*")
+        );
+        assert_eq!(fts_prefix_query(" -- "), None);
+    }
+
+    #[test]
+    fn test_insert_batch_writes_all_rows() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let memories: Vec<Memory> = (0..100)
+            .map(|i| Memory::new("Sofia", &format!("attr{}", i), &format!("val{}", i), None))
+            .collect();
+        store.insert_batch(&memories).expect("insert_batch failed");
+        assert_eq!(store.record_count().unwrap(), 100);
+    }
+
+    #[test]
+    fn test_insert_batch_rolls_back_on_failure() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let first = Memory::new("Sofia", "dietary", "vegetarian", None);
+        let batch = vec![
+            Memory::new("Sofia", "city", "Lisbon", None),
+            first.clone(),
+            first, // duplicate id
+        ];
+        assert!(store.insert_batch(&batch).is_err());
+        assert_eq!(
+            store.record_count().unwrap(),
+            0,
+            "a failed batch must not leave partial rows behind"
+        );
+    }
+
+    #[test]
+    fn test_insert_many_commits_good_rows_and_reports_failures() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let first = Memory::new("Sofia", "dietary", "vegetarian", None);
+        let batch = vec![
+            Memory::new("Sofia", "city", "Lisbon", None),
+            first.clone(),
+            first, // duplicate id
+            Memory::new("Ken", "role", "engineer", None),
+        ];
+        let report = store.insert_many(&batch).expect("insert_many failed");
+        assert_eq!(report.inserted, 3);
+        assert_eq!(report.ids.len(), 3);
+        assert_eq!(report.failures.len(), 1);
+        assert_eq!(report.failures[0].0, 2);
+        assert_eq!(store.record_count().unwrap(), 3);
+        assert_eq!(store.search("Lisbon", 10).unwrap().len(), 1);
+    }
+
+    #[test]
+    fn test_upsert_merges_normalised_duplicates() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let first = Memory::new("Sofia", "dietary", "vegetarian", None);
+        let id = store.upsert(&first).expect("upsert failed");
+        assert_eq!(id, first.id);
+
+        let mut again = Memory::new(" sofia", "Dietary", "Vegetarian  ", Some("chat"));
+        again.updated_at = first.updated_at + 1_000;
+        assert_eq!(store.upsert(&again).unwrap(), first.id);
+
+        assert_eq!(store.record_count().unwrap(), 1);
+        assert_eq!(store.seen_count(&first.id).unwrap(), Some(2));
+        let stored = store.get(&first.id).unwrap().unwrap();
+        assert_eq!(stored.value, "vegetarian", "the original wording is kept");
+        assert_eq!(stored.updated_at, again.updated_at);
+        assert_eq!(stored.source.as_deref(), Some("chat"));
+        assert!(
+            store
+                .insert(&Memory::new("Sofia", "dietary", "vegetarian", None))
+                .is_err(),
+            "a plain insert must not duplicate a stored fact"
+        );
+    }
+
+    #[test]
+    fn test_upsert_many_reports_merged_rows() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let batch = vec![
+            Memory::new("Sofia", "dietary", "vegetarian", None),
+            Memory::new("Ken", "role", "engineer", None),
+            Memory::new("Sofia", "dietary", "vegetarian", None),
+        ];
+        let report = store.upsert_many(&batch).expect("upsert_many failed");
+        assert_eq!((report.inserted, report.merged), (2, 1));
+        assert_eq!(
+            report.ids,
+            vec![
+                batch[0].id.clone(),
+                batch[1].id.clone(),
+                batch[0].id.clone()
+            ]
+        );
+        assert_eq!(store.record_count().unwrap(), 2);
+    }
+
+    #[test]
+    fn test_import_many_skips_known_ids_and_merges_facts() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let existing = Memory::new("Sofia", "dietary", "vegetarian", None);
+        store.insert(&existing).unwrap();
+
+        let mut same_fact = Memory::new("sofia", "Dietary", "vegetarian", Some("phone"));
+        same_fact.updated_at = existing.updated_at + 1_000;
+        let ken = Memory::new("Ken", "role", "engineer", None);
+        let batch = vec![(existing.clone(), 1), (same_fact, 2), (ken.clone(), 4)];
+        let report = store.import_many(&batch).expect("import_many failed");
+        assert_eq!((report.inserted, report.merged, report.skipped), (1, 1, 1));
+        assert!(report.failures.is_empty());
+        assert_eq!(report.ids[..2], [existing.id.clone(), existing.id.clone()]);
+
+        let merged = store.get(&existing.id).unwrap().unwrap();
+        assert_eq!(merged.updated_at, existing.updated_at + 1_000);
+        assert_eq!(merged.source.as_deref(), Some("phone"));
+        assert_eq!(store.record_count().unwrap(), 2);
+        // Seen-counts are kept on insert and added on merge.
+        assert_eq!(store.seen_count(&existing.id).unwrap(), Some(3));
+        assert_eq!(store.seen_count(&ken.id).unwrap(), Some(4));
+    }
+
+    /// A fact last seen `days` ago and recorded `times` times.
+    fn aged_fact(store: &MemoryStore, value: &str, days: i64, times: usize) -> Memory {
+        let mut memory = Memory::new("Sofia", "note", value, None);
+        memory.created_at -= days * 24 * 60 * 60 * 1000;
+        memory.updated_at = memory.created_at;
+        for _ in 0..times {
+            store.upsert(&memory).unwrap();
+        }
+        memory
+    }
+
+    #[test]
+    fn test_compact_archives_cold_facts_only() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let cold = aged_fact(&store, "cold", 200, 1);
+        aged_fact(&store, "reinforced", 200, 3);
+        aged_fact(&store, "fresh", 1, 1);
+
+        let report = store.compact(&RetentionPolicy::default()).unwrap();
+        assert_eq!((report.archived, report.purged), (1, 0));
+        assert_eq!(store.record_count().unwrap(), 2);
+        assert_eq!(store.archived_count().unwrap(), 1);
+        assert!(store.get(&cold.id).unwrap().is_none());
+        assert_eq!(store.search("reinforced", 10).unwrap().len(), 1);
+
+        // Archiving the same fact again merges with the archived copy.
+        aged_fact(&store, "cold", 300, 1);
+        store.compact(&RetentionPolicy::default()).unwrap();
+        assert_eq!(store.archived_count().unwrap(), 1);
+    }
+
+    #[test]
+    fn test_archived_page_round_trips_through_import_archived() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        for name in ["a", "c"] {
+            aged_fact(&store, name, 200, 1);
+        }
+        // Seen twice, so it goes cold only after twice the window.
+        aged_fact(&store, "b", 400, 2);
+        store.compact(&RetentionPolicy::default()).unwrap();
+
+        let (first, next) = store.archived_page(None, 2).unwrap();
+        assert_eq!(first.len(), 2);
+        let (rest, next) = store.archived_page(next, 2).unwrap();
+        assert_eq!((rest.len(), next), (1, None));
+
+        let (_dir2, target_path) = temp_store();
+        let target = MemoryStore::open(&target_path, &test_key()).expect("open failed");
+        let facts: Vec<_> = first.into_iter().chain(rest).collect();
+        let report = target.import_archived(&facts).unwrap();
+        assert_eq!((report.inserted, report.skipped), (3, 0));
+        assert_eq!(target.record_count().unwrap(), 0);
+        assert_eq!(target.archived_page(None, 10).unwrap().0, facts);
+        let seen: Vec<(&str, u64)> = facts
+            .iter()
+            .map(|f| (f.memory.value.as_str(), f.seen_count))
+            .collect();
+        assert!(seen.contains(&("b", 2)), "{seen:?}");
+        assert!(seen.contains(&("a", 1)), "{seen:?}");
+
+        let again = target.import_archived(&facts).unwrap();
+        assert_eq!((again.inserted, again.skipped), (0, 3));
+        assert_eq!(target.archived_count().unwrap(), 3);
+    }
+
+    #[test]
+    fn test_compact_purges_expired_archive_and_converts_old_stores() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        // Simulate a store created before incremental vacuum was enabled.
+        store
+            .conn
+            .execute_batch("PRAGMA auto_vacuum = NONE; VACUUM;")
+            .unwrap();
+        aged_fact(&store, "old", 400, 1);
+        aged_fact(&store, "kept", 0, 1);
+        store.compact(&RetentionPolicy::default()).unwrap();
+        assert_eq!(store.pragma_u64("auto_vacuum").unwrap(), 2);
+        assert_eq!(store.search("kept", 10).unwrap().len(), 1);
+
+        store
+            .conn
+            .execute(
+                "UPDATE memories_archive SET archived_at = archived_at - 86400000",
+                [],
+            )
+            .unwrap();
+        let policy = RetentionPolicy {
+            archive_ttl_days: Some(0),
+            ..RetentionPolicy::default()
+        };
+        let report = store.compact(&policy).unwrap();
+        assert_eq!(report.purged, 1);
+        assert_eq!(store.archived_count().unwrap(), 0);
+        assert_eq!(store.record_count().unwrap(), 1);
+    }
+
+    #[test]
+    fn test_open_deduplicates_existing_store() {
+        let (_dir, db_path) = temp_store();
+        {
+            let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+            // Simulate a store written before facts were deduplicated.
+            store
+                .conn
+                .execute_batch(
+                    "DROP INDEX idx_memories_norm_key;
+                     ALTER TABLE memories DROP COLUMN norm_key;
+                     ALTER TABLE memories DROP COLUMN seen_count;",
+                )
+                .unwrap();
+            for (i, value) in ["vegetarian", "Vegetarian", "vegetarian"]
+                .iter()
+                .enumerate()
+            {
+                store
+                    .conn
+                    .execute(
+                        "INSERT INTO memories (id, entity, attribute, value, source, created_at, updated_at)
+                         VALUES (?1, 'Sofia', 'dietary', ?2, NULL, ?3, ?3)",
+                        rusqlite::params![format!("id{i}"), value, 1_000 + i as i64],
+                    )
+                    .unwrap();
+            }
+        }
+        let store = MemoryStore::open(&db_path, &test_key()).expect("reopen failed");
+        assert_eq!(store.record_count().unwrap(), 1);
+        let survivor = store.get("id2").unwrap().expect("newest row survives");
+        assert_eq!(survivor.created_at, 1_000);
+        assert_eq!(store.seen_count("id2").unwrap(), Some(3));
+        assert_eq!(store.search("vegetarian", 10).unwrap().len(), 1);
+    }
+
+    #[test]
+    fn test_query_pages_through_filtered_rows_with_cursor() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let rows: Vec<Memory> = (0..25)
+            .map(|i| {
+                let entity = if i % 5 == 0 { "Ken" } else { "Sofia" };
+                let mut m = Memory::new(entity, &format!("attr{i}"), "v", None);
+                m.created_at = 1_000 + i;
+                m.updated_at = 5_000 - i;
+                m
+            })
+            .collect();
+        store.insert_batch(&rows).unwrap();
+
+        let query = MemoryQuery::new()
+            .entity("Sofia")
+            .order(QueryOrder::CreatedAsc)
+            .page_size(6);
+        let mut cursor: Option<String> = None;
+        let mut seen = Vec::new();
+        let mut pages = 0;
+        loop {
+            let page = store
+                .query(&query, cursor.as_deref())
+                .expect("query failed");
+            pages += 1;
+            seen.extend(page.memories.into_iter().map(|m| m.created_at));
+            match page.next {
+                Some(next) => cursor = Some(next),
+                None => break,
+            }
+        }
+        assert_eq!(pages, 4, "20 rows at 6 per page");
+        let expected: Vec<i64> = (0..25).filter(|i| i % 5 != 0).map(|i| 1_000 + i).collect();
+        assert_eq!(seen, expected);
+
+        let ranged = store
+            .query(
+                &MemoryQuery::new()
+                    .attribute("attr3")
+                    .order(QueryOrder::UpdatedDesc)
+                    .since_ms(4_990),
+                None,
+            )
+            .unwrap();
+        assert_eq!(ranged.memories.len(), 1);
+        assert_eq!(ranged.next, None);
+    }
+
+    #[test]
+    fn test_query_rejects_cursor_from_another_order() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let rows: Vec<Memory> = (0..3)
+            .map(|i| Memory::new("Sofia", &format!("attr{i}"), "v", None))
+            .collect();
+        store.insert_batch(&rows).unwrap();
+
+        let first = store.query(&MemoryQuery::new().page_size(1), None).unwrap();
+        let next = first.next.expect("more pages expected");
+        let other = MemoryQuery::new().order(QueryOrder::CreatedAsc);
+        assert!(matches!(
+            store.query(&other, Some(&next)),
+            Err(StoreError::InvalidCursor)
+        ));
+        assert!(matches!(
+            store.query(&MemoryQuery::new(), Some("not a cursor")),
+            Err(StoreError::InvalidCursor)
+        ));
+    }
+
+    #[test]
+    fn test_get_many_preserves_order_and_skips_missing() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let a = Memory::new("Sofia", "dietary", "vegetarian", None);
+        let b = Memory::new("Ken", "role", "engineer", None);
+        store.insert_batch(&[a.clone(), b.clone()]).unwrap();
+
+        let ids = vec![b.id.clone(), "missing".to_string(), a.id.clone()];
+        let got = store.get_many(&ids).expect("get_many failed");
+        assert_eq!(got, vec![b, a]);
+    }
+
+    #[test]
+    fn test_list_filters_by_entity_and_limits() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        for i in 0..5 {
+            store
+                .insert(&Memory::new("Sofia", &format!("attr{}", i), "v", None))
+                .unwrap();
+        }
+        store
+            .insert(&Memory::new("Ken", "role", "engineer", None))
+            .unwrap();
+
+        assert_eq!(store.list(None, 100).unwrap().len(), 6);
+        assert_eq!(store.list(Some("Sofia"), 100).unwrap().len(), 5);
+        assert_eq!(store.list(Some("Sofia"), 2).unwrap().len(), 2);
+    }
+
+    #[test]
+    fn test_page_walks_every_row_exactly_once() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        // Many rows share a timestamp so the id tiebreak is exercised.
+        let memories: Vec<Memory> = (0..57)
+            .map(|i| {
+                let mut m = Memory::new("Sofia", &format!("attr{}", i), "v", None);
+                m.updated_at = 1_000 + (i / 10) as i64;
+                m
+            })
+            .collect();
+        store.insert_batch(&memories).unwrap();
+
+        let filter = MemoryFilter::default();
+        let mut seen = Vec::new();
+        let mut after: Option<(i64, String)> = None;
+        loop {
+            let page = store
+                .page(&filter, after.as_ref().map(|(t, id)| (*t, id.as_str())), 10)
+                .expect("page failed");
+            if page.is_empty() {
+                break;
+            }
+            assert!(page.len() <= 10);
+            let last = page.last().unwrap();
+            after = Some((last.updated_at, last.id.clone()));
+            seen.extend(page.into_iter().map(|m| m.id));
+        }
+
+        assert_eq!(seen.len(), 57);
+        let mut unique = seen.clone();
+        unique.sort();
+        unique.dedup();
+        assert_eq!(unique.len(), 57, "pagination must not repeat rows");
+    }
+
+    #[test]
+    fn test_page_applies_filters() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let mut rows = vec![
+            Memory::new("Sofia", "dietary", "vegetarian", Some("chat")),
+            Memory::new("Sofia", "city", "Lisbon", Some("email")),
+            Memory::new("Ken", "role", "engineer", Some("chat")),
+        ];
+        rows[0].updated_at = 100;
+        rows[1].updated_at = 200;
+        rows[2].updated_at = 300;
+        store.insert_batch(&rows).unwrap();
+
+        let by_entity = MemoryFilter {
+            entity: Some("Sofia".to_string()),
+            ..Default::default()
+        };
+        assert_eq!(store.page(&by_entity, None, 10).unwrap().len(), 2);
+
+        let by_source = MemoryFilter {
+            source: Some("chat".to_string()),
+            ..Default::default()
+        };
+        assert_eq!(store.page(&by_source, None, 10).unwrap().len(), 2);
+
+        let window = MemoryFilter {
+            since_ms: Some(150),
+            until_ms: Some(300),
+            ..Default::default()
+        };
+        let got = store.page(&window, None, 10).unwrap();
+        assert_eq!(got.len(), 1);
+        assert_eq!(got[0].value, "Lisbon");
+    }
+
+    fn journal_mode(store: &MemoryStore) -> String {
+        store
+            .conn
+            .query_row("PRAGMA journal_mode", [], |row| row.get(0))
+            .unwrap()
+    }
+
+    #[test]
+    fn test_open_uses_wal_by_default() {
+        let (_dir, db_path) = temp_store();
+        let store = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        assert_eq!(journal_mode(&store), "wal");
+    }
+
+    #[test]
+    fn test_open_with_rollback_journal() {
+        let (_dir, db_path) = temp_store();
+        let options = StoreOptions {
+            wal: false,
+            ..StoreOptions::default()
+        };
+        let store = MemoryStore::open_with(&db_path, &test_key(), &options).expect("open failed");
+        assert_eq!(journal_mode(&store), "delete");
+    }
+
+    #[test]
+    fn test_profiles_set_their_pragmas() {
+        let (_dir, db_path) = temp_store();
+        let cache_size = |store: &MemoryStore| -> i64 {
+            store
+                .conn
+                .query_row("PRAGMA cache_size", [], |row| row.get(0))
+                .unwrap()
+        };
+        let default = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        assert_eq!(cache_size(&default), -16384);
+
+        for (profile, expected) in [
+            (StoreProfile::BulkIngest, -131072),
+            (StoreProfile::Mobile, -2048),
+        ] {
+            let options = StoreOptions {
+                profile,
+                ..StoreOptions::default()
+            };
+            let store =
+                MemoryStore::open_with(&db_path, &test_key(), &options).expect("open failed");
+            assert_eq!(cache_size(&store), expected, "{profile:?}");
+            store
+                .insert(&Memory::new("Sofia", &format!("{profile:?}"), "v", None))
+                .expect("every profile can write the same store");
+        }
+    }
+
+    #[test]
+    fn test_store_profile_parses_from_config() {
+        let config: EngramConfig = toml::from_str("[store]\nprofile = \"bulk-ingest\"\n").unwrap();
+        assert_eq!(
+            StoreOptions::from_config(&config).profile,
+            StoreProfile::BulkIngest
+        );
+        assert_eq!(
+            StoreOptions::from_config(&EngramConfig::default()).profile,
+            StoreProfile::Interactive
+        );
+    }
+
+    #[test]
+    fn test_retention_policy_parses_from_config() {
+        let config: EngramConfig =
+            toml::from_str("[store.retention]\ncold_after_days = 30\n").unwrap();
+        assert_eq!(
+            config.store.retention,
+            RetentionPolicy {
+                cold_after_days: 30,
+                ..RetentionPolicy::default()
+            }
+        );
+    }
+
+    #[test]
+    fn test_read_only_connection_rejects_writes() {
+        let (_dir, db_path) = temp_store();
+        let _writer = MemoryStore::open(&db_path, &test_key()).expect("open failed");
+        let options = StoreOptions {
+            read_only: true,
+            ..StoreOptions::default()
+        };
+        let reader = MemoryStore::open_with(&db_path, &test_key(), &options).expect("open failed");
+        assert_eq!(reader.record_count().unwrap(), 0);
+        let result = reader.insert(&Memory::new("Sofia", "dietary", "vegetarian", None));
+        assert!(result.is_err(), "read-only connection must not write");
+    }
+
+    #[test]
+    fn test_pool_reads_see_committed_writes_from_any_thread() {
+        let (_dir, db_path) = temp_store();
+        let pool = StorePool::open(&db_path, &test_key(), 3).expect("pool open failed");
+        assert_eq!(pool.reader_count(), 3);
+
+        let memory = Memory::new("Sofia", "dietary", "vegetarian", None);
+        pool.write(|s| s.insert(&memory)).unwrap();
+
+        std::thread::scope(|scope| {
+            for _ in 0..6 {
+                scope.spawn(|| {
+                    let got = pool.read(|s| s.get(&memory.id)).unwrap();
+                    assert_eq!(got.unwrap().value, "vegetarian");
+                });
+            }
+        });
+    }
+
+    #[test]
+    fn test_single_pool_reads_through_the_writer() {
+        let (_dir, db_path) = temp_store();
+        let pool = StorePool::single(MemoryStore::open(&db_path, &test_key()).unwrap());
+        pool.write(|s| s.insert(&Memory::new("Ken", "role", "engineer", None)))
+            .unwrap();
+        assert_eq!(pool.read(|s| s.record_count()).unwrap(), 1);
+    }
+
+    /// Parallel readers should scale with cores. Timing-sensitive, so run it
+    /// explicitly: `cargo test -p engram-core --release -- --ignored --nocapture pool_read`.
+    #[test]
+    #[ignore]
+    fn test_pool_read_throughput_scales_with_cores() {
+        let (_dir, db_path) = temp_store();
+        let threads = std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+            .min(8);
+        let pool = StorePool::open(&db_path, &test_key(), threads).expect("pool open failed");
+        let rows: Vec<Memory> = (0..20_000)
+            .map(|i| Memory::new(&format!("entity{}", i % 500), &format!("a{i}"), "v", None))
+            .collect();
+        pool.write(|s| s.insert_batch(&rows)).unwrap();
+
+        let reads_per_sec = |workers: usize| {
+            let per_worker = 2_000;
+            let start = std::time::Instant::now();
+            std::thread::scope(|scope| {
+                for w in 0..workers {
+                    let pool = &pool;
+                    scope.spawn(move || {
+                        for i in 0..per_worker {
+                            let entity = format!("entity{}", (w * per_worker + i) % 500);
+                            pool.read(|s| s.find_by_entity(&entity)).unwrap();
+                        }
+                    });
+                }
+            });
+            (workers * per_worker) as f64 / start.elapsed().as_secs_f64()
+        };
+
+        let one = reads_per_sec(1);
+        let many = reads_per_sec(threads);
+        println!("reads/s: 1 thread {one:.0}, {threads} threads {many:.0}");
+        if threads >= 2 {
+            assert!(
+                many > one * 1.5,
+                "{threads} readers should beat one by 1.5x: {many:.0} vs {one:.0}"
+            );
+        }
+    }
 }
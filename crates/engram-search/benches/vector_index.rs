@@ -0,0 +1,147 @@
+//! Insert and KNN latency of `VectorIndex` over 100k 384-dimensional vectors.
+//!
+//! `json` binds each vector the way `VectorIndex` used to: serialised with
+//! `serde_json` and parsed again by sqlite-vec. `blob` goes through
+//! `VectorIndex::insert_many` and `knn_search`, which bind little-endian
+//! float32 blobs. Both variants run against the same table, each for about
+//! a second, and the mean time per call and rate are printed.
+//!
+//! Run with `cargo bench -p engram-search --bench vector_index`.
+
+use std::hint::black_box;
+use std::time::{Duration, Instant};
+
+use engram_search::vector::VectorIndex;
+use rusqlite::{params, Connection};
+use tempfile::TempDir;
+
+const DIMENSIONS: usize = 384;
+const INDEXED: usize = 100_000;
+const INSERT_BATCH: usize = 1_000;
+
+/// Time spent measuring each variant.
+const MEASURE: Duration = Duration::from_secs(1);
+
+/// Deterministic pseudo-random vectors, so runs are comparable.
+fn vectors(count: usize, seed: u64) -> Vec<Vec<f32>> {
+    let mut state = seed;
+    (0..count)
+        .map(|_| {
+            (0..DIMENSIONS)
+                .map(|_| {
+                    state = state
+                        .wrapping_mul(6364136223846793005)
+                        .wrapping_add(1442695040888963407);
+                    (state >> 40) as f32 / (1u64 << 24) as f32 - 0.5
+                })
+                .collect()
+        })
+        .collect()
+}
+
+fn insert_all(index: &VectorIndex, prefix: &str, vectors: &[Vec<f32>]) {
+    let ids: Vec<String> = (0..vectors.len())
+        .map(|i| format!("{prefix}-{i}"))
+        .collect();
+    let entries: Vec<(&str, &[f32])> = ids
+        .iter()
+        .zip(vectors)
+        .map(|(id, v)| (id.as_str(), v.as_slice()))
+        .collect();
+    index.insert_many(&entries).unwrap();
+}
+
+fn insert_json(conn: &mut Connection, prefix: &str, vectors: &[Vec<f32>]) {
+    let tx = conn.transaction().unwrap();
+    {
+        let mut insert = tx
+            .prepare(
+                "INSERT INTO memory_vectors (embedding, memory_id, chunk_offset, snippet) \
+                 VALUES (?, ?, 0, '')",
+            )
+            .unwrap();
+        for (i, vector) in vectors.iter().enumerate() {
+            let json = serde_json::to_string(vector).unwrap();
+            insert
+                .execute(params![json, format!("{prefix}-{i}")])
+                .unwrap();
+        }
+    }
+    tx.commit().unwrap();
+}
+
+fn knn_json(conn: &Connection, query: &[f32], k: usize) -> Vec<(String, f32)> {
+    let json = serde_json::to_string(query).unwrap();
+    let mut stmt = conn
+        .prepare(
+            "SELECT memory_id, distance FROM memory_vectors \
+             WHERE embedding MATCH ?1 AND k = ?2 ORDER BY distance",
+        )
+        .unwrap();
+    let rows = stmt
+        .query_map(params![json, k as i64], |row| {
+            Ok((row.get(0)?, row.get(1)?))
+        })
+        .unwrap();
+    rows.map(Result::unwrap).collect()
+}
+
+/// Call `routine` for about [`MEASURE`], then print the mean time per call and
+/// the rate of `unit`s, `per_call` of which each call handles.
+fn bench<R>(name: &str, per_call: usize, unit: &str, mut routine: impl FnMut() -> R) {
+    // Warm-up call, not timed.
+    black_box(routine());
+    let mut calls = 0u32;
+    let start = Instant::now();
+    while start.elapsed() < MEASURE {
+        black_box(routine());
+        calls += 1;
+    }
+    let mean = start.elapsed() / calls;
+    let rate = per_call as f64 / mean.as_secs_f64();
+    println!("{name}: {mean:?} per call, {rate:.0} {unit}/s ({calls} calls)");
+}
+
+fn main() {
+    let dir = TempDir::new().unwrap();
+    let path = dir.path().join("vectors.db");
+    let index = VectorIndex::open(&path).unwrap();
+    for (batch, chunk) in vectors(INDEXED, 1).chunks(10_000).enumerate() {
+        insert_all(&index, &format!("seed{batch}"), chunk);
+    }
+    // Opening the index registered sqlite-vec for this connection too.
+    let mut conn = Connection::open(&path).unwrap();
+
+    let batch = vectors(INSERT_BATCH, 2);
+    let mut round = 0;
+    bench(
+        &format!("vector_insert/json/{INDEXED}"),
+        INSERT_BATCH,
+        "vectors",
+        || {
+            round += 1;
+            insert_json(&mut conn, &format!("json{round}"), &batch)
+        },
+    );
+    bench(
+        &format!("vector_insert/blob/{INDEXED}"),
+        INSERT_BATCH,
+        "vectors",
+        || {
+            round += 1;
+            insert_all(&index, &format!("blob{round}"), &batch)
+        },
+    );
+
+    let queries = vectors(64, 3);
+    let mut next = 0;
+    // knn_search(.., 10) asks sqlite-vec for 40 chunks on its first pass.
+    bench(&format!("vector_knn/json/{INDEXED}"), 1, "queries", || {
+        next = (next + 1) % queries.len();
+        knn_json(&conn, &queries[next], 40)
+    });
+    bench(&format!("vector_knn/blob/{INDEXED}"), 1, "queries", || {
+        next = (next + 1) % queries.len();
+        index.knn_search(&queries[next], 10).unwrap()
+    });
+}
@@ -0,0 +1,3 @@
+fn main() {
+    uniffi::generate_scaffolding("src/engram_search.udl").unwrap();
+}
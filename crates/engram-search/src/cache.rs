@@ -0,0 +1,327 @@
+// cache: embedding caches keyed by (model id, text hash)
+//
+// `EmbeddingCache` is a SQLite file shared by every vault, so text embedded
+// once (a note re-indexed with --force, a vault re-added, the same `_context`
+// file in several vaults) is never sent through the model again. The least
+// recently used entries are evicted past a size bound. `QueryCache` is a small
+// in-memory LRU that `Embedder::embed` consults for repeated queries.
+
+use std::collections::HashMap;
+use std::path::Path;
+use std::time::Duration;
+
+use rusqlite::{params, Connection, OptionalExtension};
+use sha2::{Digest, Sha256};
+
+use crate::SearchError;
+
+/// Default bound on cached embeddings: about 150 MB of 384-dimensional vectors.
+pub const DEFAULT_CACHE_ENTRIES: usize = 100_000;
+
+/// Default number of query embeddings [`QueryCache`] keeps.
+pub const DEFAULT_QUERY_ENTRIES: usize = 256;
+
+/// Persistent, size-bounded LRU cache of embeddings.
+pub struct EmbeddingCache {
+    conn: Connection,
+    max_entries: usize,
+    /// Last `last_used` stamp handed out; higher means more recently used.
+    clock: i64,
+}
+
+impl EmbeddingCache {
+    /// Open (or create) the cache at `path`, holding at most `max_entries` embeddings.
+    ///
+    /// The file uses WAL mode with a busy timeout, so `engram index`, the daemon and
+    /// searches can share it.
+    pub fn open(path: &Path, max_entries: usize) -> Result<Self, SearchError> {
+        if let Some(dir) = path.parent() {
+            std::fs::create_dir_all(dir).map_err(|e| SearchError::Io(e.to_string()))?;
+        }
+        let conn = Connection::open(path).map_err(|e| SearchError::Db(e.to_string()))?;
+        conn.busy_timeout(Duration::from_secs(5))
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        conn.query_row("PRAGMA journal_mode = WAL", [], |_| Ok(()))
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        conn.execute_batch(
+            "CREATE TABLE IF NOT EXISTS embeddings ( \
+                 model TEXT NOT NULL, \
+                 text_hash TEXT NOT NULL, \
+                 vector BLOB NOT NULL, \
+                 last_used INTEGER NOT NULL, \
+                 PRIMARY KEY (model, text_hash) \
+             ); \
+             CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used);",
+        )
+        .map_err(|e| SearchError::Db(e.to_string()))?;
+
+        let clock: Option<i64> = conn
+            .query_row("SELECT MAX(last_used) FROM embeddings", [], |row| {
+                row.get(0)
+            })
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+
+        Ok(Self {
+            conn,
+            max_entries: max_entries.max(1),
+            clock: clock.unwrap_or(0),
+        })
+    }
+
+    /// Return the cached embedding of each of `texts` under `model`, marking hits as used.
+    pub fn get_many(
+        &mut self,
+        model: &str,
+        texts: &[&str],
+    ) -> Result<Vec<Option<Vec<f32>>>, SearchError> {
+        let tx = self
+            .conn
+            .transaction()
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        let mut found = Vec::with_capacity(texts.len());
+        {
+            let mut touch = tx
+                .prepare(
+                    "UPDATE embeddings SET last_used = ?3 \
+                     WHERE model = ?1 AND text_hash = ?2 RETURNING vector",
+                )
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+            for text in texts {
+                self.clock += 1;
+                let blob: Option<Vec<u8>> = touch
+                    .query_row(params![model, text_hash(text), self.clock], |row| {
+                        row.get(0)
+                    })
+                    .optional()
+                    .map_err(|e| SearchError::Db(e.to_string()))?;
+                found.push(blob.map(|b| decode(&b)));
+            }
+        }
+        tx.commit().map_err(|e| SearchError::Db(e.to_string()))?;
+        Ok(found)
+    }
+
+    /// Store the embedding of each `(text, vector)` under `model`, then evict the least
+    /// recently used entries beyond the size bound.
+    pub fn put_many(&mut self, model: &str, entries: &[(&str, &[f32])]) -> Result<(), SearchError> {
+        let tx = self
+            .conn
+            .transaction()
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        {
+            let mut insert = tx
+                .prepare(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, last_used) \
+                     VALUES (?1, ?2, ?3, ?4)",
+                )
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+            for (text, vector) in entries {
+                self.clock += 1;
+                insert
+                    .execute(params![model, text_hash(text), encode(vector), self.clock])
+                    .map_err(|e| SearchError::Db(e.to_string()))?;
+            }
+
+            let count: i64 = tx
+                .query_row("SELECT COUNT(*) FROM embeddings", [], |row| row.get(0))
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+            let excess = count - self.max_entries as i64;
+            if excess > 0 {
+                tx.execute(
+                    "DELETE FROM embeddings WHERE rowid IN \
+                     (SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+                    params![excess],
+                )
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+            }
+        }
+        tx.commit().map_err(|e| SearchError::Db(e.to_string()))?;
+        Ok(())
+    }
+
+    /// Embed `texts` under `model`, calling `embed` only for texts not already cached.
+    ///
+    /// `embed` receives the misses in order and must return one vector per text; its
+    /// results are cached. When every text is cached, `embed` is not called at all.
+    pub fn embed_batch_with(
+        &mut self,
+        model: &str,
+        texts: &[&str],
+        embed: impl FnOnce(&[&str]) -> Result<Vec<Vec<f32>>, SearchError>,
+    ) -> Result<Vec<Vec<f32>>, SearchError> {
+        let mut vectors = self.get_many(model, texts)?;
+        let misses: Vec<usize> = (0..texts.len()).filter(|&i| vectors[i].is_none()).collect();
+        if !misses.is_empty() {
+            let miss_texts: Vec<&str> = misses.iter().map(|&i| texts[i]).collect();
+            let embedded = embed(&miss_texts)?;
+            if embedded.len() != miss_texts.len() {
+                return Err(SearchError::Embed(format!(
+                    "expected {} embeddings, got {}",
+                    miss_texts.len(),
+                    embedded.len()
+                )));
+            }
+            let entries: Vec<(&str, &[f32])> = miss_texts
+                .iter()
+                .zip(&embedded)
+                .map(|(text, vector)| (*text, vector.as_slice()))
+                .collect();
+            self.put_many(model, &entries)?;
+            for (i, vector) in misses.into_iter().zip(embedded) {
+                vectors[i] = Some(vector);
+            }
+        }
+        Ok(vectors.into_iter().flatten().collect())
+    }
+
+    /// Return the number of cached embeddings.
+    pub fn len(&self) -> Result<usize, SearchError> {
+        let count: i64 = self
+            .conn
+            .query_row("SELECT COUNT(*) FROM embeddings", [], |row| row.get(0))
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        Ok(count as usize)
+    }
+
+    /// Return `true` when nothing is cached.
+    pub fn is_empty(&self) -> Result<bool, SearchError> {
+        Ok(self.len()? == 0)
+    }
+}
+
+/// In-memory LRU of query embeddings, keyed by the query text.
+pub struct QueryCache {
+    capacity: usize,
+    entries: HashMap<String, (Vec<f32>, u64)>,
+    clock: u64,
+}
+
+impl QueryCache {
+    /// Create an empty cache holding at most `capacity` queries.
+    pub fn new(capacity: usize) -> Self {
+        Self {
+            capacity: capacity.max(1),
+            entries: HashMap::new(),
+            clock: 0,
+        }
+    }
+
+    /// Return the cached embedding of `text`, marking it as used.
+    pub fn get(&mut self, text: &str) -> Option<Vec<f32>> {
+        self.clock += 1;
+        let clock = self.clock;
+        self.entries.get_mut(text).map(|(vector, used)| {
+            *used = clock;
+            vector.clone()
+        })
+    }
+
+    /// Cache `vector` for `text`, evicting the least recently used query when full.
+    pub fn insert(&mut self, text: &str, vector: Vec<f32>) {
+        if self.entries.len() >= self.capacity && !self.entries.contains_key(text) {
+            let oldest = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (_, used))| *used)
+                .map(|(key, _)| key.clone());
+            if let Some(oldest) = oldest {
+                self.entries.remove(&oldest);
+            }
+        }
+        self.clock += 1;
+        self.entries.insert(text.to_string(), (vector, self.clock));
+    }
+}
+
+// --- Private helpers ---
+
+/// Full SHA-256 of `text`, hex-encoded.
+fn text_hash(text: &str) -> String {
+    hex::encode(Sha256::digest(text.as_bytes()))
+}
+
+fn encode(vector: &[f32]) -> Vec<u8> {
+    vector.iter().flat_map(|x| x.to_le_bytes()).collect()
+}
+
+fn decode(blob: &[u8]) -> Vec<f32> {
+    blob.chunks_exact(4)
+        .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tempfile::TempDir;
+
+    fn make_cache(max_entries: usize) -> (EmbeddingCache, TempDir) {
+        let dir = TempDir::new().unwrap();
+        let cache = EmbeddingCache::open(&dir.path().join("embeddings.db"), max_entries).unwrap();
+        (cache, dir)
+    }
+
+    fn fake_vector(text: &str) -> Vec<f32> {
+        vec![text.len() as f32, 0.5, -1.25]
+    }
+
+    #[test]
+    fn test_embed_batch_with_only_embeds_misses() {
+        let (mut cache, _dir) = make_cache(100);
+
+        let first = cache
+            .embed_batch_with("m", &["a", "bb"], |texts| {
+                Ok(texts.iter().map(|t| fake_vector(t)).collect())
+            })
+            .unwrap();
+        assert_eq!(first, vec![fake_vector("a"), fake_vector("bb")]);
+
+        let mut asked = Vec::new();
+        let second = cache
+            .embed_batch_with("m", &["bb", "ccc", "a"], |texts| {
+                asked.extend(texts.iter().map(|t| t.to_string()));
+                Ok(texts.iter().map(|t| fake_vector(t)).collect())
+            })
+            .unwrap();
+        assert_eq!(asked, vec!["ccc"]);
+        assert_eq!(
+            second,
+            vec![fake_vector("bb"), fake_vector("ccc"), fake_vector("a")]
+        );
+
+        // Entries are per model.
+        assert_eq!(cache.get_many("other", &["a"]).unwrap(), vec![None]);
+    }
+
+    #[test]
+    fn test_cache_evicts_least_recently_used_and_persists() {
+        let dir = TempDir::new().unwrap();
+        let path = dir.path().join("embeddings.db");
+        {
+            let mut cache = EmbeddingCache::open(&path, 2).unwrap();
+            cache
+                .put_many("m", &[("old", &[1.0]), ("kept", &[2.0])])
+                .unwrap();
+            // Touch "old" so "kept" becomes the least recently used.
+            cache.get_many("m", &["old"]).unwrap();
+            cache.put_many("m", &[("new", &[3.0])]).unwrap();
+            assert_eq!(cache.len().unwrap(), 2);
+        }
+
+        let mut cache = EmbeddingCache::open(&path, 2).unwrap();
+        let found = cache.get_many("m", &["old", "kept", "new"]).unwrap();
+        assert_eq!(found, vec![Some(vec![1.0]), None, Some(vec![3.0])]);
+    }
+
+    #[test]
+    fn test_query_cache_evicts_least_recently_used() {
+        let mut queries = QueryCache::new(2);
+        queries.insert("a", vec![1.0]);
+        queries.insert("b", vec![2.0]);
+        assert_eq!(queries.get("a"), Some(vec![1.0]));
+        queries.insert("c", vec![3.0]);
+        assert_eq!(queries.get("b"), None);
+        assert_eq!(queries.get("a"), Some(vec![1.0]));
+        assert_eq!(queries.get("c"), Some(vec![3.0]));
+    }
+}
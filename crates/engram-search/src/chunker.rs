@@ -0,0 +1,208 @@
+// chunker: split markdown into heading-scoped chunks for embedding
+
+/// Default chunk size, in estimated model tokens.
+///
+/// AllMiniLML6V2 reads at most 256 word pieces and silently drops the rest;
+/// 200 estimated tokens leaves headroom for words that split into several pieces.
+pub const DEFAULT_CHUNK_TOKENS: usize = 200;
+
+/// A slice of a markdown document small enough to embed in full.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct Chunk<'a> {
+    /// Byte offset of `text` in the document.
+    pub offset: usize,
+    /// The chunk text, trimmed of surrounding whitespace.
+    pub text: &'a str,
+}
+
+/// Estimate the number of model tokens in `text`: four word pieces per three words.
+pub fn estimate_tokens(text: &str) -> usize {
+    (text.split_whitespace().count() * 4).div_ceil(3)
+}
+
+/// Split `content` into chunks of at most `max_tokens` estimated tokens.
+///
+/// Every heading (outside fenced code blocks) starts a new chunk. Sections over
+/// the budget are packed paragraph by paragraph, and a single paragraph over the
+/// budget is cut between words. Whitespace-only chunks are dropped, so an empty
+/// document yields no chunks.
+pub fn chunk_markdown(content: &str, max_tokens: usize) -> Vec<Chunk<'_>> {
+    let max_tokens = max_tokens.max(1);
+    let mut chunks = Vec::new();
+    for (start, end) in sections(content) {
+        pack_section(content, start, end, max_tokens, &mut chunks);
+    }
+    chunks
+}
+
+// --- Private helpers ---
+
+/// Byte ranges of the heading-delimited sections of `content`.
+fn sections(content: &str) -> Vec<(usize, usize)> {
+    let mut bounds = vec![0];
+    let mut in_fence = false;
+    let mut offset = 0;
+    for line in content.split_inclusive('\n') {
+        let trimmed = line.trim_start();
+        if trimmed.starts_with("```") || trimmed.starts_with("~~~") {
+            in_fence = !in_fence;
+        } else if !in_fence && offset > 0 && is_heading(trimmed) {
+            bounds.push(offset);
+        }
+        offset += line.len();
+    }
+    bounds.push(content.len());
+    bounds.windows(2).map(|w| (w[0], w[1])).collect()
+}
+
+/// An ATX heading: one to six `#` followed by whitespace or the end of the line.
+fn is_heading(line: &str) -> bool {
+    let hashes = line.bytes().take_while(|&b| b == b'#').count();
+    let after = line[hashes..].chars().next();
+    (1..=6).contains(&hashes) && after.map_or(true, char::is_whitespace)
+}
+
+/// Byte ranges of the blank-line-separated paragraphs in `content[start..end]`.
+fn paragraphs(content: &str, start: usize, end: usize) -> Vec<(usize, usize)> {
+    let mut bounds = vec![start];
+    let mut offset = start;
+    let mut after_blank = false;
+    for line in content[start..end].split_inclusive('\n') {
+        let blank = line.trim().is_empty();
+        if after_blank && !blank && offset > start {
+            bounds.push(offset);
+        }
+        after_blank = blank;
+        offset += line.len();
+    }
+    bounds.push(end);
+    bounds.windows(2).map(|w| (w[0], w[1])).collect()
+}
+
+/// Byte offsets in `content[start..end]` where a word begins.
+fn word_starts(content: &str, start: usize, end: usize) -> Vec<usize> {
+    let mut starts = Vec::new();
+    let mut prev_space = true;
+    for (i, c) in content[start..end].char_indices() {
+        let space = c.is_whitespace();
+        if prev_space && !space {
+            starts.push(start + i);
+        }
+        prev_space = space;
+    }
+    starts
+}
+
+/// Greedily pack the paragraphs of one section into chunks within `max_tokens`.
+fn pack_section<'a>(
+    content: &'a str,
+    start: usize,
+    end: usize,
+    max_tokens: usize,
+    chunks: &mut Vec<Chunk<'a>>,
+) {
+    let mut chunk_start = start;
+    let mut chunk_tokens = 0;
+    for (para_start, para_end) in paragraphs(content, start, end) {
+        let tokens = estimate_tokens(&content[para_start..para_end]);
+        if chunk_tokens > 0 && chunk_tokens + tokens > max_tokens {
+            push_chunk(content, chunk_start, para_start, chunks);
+            chunk_start = para_start;
+            chunk_tokens = 0;
+        }
+        if tokens <= max_tokens {
+            chunk_tokens += tokens;
+            continue;
+        }
+
+        // One paragraph over budget: cut it every `words` words and keep the
+        // remainder open so the next paragraph can join it.
+        let words = (max_tokens * 3 / 4).max(1);
+        let starts = word_starts(content, para_start, para_end);
+        let mut cut = chunk_start;
+        for &next in starts.iter().skip(words).step_by(words) {
+            push_chunk(content, cut, next, chunks);
+            cut = next;
+        }
+        chunk_start = cut;
+        chunk_tokens = estimate_tokens(&content[cut..para_end]);
+    }
+    push_chunk(content, chunk_start, end, chunks);
+}
+
+fn push_chunk<'a>(content: &'a str, start: usize, end: usize, chunks: &mut Vec<Chunk<'a>>) {
+    let text = &content[start..end];
+    let trimmed = text.trim_start();
+    let offset = start + (text.len() - trimmed.len());
+    let text = trimmed.trim_end();
+    if !text.is_empty() {
+        chunks.push(Chunk { offset, text });
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_headings_start_new_chunks_with_offsets() {
+        let doc = "Intro line.\n\n# Alpha\nalpha body\n\n## Beta\nbeta body\n";
+        let chunks = chunk_markdown(doc, DEFAULT_CHUNK_TOKENS);
+        let texts: Vec<&str> = chunks.iter().map(|c| c.text).collect();
+        assert_eq!(
+            texts,
+            vec!["Intro line.", "# Alpha\nalpha body", "## Beta\nbeta body"]
+        );
+        for chunk in &chunks {
+            assert_eq!(
+                &doc[chunk.offset..chunk.offset + chunk.text.len()],
+                chunk.text
+            );
+        }
+    }
+
+    #[test]
+    fn test_hash_lines_inside_code_fences_are_not_headings() {
+        let doc = "# Script\n```sh\n# a shell comment\necho hi\n```\n";
+        let chunks = chunk_markdown(doc, DEFAULT_CHUNK_TOKENS);
+        assert_eq!(chunks.len(), 1);
+        assert!(chunks[0].text.contains("# a shell comment"));
+    }
+
+    #[test]
+    fn test_long_sections_are_split_within_budget() {
+        let paragraph = "word ".repeat(60);
+        let doc = format!(
+            "# Long\n{paragraph}\n\n{paragraph}\n\n{}",
+            "tail ".repeat(500)
+        );
+        let chunks = chunk_markdown(&doc, 100);
+        assert!(
+            chunks.len() > 3,
+            "expected several chunks, got {}",
+            chunks.len()
+        );
+        for chunk in &chunks {
+            assert!(
+                estimate_tokens(chunk.text) <= 100,
+                "chunk at {} is over budget",
+                chunk.offset
+            );
+        }
+        let words: usize = chunks
+            .iter()
+            .map(|c| c.text.split_whitespace().count())
+            .sum();
+        assert_eq!(
+            words,
+            2 + 60 + 60 + 500,
+            "no words may be lost or duplicated"
+        );
+    }
+
+    #[test]
+    fn test_blank_document_has_no_chunks() {
+        assert!(chunk_markdown("", DEFAULT_CHUNK_TOKENS).is_empty());
+        assert!(chunk_markdown(" \n\n\t\n", DEFAULT_CHUNK_TOKENS).is_empty());
+    }
+}
@@ -1,15 +1,27 @@
 // embedder: fastembed vector embedding generation
 
+use std::sync::Mutex;
+
 use fastembed::{EmbeddingModel, InitOptions, TextEmbedding};
 
+use crate::cache::{EmbeddingCache, QueryCache, DEFAULT_QUERY_ENTRIES};
 use crate::SearchError;
 
+/// Identifies the model in [`EmbeddingCache`] keys; change it along with the model.
+pub const MODEL_ID: &str = "fastembed/AllMiniLML6V2";
+
 /// Wraps a fastembed TextEmbedding model for producing dense vector embeddings.
 ///
 /// Uses AllMiniLML6V2, which produces 384-dimensional float vectors.
 /// Model weights (~90 MB) are downloaded on first use and cached locally thereafter.
+///
+/// Recent query embeddings are kept in memory, so a repeated [`Embedder::embed`] call
+/// skips inference. With [`Embedder::with_cache`], embeddings are also looked up in and
+/// written to a persistent [`EmbeddingCache`].
 pub struct Embedder {
     model: TextEmbedding,
+    queries: Mutex<QueryCache>,
+    cache: Option<Mutex<EmbeddingCache>>,
 }
 
 impl Embedder {
@@ -19,22 +31,52 @@ impl Embedder {
     pub fn new() -> Result<Self, SearchError> {
         let model = TextEmbedding::try_new(InitOptions::new(EmbeddingModel::AllMiniLML6V2))
             .map_err(|e| SearchError::Embed(e.to_string()))?;
-        Ok(Self { model })
+        Ok(Self {
+            model,
+            queries: Mutex::new(QueryCache::new(DEFAULT_QUERY_ENTRIES)),
+            cache: None,
+        })
+    }
+
+    /// Consult and fill `cache` before running the model.
+    pub fn with_cache(mut self, cache: EmbeddingCache) -> Self {
+        self.cache = Some(Mutex::new(cache));
+        self
     }
 
     /// Embed a single text string, returning a 384-dimensional vector.
+    ///
+    /// Repeated texts (typically queries) are answered from memory.
     pub fn embed(&self, text: &str) -> Result<Vec<f32>, SearchError> {
-        let mut embeddings = self
-            .model
-            .embed(vec![text], None)
-            .map_err(|e| SearchError::Embed(e.to_string()))?;
-        embeddings
+        if let Some(embedding) = self.queries.lock().unwrap().get(text) {
+            return Ok(embedding);
+        }
+        let embedding = self
+            .embed_batch(&[text])?
             .pop()
-            .ok_or_else(|| SearchError::Embed("no embedding returned".to_string()))
+            .ok_or_else(|| SearchError::Embed("no embedding returned".to_string()))?;
+        self.queries.lock().unwrap().insert(text, embedding.clone());
+        Ok(embedding)
     }
 
     /// Embed a batch of text strings, returning one 384-dimensional vector per input.
+    ///
+    /// With a persistent cache, only the texts it does not hold are run through the model.
     pub fn embed_batch(&self, texts: &[&str]) -> Result<Vec<Vec<f32>>, SearchError> {
+        if texts.is_empty() {
+            return Ok(Vec::new());
+        }
+        match &self.cache {
+            Some(cache) => cache
+                .lock()
+                .unwrap()
+                .embed_batch_with(MODEL_ID, texts, |misses| self.run_model(misses)),
+            None => self.run_model(texts),
+        }
+    }
+
+    /// Run the model on `texts`, bypassing every cache.
+    pub fn run_model(&self, texts: &[&str]) -> Result<Vec<Vec<f32>>, SearchError> {
         self.model
             .embed(texts.to_vec(), None)
             .map_err(|e| SearchError::Embed(e.to_string()))
@@ -90,4 +132,20 @@ mod tests {
             assert_eq!(emb.len(), 384);
         }
     }
+
+    #[test]
+    fn test_with_cache_stores_and_reuses_embeddings() {
+        let dir = tempfile::TempDir::new().unwrap();
+        let cache = EmbeddingCache::open(&dir.path().join("embeddings.db"), 10).unwrap();
+        let embedder = make_embedder().with_cache(cache);
+        let first = embedder
+            .embed_batch(&["cached text", "other text"])
+            .expect("embed_batch should succeed");
+        let again = embedder
+            .embed_batch(&["other text"])
+            .expect("embed_batch should succeed");
+        assert_eq!(again[0], first[1]);
+        let cached = embedder.cache.as_ref().unwrap().lock().unwrap().len();
+        assert_eq!(cached.unwrap(), 2);
+    }
 }
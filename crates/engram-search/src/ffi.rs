@@ -0,0 +1,246 @@
+// ffi.rs — UniFFI-compatible wrappers for the FFI boundary
+//
+// This module exposes in-process search over a vault's tantivy index and
+// vector store, so foreign callers do not have to spawn `engram search`.
+
+use std::path::Path;
+use std::sync::Mutex;
+
+use crate::chunker::{chunk_markdown, DEFAULT_CHUNK_TOKENS};
+use crate::embedder::Embedder;
+use crate::hybrid::fuse;
+use crate::indexer::TantivyIndexer;
+use crate::vector::{VectorHit, VectorIndex};
+use crate::{SearchError, SearchResult, SearchSource};
+
+/// Which index a [`SearchHandle::search`] call consults.
+/// uniffi::Enum semantics are provided by the UDL definition (enum SearchMode).
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum SearchMode {
+    Fulltext,
+    Vector,
+    Hybrid,
+}
+
+/// A long-lived handle on one vault's search indices.
+///
+/// The tantivy index and vector store are opened once; the embedding model is
+/// loaded on the first vector or hybrid query (or `index_file`) and kept for
+/// the life of the handle, so later queries skip the model start-up cost.
+/// The handle only reads the tantivy index between calls: `index_file` takes
+/// the writer lock for its own commit and releases it before returning, so
+/// `engram index` and the daemon can keep writing while a handle is open.
+/// uniffi::Object semantics are provided by the UDL definition (interface SearchHandle).
+pub struct SearchHandle {
+    indexer: Mutex<TantivyIndexer>,
+    vectors: Mutex<VectorIndex>,
+    embedder: Mutex<Option<Embedder>>,
+}
+
+impl SearchHandle {
+    /// Open (or create) the tantivy index at `index_dir` and the vector store at `vectors_path`.
+    ///
+    /// These are the `search/` directory and `vectors.db` file that `engram index`
+    /// writes under `~/.engram/<vault>/`.
+    pub fn new(index_dir: String, vectors_path: String) -> Result<Self, SearchError> {
+        let indexer = TantivyIndexer::open(Path::new(&index_dir))?;
+        let vectors = VectorIndex::open(Path::new(&vectors_path))?;
+        Ok(Self {
+            indexer: Mutex::new(indexer),
+            vectors: Mutex::new(vectors),
+            embedder: Mutex::new(None),
+        })
+    }
+
+    /// Search for `query`, returning up to `limit` results.
+    ///
+    /// Vector scores are `1 - distance` of the best-matching chunk, whose text is the snippet;
+    /// hybrid scores are RRF scores, as in `engram search`.
+    pub fn search(
+        &self,
+        query: String,
+        limit: u32,
+        mode: SearchMode,
+    ) -> Result<Vec<SearchResult>, SearchError> {
+        let limit = limit as usize;
+        match mode {
+            SearchMode::Fulltext => self.indexer.lock().unwrap().search(&query, limit),
+            SearchMode::Vector => {
+                let knn = self.knn(&query, limit)?;
+                Ok(knn
+                    .into_iter()
+                    .map(|hit| SearchResult {
+                        path: hit.path,
+                        snippet: hit.snippet,
+                        score: 1.0 - hit.distance,
+                        source: SearchSource::Vector,
+                    })
+                    .collect())
+            }
+            SearchMode::Hybrid => {
+                let candidate_pool = limit * 3;
+                let ft_results = self
+                    .indexer
+                    .lock()
+                    .unwrap()
+                    .search(&query, candidate_pool)?;
+                let vec_results = self.knn(&query, candidate_pool)?;
+                Ok(fuse(ft_results, vec_results, limit))
+            }
+        }
+    }
+
+    /// Index (or re-index) one file in both the full-text index and the vector store.
+    ///
+    /// Unchanged content (same hash in both indices) is skipped without running the model.
+    pub fn index_file(&self, path: String, content: String) -> Result<(), SearchError> {
+        let hash = TantivyIndexer::content_hash(&content);
+        let stale_vector = self.vectors.lock().unwrap().needs_reindex(&path, &hash)?;
+        if !stale_vector && !self.indexer.lock().unwrap().needs_reindex(&path, &hash) {
+            return Ok(());
+        }
+        let chunks = chunk_markdown(&content, DEFAULT_CHUNK_TOKENS);
+        let texts: Vec<&str> = chunks.iter().map(|c| c.text).collect();
+        let embeddings = self.embed_batch(&texts)?;
+        {
+            let mut indexer = self.indexer.lock().unwrap();
+            let indexed = indexer.index_file(&path, &content);
+            indexer.release_writer();
+            indexed?;
+        }
+        let chunk_vectors: Vec<_> = chunks.into_iter().zip(embeddings).collect();
+        self.vectors
+            .lock()
+            .unwrap()
+            .upsert(&path, &hash, &chunk_vectors)
+    }
+
+    /// Return the number of documents in the full-text index.
+    pub fn indexed_doc_count(&self) -> u64 {
+        self.indexer.lock().unwrap().indexed_doc_count() as u64
+    }
+
+    // --- Private helpers ---
+
+    /// Embed `text`, loading the model on first use.
+    fn embed(&self, text: &str) -> Result<Vec<f32>, SearchError> {
+        let mut embedder = self.embedder.lock().unwrap();
+        if embedder.is_none() {
+            *embedder = Some(Embedder::new()?);
+        }
+        embedder.as_ref().unwrap().embed(text)
+    }
+
+    /// Embed each of `texts`, loading the model on first use.
+    fn embed_batch(&self, texts: &[&str]) -> Result<Vec<Vec<f32>>, SearchError> {
+        if texts.is_empty() {
+            return Ok(Vec::new());
+        }
+        let mut embedder = self.embedder.lock().unwrap();
+        if embedder.is_none() {
+            *embedder = Some(Embedder::new()?);
+        }
+        embedder.as_ref().unwrap().embed_batch(texts)
+    }
+
+    fn knn(&self, query: &str, limit: usize) -> Result<Vec<VectorHit>, SearchError> {
+        let embedding = self.embed(query)?;
+        self.vectors.lock().unwrap().knn_search(&embedding, limit)
+    }
+}
+
+// ── tests ─────────────────────────────────────────────────────────────────────
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tempfile::TempDir;
+
+    fn make_handle() -> (SearchHandle, TempDir) {
+        let dir = TempDir::new().unwrap();
+        let handle = SearchHandle::new(
+            dir.path().join("search").to_string_lossy().into_owned(),
+            dir.path().join("vectors.db").to_string_lossy().into_owned(),
+        )
+        .expect("SearchHandle::new failed");
+        (handle, dir)
+    }
+
+    #[test]
+    fn test_index_file_then_search_all_modes() {
+        let (handle, _dir) = make_handle();
+        handle
+            .index_file(
+                "Sofia.md".to_string(),
+                "Sofia is a city in Bulgaria and the capital.".to_string(),
+            )
+            .unwrap();
+        assert_eq!(handle.indexed_doc_count(), 1);
+
+        for mode in [SearchMode::Fulltext, SearchMode::Vector, SearchMode::Hybrid] {
+            let results = handle
+                .search("Sofia Bulgaria".to_string(), 5, mode)
+                .unwrap();
+            assert_eq!(results.len(), 1, "{mode:?} should find Sofia.md");
+            assert_eq!(results[0].path, "Sofia.md");
+        }
+    }
+
+    #[test]
+    fn test_vector_search_reaches_past_the_model_window() {
+        let (handle, _dir) = make_handle();
+        let filler = "Quarterly planning notes about budgets and hiring. ".repeat(60);
+        let content =
+            format!("# Planning\n{filler}\n\n## Travel\nSofia is the capital of Bulgaria.\n");
+        handle.index_file("long.md".to_string(), content).unwrap();
+
+        let results = handle
+            .search("capital of Bulgaria".to_string(), 5, SearchMode::Vector)
+            .unwrap();
+        assert_eq!(results.len(), 1, "chunks must fold into one document");
+        assert!(
+            results[0]
+                .snippet
+                .contains("Sofia is the capital of Bulgaria"),
+            "snippet should be the matching chunk, got: {}",
+            results[0].snippet
+        );
+    }
+
+    #[test]
+    fn test_open_handle_does_not_hold_the_writer_lock() {
+        let (handle, dir) = make_handle();
+        handle
+            .index_file("a.md".to_string(), "alpha note".to_string())
+            .unwrap();
+
+        // `engram index` opening the same directory must be able to write.
+        let mut indexer = TantivyIndexer::open(&dir.path().join("search")).unwrap();
+        indexer.index_file("b.md", "beta note").unwrap();
+        drop(indexer);
+
+        handle
+            .index_file("c.md".to_string(), "gamma note".to_string())
+            .unwrap();
+        let results = handle
+            .search("note".to_string(), 10, SearchMode::Fulltext)
+            .unwrap();
+        assert_eq!(results.len(), 3);
+    }
+
+    #[test]
+    fn test_reindexing_a_file_does_not_duplicate_vectors() {
+        let (handle, _dir) = make_handle();
+        handle
+            .index_file("note.md".to_string(), "first draft".to_string())
+            .unwrap();
+        handle
+            .index_file("note.md".to_string(), "second draft".to_string())
+            .unwrap();
+
+        let results = handle
+            .search("draft".to_string(), 10, SearchMode::Vector)
+            .unwrap();
+        assert_eq!(results.len(), 1);
+    }
+}
@@ -4,7 +4,7 @@ use std::collections::HashMap;
 
 use crate::embedder::Embedder;
 use crate::indexer::TantivyIndexer;
-use crate::vector::VectorIndex;
+use crate::vector::{VectorHit, VectorIndex};
 use crate::{SearchError, SearchResult, SearchSource};
 
 /// The k constant for Reciprocal Rank Fusion (Cormack, Clarke & Buettcher 2009).
@@ -38,7 +38,7 @@ impl HybridSearch {
     /// Run hybrid search for `query`, returning up to `limit` results.
     ///
     /// Uses Reciprocal Rank Fusion (k=60) to merge full-text and vector results.
-    /// Returns results with `source=Hybrid` and snippet from full-text results if available.
+    /// Vector results rank documents by their best-matching chunk; see [`fuse`] for snippets.
     pub fn search(&self, query: &str, limit: usize) -> Result<Vec<SearchResult>, SearchError> {
         let candidate_pool = limit * 3;
 
@@ -49,41 +49,57 @@ impl HybridSearch {
         let embedding = self.embedder.embed(query)?;
         let vec_results = self.vector_index.knn_search(&embedding, candidate_pool)?;
 
-        // RRF merge: accumulate 1/(k + rank + 1) for each result in each list
-        let mut scores: HashMap<String, f32> = HashMap::new();
+        Ok(fuse(ft_results, vec_results, limit))
+    }
+}
 
-        for (rank, result) in ft_results.iter().enumerate() {
-            *scores.entry(result.path.clone()).or_insert(0.0) += rrf_score(rank, RRF_K);
-        }
+/// Merge full-text results and per-document vector hits with RRF (k=60).
+///
+/// Returns up to `limit` results with `source=Hybrid`. The snippet is the
+/// matching chunk from the vector hit where there is one, otherwise the
+/// full-text snippet for the same path.
+pub fn fuse(
+    ft_results: Vec<SearchResult>,
+    vec_results: Vec<VectorHit>,
+    limit: usize,
+) -> Vec<SearchResult> {
+    // RRF merge: accumulate 1/(k + rank + 1) for each result in each list
+    let mut scores: HashMap<String, f32> = HashMap::new();
+
+    for (rank, result) in ft_results.iter().enumerate() {
+        *scores.entry(result.path.clone()).or_insert(0.0) += rrf_score(rank, RRF_K);
+    }
 
-        for (rank, (memory_id, _distance)) in vec_results.iter().enumerate() {
-            *scores.entry(memory_id.clone()).or_insert(0.0) += rrf_score(rank, RRF_K);
-        }
+    for (rank, hit) in vec_results.iter().enumerate() {
+        *scores.entry(hit.path.clone()).or_insert(0.0) += rrf_score(rank, RRF_K);
+    }
 
-        // Build snippet map from full-text results (path → snippet)
-        let snippet_map: HashMap<String, String> = ft_results
-            .into_iter()
-            .map(|r| (r.path, r.snippet))
-            .collect();
-
-        // Sort by combined RRF score descending
-        let mut scored: Vec<(String, f32)> = scores.into_iter().collect();
-        scored.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap_or(std::cmp::Ordering::Equal));
-
-        // Return top limit results with source=Hybrid
-        let results = scored
-            .into_iter()
-            .take(limit)
-            .map(|(path, score)| SearchResult {
-                snippet: snippet_map.get(&path).cloned().unwrap_or_default(),
-                path,
-                score,
-                source: SearchSource::Hybrid,
-            })
-            .collect();
-
-        Ok(results)
+    // Build snippet map (path → snippet): full-text first, then matching chunks on top
+    let mut snippet_map: HashMap<String, String> = ft_results
+        .into_iter()
+        .map(|r| (r.path, r.snippet))
+        .collect();
+    for hit in vec_results {
+        if !hit.snippet.is_empty() {
+            snippet_map.insert(hit.path, hit.snippet);
+        }
     }
+
+    // Sort by combined RRF score descending
+    let mut scored: Vec<(String, f32)> = scores.into_iter().collect();
+    scored.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap_or(std::cmp::Ordering::Equal));
+
+    // Return top limit results with source=Hybrid
+    scored
+        .into_iter()
+        .take(limit)
+        .map(|(path, score)| SearchResult {
+            snippet: snippet_map.get(&path).cloned().unwrap_or_default(),
+            path,
+            score,
+            source: SearchSource::Hybrid,
+        })
+        .collect()
 }
 
 #[cfg(test)]
@@ -95,6 +111,15 @@ mod tests {
     use engram_core::vault::Vault;
     use tempfile::TempDir;
 
+    fn vector_hit(path: &str, distance: f32, snippet: &str) -> VectorHit {
+        VectorHit {
+            path: path.to_string(),
+            offset: 0,
+            snippet: snippet.to_string(),
+            distance,
+        }
+    }
+
     /// Helper: build a HybridSearch with "Sofia.md" in both the full-text and vector indices.
     fn make_hybrid_with_sofia() -> (HybridSearch, TempDir, TempDir, TempDir) {
         let index_dir = TempDir::new().unwrap();
@@ -180,6 +205,51 @@ mod tests {
         );
     }
 
+    /// `fuse` must rank a path found by both searches first, keep its full-text
+    /// snippet, and return at most `limit` results.
+    #[test]
+    fn test_fuse_prefers_paths_in_both_lists() {
+        let ft = vec![
+            SearchResult {
+                path: "other.md".to_string(),
+                snippet: "other".to_string(),
+                score: 2.0,
+                source: SearchSource::FullText,
+            },
+            SearchResult {
+                path: "Sofia.md".to_string(),
+                snippet: "Sofia is a city".to_string(),
+                score: 1.0,
+                source: SearchSource::FullText,
+            },
+        ];
+        let vec = vec![
+            vector_hit("Sofia.md", 0.1, ""),
+            vector_hit("third.md", 0.5, ""),
+        ];
+
+        let results = fuse(ft, vec, 2);
+        assert_eq!(results.len(), 2);
+        assert_eq!(results[0].path, "Sofia.md");
+        assert_eq!(results[0].snippet, "Sofia is a city");
+    }
+
+    /// A vector hit's chunk snippet should replace the document-start snippet from full-text.
+    #[test]
+    fn test_fuse_prefers_matching_chunk_snippet() {
+        let ft = vec![SearchResult {
+            path: "long.md".to_string(),
+            snippet: "# Title".to_string(),
+            score: 1.0,
+            source: SearchSource::FullText,
+        }];
+        let vec = vec![vector_hit("long.md", 0.2, "## Section that matched")];
+
+        let results = fuse(ft, vec, 5);
+        assert_eq!(results.len(), 1);
+        assert_eq!(results[0].snippet, "## Section that matched");
+    }
+
     /// Verify the RRF formula with k=60:
     ///   rank 0 in one list  → 1/(60+0+1) = 1/61 ≈ 0.01639
     ///   rank 0 in both lists → 2/61 ≈ 0.03279
@@ -13,11 +13,18 @@ use engram_core::vault::Vault;
 
 use crate::{SearchError, SearchResult, SearchSource};
 
+/// Heap budget for the tantivy writer's indexing arena.
+const WRITER_HEAP_BYTES: usize = 50_000_000;
+
 /// Full-text indexer backed by tantivy.
+///
+/// Searching only needs the reader. The writer, which holds tantivy's
+/// directory-wide writer lock and its indexing arena, is created on the first
+/// write and kept until [`TantivyIndexer::release_writer`] or drop.
 pub struct TantivyIndexer {
     index: Index,
     reader: IndexReader,
-    writer: IndexWriter,
+    writer: Option<IndexWriter>,
     path_field: tantivy::schema::Field,
     body_field: tantivy::schema::Field,
     hash_field: tantivy::schema::Field,
@@ -34,7 +41,9 @@ impl TantivyIndexer {
     /// Open or create a tantivy index at `index_dir`.
     ///
     /// If `meta.json` exists in `index_dir`, opens the existing index;
-    /// otherwise creates a new one with the expected schema.
+    /// otherwise creates a new one with the expected schema. Opening does not
+    /// take the writer lock, so any number of searchers can share an index
+    /// that `engram index` or the daemon is writing.
     pub fn open(index_dir: &Path) -> Result<Self, SearchError> {
         let index = if index_dir.join("meta.json").exists() {
             Index::open_in_dir(index_dir).map_err(|e| SearchError::Index(e.to_string()))?
@@ -72,14 +81,10 @@ impl TantivyIndexer {
             .try_into()
             .map_err(|e: tantivy::TantivyError| SearchError::Index(e.to_string()))?;
 
-        let writer = index
-            .writer(50_000_000)
-            .map_err(|e| SearchError::Index(e.to_string()))?;
-
         Ok(Self {
             index,
             reader,
-            writer,
+            writer: None,
             path_field,
             body_field,
             hash_field,
@@ -99,7 +104,7 @@ impl TantivyIndexer {
     pub fn index_file(&mut self, path: &str, content: &str) -> Result<(), SearchError> {
         // Delete any previously indexed version of this path.
         let path_term = Term::from_field_text(self.path_field, path);
-        self.writer.delete_term(path_term);
+        self.writer()?.delete_term(path_term);
 
         let hash = Self::content_hash(content);
 
@@ -113,11 +118,12 @@ impl TantivyIndexer {
             body_field => content,
             hash_field => hash,
         );
-        self.writer
+        let writer = self.writer()?;
+        writer
             .add_document(document)
             .map_err(|e| SearchError::Index(e.to_string()))?;
 
-        self.writer
+        writer
             .commit()
             .map_err(|e| SearchError::Index(e.to_string()))?;
 
@@ -227,28 +233,32 @@ impl TantivyIndexer {
 
             // Delete any stale doc for this path, then add the updated version.
             let path_term = Term::from_field_text(path_field, rel_path.as_str());
-            self.writer.delete_term(path_term);
+            let writer = self.writer()?;
+            writer.delete_term(path_term);
 
             let document = doc!(
                 path_field => rel_path.as_str(),
                 body_field => content.as_str(),
                 hash_field => current_hash,
             );
-            self.writer
+            writer
                 .add_document(document)
                 .map_err(|e| SearchError::Index(e.to_string()))?;
 
             indexed += 1;
         }
 
-        // Single commit for the whole vault run.
-        self.writer
-            .commit()
-            .map_err(|e| SearchError::Index(e.to_string()))?;
+        // Single commit for the whole vault run; nothing to commit when every
+        // file was unchanged.
+        if let Some(writer) = self.writer.as_mut() {
+            writer
+                .commit()
+                .map_err(|e| SearchError::Index(e.to_string()))?;
 
-        self.reader
-            .reload()
-            .map_err(|e| SearchError::Index(e.to_string()))?;
+            self.reader
+                .reload()
+                .map_err(|e| SearchError::Index(e.to_string()))?;
+        }
 
         Ok(IndexStats {
             indexed,
@@ -261,6 +271,27 @@ impl TantivyIndexer {
     pub fn indexed_doc_count(&self) -> usize {
         self.reader.searcher().num_docs() as usize
     }
+
+    /// Drop the writer, releasing the writer lock and its arena.
+    ///
+    /// Uncommitted changes are discarded; every write method commits before returning.
+    pub fn release_writer(&mut self) {
+        self.writer = None;
+    }
+
+    // --- Private helpers ---
+
+    /// Return the writer, taking the writer lock on first use.
+    fn writer(&mut self) -> Result<&mut IndexWriter, SearchError> {
+        if self.writer.is_none() {
+            let writer = self
+                .index
+                .writer(WRITER_HEAP_BYTES)
+                .map_err(|e| SearchError::Index(e.to_string()))?;
+            self.writer = Some(writer);
+        }
+        Ok(self.writer.as_mut().unwrap())
+    }
 }
 
 #[cfg(test)]
@@ -373,6 +404,22 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_open_does_not_take_the_writer_lock() {
+        let (searcher, dir) = make_indexer();
+        let mut writer = TantivyIndexer::open(dir.path()).unwrap();
+        writer.index_file("notes/a.md", "shared index").unwrap();
+
+        // A second writer is refused until the first releases the lock.
+        let mut other = TantivyIndexer::open(dir.path()).unwrap();
+        assert!(other.index_file("notes/b.md", "blocked").is_err());
+        writer.release_writer();
+        other.index_file("notes/b.md", "unblocked").unwrap();
+
+        searcher.reader.reload().unwrap();
+        assert_eq!(searcher.indexed_doc_count(), 2);
+    }
+
     #[test]
     fn test_index_vault_first_run_indexes_all_files() {
         let index_dir = TempDir::new().unwrap();
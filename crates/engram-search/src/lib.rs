@@ -1,10 +1,20 @@
 // engram-search: full-text and vector search for engram
 
+// UniFFI scaffolding — generated from src/engram_search.udl by build.rs.
+uniffi::include_scaffolding!("engram_search");
+
+pub mod cache;
+pub mod chunker;
 pub mod embedder;
+pub mod ffi;
 pub mod hybrid;
 pub mod indexer;
+pub mod pipeline;
 pub mod vector;
 
+// The generated scaffolding resolves the FFI types by their unqualified names.
+pub use ffi::{SearchHandle, SearchMode};
+
 use thiserror::Error;
 
 #[derive(Debug, Error)]
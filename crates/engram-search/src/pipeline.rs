@@ -0,0 +1,367 @@
+// pipeline: batched, multi-threaded embedding of vault files into a VectorIndex
+//
+// Reader threads read, hash and chunk files in parallel and stream them to the
+// calling thread. There, chunks are gathered into windows of several batches,
+// sorted by length so each `embed_batch` call pads its inputs to a similar
+// size, embedded, and written with one transaction per window.
+
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::mpsc;
+use std::thread;
+use std::time::{Duration, Instant};
+
+use engram_core::vault::Vault;
+
+use crate::chunker::{chunk_markdown, Chunk, DEFAULT_CHUNK_TOKENS};
+use crate::indexer::TantivyIndexer;
+use crate::vector::VectorIndex;
+use crate::SearchError;
+
+/// Default number of chunks per `embed_batch` call.
+pub const DEFAULT_EMBED_BATCH: usize = 64;
+
+/// Batches gathered, sorted by length and written together.
+const WINDOW_BATCHES: usize = 8;
+
+/// Tuning for [`embed_files`].
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct EmbedOptions {
+    /// Chunks per `embed_batch` call.
+    pub batch_size: usize,
+    /// Threads reading, hashing and chunking files.
+    pub threads: usize,
+}
+
+impl Default for EmbedOptions {
+    /// [`DEFAULT_EMBED_BATCH`] chunks per batch and one reader thread per core.
+    fn default() -> Self {
+        Self {
+            batch_size: DEFAULT_EMBED_BATCH,
+            threads: thread::available_parallelism()
+                .map(|n| n.get())
+                .unwrap_or(1),
+        }
+    }
+}
+
+/// Running totals of an [`embed_files`] call.
+#[derive(Debug, Default, Clone)]
+pub struct EmbedStats {
+    /// Files whose vectors were (re)written.
+    pub embedded: usize,
+    /// Files whose content hash matched the index.
+    pub unchanged: usize,
+    /// Chunks embedded.
+    pub chunks: usize,
+    /// Files that could not be read or embedded, with the reason.
+    pub failures: Vec<(String, String)>,
+    /// Time since the call started.
+    pub elapsed: Duration,
+}
+
+impl EmbedStats {
+    /// Files checked per second, embedded or not.
+    pub fn files_per_sec(&self) -> f64 {
+        let files = self.embedded + self.unchanged + self.failures.len();
+        files as f64 / self.elapsed.as_secs_f64().max(f64::EPSILON)
+    }
+}
+
+/// Embed every file in `paths` whose content hash differs from the one stored in `index`.
+///
+/// `embed` turns a batch of chunk texts into one vector each; it is only called when
+/// something changed, so callers can load the model lazily inside it. `progress` is called
+/// after each window is written. Read and embedding failures are collected in
+/// [`EmbedStats::failures`]; only database errors abort the run.
+pub fn embed_files(
+    vault: &Vault,
+    paths: &[String],
+    index: &VectorIndex,
+    options: EmbedOptions,
+    mut embed: impl FnMut(&[&str]) -> Result<Vec<Vec<f32>>, SearchError>,
+    mut progress: impl FnMut(&EmbedStats),
+) -> Result<EmbedStats, SearchError> {
+    let started = Instant::now();
+    let batch_size = options.batch_size.max(1);
+    let threads = options.threads.max(1);
+    let known = index.content_hashes()?;
+    let next = AtomicUsize::new(0);
+    let (tx, rx) = mpsc::sync_channel::<Prepared>(threads * 4);
+
+    let mut stats = EmbedStats::default();
+    thread::scope(|scope| {
+        for _ in 0..threads {
+            let (tx, next, known) = (tx.clone(), &next, &known);
+            scope.spawn(move || loop {
+                let i = next.fetch_add(1, Ordering::Relaxed);
+                let Some(path) = paths.get(i) else { break };
+                // A closed channel means the consumer gave up; stop reading.
+                if tx.send(prepare(vault, path, known)).is_err() {
+                    break;
+                }
+            });
+        }
+        drop(tx);
+
+        let mut window: Vec<ChangedFile> = Vec::new();
+        let mut window_chunks = 0;
+        for prepared in rx {
+            match prepared {
+                Prepared::Unchanged => stats.unchanged += 1,
+                Prepared::Failed(path, error) => stats.failures.push((path, error)),
+                Prepared::Changed(file) => {
+                    window_chunks += file.chunks.len();
+                    window.push(file);
+                    if window_chunks >= batch_size * WINDOW_BATCHES {
+                        write_window(index, &mut window, batch_size, &mut embed, &mut stats)?;
+                        window_chunks = 0;
+                        stats.elapsed = started.elapsed();
+                        progress(&stats);
+                    }
+                }
+            }
+        }
+        if !window.is_empty() {
+            write_window(index, &mut window, batch_size, &mut embed, &mut stats)?;
+        }
+        Ok::<(), SearchError>(())
+    })?;
+
+    stats.elapsed = started.elapsed();
+    progress(&stats);
+    Ok(stats)
+}
+
+// --- Private helpers ---
+
+/// A file that needs embedding, with its chunks as `(offset, len)` ranges into `content`.
+struct ChangedFile {
+    path: String,
+    hash: String,
+    content: String,
+    chunks: Vec<(usize, usize)>,
+}
+
+impl ChangedFile {
+    fn chunk(&self, i: usize) -> Chunk<'_> {
+        let (offset, len) = self.chunks[i];
+        Chunk {
+            offset,
+            text: &self.content[offset..offset + len],
+        }
+    }
+}
+
+/// What a reader thread found for one path.
+enum Prepared {
+    Unchanged,
+    Changed(ChangedFile),
+    Failed(String, String),
+}
+
+/// Read, hash and chunk one file on a reader thread.
+fn prepare(vault: &Vault, path: &str, known: &HashMap<String, String>) -> Prepared {
+    let content = match vault.read(path) {
+        Ok(c) => c,
+        Err(e) => return Prepared::Failed(path.to_string(), format!("read failed — {e}")),
+    };
+    let hash = TantivyIndexer::content_hash(&content);
+    if known.get(path) == Some(&hash) {
+        return Prepared::Unchanged;
+    }
+    let chunks = chunk_markdown(&content, DEFAULT_CHUNK_TOKENS)
+        .iter()
+        .map(|c| (c.offset, c.text.len()))
+        .collect();
+    Prepared::Changed(ChangedFile {
+        path: path.to_string(),
+        hash,
+        content,
+        chunks,
+    })
+}
+
+/// Embed the chunks of every file in `window`, shortest first, and write the files whose
+/// chunks were all embedded in one transaction. Empties `window`.
+fn write_window(
+    index: &VectorIndex,
+    window: &mut Vec<ChangedFile>,
+    batch_size: usize,
+    embed: &mut impl FnMut(&[&str]) -> Result<Vec<Vec<f32>>, SearchError>,
+    stats: &mut EmbedStats,
+) -> Result<(), SearchError> {
+    let mut order: Vec<(usize, usize)> = window
+        .iter()
+        .enumerate()
+        .flat_map(|(f, file)| (0..file.chunks.len()).map(move |c| (f, c)))
+        .collect();
+    order.sort_by_key(|&(f, c)| window[f].chunks[c].1);
+
+    let mut vectors: Vec<Vec<Option<Vec<f32>>>> = window
+        .iter()
+        .map(|file| vec![None; file.chunks.len()])
+        .collect();
+    let mut errors: Vec<Option<String>> = vec![None; window.len()];
+    for batch in order.chunks(batch_size) {
+        let texts: Vec<&str> = batch
+            .iter()
+            .map(|&(f, c)| window[f].chunk(c).text)
+            .collect();
+        match embed(&texts) {
+            Ok(embeddings) => {
+                for (&(f, c), embedding) in batch.iter().zip(embeddings) {
+                    vectors[f][c] = Some(embedding);
+                }
+            }
+            Err(e) => {
+                for &(f, _) in batch {
+                    errors[f] = Some(format!("embed failed — {e}"));
+                }
+            }
+        }
+    }
+
+    let mut complete: Vec<(usize, Vec<(Chunk<'_>, Vec<f32>)>)> = Vec::new();
+    for (f, file) in window.iter().enumerate() {
+        if let Some(error) = errors[f].take() {
+            stats.failures.push((file.path.clone(), error));
+            continue;
+        }
+        let chunk_vectors: Option<Vec<_>> = std::mem::take(&mut vectors[f])
+            .into_iter()
+            .enumerate()
+            .map(|(c, v)| v.map(|v| (file.chunk(c), v)))
+            .collect();
+        match chunk_vectors {
+            Some(chunk_vectors) => complete.push((f, chunk_vectors)),
+            None => stats.failures.push((
+                file.path.clone(),
+                "embed failed — missing vectors".to_string(),
+            )),
+        }
+    }
+
+    let documents: Vec<(&str, &str, &[(Chunk<'_>, Vec<f32>)])> = complete
+        .iter()
+        .map(|(f, chunks)| {
+            let file = &window[*f];
+            (file.path.as_str(), file.hash.as_str(), chunks.as_slice())
+        })
+        .collect();
+    index.upsert_many(&documents)?;
+    stats.embedded += documents.len();
+    stats.chunks += complete
+        .iter()
+        .map(|(_, chunks)| chunks.len())
+        .sum::<usize>();
+    window.clear();
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tempfile::TempDir;
+
+    /// Stand-in for the model: every chunk maps to a vector derived from its length.
+    fn fake_embed(
+        calls: &mut Vec<usize>,
+    ) -> impl FnMut(&[&str]) -> Result<Vec<Vec<f32>>, SearchError> + '_ {
+        move |texts| {
+            calls.push(texts.len());
+            Ok(texts
+                .iter()
+                .map(|t| {
+                    let mut v = vec![0.0_f32; 384];
+                    v[0] = t.len() as f32;
+                    v
+                })
+                .collect())
+        }
+    }
+
+    fn make_vault(files: usize) -> (TempDir, Vault, Vec<String>) {
+        let dir = TempDir::new().unwrap();
+        let vault = Vault::new(dir.path());
+        let mut paths = Vec::new();
+        for i in 0..files {
+            let path = format!("note-{i}.md");
+            vault
+                .write(
+                    &path,
+                    &format!("# Note {i}\nbody {i}\n\n## Part\nmore {i}\n"),
+                )
+                .unwrap();
+            paths.push(path);
+        }
+        (dir, vault, paths)
+    }
+
+    #[test]
+    fn test_embeds_in_batches_then_skips_unchanged_files() {
+        let (_vault_dir, vault, paths) = make_vault(30);
+        let db_dir = TempDir::new().unwrap();
+        let index = VectorIndex::open(&db_dir.path().join("vectors.db")).unwrap();
+        let options = EmbedOptions {
+            batch_size: 16,
+            threads: 3,
+        };
+
+        let mut calls = Vec::new();
+        let stats = embed_files(
+            &vault,
+            &paths,
+            &index,
+            options,
+            fake_embed(&mut calls),
+            |_| {},
+        )
+        .unwrap();
+        assert_eq!((stats.embedded, stats.unchanged, stats.chunks), (30, 0, 60));
+        assert!(stats.failures.is_empty());
+        assert!(
+            calls.iter().all(|&n| n <= 16),
+            "batches over size: {calls:?}"
+        );
+        assert_eq!(calls.iter().sum::<usize>(), 60);
+        assert_eq!(index.indexed_paths().unwrap().len(), 30);
+
+        vault.write("note-7.md", "# Edited\nnew body\n").unwrap();
+        let mut calls = Vec::new();
+        let stats = embed_files(
+            &vault,
+            &paths,
+            &index,
+            options,
+            fake_embed(&mut calls),
+            |_| {},
+        )
+        .unwrap();
+        assert_eq!((stats.embedded, stats.unchanged), (1, 29));
+        assert_eq!(calls, vec![1]);
+    }
+
+    #[test]
+    fn test_failures_are_reported_per_file() {
+        let (_vault_dir, vault, mut paths) = make_vault(2);
+        paths.push("missing.md".to_string());
+        let db_dir = TempDir::new().unwrap();
+        let index = VectorIndex::open(&db_dir.path().join("vectors.db")).unwrap();
+
+        let stats = embed_files(
+            &vault,
+            &paths,
+            &index,
+            EmbedOptions::default(),
+            |_| Err(SearchError::Embed("model offline".to_string())),
+            |_| {},
+        )
+        .unwrap();
+        assert_eq!(stats.embedded, 0);
+        let mut failed: Vec<&str> = stats.failures.iter().map(|(p, _)| p.as_str()).collect();
+        failed.sort();
+        assert_eq!(failed, vec!["missing.md", "note-0.md", "note-1.md"]);
+        assert!(index.indexed_paths().unwrap().is_empty());
+    }
+}
@@ -1,15 +1,46 @@
 // vector: sqlite-vec vector storage and search
 
+use std::borrow::Cow;
+use std::collections::{HashMap, HashSet};
 use std::path::Path;
 use std::sync::Once;
 
-use rusqlite::{params, Connection};
+use rusqlite::{params, Connection, OptionalExtension};
 
+use crate::chunker::Chunk;
 use crate::SearchError;
 
 /// One-time registration guard so `sqlite3_auto_extension` is called at most once per process.
 static INIT_SQLITE_VEC: Once = Once::new();
 
+/// Schema version stored in `PRAGMA user_version`.
+///
+/// Version 1 stores one vector per chunk. Older stores held one vector per file with no
+/// chunk columns; they are dropped on open and rebuilt by the next `engram index`.
+/// Version 2 adds `vector_chunks`, the rowids of each path's chunks, so replacing or
+/// removing a path deletes by rowid instead of scanning `memory_vectors`; version-1
+/// stores are backfilled on open.
+const SCHEMA_VERSION: i64 = 2;
+
+/// Characters of chunk text kept as the snippet for a vector hit.
+const SNIPPET_CHARS: usize = 200;
+
+/// Upper bound on `k` accepted by sqlite-vec's KNN queries.
+const MAX_KNN_K: usize = 4096;
+
+/// The best-matching chunk of one document, as returned by [`VectorIndex::knn_search`].
+#[derive(Debug, Clone, PartialEq)]
+pub struct VectorHit {
+    /// Vault-relative path (the `memory_id` the vectors were stored under).
+    pub path: String,
+    /// Byte offset of the matching chunk in the document.
+    pub offset: usize,
+    /// The first 200 characters of the matching chunk; empty for whole-document vectors.
+    pub snippet: String,
+    /// L2 distance between the query and the matching chunk.
+    pub distance: f32,
+}
+
 /// SQLite-backed KNN vector store using sqlite-vec (vec0 virtual tables).
 pub struct VectorIndex {
     conn: Connection,
@@ -19,7 +50,9 @@ impl VectorIndex {
     /// Open (or create) a VectorIndex at `path`.
     ///
     /// Registers the sqlite-vec extension via `sqlite3_auto_extension`, opens the SQLite
-    /// connection at `path`, and ensures the `memory_vectors` virtual table exists.
+    /// connection at `path`, and ensures the `memory_vectors` virtual table (one row per
+    /// chunk), the `vector_chunks` table of each path's chunk rowids and the
+    /// `vector_sources` table of per-path content hashes exist.
     pub fn open(path: &Path) -> Result<Self, SearchError> {
         // Register the sqlite-vec extension exactly once for this process.
         INIT_SQLITE_VEC.call_once(|| unsafe {
@@ -37,54 +70,280 @@ impl VectorIndex {
 
         let conn = Connection::open(path).map_err(|e| SearchError::Db(e.to_string()))?;
 
-        conn.execute_batch(
+        let version: i64 = conn
+            .query_row("PRAGMA user_version", [], |row| row.get(0))
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        if version < 1 {
+            // vec0 tables cannot gain columns, so pre-chunking stores start over.
+            conn.execute_batch(
+                "DROP TABLE IF EXISTS memory_vectors; \
+                 DROP TABLE IF EXISTS vector_sources;",
+            )
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        }
+
+        conn.execute_batch(&format!(
             "CREATE VIRTUAL TABLE IF NOT EXISTS memory_vectors \
-             USING vec0(embedding float[384], +memory_id text);",
-        )
+             USING vec0(embedding float[384], +memory_id text, +chunk_offset integer, \
+                        +snippet text); \
+             CREATE TABLE IF NOT EXISTS vector_sources ( \
+                 path TEXT PRIMARY KEY, \
+                 content_hash TEXT NOT NULL \
+             ); \
+             CREATE TABLE IF NOT EXISTS vector_chunks ( \
+                 path TEXT NOT NULL, \
+                 chunk_rowid INTEGER NOT NULL, \
+                 PRIMARY KEY (path, chunk_rowid) \
+             ) WITHOUT ROWID;"
+        ))
         .map_err(|e| SearchError::Db(e.to_string()))?;
+        if version < 2 {
+            // One last scan of the vec0 table records where every existing chunk lives.
+            conn.execute_batch(
+                "INSERT OR IGNORE INTO vector_chunks (path, chunk_rowid) \
+                 SELECT memory_id, rowid FROM memory_vectors;",
+            )
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        }
+        conn.execute_batch(&format!("PRAGMA user_version = {SCHEMA_VERSION};"))
+            .map_err(|e| SearchError::Db(e.to_string()))?;
 
         Ok(Self { conn })
     }
 
-    /// Insert an embedding together with its associated `memory_id`.
-    ///
-    /// The embedding is serialized as a JSON array before being stored.
+    /// Insert a whole-document embedding together with its associated `memory_id`.
     pub fn insert(&self, memory_id: &str, embedding: &[f32]) -> Result<(), SearchError> {
-        let embedding_json =
-            serde_json::to_string(embedding).map_err(|e| SearchError::Db(e.to_string()))?;
+        self.insert_many(&[(memory_id, embedding)])
+    }
 
-        self.conn
-            .execute(
-                "INSERT INTO memory_vectors (embedding, memory_id) VALUES (?, ?)",
-                params![embedding_json, memory_id],
-            )
+    /// [`insert`](Self::insert) several `(memory_id, embedding)` pairs in a single
+    /// transaction, reusing one prepared statement.
+    pub fn insert_many(&self, entries: &[(&str, &[f32])]) -> Result<(), SearchError> {
+        let tx = self
+            .conn
+            .unchecked_transaction()
             .map_err(|e| SearchError::Db(e.to_string()))?;
+        {
+            let mut insert = tx
+                .prepare(
+                    "INSERT INTO memory_vectors (embedding, memory_id, chunk_offset, snippet) \
+                     VALUES (?, ?, 0, '')",
+                )
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+            let mut track = tx
+                .prepare("INSERT INTO vector_chunks (path, chunk_rowid) VALUES (?, ?)")
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+            for (memory_id, embedding) in entries {
+                insert
+                    .execute(params![&*f32_blob(embedding), memory_id])
+                    .map_err(|e| SearchError::Db(e.to_string()))?;
+                track
+                    .execute(params![memory_id, tx.last_insert_rowid()])
+                    .map_err(|e| SearchError::Db(e.to_string()))?;
+            }
+        }
+        tx.commit().map_err(|e| SearchError::Db(e.to_string()))?;
 
         Ok(())
     }
 
-    /// Return the `limit` nearest neighbours to `query_embedding`, ordered by ascending L2 distance.
+    /// Replace the chunk embeddings stored for `path` and record the `content_hash` they
+    /// were computed from.
     ///
-    /// Returns `(memory_id, distance)` pairs.
+    /// The old vectors, the new vectors and the hash are written in one transaction, so a
+    /// crash never leaves a path with a hash but no vectors.
+    pub fn upsert(
+        &self,
+        path: &str,
+        content_hash: &str,
+        chunks: &[(Chunk<'_>, Vec<f32>)],
+    ) -> Result<(), SearchError> {
+        self.upsert_many(&[(path, content_hash, chunks)])
+    }
+
+    /// [`upsert`](Self::upsert) several documents, given as `(path, content_hash, chunks)`,
+    /// in a single transaction.
+    pub fn upsert_many(
+        &self,
+        documents: &[(&str, &str, &[(Chunk<'_>, Vec<f32>)])],
+    ) -> Result<(), SearchError> {
+        let tx = self
+            .conn
+            .unchecked_transaction()
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        {
+            let mut insert = tx
+                .prepare(
+                    "INSERT INTO memory_vectors (embedding, memory_id, chunk_offset, snippet) \
+                     VALUES (?, ?, ?, ?)",
+                )
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+            let mut track = tx
+                .prepare("INSERT INTO vector_chunks (path, chunk_rowid) VALUES (?, ?)")
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+            let mut record = tx
+                .prepare(
+                    "INSERT INTO vector_sources (path, content_hash) VALUES (?1, ?2) \
+                     ON CONFLICT(path) DO UPDATE SET content_hash = excluded.content_hash",
+                )
+                .map_err(|e| SearchError::Db(e.to_string()))?;
+
+            for (path, content_hash, chunks) in documents {
+                delete_chunks(&tx, path)?;
+                for (chunk, embedding) in chunks.iter() {
+                    let snippet: String = chunk.text.chars().take(SNIPPET_CHARS).collect();
+                    insert
+                        .execute(params![
+                            &*f32_blob(embedding),
+                            path,
+                            chunk.offset as i64,
+                            snippet
+                        ])
+                        .map_err(|e| SearchError::Db(e.to_string()))?;
+                    track
+                        .execute(params![path, tx.last_insert_rowid()])
+                        .map_err(|e| SearchError::Db(e.to_string()))?;
+                }
+                record
+                    .execute(params![path, content_hash])
+                    .map_err(|e| SearchError::Db(e.to_string()))?;
+            }
+        }
+        tx.commit().map_err(|e| SearchError::Db(e.to_string()))?;
+
+        Ok(())
+    }
+
+    /// Delete every embedding stored for `memory_id`, and its content hash, so it can be
+    /// re-inserted without duplicates or dropped when its file is gone.
+    pub fn remove(&self, memory_id: &str) -> Result<(), SearchError> {
+        let tx = self
+            .conn
+            .unchecked_transaction()
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+        delete_chunks(&tx, memory_id)?;
+        tx.execute(
+            "DELETE FROM vector_sources WHERE path = ?",
+            params![memory_id],
+        )
+        .map_err(|e| SearchError::Db(e.to_string()))?;
+        tx.commit().map_err(|e| SearchError::Db(e.to_string()))?;
+
+        Ok(())
+    }
+
+    /// Return `true` when `path` has no stored content hash or it differs from `current_hash`.
     ///
-    /// sqlite-vec requires the `k` limit to be visible at query-planning time, so we embed it
-    /// directly in the SQL string via `k = <literal>` in the WHERE clause.  The spec's
-    /// `LIMIT ?2` form does not work when the limit is a bound parameter because the virtual
-    /// table planner never sees it.
+    /// Vectors written by [`insert`](Self::insert) carry no hash, so their paths always need
+    /// re-indexing; [`upsert`](Self::upsert) then replaces them.
+    pub fn needs_reindex(&self, path: &str, current_hash: &str) -> Result<bool, SearchError> {
+        let stored: Option<String> = self
+            .conn
+            .query_row(
+                "SELECT content_hash FROM vector_sources WHERE path = ?",
+                params![path],
+                |row| row.get(0),
+            )
+            .optional()
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+
+        Ok(stored.as_deref() != Some(current_hash))
+    }
+
+    /// Return the stored content hash of every path, keyed by path.
+    ///
+    /// Lets callers check many files with one query, e.g. from threads that cannot share
+    /// the connection.
+    pub fn content_hashes(&self) -> Result<HashMap<String, String>, SearchError> {
+        let mut stmt = self
+            .conn
+            .prepare("SELECT path, content_hash FROM vector_sources")
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+
+        let rows = stmt
+            .query_map([], |row| Ok((row.get(0)?, row.get(1)?)))
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+
+        let mut hashes = HashMap::new();
+        for row in rows {
+            let (path, hash) = row.map_err(|e| SearchError::Db(e.to_string()))?;
+            hashes.insert(path, hash);
+        }
+
+        Ok(hashes)
+    }
+
+    /// Return every path that has a stored vector or content hash, sorted.
+    pub fn indexed_paths(&self) -> Result<Vec<String>, SearchError> {
+        let mut stmt = self
+            .conn
+            .prepare(
+                "SELECT path FROM vector_sources \
+                 UNION \
+                 SELECT path FROM vector_chunks \
+                 ORDER BY 1",
+            )
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+
+        let rows = stmt
+            .query_map([], |row| row.get(0))
+            .map_err(|e| SearchError::Db(e.to_string()))?;
+
+        let mut paths = Vec::new();
+        for row in rows {
+            paths.push(row.map_err(|e| SearchError::Db(e.to_string()))?);
+        }
+
+        Ok(paths)
+    }
+
+    /// Return the `limit` documents nearest to `query_embedding`, ordered by ascending L2
+    /// distance of their best-matching chunk.
+    ///
+    /// Chunks are fetched nearest first and folded into their documents; when the first
+    /// `k` chunks cover fewer than `limit` documents, `k` is doubled (up to sqlite-vec's
+    /// maximum of 4096) and the query repeated.
     pub fn knn_search(
         &self,
         query_embedding: &[f32],
         limit: usize,
-    ) -> Result<Vec<(String, f32)>, SearchError> {
-        let query_json =
-            serde_json::to_string(query_embedding).map_err(|e| SearchError::Db(e.to_string()))?;
+    ) -> Result<Vec<VectorHit>, SearchError> {
+        let query = f32_blob(query_embedding);
+
+        let mut k = (limit * 4).clamp(1, MAX_KNN_K);
+        loop {
+            let chunks = self.knn_chunks(&query, k)?;
+            let exhausted = chunks.len() < k || k == MAX_KNN_K;
+
+            // Rows arrive nearest first, so the first chunk seen per path is its best.
+            let mut seen = HashSet::new();
+            let mut hits: Vec<VectorHit> = chunks
+                .into_iter()
+                .filter(|hit| seen.insert(hit.path.clone()))
+                .collect();
+            if hits.len() >= limit || exhausted {
+                hits.truncate(limit);
+                return Ok(hits);
+            }
+            k = (k * 2).min(MAX_KNN_K);
+        }
+    }
 
+    // --- Private helpers ---
+
+    /// Return the `k` chunks nearest to `query`, a float32 blob, nearest first.
+    ///
+    /// sqlite-vec requires the `k` limit to be visible at query-planning time, so we embed it
+    /// directly in the SQL string via `k = <literal>` in the WHERE clause.  The spec's
+    /// `LIMIT ?2` form does not work when the limit is a bound parameter because the virtual
+    /// table planner never sees it.
+    fn knn_chunks(&self, query: &[u8], k: usize) -> Result<Vec<VectorHit>, SearchError> {
         // sqlite-vec requires the `k` limit to be a compile-time-visible constraint.
         // Using `k = ?` in the WHERE clause is the canonical approach documented by sqlite-vec.
         let mut stmt = self
             .conn
             .prepare(
-                "SELECT memory_id, distance \
+                "SELECT memory_id, chunk_offset, snippet, distance \
                  FROM memory_vectors \
                  WHERE embedding MATCH ?1 \
                  AND k = ?2 \
@@ -93,10 +352,13 @@ impl VectorIndex {
             .map_err(|e| SearchError::Db(e.to_string()))?;
 
         let rows = stmt
-            .query_map(params![query_json, limit as i64], |row| {
-                let memory_id: String = row.get(0)?;
-                let distance: f32 = row.get(1)?;
-                Ok((memory_id, distance))
+            .query_map(params![query, k as i64], |row| {
+                Ok(VectorHit {
+                    path: row.get(0)?,
+                    offset: row.get::<_, i64>(1)? as usize,
+                    snippet: row.get(2)?,
+                    distance: row.get(3)?,
+                })
             })
             .map_err(|e| SearchError::Db(e.to_string()))?;
 
@@ -109,6 +371,48 @@ impl VectorIndex {
     }
 }
 
+/// Delete the chunk vectors stored for `path`, and their `vector_chunks` rows.
+///
+/// vec0 only looks rows up by rowid, so filtering `memory_vectors` on `memory_id` scans
+/// the whole table. The rowids come from the `vector_chunks` primary key instead, and a
+/// path with none recorded (a file indexed for the first time) skips the deletes.
+fn delete_chunks(conn: &Connection, path: &str) -> Result<(), SearchError> {
+    let known = conn
+        .prepare_cached("SELECT 1 FROM vector_chunks WHERE path = ? LIMIT 1")
+        .and_then(|mut stmt| stmt.query_row(params![path], |_| Ok(())).optional())
+        .map_err(|e| SearchError::Db(e.to_string()))?
+        .is_some();
+    if !known {
+        return Ok(());
+    }
+    conn.prepare_cached(
+        "DELETE FROM memory_vectors \
+         WHERE rowid IN (SELECT chunk_rowid FROM vector_chunks WHERE path = ?)",
+    )
+    .and_then(|mut stmt| stmt.execute(params![path]))
+    .map_err(|e| SearchError::Db(e.to_string()))?;
+    conn.prepare_cached("DELETE FROM vector_chunks WHERE path = ?")
+        .and_then(|mut stmt| stmt.execute(params![path]))
+        .map_err(|e| SearchError::Db(e.to_string()))?;
+    Ok(())
+}
+
+/// View `vector` as the little-endian float32 blob sqlite-vec reads natively.
+///
+/// Binding the blob spares sqlite-vec from parsing a JSON array (several KB of text for a
+/// 384-dimensional vector). On little-endian targets this borrows the slice's bytes.
+fn f32_blob(vector: &[f32]) -> Cow<'_, [u8]> {
+    if cfg!(target_endian = "little") {
+        // SAFETY: any initialised f32 is 4 plain bytes, u8 has alignment 1, and the view
+        // covers exactly the slice's memory for the slice's lifetime.
+        Cow::Borrowed(unsafe {
+            std::slice::from_raw_parts(vector.as_ptr().cast::<u8>(), std::mem::size_of_val(vector))
+        })
+    } else {
+        Cow::Owned(vector.iter().flat_map(|x| x.to_le_bytes()).collect())
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -124,6 +428,17 @@ mod tests {
         vec![1.0_f32; 384]
     }
 
+    /// Helper: a single chunk covering a whole document, paired with `embedding`.
+    fn whole(embedding: Vec<f32>) -> Vec<(Chunk<'static>, Vec<f32>)> {
+        vec![(
+            Chunk {
+                offset: 0,
+                text: "body",
+            },
+            embedding,
+        )]
+    }
+
     /// Helper: open a fresh VectorIndex backed by a temp file.
     fn make_index() -> (VectorIndex, TempDir) {
         let dir = TempDir::new().unwrap();
@@ -141,7 +456,7 @@ mod tests {
         let results = index.knn_search(&zero_vec(), 1).unwrap();
         assert_eq!(results.len(), 1, "should find exactly one result");
         assert_eq!(
-            results[0].0, "vec-zero",
+            results[0].path, "vec-zero",
             "should return the inserted memory_id"
         );
     }
@@ -158,15 +473,223 @@ mod tests {
         let results = index.knn_search(&zero_vec(), 2).unwrap();
         assert_eq!(results.len(), 2, "should return 2 results");
         assert_eq!(
-            results[0].0, "vec-zero",
+            results[0].path, "vec-zero",
             "vec-zero should be the nearest neighbour"
         );
         assert!(
-            results[0].1 < results[1].1,
+            results[0].distance < results[1].distance,
             "nearest neighbour should have a strictly smaller distance: {} vs {}",
-            results[0].1,
-            results[1].1
+            results[0].distance,
+            results[1].distance
+        );
+    }
+
+    #[test]
+    fn test_remove_deletes_all_vectors_for_id() {
+        let (index, _dir) = make_index();
+
+        index.insert("vec-zero", &zero_vec()).unwrap();
+        index.insert("vec-zero", &zero_vec()).unwrap();
+        index.insert("vec-ones", &ones_vec()).unwrap();
+        index.remove("vec-zero").unwrap();
+
+        let results = index.knn_search(&zero_vec(), 3).unwrap();
+        assert_eq!(results.len(), 1, "only vec-ones should remain");
+        assert_eq!(results[0].path, "vec-ones");
+    }
+
+    #[test]
+    fn test_upsert_replaces_vector_and_tracks_hash() {
+        let (index, _dir) = make_index();
+
+        assert!(index.needs_reindex("note.md", "aaaa").unwrap());
+        index.upsert("note.md", "aaaa", &whole(zero_vec())).unwrap();
+        assert!(!index.needs_reindex("note.md", "aaaa").unwrap());
+        assert!(index.needs_reindex("note.md", "bbbb").unwrap());
+
+        index.upsert("note.md", "bbbb", &whole(ones_vec())).unwrap();
+        let results = index.knn_search(&ones_vec(), 5).unwrap();
+        assert_eq!(results.len(), 1, "upsert must not duplicate vectors");
+        assert!(!index.needs_reindex("note.md", "bbbb").unwrap());
+    }
+
+    #[test]
+    fn test_remove_forgets_hash_and_indexed_paths_covers_legacy_rows() {
+        let (index, _dir) = make_index();
+
+        index.upsert("kept.md", "aaaa", &whole(zero_vec())).unwrap();
+        index.upsert("gone.md", "bbbb", &whole(ones_vec())).unwrap();
+        // Written before hashes were tracked.
+        index.insert("legacy.md", &zero_vec()).unwrap();
+        assert_eq!(
+            index.indexed_paths().unwrap(),
+            vec!["gone.md", "kept.md", "legacy.md"]
+        );
+
+        index.remove("gone.md").unwrap();
+        assert!(index.needs_reindex("gone.md", "bbbb").unwrap());
+        assert_eq!(index.indexed_paths().unwrap(), vec!["kept.md", "legacy.md"]);
+    }
+
+    #[test]
+    fn test_upsert_many_writes_every_document_and_hash() {
+        let (index, _dir) = make_index();
+
+        let zero = whole(zero_vec());
+        let ones = whole(ones_vec());
+        index
+            .upsert_many(&[("a.md", "aaaa", &zero), ("b.md", "bbbb", &ones)])
+            .unwrap();
+
+        let hashes = index.content_hashes().unwrap();
+        assert_eq!(hashes.len(), 2);
+        assert_eq!(hashes["a.md"], "aaaa");
+        assert_eq!(hashes["b.md"], "bbbb");
+        assert_eq!(index.knn_search(&zero_vec(), 5).unwrap().len(), 2);
+    }
+
+    #[test]
+    fn test_chunk_hits_aggregate_to_best_chunk_per_document() {
+        let (index, _dir) = make_index();
+
+        let mut near = zero_vec();
+        near[0] = 0.1;
+        let mut far = zero_vec();
+        far[0] = 5.0;
+        let long_doc = vec![
+            (
+                Chunk {
+                    offset: 0,
+                    text: "# Intro",
+                },
+                far.clone(),
+            ),
+            (
+                Chunk {
+                    offset: 120,
+                    text: "## Details about the match",
+                },
+                near,
+            ),
+        ];
+        index.upsert("long.md", "aaaa", &long_doc).unwrap();
+        index
+            .upsert("other.md", "bbbb", &whole(ones_vec()))
+            .unwrap();
+
+        let results = index.knn_search(&zero_vec(), 2).unwrap();
+        assert_eq!(results.len(), 2, "one hit per document");
+        assert_eq!(results[0].path, "long.md");
+        assert_eq!(
+            results[0].offset, 120,
+            "hit should point at the nearest chunk"
         );
+        assert_eq!(results[0].snippet, "## Details about the match");
+        assert_eq!(results[1].path, "other.md");
+    }
+
+    #[test]
+    fn test_open_drops_pre_chunking_store() {
+        let dir = TempDir::new().unwrap();
+        let db_path = dir.path().join("legacy.db");
+        // Opening any index registers sqlite-vec for the raw connection below.
+        drop(VectorIndex::open(&dir.path().join("current.db")).unwrap());
+        {
+            let conn = Connection::open(&db_path).unwrap();
+            conn.execute_batch(
+                "CREATE VIRTUAL TABLE memory_vectors \
+                 USING vec0(embedding float[384], +memory_id text);",
+            )
+            .unwrap();
+            let embedding = serde_json::to_string(&zero_vec()).unwrap();
+            conn.execute(
+                "INSERT INTO memory_vectors (embedding, memory_id) VALUES (?, 'old.md')",
+                params![embedding],
+            )
+            .unwrap();
+        }
+
+        let index = VectorIndex::open(&db_path).unwrap();
+        assert!(index.indexed_paths().unwrap().is_empty());
+        index.upsert("new.md", "aaaa", &whole(zero_vec())).unwrap();
+        assert_eq!(index.indexed_paths().unwrap(), vec!["new.md"]);
+    }
+
+    /// Helper: the rowids `vector_chunks` records for `path`, and those `memory_vectors`
+    /// actually holds for it, both sorted.
+    fn chunk_rowids(index: &VectorIndex, path: &str) -> (Vec<i64>, Vec<i64>) {
+        let rowids = |sql: &str| -> Vec<i64> {
+            let mut stmt = index.conn.prepare(sql).unwrap();
+            let rows = stmt.query_map(params![path], |row| row.get(0)).unwrap();
+            rows.map(Result::unwrap).collect()
+        };
+        (
+            rowids("SELECT chunk_rowid FROM vector_chunks WHERE path = ? ORDER BY 1"),
+            rowids("SELECT rowid FROM memory_vectors WHERE memory_id = ? ORDER BY 1"),
+        )
+    }
+
+    #[test]
+    fn test_chunk_rowids_follow_upsert_and_remove() {
+        let (index, _dir) = make_index();
+
+        let two_chunks = vec![
+            (
+                Chunk {
+                    offset: 0,
+                    text: "# Intro",
+                },
+                zero_vec(),
+            ),
+            (
+                Chunk {
+                    offset: 40,
+                    text: "## More",
+                },
+                ones_vec(),
+            ),
+        ];
+        index.upsert("long.md", "aaaa", &two_chunks).unwrap();
+        let (tracked, stored) = chunk_rowids(&index, "long.md");
+        assert_eq!(tracked.len(), 2);
+        assert_eq!(tracked, stored);
+
+        index.upsert("long.md", "bbbb", &whole(ones_vec())).unwrap();
+        let (tracked, stored) = chunk_rowids(&index, "long.md");
+        assert_eq!(tracked.len(), 1, "replaced chunks must be forgotten");
+        assert_eq!(tracked, stored);
+
+        index.insert("legacy.md", &zero_vec()).unwrap();
+        index.remove("long.md").unwrap();
+        index.remove("legacy.md").unwrap();
+        assert_eq!(chunk_rowids(&index, "long.md"), (vec![], vec![]));
+        assert_eq!(chunk_rowids(&index, "legacy.md"), (vec![], vec![]));
+        assert!(index.indexed_paths().unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_open_backfills_chunk_rowids_of_version_1_store() {
+        let dir = TempDir::new().unwrap();
+        let db_path = dir.path().join("v1.db");
+        {
+            let index = VectorIndex::open(&db_path).unwrap();
+            index.upsert("note.md", "aaaa", &whole(zero_vec())).unwrap();
+            // Version 1 had no chunk table.
+            index
+                .conn
+                .execute_batch("DROP TABLE vector_chunks; PRAGMA user_version = 1;")
+                .unwrap();
+        }
+
+        let index = VectorIndex::open(&db_path).unwrap();
+        let (tracked, stored) = chunk_rowids(&index, "note.md");
+        assert_eq!(tracked.len(), 1);
+        assert_eq!(tracked, stored);
+        assert!(!index.needs_reindex("note.md", "aaaa").unwrap());
+
+        index.upsert("note.md", "bbbb", &whole(ones_vec())).unwrap();
+        let results = index.knn_search(&ones_vec(), 5).unwrap();
+        assert_eq!(results.len(), 1, "upsert must replace the backfilled chunk");
     }
 
     #[test]
@@ -188,4 +711,33 @@ mod tests {
             results.len()
         );
     }
+
+    #[test]
+    fn test_insert_many_stores_every_vector() {
+        let (index, _dir) = make_index();
+
+        let vectors: Vec<(String, Vec<f32>)> = (0..10)
+            .map(|i| {
+                let mut v = zero_vec();
+                v[i] = 1.0;
+                (format!("vec-{i}"), v)
+            })
+            .collect();
+        let entries: Vec<(&str, &[f32])> = vectors
+            .iter()
+            .map(|(id, v)| (id.as_str(), v.as_slice()))
+            .collect();
+        index.insert_many(&entries).unwrap();
+
+        assert_eq!(index.indexed_paths().unwrap().len(), 10);
+        let results = index.knn_search(&vectors[3].1, 1).unwrap();
+        assert_eq!(results[0].path, "vec-3");
+        assert!(results[0].distance.abs() < 1e-6);
+    }
+
+    #[test]
+    fn test_f32_blob_is_little_endian() {
+        let expected = [1.0_f32.to_le_bytes(), (-2.5_f32).to_le_bytes()].concat();
+        assert_eq!(f32_blob(&[1.0, -2.5]).as_ref(), expected.as_slice());
+    }
 }
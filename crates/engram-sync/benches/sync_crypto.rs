@@ -0,0 +1,152 @@
+//! Throughput and heap traffic of the sync encryption paths.
+//!
+//! `copying` rebuilds the blob the way `encrypt_for_sync` used to: encrypt
+//! into a fresh Vec, prefix the nonce, then copy everything behind the magic.
+//! Before timing, each variant's heap bytes per call are printed, counted by
+//! a wrapping global allocator. Each variant is then timed for about a second
+//! and its mean time per call and MB/s are printed; per-call inputs are built
+//! outside the timed region.
+//!
+//! Run with `cargo bench -p engram-sync --bench sync_crypto`.
+
+use std::alloc::{GlobalAlloc, Layout, System};
+use std::hint::black_box;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::{Duration, Instant};
+
+use bytes::Bytes;
+use engram_core::crypto::{encrypt, EngramKey};
+use engram_sync::encrypt::{
+    decrypt_from_sync, encrypt_for_sync, open_from_sync, seal_for_sync, MAGIC,
+};
+
+struct CountingAlloc;
+
+static ALLOCATED: AtomicUsize = AtomicUsize::new(0);
+
+unsafe impl GlobalAlloc for CountingAlloc {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        ALLOCATED.fetch_add(layout.size(), Ordering::Relaxed);
+        System.alloc(layout)
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        System.dealloc(ptr, layout)
+    }
+
+    unsafe fn realloc(&self, ptr: *mut u8, layout: Layout, new_size: usize) -> *mut u8 {
+        ALLOCATED.fetch_add(new_size, Ordering::Relaxed);
+        System.realloc(ptr, layout, new_size)
+    }
+}
+
+#[global_allocator]
+static GLOBAL: CountingAlloc = CountingAlloc;
+
+const SIZES: [usize; 3] = [4 * 1024, 1024 * 1024, 8 * 1024 * 1024];
+
+/// Time spent measuring each variant.
+const MEASURE: Duration = Duration::from_secs(1);
+
+fn copying_encrypt(key: &EngramKey, plaintext: &[u8]) -> Bytes {
+    let ciphertext = encrypt(key, plaintext).unwrap();
+    let mut output = Vec::with_capacity(MAGIC.len() + ciphertext.len());
+    output.extend_from_slice(MAGIC);
+    output.extend_from_slice(&ciphertext);
+    Bytes::from(output)
+}
+
+/// Heap bytes requested while running `f` once, excluding its input.
+fn allocated_by<T, R>(input: T, f: impl FnOnce(T) -> R) -> usize {
+    let before = ALLOCATED.load(Ordering::Relaxed);
+    let result = f(input);
+    let after = ALLOCATED.load(Ordering::Relaxed);
+    drop(result);
+    after - before
+}
+
+/// Run `routine` on fresh input from `setup` for about [`MEASURE`], then print the
+/// mean time per call and the throughput over `bytes` bytes per call.
+fn bench<I, R>(
+    name: &str,
+    bytes: usize,
+    mut setup: impl FnMut() -> I,
+    mut routine: impl FnMut(I) -> R,
+) {
+    // Warm-up call, not timed.
+    black_box(routine(setup()));
+    let mut spent = Duration::ZERO;
+    let mut calls = 0u32;
+    while spent < MEASURE {
+        let input = setup();
+        let start = Instant::now();
+        let output = black_box(routine(input));
+        spent += start.elapsed();
+        drop(output);
+        calls += 1;
+    }
+    let mean = spent / calls;
+    let mb_per_s = bytes as f64 / mean.as_secs_f64() / 1_000_000.0;
+    println!("{name}: {mean:?} per call, {mb_per_s:.1} MB/s ({calls} calls)");
+}
+
+fn bench_encrypt(key: &EngramKey) {
+    for size in SIZES {
+        let plaintext = vec![0x5au8; size];
+        println!(
+            "sync_encrypt/{size}: heap bytes per call: copying {}, encrypt_for_sync {}, seal_for_sync {}",
+            allocated_by(&plaintext, |p| copying_encrypt(key, p)),
+            allocated_by(&plaintext, |p| encrypt_for_sync(key, p)),
+            allocated_by(plaintext.clone(), |p| seal_for_sync(key, p)),
+        );
+
+        bench(
+            &format!("sync_encrypt/copying/{size}"),
+            size,
+            || &plaintext,
+            |p| copying_encrypt(key, p),
+        );
+        bench(
+            &format!("sync_encrypt/encrypt_for_sync/{size}"),
+            size,
+            || &plaintext,
+            |p| encrypt_for_sync(key, p).unwrap(),
+        );
+        bench(
+            &format!("sync_encrypt/seal_for_sync/{size}"),
+            size,
+            || plaintext.clone(),
+            |owned| seal_for_sync(key, owned).unwrap(),
+        );
+    }
+}
+
+fn bench_decrypt(key: &EngramKey) {
+    for size in SIZES {
+        let blob = encrypt_for_sync(key, &vec![0x5au8; size]).unwrap();
+        println!(
+            "sync_decrypt/{size}: heap bytes per call: decrypt_from_sync {}, open_from_sync {}",
+            allocated_by(&blob, |b| decrypt_from_sync(key, b)),
+            allocated_by(Bytes::copy_from_slice(&blob), |b| open_from_sync(key, b)),
+        );
+
+        bench(
+            &format!("sync_decrypt/decrypt_from_sync/{size}"),
+            size,
+            || &blob,
+            |blob| decrypt_from_sync(key, blob).unwrap(),
+        );
+        bench(
+            &format!("sync_decrypt/open_from_sync/{size}"),
+            size,
+            || Bytes::copy_from_slice(&blob),
+            |pulled| open_from_sync(key, pulled).unwrap(),
+        );
+    }
+}
+
+fn main() {
+    let key = EngramKey::from_bytes([7u8; 32]);
+    bench_encrypt(&key);
+    bench_decrypt(&key);
+}
@@ -4,7 +4,7 @@
 //! Deletion propagation: files deleted on one side are deleted on the other.
 
 use crate::{
-    encrypt::{decrypt_from_sync, encrypt_for_sync},
+    encrypt::{open_from_sync, seal_for_sync},
     manifest::{classify_changes, BiSyncState, ChangeKind, FileEntry, SyncManifest},
     SyncBackend, SyncError,
 };
@@ -182,14 +182,14 @@ pub async fn run_bisync<B: SyncBackend>(
                 let content = std::fs::read(&local_file).map_err(|e| {
                     SyncError::Io(format!("read {}: {e}", change.path))
                 })?;
-                let encrypted = encrypt_for_sync(key, &content)?;
+                let encrypted = seal_for_sync(key, content)?;
                 backend.push(&change.path, encrypted).await?;
                 result.uploaded += 1;
             }
 
             ChangeKind::RemoteOnly | ChangeKind::NewRemote => {
                 let encrypted = backend.pull(&change.path).await?;
-                let content = decrypt_from_sync(key, &encrypted)?;
+                let content = open_from_sync(key, encrypted)?;
                 // Fix 5: Propagate create_dir_all errors instead of swallowing with .ok().
                 if let Some(parent) = local_file.parent() {
                     std::fs::create_dir_all(parent).map_err(|e| {
@@ -210,7 +210,7 @@ pub async fn run_bisync<B: SyncBackend>(
                     // Local is newer (or tied): save remote as a conflict copy, upload local.
                     let conflict_path = conflict_copy_name(&change.path, *remote_mtime);
                     let remote_encrypted = backend.pull(&change.path).await?;
-                    let remote_content = decrypt_from_sync(key, &remote_encrypted)?;
+                    let remote_content = open_from_sync(key, remote_encrypted)?;
                     let conflict_local = vault_path.join(&conflict_path);
                     // Fix 5: Propagate create_dir_all errors.
                     if let Some(parent) = conflict_local.parent() {
@@ -226,7 +226,7 @@ pub async fn run_bisync<B: SyncBackend>(
                     let content = std::fs::read(&local_file).map_err(|e| {
                         SyncError::Io(format!("read {}: {e}", change.path))
                     })?;
-                    let encrypted = encrypt_for_sync(key, &content)?;
+                    let encrypted = seal_for_sync(key, content)?;
                     backend.push(&change.path, encrypted).await?;
                 } else {
                     // Remote is newer: save local as a conflict copy, download remote.
@@ -244,7 +244,7 @@ pub async fn run_bisync<B: SyncBackend>(
                     })?;
 
                     let encrypted = backend.pull(&change.path).await?;
-                    let content = decrypt_from_sync(key, &encrypted)?;
+                    let content = open_from_sync(key, encrypted)?;
                     std::fs::write(&local_file, &content).map_err(|e| {
                         SyncError::Io(format!("write {}: {e}", change.path))
                     })?;
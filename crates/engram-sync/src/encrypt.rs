@@ -1,22 +1,45 @@
 // crates/engram-sync/src/encrypt.rs
 
 use crate::backend::SyncError;
-use bytes::Bytes;
-use engram_core::crypto::{decrypt, encrypt, EngramKey};
+use bytes::{Bytes, BytesMut};
+use engram_core::crypto::{
+    decrypt, decrypt_in_place, encrypt_in_place, EngramKey, NONCE_LEN, TAG_LEN,
+};
 
 pub const MAGIC: &[u8] = b"ENGRAM_V1:";
 
+/// Bytes a sync blob adds around the plaintext: magic, nonce and tag.
+pub const OVERHEAD: usize = MAGIC.len() + NONCE_LEN + TAG_LEN;
+
 /// Encrypt plaintext for cloud sync.
 ///
 /// Prepends a `ENGRAM_V1:` magic prefix so encrypted blobs are
 /// identifiable without attempting decryption. The actual encryption
-/// is delegated to `engram_core::crypto::encrypt` (XChaCha20-Poly1305).
+/// is XChaCha20-Poly1305 via `engram_core::crypto`. The blob is built in a
+/// single allocation; use [`seal_for_sync`] when the plaintext is already an
+/// owned `Vec` to avoid even that copy.
 pub fn encrypt_for_sync(key: &EngramKey, plaintext: &[u8]) -> Result<Bytes, SyncError> {
-    let ciphertext = encrypt(key, plaintext).map_err(|e| SyncError::Encryption(e.to_string()))?;
-    let mut output = Vec::with_capacity(MAGIC.len() + ciphertext.len());
-    output.extend_from_slice(MAGIC);
-    output.extend_from_slice(&ciphertext);
-    Ok(Bytes::from(output))
+    let mut buf = Vec::with_capacity(OVERHEAD + plaintext.len());
+    buf.extend_from_slice(MAGIC);
+    buf.resize(MAGIC.len() + NONCE_LEN, 0);
+    buf.extend_from_slice(plaintext);
+    seal(key, buf)
+}
+
+/// Encrypt an owned plaintext buffer for cloud sync, reusing its allocation.
+///
+/// The plaintext is shifted up to make room for the magic prefix and nonce
+/// and encrypted in place; at most one reallocation grows the buffer by
+/// [`OVERHEAD`]. The output is identical in format to [`encrypt_for_sync`].
+pub fn seal_for_sync(key: &EngramKey, plaintext: Vec<u8>) -> Result<Bytes, SyncError> {
+    let mut buf = plaintext;
+    let len = buf.len();
+    let header = MAGIC.len() + NONCE_LEN;
+    buf.reserve_exact(OVERHEAD);
+    buf.resize(len + header, 0);
+    buf.copy_within(..len, header);
+    buf[..MAGIC.len()].copy_from_slice(MAGIC);
+    seal(key, buf)
 }
 
 /// Decrypt a blob produced by `encrypt_for_sync`.
@@ -24,15 +47,41 @@ pub fn encrypt_for_sync(key: &EngramKey, plaintext: &[u8]) -> Result<Bytes, Sync
 /// Returns an error if the magic prefix is missing (blob was not produced
 /// by this system) or if decryption fails (wrong key or tampered data).
 pub fn decrypt_from_sync(key: &EngramKey, data: &[u8]) -> Result<Vec<u8>, SyncError> {
-    if !data.starts_with(MAGIC) {
-        return Err(SyncError::Encryption(
-            "Not an engram-encrypted blob (missing magic prefix)".into(),
-        ));
-    }
-    let ciphertext = &data[MAGIC.len()..];
+    let ciphertext = check_magic(data)?;
     decrypt(key, ciphertext).map_err(|e| SyncError::Encryption(e.to_string()))
 }
 
+/// Decrypt a pulled blob in place, returning the plaintext as a view into it.
+///
+/// `data` is decrypted where it lies when this is its only handle (as for a
+/// freshly pulled object); a shared buffer is copied once first. Errors are
+/// as for [`decrypt_from_sync`].
+pub fn open_from_sync(key: &EngramKey, data: Bytes) -> Result<Bytes, SyncError> {
+    check_magic(&data)?;
+    let mut buf = data
+        .try_into_mut()
+        .unwrap_or_else(|shared| BytesMut::from(&shared[..]));
+    let plaintext = decrypt_in_place(key, &mut buf[MAGIC.len()..])
+        .map_err(|e| SyncError::Encryption(e.to_string()))?;
+    Ok(buf
+        .freeze()
+        .slice(MAGIC.len() + plaintext.start..MAGIC.len() + plaintext.end))
+}
+
+/// Encrypt `buf` (magic, nonce space, plaintext) in place.
+fn seal(key: &EngramKey, mut buf: Vec<u8>) -> Result<Bytes, SyncError> {
+    encrypt_in_place(key, &mut buf, MAGIC.len())
+        .map_err(|e| SyncError::Encryption(e.to_string()))?;
+    Ok(Bytes::from(buf))
+}
+
+/// Strip the magic prefix, rejecting blobs that do not carry it.
+fn check_magic(data: &[u8]) -> Result<&[u8], SyncError> {
+    data.strip_prefix(MAGIC).ok_or_else(|| {
+        SyncError::Encryption("Not an engram-encrypted blob (missing magic prefix)".into())
+    })
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -52,6 +101,24 @@ mod tests {
         assert_eq!(decrypted, plaintext);
     }
 
+    #[test]
+    fn test_seal_and_open_in_place_roundtrip() {
+        let key = test_key();
+        let plaintext = b"# Sofia.md\n\nSofia is vegetarian.".to_vec();
+        let sealed = seal_for_sync(&key, plaintext.clone()).unwrap();
+        assert_eq!(sealed.len(), plaintext.len() + OVERHEAD);
+        assert_eq!(decrypt_from_sync(&key, &sealed).unwrap(), plaintext);
+
+        // A blob that is still shared elsewhere is copied, not mutated.
+        let opened = open_from_sync(&key, sealed.clone()).unwrap();
+        assert_eq!(&opened[..], &plaintext[..]);
+        assert!(sealed.starts_with(MAGIC));
+        let opened = open_from_sync(&key, sealed).unwrap();
+        assert_eq!(&opened[..], &plaintext[..]);
+
+        assert!(open_from_sync(&key, Bytes::from_static(b"raw")).is_err());
+    }
+
     #[test]
     fn test_encrypted_has_magic_prefix() {
         let key = test_key();
@@ -1,7 +1,175 @@
 """Hook module: injects engram memory context at session start via prompt:submit."""
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import math
+import os
+import time
+import tomllib
+from pathlib import Path
+
+
+def _engram_home() -> Path:
+    return Path.home() / ".engram"
+
+
+def _config_path() -> Path:
+    """Same resolution as `EngramConfig::config_path` in engram-core."""
+    override = os.environ.get("ENGRAM_CONFIG_PATH")
+    return Path(override) if override else _engram_home() / "config.toml"
+
+
+def _stat_key(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _fingerprint() -> tuple:
+    """Cheap snapshot of what `engram awareness` reads, without walking vaults.
+
+    Covers the config file, each vault's `_context/*.md` files (their content
+    is inlined) and the memory store the CLI resolves, plus its WAL (facts
+    written by `engram observe`). Files added to a vault are picked up when
+    the block reaches ``max_age``.
+    """
+    config_path = _config_path()
+    parts: list = [("config", _stat_key(config_path))]
+    try:
+        vaults = tomllib.loads(config_path.read_text()).get("vaults", {})
+    except (OSError, tomllib.TOMLDecodeError):
+        vaults = {}
+
+    for _, entry in sorted(vaults.items()):
+        vault = Path(os.path.expanduser(str(entry.get("path", ""))))
+        for md in sorted((vault / "_context").glob("*.md")):
+            parts.append((str(md), _stat_key(md)))
+    parts.extend(_store_keys(_store_path(vaults)))
+    return tuple(parts)
+
+
+def _store_path(vaults: dict) -> Path:
+    """Same resolution as `default_store_path_from_config` in engram-cli.
+
+    ``ENGRAM_STORE_PATH`` wins; otherwise the default vault's (the first
+    flagged ``default``, else the first by name) `~/.engram/<name>/memory.db`;
+    otherwise the legacy `~/.engram/memory.db`.
+    """
+    override = os.environ.get("ENGRAM_STORE_PATH")
+    if override:
+        return Path(override)
+    names = sorted(vaults)
+    flagged = [name for name in names if vaults[name].get("default")]
+    if flagged or names:
+        return _engram_home() / (flagged or names)[0] / "memory.db"
+    return _engram_home() / "memory.db"
+
+
+def _store_keys(store: Path) -> list:
+    """Stat keys for a memory store and its WAL."""
+    wal = Path(f"{store}-wal")
+    return [(str(store), _stat_key(store)), (str(wal), _stat_key(wal))]
+
+
+async def _run_awareness(timeout: float) -> str | None:
+    """Run `engram awareness` without blocking the event loop.
+
+    Returns the trimmed output, or None on failure, timeout or missing binary.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "engram",
+            "awareness",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    if proc.returncode != 0:
+        return None
+    return stdout.decode(errors="replace").strip() or None
+
+
+class AwarenessCache:
+    """Stale-while-revalidate cache for the awareness block.
+
+    A prompt is answered from the last good block whenever one exists. The
+    block is regenerated in the background only when the vault/store
+    fingerprint changes or the block is older than ``max_age`` seconds; the
+    very first prompt waits for the initial run. The fingerprint is taken at
+    most once every ``check_interval`` seconds, so a burst of prompts stats
+    the files once.
+    """
+
+    def __init__(self, timeout: float = 10, max_age: float = 600, check_interval: float = 5):
+        self.timeout = timeout
+        self.max_age = max_age
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.failures = 0
+        self._content: str | None = None
+        self._fingerprint: tuple | None = None
+        self._fetched_at = 0.0
+        self._checked_at = -math.inf
+        self._refresh_task: asyncio.Task | None = None
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "refreshing": self._refresh_task is not None and not self._refresh_task.done(),
+        }
+
+    async def get(self) -> str | None:
+        now = time.monotonic()
+        if self._content is not None and now - self._checked_at < self.check_interval:
+            self.hits += 1
+            return self._content
+        self._checked_at = now
+        fingerprint = await asyncio.to_thread(_fingerprint)
+
+        if self._content is None:
+            self.misses += 1
+            if self.failures == 0:
+                await self._refresh(fingerprint)
+            else:
+                # Don't stall every prompt on a binary that keeps failing.
+                self._refresh_in_background(fingerprint)
+            return self._content
+
+        self.hits += 1
+        expired = time.monotonic() - self._fetched_at > self.max_age
+        if fingerprint != self._fingerprint or expired:
+            self._refresh_in_background(fingerprint)
+        return self._content
+
+    def _refresh_in_background(self, fingerprint: tuple) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh(fingerprint))
+
+    async def _refresh(self, fingerprint: tuple) -> None:
+        # `fingerprint` was taken before the run, so edits made while the
+        # command is running still invalidate the result on the next prompt.
+        self.refreshes += 1
+        content = await _run_awareness(self.timeout)
+        if content is None:
+            self.failures += 1
+            return
+        self._content = content
+        self._fingerprint = fingerprint
+        self._fetched_at = time.monotonic()
 
 
 async def mount(coordinator, config: dict):
@@ -11,28 +179,27 @@ async def mount(coordinator, config: dict):
     except ImportError:
         HookResult = None
 
+    cache = AwarenessCache(
+        timeout=config.get("timeout", 10),
+        max_age=config.get("max_age", 600),
+        check_interval=config.get("check_interval", 5),
+    )
+
     async def handle_prompt_submit(event):
-        """Call engram awareness for three-layer vault context and inject result as system reminder."""
-        try:
-            result = subprocess.run(
-                ["engram", "awareness"],
-                capture_output=True,
-                text=True,
-                timeout=config.get("timeout", 10),
+        """Inject the cached three-layer vault context, refreshing it in the background."""
+        content = await cache.get()
+        if content and HookResult is not None:
+            return HookResult(
+                action="inject_context",
+                content=content,
+                ephemeral=True,
+                suppress_output=True,
             )
-            if result.returncode == 0 and result.stdout.strip():
-                if HookResult is not None:
-                    return HookResult(
-                        action="inject_context",
-                        content=result.stdout.strip(),
-                        ephemeral=True,
-                        suppress_output=True,
-                    )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
         if HookResult is not None:
             return HookResult(action="noop")
 
+    handle_prompt_submit.cache = cache
+
     coordinator.hooks.register(
         "prompt:submit",
         handle_prompt_submit,
@@ -1,12 +1,15 @@
 """Tests for hook-memory-context module."""
 from __future__ import annotations
 
-import subprocess
-from unittest.mock import MagicMock, patch
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from amplifier_module_hook_memory_context import mount
+from amplifier_module_hook_memory_context import AwarenessCache, _fingerprint, mount
+
+MODULE = "amplifier_module_hook_memory_context"
 
 
 @pytest.fixture
@@ -27,21 +30,24 @@ async def test_mount_registers_hook(coordinator):
     assert args[0][0] == "prompt:submit"
 
 
+def _fake_proc(stdout: bytes = b"", returncode: int = 0):
+    proc = MagicMock()
+    proc.returncode = returncode
+    proc.communicate = AsyncMock(return_value=(stdout, b""))
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
 @pytest.mark.asyncio
 async def test_handler_calls_engram_load(coordinator):
-    """Handler subprocess-calls engram awareness."""
+    """Handler runs engram awareness as an asyncio subprocess."""
     await mount(coordinator, {})
     handler = coordinator.hooks.register.call_args[0][1]
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(returncode=0, stdout="<engram-context>\n## Personal\nDomains: Work (89)\n</engram-context>")
+    proc = _fake_proc(b"<engram-context>\n## Personal\nDomains: Work (89)\n</engram-context>")
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as mock_exec:
         await handler(MagicMock())
-        mock_run.assert_called_once_with(
-            ["engram", "awareness"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+    assert mock_exec.call_args[0] == ("engram", "awareness")
 
 
 @pytest.mark.asyncio
@@ -50,7 +56,7 @@ async def test_handler_tolerates_missing_engram_binary(coordinator):
     await mount(coordinator, {})
     handler = coordinator.hooks.register.call_args[0][1]
 
-    with patch("subprocess.run", side_effect=FileNotFoundError):
+    with patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=FileNotFoundError)):
         result = await handler(MagicMock())
     assert result is None
 
@@ -58,9 +64,168 @@ async def test_handler_tolerates_missing_engram_binary(coordinator):
 @pytest.mark.asyncio
 async def test_handler_tolerates_timeout(coordinator):
     """Handler returns None gracefully when engram times out."""
-    await mount(coordinator, {})
+    await mount(coordinator, {"timeout": 0.05})
     handler = coordinator.hooks.register.call_args[0][1]
 
-    with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="engram", timeout=5)):
+    async def hang():
+        await asyncio.sleep(5)
+
+    proc = _fake_proc()
+    proc.communicate = hang
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
         result = await handler(MagicMock())
     assert result is None
+    proc.kill.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_hits_until_fingerprint_changes():
+    """Unchanged fingerprint is a hit with no rerun; a change reruns in the background."""
+    cache = AwarenessCache(check_interval=0)
+    fingerprint = ["v1"]
+    runs = []
+
+    async def fake_run(timeout):
+        runs.append(fingerprint[0])
+        return f"block {fingerprint[0]}"
+
+    with patch(f"{MODULE}._fingerprint", lambda: (fingerprint[0],)), \
+            patch(f"{MODULE}._run_awareness", fake_run):
+        assert await cache.get() == "block v1"
+        assert await cache.get() == "block v1"
+        assert runs == ["v1"]
+
+        fingerprint[0] = "v2"
+        # Stale block is served immediately while the refresh runs.
+        assert await cache.get() == "block v1"
+        await cache._refresh_task
+        assert await cache.get() == "block v2"
+
+    assert runs == ["v1", "v2"]
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_block_on_slow_refresh():
+    """A slow background refresh never delays a prompt that has a cached block."""
+    cache = AwarenessCache(check_interval=0)
+    fingerprint = ["v1"]
+    release = asyncio.Event()
+
+    async def fake_run(timeout):
+        if fingerprint[0] != "v1":
+            await release.wait()
+        return f"block {fingerprint[0]}"
+
+    with patch(f"{MODULE}._fingerprint", lambda: (fingerprint[0],)), \
+            patch(f"{MODULE}._run_awareness", fake_run):
+        await cache.get()
+        fingerprint[0] = "v2"
+        result = await asyncio.wait_for(cache.get(), timeout=1)
+        assert result == "block v1"
+        assert cache.stats()["refreshing"]
+        release.set()
+        await cache._refresh_task
+    assert await cache.get() == "block v2"
+
+
+@pytest.mark.asyncio
+async def test_cache_checks_fingerprint_at_most_once_per_interval():
+    """Prompts within check_interval reuse the last check without statting anything."""
+    cache = AwarenessCache(check_interval=60)
+    checks = []
+
+    def fingerprint():
+        checks.append(1)
+        return (len(checks),)
+
+    async def fake_run(timeout):
+        return "block"
+
+    with patch(f"{MODULE}._fingerprint", fingerprint), \
+            patch(f"{MODULE}._run_awareness", fake_run):
+        for _ in range(5):
+            assert await cache.get() == "block"
+        assert len(checks) == 1
+
+        cache._checked_at -= 61
+        await cache.get()
+    assert len(checks) == 2
+    assert cache.stats()["hits"] == 5
+
+
+def _home_with_vault(tmp_path, monkeypatch, vaults: str = "personal"):
+    """An isolated home whose config lists `vaults`, each backed by a directory."""
+    home = tmp_path / "home"
+    (home / ".engram").mkdir(parents=True)
+    config = home / ".engram" / "config.toml"
+    lines = []
+    for name in vaults.split():
+        vault = tmp_path / name
+        (vault / "_context").mkdir(parents=True)
+        lines.append(f'[vaults.{name}]\npath = "{vault}"\n')
+    config.write_text("".join(lines))
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("ENGRAM_CONFIG_PATH", str(config))
+    monkeypatch.delenv("ENGRAM_STORE_PATH", raising=False)
+    return home
+
+
+def test_fingerprint_tracks_context_files_and_store(tmp_path, monkeypatch):
+    """Editing a _context file or writing the default vault's store changes the fingerprint."""
+    home = _home_with_vault(tmp_path, monkeypatch, "work personal")
+
+    before = _fingerprint()
+    assert _fingerprint() == before
+
+    # Ordinary vault files are left to max_age; no directory walk.
+    (tmp_path / "personal" / "note.md").write_text("hello")
+    assert _fingerprint() == before
+
+    (tmp_path / "personal" / "_context" / "about.md").write_text("hello")
+    after_context = _fingerprint()
+    assert after_context != before
+
+    # Only the store the CLI resolves counts: the first vault by name.
+    (home / ".engram" / "work").mkdir()
+    (home / ".engram" / "personal").mkdir()
+    (home / ".engram" / "work" / "memory.db").write_bytes(b"x")
+    assert _fingerprint() == after_context
+    (home / ".engram" / "personal" / "memory.db").write_bytes(b"x")
+    assert _fingerprint() != after_context
+
+
+def test_fingerprint_honours_store_path_override(tmp_path, monkeypatch):
+    """ENGRAM_STORE_PATH replaces the per-vault store, as in the CLI."""
+    home = _home_with_vault(tmp_path, monkeypatch)
+    store = tmp_path / "elsewhere.db"
+    monkeypatch.setenv("ENGRAM_STORE_PATH", str(store))
+
+    before = _fingerprint()
+    (home / ".engram" / "personal").mkdir()
+    (home / ".engram" / "personal" / "memory.db").write_bytes(b"x")
+    assert _fingerprint() == before
+
+    store.write_bytes(b"x")
+    after_store = _fingerprint()
+    assert after_store != before
+    (tmp_path / "elsewhere.db-wal").write_bytes(b"wal")
+    assert _fingerprint() != after_store
+
+
+def test_fingerprint_tracks_legacy_store(tmp_path, monkeypatch):
+    """Writes to the legacy ~/.engram/memory.db change the fingerprint."""
+    home = tmp_path / "home"
+    (home / ".engram").mkdir(parents=True)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("ENGRAM_CONFIG_PATH", str(home / ".engram" / "config.toml"))
+    monkeypatch.delenv("ENGRAM_STORE_PATH", raising=False)
+
+    before = _fingerprint()
+    (home / ".engram" / "memory.db").write_bytes(b"x")
+    after_store = _fingerprint()
+    assert after_store != before
+
+    (home / ".engram" / "memory.db-wal").write_bytes(b"wal")
+    assert _fingerprint() != after_store
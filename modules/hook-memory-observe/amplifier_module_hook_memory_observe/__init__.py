@@ -1,8 +1,129 @@
 """Hook module: triggers engram observe at session end to extract memories."""
 from __future__ import annotations
 
+import asyncio
 import os
-import subprocess
+
+
+class ObserveQueue:
+    """Bounded queue of `engram observe` jobs drained by a fixed worker pool.
+
+    At most ``max_concurrency`` observe processes run at once and at most
+    ``max_queue`` jobs wait behind them; further submissions are rejected.
+    A transcript that is already waiting is not queued twice. ``close`` gives
+    waiting jobs ``drain_timeout`` seconds to finish; any still queued after
+    that are dropped and counted as abandoned.
+    """
+
+    def __init__(self, max_concurrency: int = 2, max_queue: int = 32, drain_timeout: float = 30.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.drain_timeout = max(0.0, drain_timeout)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.deduplicated = 0
+        self.abandoned = 0
+        self.running = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_queue))
+        self._queued_paths: set[str] = set()
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        return {
+            "depth": self.depth,
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "deduplicated": self.deduplicated,
+            "abandoned": self.abandoned,
+        }
+
+    def submit(self, transcript_path: str) -> str:
+        """Enqueue an observe job. Returns "queued", "duplicate" or "rejected"."""
+        if transcript_path in self._queued_paths:
+            self.deduplicated += 1
+            return "duplicate"
+        try:
+            self._queue.put_nowait(transcript_path)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return "rejected"
+        self._queued_paths.add(transcript_path)
+        self.submitted += 1
+        self._ensure_workers()
+        return "queued"
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Drain queued jobs for up to ``drain_timeout`` seconds, then stop the workers.
+
+        Jobs still waiting when the timeout expires are abandoned. Observe
+        processes already started run to completion.
+        """
+        if self._workers:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.drain_timeout)
+            except asyncio.TimeoutError:
+                pass
+        while not self._queue.empty():
+            self._queued_paths.discard(self._queue.get_nowait())
+            self._queue.task_done()
+            self.abandoned += 1
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # --- Private helpers ---
+
+    def _ensure_workers(self) -> None:
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.max_concurrency:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        while True:
+            transcript_path = await self._queue.get()
+            # Once a job starts, a new submission for the same transcript is a
+            # fresh observation of a longer session, so it may queue again.
+            self._queued_paths.discard(transcript_path)
+            self.running += 1
+            try:
+                if await _run_observe(transcript_path):
+                    self.completed += 1
+                else:
+                    self.failed += 1
+            finally:
+                self.running -= 1
+                self._queue.task_done()
+
+
+async def _run_observe(transcript_path: str) -> bool:
+    """Run `engram observe` for one transcript and wait for it to exit."""
+    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+    cmd = ["engram", "observe", transcript_path]
+    if api_key:
+        cmd.extend(["--api-key", api_key])
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    return await proc.wait() == 0
 
 
 async def mount(coordinator, config: dict):
@@ -12,37 +133,31 @@ async def mount(coordinator, config: dict):
     except ImportError:
         HookResult = None
 
+    queue = ObserveQueue(
+        max_concurrency=config.get("max_concurrency", 2),
+        max_queue=config.get("max_queue", 32),
+        drain_timeout=config.get("drain_timeout", 30.0),
+    )
+
     async def handle_execution_end(event):
-        """Call engram observe <transcript_path> in background after session ends."""
+        """Queue engram observe <transcript_path> to run in the background after session ends."""
         transcript_path = None
         if hasattr(event, "context") and isinstance(event.context, dict):
             transcript_path = event.context.get("transcript_path")
 
-        if not transcript_path:
-            if HookResult is not None:
-                return HookResult(action="noop")
-            return None
-
-        api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-        cmd = ["engram", "observe", transcript_path]
-        if api_key:
-            cmd.extend(["--api-key", api_key])
-
-        try:
-            subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        except FileNotFoundError:
-            pass
+        if transcript_path:
+            queue.submit(transcript_path)
 
         if HookResult is not None:
             return HookResult(action="noop")
         return None
 
+    handle_execution_end.queue = queue
+
     coordinator.hooks.register(
         "execution:end",
         handle_execution_end,
         priority=config.get("priority", 90),
     )
+
+    return queue.close
@@ -1,12 +1,12 @@
 """Tests for hook-memory-observe module."""
 from __future__ import annotations
 
-import subprocess
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from amplifier_module_hook_memory_observe import mount
+from amplifier_module_hook_memory_observe import ObserveQueue, mount
 
 
 @pytest.fixture
@@ -38,25 +38,138 @@ async def test_handler_skips_when_no_transcript_path(coordinator):
     assert result is None
 
 
+def _fake_exec(returncode: int = 0, gate: asyncio.Event | None = None, log: list | None = None):
+    """Stand-in for asyncio.create_subprocess_exec that records concurrency."""
+    state = {"running": 0, "peak": 0}
+
+    async def fake_exec(*cmd, **kwargs):
+        if log is not None:
+            log.append(list(cmd))
+        proc = MagicMock()
+
+        async def wait():
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            if gate is not None:
+                await gate.wait()
+            state["running"] -= 1
+            return returncode
+
+        proc.wait = wait
+        return proc
+
+    return fake_exec, state
+
+
 @pytest.mark.asyncio
 async def test_handler_calls_engram_observe(coordinator):
     await mount(coordinator, {})
     handler = coordinator.hooks.register.call_args[0][1]
+    calls = []
+    fake_exec, _ = _fake_exec(log=calls)
 
-    with patch("subprocess.Popen") as mock_popen:
+    with patch("asyncio.create_subprocess_exec", fake_exec):
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
             await handler(make_event("/tmp/transcript.jsonl"))
-        mock_popen.assert_called_once()
-        cmd = mock_popen.call_args[0][0]
-        assert "engram" in cmd
-        assert "observe" in cmd
-        assert "/tmp/transcript.jsonl" in cmd
+            await handler.queue.join()
+    assert len(calls) == 1
+    cmd = calls[0]
+    assert "engram" in cmd
+    assert "observe" in cmd
+    assert "/tmp/transcript.jsonl" in cmd
+    assert handler.queue.stats()["completed"] == 1
 
 
 @pytest.mark.asyncio
 async def test_handler_tolerates_missing_engram(coordinator):
     await mount(coordinator, {})
     handler = coordinator.hooks.register.call_args[0][1]
-    with patch("subprocess.Popen", side_effect=FileNotFoundError):
+    with patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=FileNotFoundError)):
         result = await handler(make_event("/tmp/transcript.jsonl"))
+        await handler.queue.join()
     assert result is None
+    assert handler.queue.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_caps_concurrency():
+    queue = ObserveQueue(max_concurrency=2, max_queue=10)
+    gate = asyncio.Event()
+    fake_exec, state = _fake_exec(gate=gate)
+
+    with patch("asyncio.create_subprocess_exec", fake_exec):
+        for i in range(6):
+            assert queue.submit(f"/tmp/t{i}.jsonl") == "queued"
+        await asyncio.sleep(0.01)
+        assert queue.running == 2
+        assert queue.depth == 4
+        gate.set()
+        await queue.join()
+    await queue.close()
+    assert state["peak"] == 2
+    assert queue.stats()["completed"] == 6
+
+
+@pytest.mark.asyncio
+async def test_queue_drops_duplicates_and_rejects_overflow():
+    queue = ObserveQueue(max_concurrency=1, max_queue=2)
+    gate = asyncio.Event()
+    fake_exec, _ = _fake_exec(gate=gate)
+
+    with patch("asyncio.create_subprocess_exec", fake_exec):
+        assert queue.submit("/tmp/a.jsonl") == "queued"
+        await asyncio.sleep(0.01)  # a is now running, so the queue is empty
+        assert queue.submit("/tmp/b.jsonl") == "queued"
+        assert queue.submit("/tmp/b.jsonl") == "duplicate"
+        assert queue.submit("/tmp/c.jsonl") == "queued"
+        assert queue.submit("/tmp/d.jsonl") == "rejected"
+        gate.set()
+        await queue.join()
+    await queue.close()
+    stats = queue.stats()
+    assert stats["deduplicated"] == 1
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 3
+    assert stats["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_handler_counts_spawn_errors_as_failed(coordinator):
+    await mount(coordinator, {})
+    handler = coordinator.hooks.register.call_args[0][1]
+    with patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=PermissionError)):
+        await handler(make_event("/tmp/transcript.jsonl"))
+        await handler.queue.join()
+    assert handler.queue.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_close_drains_queued_jobs():
+    queue = ObserveQueue(max_concurrency=1, max_queue=10, drain_timeout=5)
+    fake_exec, _ = _fake_exec()
+
+    with patch("asyncio.create_subprocess_exec", fake_exec):
+        for i in range(4):
+            queue.submit(f"/tmp/t{i}.jsonl")
+        await queue.close()
+    stats = queue.stats()
+    assert stats["completed"] == 4
+    assert stats["abandoned"] == 0
+
+
+@pytest.mark.asyncio
+async def test_close_abandons_jobs_left_after_drain_timeout():
+    queue = ObserveQueue(max_concurrency=1, max_queue=10, drain_timeout=0.05)
+    gate = asyncio.Event()
+    fake_exec, _ = _fake_exec(gate=gate)
+
+    with patch("asyncio.create_subprocess_exec", fake_exec):
+        for i in range(4):
+            queue.submit(f"/tmp/t{i}.jsonl")
+        await asyncio.sleep(0.01)
+        await queue.close()
+    stats = queue.stats()
+    assert stats["abandoned"] == 3
+    assert stats["depth"] == 0
+    assert queue.submit("/tmp/t1.jsonl") == "queued"
+    await queue.close()
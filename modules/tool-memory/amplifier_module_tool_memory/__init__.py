@@ -1,8 +1,14 @@
 """Tool module: exposes memory_search, memory_load, memory_status via engram CLI."""
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
 import subprocess
 
+# How long to wait for a freshly spawned `engram mcp` to answer `initialize`.
+_STARTUP_TIMEOUT = 10
+
 
 def _run_engram(args: list[str], timeout: int = 10) -> str:
     """Run an engram CLI command and return stdout or error message."""
@@ -22,8 +28,153 @@ def _run_engram(args: list[str], timeout: int = 10) -> str:
         return f"engram timed out after {timeout}s"
 
 
+class WorkerDied(Exception):
+    """The `engram mcp` child exited while a request was in flight."""
+
+
+class EngramWorker:
+    """One long-lived `engram mcp` child, spoken to with JSON-RPC over stdin/stdout.
+
+    Requests are tagged with increasing ids and may be issued concurrently; a
+    single reader task routes each response line back to the waiting caller.
+    The child is spawned lazily and respawned on the next call after it exits.
+    """
+
+    def __init__(self, command: list[str] | None = None):
+        self.command = command or ["engram", "mcp"]
+        self.starts = 0
+        self._proc: asyncio.subprocess.Process | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._reader: asyncio.Task | None = None
+        self._ids = itertools.count(1)
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        # The reader finishing (stdout EOF) is the earliest sign of a dead child;
+        # `returncode` is only set once the exit has been reaped.
+        return (
+            self._proc is not None
+            and self._proc.returncode is None
+            and self._reader is not None
+            and not self._reader.done()
+        )
+
+    async def call_tool(self, name: str, arguments: dict, timeout: float) -> str:
+        """Invoke an MCP tool and return its text content or an error message."""
+        for attempt in range(2):
+            try:
+                await self._ensure_started()
+                response = await self._request(
+                    "tools/call", {"name": name, "arguments": arguments}, timeout
+                )
+            except FileNotFoundError:
+                return "engram binary not found. Install engram first."
+            except asyncio.TimeoutError:
+                # The server handles one request at a time, so a stuck call
+                # blocks everything queued behind it. Start over on next call.
+                await self._kill()
+                return f"engram timed out after {timeout}s"
+            except WorkerDied as e:
+                if attempt == 0:
+                    continue
+                return f"engram error: {e}"
+            break
+
+        if "error" in response:
+            return f"engram error: {response['error'].get('message', 'unknown error')}"
+        content = response.get("result", {}).get("content", [])
+        return "\n".join(c.get("text", "") for c in content if c.get("type") == "text")
+
+    async def close(self) -> None:
+        """Terminate the child and fail any in-flight requests."""
+        await self._kill()
+
+    # --- Private helpers ---
+
+    async def _ensure_started(self) -> None:
+        async with self._start_lock:
+            if self.alive:
+                return
+            await self._kill()
+            proc = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            self._proc = proc
+            self._pending = {}
+            self._reader = asyncio.create_task(self._read_responses(proc, self._pending))
+            self.starts += 1
+            try:
+                await self._request(
+                    "initialize",
+                    {
+                        "protocolVersion": "2024-11-05",
+                        "capabilities": {},
+                        "clientInfo": {"name": "amplifier-module-tool-memory", "version": "0.1.0"},
+                    },
+                    _STARTUP_TIMEOUT,
+                )
+            except BaseException:
+                await self._kill()
+                raise
+
+    async def _request(self, method: str, params: dict, timeout: float) -> dict:
+        proc, pending = self._proc, self._pending
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        pending[request_id] = future
+        line = json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        try:
+            proc.stdin.write(line.encode() + b"\n")
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            pending.pop(request_id, None)
+            raise WorkerDied("engram mcp exited") from e
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            pending.pop(request_id, None)
+
+    @staticmethod
+    async def _read_responses(proc: asyncio.subprocess.Process, pending: dict) -> None:
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            future = pending.get(message.get("id")) if isinstance(message, dict) else None
+            if future is not None and not future.done():
+                future.set_result(message)
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(WorkerDied("engram mcp exited"))
+
+    async def _kill(self) -> None:
+        proc, reader = self._proc, self._reader
+        self._proc = self._reader = None
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        if reader is not None:
+            await reader
+
+
 async def mount(coordinator, config: dict):
-    """Register memory tools with the coordinator."""
+    """Register memory tools with the coordinator.
+
+    By default calls go through one persistent `engram mcp` worker; set
+    ``persistent: false`` to spawn a fresh `engram` process per call instead.
+    Both return the same text: the worker's ``engram_search``/``engram_load``/
+    ``engram_status`` tools answer with what the matching CLI command prints.
+    """
+    persistent = config.get("persistent", True)
+    worker = EngramWorker(config.get("command"))
 
     async def memory_search(query: str, limit: int = 10) -> str:
         """Search personal memory vault semantically.
@@ -32,7 +183,10 @@ async def mount(coordinator, config: dict):
             query: Natural language search query
             limit: Maximum number of results to return (default: 10)
         """
-        return _run_engram(["search", query, "--limit", str(limit)], timeout=config.get("timeout", 10))
+        timeout = config.get("timeout", 10)
+        if not persistent:
+            return _run_engram(["search", query, "--limit", str(limit)], timeout=timeout)
+        return await worker.call_tool("engram_search", {"query": query, "limit": limit}, timeout)
 
     async def memory_load(format: str = "context") -> str:  # noqa: A002
         """Load context from personal memory vault.
@@ -40,12 +194,20 @@ async def mount(coordinator, config: dict):
         Args:
             format: Output format -- 'context' (default), 'facts', or 'summary'
         """
-        return _run_engram(["load", f"--format={format}"], timeout=config.get("timeout", 5))
+        timeout = config.get("timeout", 5)
+        if not persistent:
+            return _run_engram(["load", f"--format={format}"], timeout=timeout)
+        return await worker.call_tool("engram_load", {"format": format}, timeout)
 
     async def memory_status() -> str:
         """Get status of personal memory vault, search index, and sync backend."""
-        return _run_engram(["status"], timeout=config.get("timeout", 5))
+        timeout = config.get("timeout", 5)
+        if not persistent:
+            return _run_engram(["status"], timeout=timeout)
+        return await worker.call_tool("engram_status", {}, timeout)
 
     coordinator.tools.register(memory_search)
     coordinator.tools.register(memory_load)
     coordinator.tools.register(memory_status)
+
+    return worker.close
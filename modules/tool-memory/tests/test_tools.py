@@ -55,7 +55,7 @@ def test_run_engram_handles_timeout():
 
 @pytest.mark.asyncio
 async def test_memory_search_calls_engram_search(coordinator):
-    await mount(coordinator, {})
+    await mount(coordinator, {"persistent": False})
     search_fn = next(
         call[0][0] for call in coordinator.tools.register.call_args_list
         if call[0][0].__name__ == "memory_search"
@@ -69,7 +69,7 @@ async def test_memory_search_calls_engram_search(coordinator):
 
 @pytest.mark.asyncio
 async def test_memory_load_calls_engram_load(coordinator):
-    await mount(coordinator, {})
+    await mount(coordinator, {"persistent": False})
     load_fn = next(
         call[0][0] for call in coordinator.tools.register.call_args_list
         if call[0][0].__name__ == "memory_load"
@@ -82,7 +82,7 @@ async def test_memory_load_calls_engram_load(coordinator):
 
 @pytest.mark.asyncio
 async def test_memory_status_calls_engram_status(coordinator):
-    await mount(coordinator, {})
+    await mount(coordinator, {"persistent": False})
     status_fn = next(
         call[0][0] for call in coordinator.tools.register.call_args_list
         if call[0][0].__name__ == "memory_status"
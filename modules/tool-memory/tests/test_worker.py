@@ -0,0 +1,213 @@
+"""Tests for the persistent `engram mcp` worker."""
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import sys
+import textwrap
+from unittest.mock import MagicMock
+
+import pytest
+
+from amplifier_module_tool_memory import EngramWorker, mount
+
+# Minimal stand-in for `engram mcp`: answers initialize and tools/call, and
+# understands a few magic queries so tests can crash or stall the child.
+STUB_SERVER = textwrap.dedent(
+    """
+    import json, os, sys, time
+    for line in sys.stdin:
+        req = json.loads(line)
+        if req["method"] == "initialize":
+            result = {"protocolVersion": "2024-11-05"}
+        else:
+            args = req["params"]["arguments"]
+            query = args.get("query", "")
+            if query == "crash":
+                sys.exit(1)
+            if query == "slow":
+                time.sleep(5)
+            text = f"{req['params']['name']} pid={os.getpid()} {json.dumps(args, sort_keys=True)}"
+            result = {"content": [{"type": "text", "text": text}]}
+        print(json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": result}), flush=True)
+    """
+)
+
+
+@pytest.fixture
+def stub_command(tmp_path):
+    script = tmp_path / "engram_mcp_stub.py"
+    script.write_text(STUB_SERVER)
+    return [sys.executable, str(script)]
+
+
+@pytest.mark.asyncio
+async def test_worker_reuses_one_child(stub_command):
+    worker = EngramWorker(stub_command)
+    first = await worker.call_tool("memory_status", {}, timeout=5)
+    second = await worker.call_tool("memory_load", {"format": "context"}, timeout=5)
+    await worker.close()
+    assert first.startswith("memory_status pid=")
+    assert second.startswith("memory_load pid=")
+    assert first.split()[1] == second.split()[1]
+    assert worker.starts == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_multiplexes_concurrent_calls(stub_command):
+    worker = EngramWorker(stub_command)
+    results = await asyncio.gather(
+        *(worker.call_tool("memory_search", {"query": f"q{i}"}, timeout=5) for i in range(20))
+    )
+    await worker.close()
+    for i, text in enumerate(results):
+        assert f'"query": "q{i}"' in text
+    assert worker.starts == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_restarts_after_child_dies(stub_command):
+    worker = EngramWorker(stub_command)
+    await worker.call_tool("memory_status", {}, timeout=5)
+    result = await worker.call_tool("memory_search", {"query": "crash"}, timeout=5)
+    assert "engram error" in result
+    after = await worker.call_tool("memory_status", {}, timeout=5)
+    await worker.close()
+    assert after.startswith("memory_status pid=")
+    assert worker.starts >= 2
+
+
+@pytest.mark.asyncio
+async def test_worker_timeout_kills_child(stub_command):
+    worker = EngramWorker(stub_command)
+    result = await worker.call_tool("memory_search", {"query": "slow"}, timeout=0.2)
+    assert "timed out" in result
+    assert not worker.alive
+    after = await worker.call_tool("memory_status", {}, timeout=5)
+    await worker.close()
+    assert after.startswith("memory_status pid=")
+
+
+@pytest.mark.asyncio
+async def test_worker_handles_missing_binary(tmp_path):
+    worker = EngramWorker([str(tmp_path / "no-such-engram"), "mcp"])
+    result = await worker.call_tool("memory_status", {}, timeout=5)
+    assert "not found" in result
+
+
+@pytest.mark.asyncio
+async def test_mount_routes_tools_through_worker(stub_command):
+    coordinator = MagicMock()
+    close = await mount(coordinator, {"command": stub_command})
+    search_fn = next(
+        call[0][0] for call in coordinator.tools.register.call_args_list
+        if call[0][0].__name__ == "memory_search"
+    )
+    result = await search_fn("Sofia vegetarian", limit=5)
+    await close()
+    assert result.startswith("engram_search pid=")
+    assert '"limit": 5' in result
+
+
+# Stand-in `engram` binary honouring the contract both modes rely on: each MCP
+# tool answers with what the matching CLI command prints, and fails with the
+# message the command writes to stderr.
+FAKE_ENGRAM = textwrap.dedent(
+    """
+    import json, sys
+
+    def search(query, limit):
+        if query == "missing-index":
+            raise RuntimeError("Search index not found. Run: engram index")
+        return f'Results for "{query}" [hybrid] — {limit} found\\nnote.md (score: 0.50)\\n'
+
+    def load(fmt):
+        if fmt != "context":
+            raise RuntimeError(f"Unknown format: {fmt}. Valid formats: context")
+        return "<engram-context>\\nSofia: dietary = vegetarian\\n</engram-context>\\n"
+
+    def status():
+        return "Vaults:\\n  ✓ personal [default] — 3 files\\nMemory store: present, 1 records\\n"
+
+    def run(command, args):
+        if command == "search":
+            return search(args["query"], args["limit"])
+        if command == "load":
+            return load(args["format"])
+        return status()
+
+    tools = {"engram_search": "search", "engram_load": "load", "engram_status": "status"}
+    if sys.argv[1] == "mcp":
+        for line in sys.stdin:
+            req = json.loads(line)
+            reply = {"jsonrpc": "2.0", "id": req["id"]}
+            if req["method"] == "initialize":
+                reply["result"] = {"protocolVersion": "2024-11-05"}
+            else:
+                params = req["params"]
+                try:
+                    text = run(tools[params["name"]], params["arguments"])
+                    reply["result"] = {"content": [{"type": "text", "text": text}]}
+                except RuntimeError as e:
+                    reply["error"] = {"code": -32603, "message": str(e)}
+            print(json.dumps(reply), flush=True)
+    else:
+        argv = sys.argv[1:]
+        args = {}
+        if argv[0] == "search":
+            args = {"query": argv[1], "limit": int(argv[3])}
+        elif argv[0] == "load":
+            args = {"format": argv[1].split("=", 1)[1]}
+        try:
+            sys.stdout.write(run(argv[0], args))
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+    """
+)
+
+
+async def _tool_outputs(config: dict) -> dict:
+    coordinator = MagicMock()
+    close = await mount(coordinator, config)
+    tools = {call[0][0].__name__: call[0][0] for call in coordinator.tools.register.call_args_list}
+    outputs = {
+        "search": await tools["memory_search"]("Sofia vegetarian", limit=5),
+        "search_error": await tools["memory_search"]("missing-index", limit=5),
+        "load": await tools["memory_load"](format="context"),
+        "load_error": await tools["memory_load"](format="summary"),
+        "status": await tools["memory_status"](),
+    }
+    await close()
+    return outputs
+
+
+@pytest.fixture
+def fake_engram_on_path(tmp_path, monkeypatch):
+    script = tmp_path / "engram"
+    script.write_text(f"#!{sys.executable}\n{FAKE_ENGRAM}")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="fake engram is a shebang script")
+async def test_persistent_and_per_call_modes_return_the_same_output(fake_engram_on_path):
+    persistent = await _tool_outputs({})
+    per_call = await _tool_outputs({"persistent": False})
+    assert persistent == per_call
+    assert persistent["search_error"] == "engram error: Search index not found. Run: engram index"
+    assert persistent["load_error"].startswith("engram error: Unknown format: summary")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(shutil.which("engram") is None, reason="engram binary not installed")
+async def test_modes_match_with_the_real_binary(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("ENGRAM_CONFIG_PATH", str(tmp_path / "config.toml"))
+    monkeypatch.setenv("ENGRAM_STORE_PATH", str(tmp_path / "memory.db"))
+    monkeypatch.setenv("ENGRAM_VAULT_KEY", "BwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwcHBwc=")
+    persistent = await _tool_outputs({})
+    per_call = await _tool_outputs({"persistent": False})
+    assert persistent == per_call